@@ -1,11 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import Optional
 from app.db.session import get_db
 from app.models.user import User
 from app.models.company import Company
 from app.schemas.barobill_member import BarobillMemberCreate, BarobillMemberResponse
-from app.core.barobill import BaroBillMemberService, BaroBillAuthService
+from app.core.barobill import (
+    BaroBillMemberService,
+    AsyncBaroBillMemberService,
+    AsyncBaroBillAuthService,
+    certificate_status_cache,
+)
 from app.core.config import settings
 from app.api.v1.auth import get_current_user
 from datetime import datetime
@@ -63,7 +69,7 @@ def get_barobill_member_service() -> Optional[BaroBillMemberService]:
     )
 
 
-def get_barobill_auth_service() -> Optional[BaroBillAuthService]:
+def get_barobill_auth_service() -> Optional[AsyncBaroBillAuthService]:
     """바로빌 인증 서비스 의존성 (파트너 인증키 사용, Optional 반환)"""
     # 조회용, Optional 반환 함수이므로 is_barobill_configured()로 분기 처리
     if not settings.is_barobill_configured():
@@ -74,7 +80,7 @@ def get_barobill_auth_service() -> Optional[BaroBillAuthService]:
     corp_num = getattr(settings, "BAROBILL_CORP_NUM", None)
     use_test_server = getattr(settings, "BAROBILL_USE_TEST_SERVER", False)
 
-    return BaroBillAuthService(
+    return AsyncBaroBillAuthService(
         cert_key=cert_key,
         corp_num=corp_num,
         use_test_server=use_test_server,
@@ -150,15 +156,31 @@ def register_barobill_member(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error_msg)
 
 
+def get_async_barobill_member_service() -> Optional[AsyncBaroBillMemberService]:
+    """바로빌 회원 관리 서비스 의존성 (비동기, 파트너 인증키 사용, Optional 반환)"""
+    if not settings.is_barobill_configured():
+        return None
+
+    cert_key = getattr(settings, "BAROBILL_CERT_KEY", None)
+    corp_num = getattr(settings, "BAROBILL_CORP_NUM", None)
+    use_test_server = getattr(settings, "BAROBILL_USE_TEST_SERVER", False)
+
+    return AsyncBaroBillMemberService(
+        cert_key=cert_key,
+        corp_num=corp_num,
+        use_test_server=use_test_server,
+    )
+
+
 @router.post(
     "/auto-link", response_model=AutoLinkResponse, status_code=status.HTTP_200_OK
 )
-def auto_link_barobill(
+async def auto_link_barobill(
     request: AutoLinkRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-    partner_service: Optional[BaroBillMemberService] = Depends(
-        get_barobill_member_service
+    partner_service: Optional[AsyncBaroBillMemberService] = Depends(
+        get_async_barobill_member_service
     ),
 ):
     """
@@ -181,8 +203,8 @@ def auto_link_barobill(
             )
 
         # 회사 정보 조회
-        company = (
-            db.query(Company)
+        company = await run_in_threadpool(
+            lambda: db.query(Company)
             .filter(
                 Company.id == request.company_id, Company.user_id == current_user.id
             )
@@ -243,7 +265,7 @@ def auto_link_barobill(
             )
 
         # 사업자번호 하이픈 제거 및 검증
-        corp_num_clean = company.business_number.replace("-", "").strip()
+        corp_num_clean = company.business_number_normalized
         if not corp_num_clean or len(corp_num_clean) != 10:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -261,7 +283,7 @@ def auto_link_barobill(
         barobill_registered = False
         result_code = None
         try:
-            barobill_result = partner_service.regist_corp_member(
+            barobill_result = await partner_service.regist_corp_member(
                 corp_num=corp_num_clean,
                 corp_name=company.name,
                 ceo_name=company.ceo_name,
@@ -308,8 +330,8 @@ def auto_link_barobill(
             current_user.barobill_corp_num = corp_num_clean
             current_user.barobill_linked = True
             current_user.barobill_linked_at = datetime.now()
-            db.commit()
-            db.refresh(current_user)
+            await run_in_threadpool(db.commit)
+            await run_in_threadpool(db.refresh, current_user)
 
             # result_code에 따라 메시지 결정
             if result_code == -32000:
@@ -332,7 +354,7 @@ def auto_link_barobill(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         error_msg = str(e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -341,11 +363,11 @@ def auto_link_barobill(
 
 
 @router.post("/certificate/check", response_model=CertificateCheckResponse)
-def check_certificate(
+async def check_certificate(
     request: CertificateCheckRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-    auth_service: Optional[BaroBillAuthService] = Depends(get_barobill_auth_service),
+    auth_service: Optional[AsyncBaroBillAuthService] = Depends(get_barobill_auth_service),
 ):
     """
     인증서 등록 여부 확인
@@ -377,9 +399,13 @@ def check_certificate(
                 regist_url=None,
             )
 
+        # 인증서를 방금 등록했을 수 있으므로 발행 전 확인용 인증서 상태 캐시 무효화
+        if current_user.barobill_corp_num:
+            certificate_status_cache.invalidate(current_user.barobill_corp_num)
+
         # 인증서 유효성 확인
         try:
-            cert_check_result = auth_service.check_cert_is_valid(
+            cert_check_result = await auth_service.check_cert_is_valid(
                 member_id=current_user.barobill_id,
                 member_pwd=request.password,
             )
@@ -393,7 +419,7 @@ def check_certificate(
             else:
                 # 인증서 미등록 시 등록 URL 조회
                 try:
-                    regist_url_result = auth_service.get_certificate_regist_url(
+                    regist_url_result = await auth_service.get_certificate_regist_url(
                         member_id=current_user.barobill_id,
                         member_pwd=request.password,
                     )
@@ -420,7 +446,7 @@ def check_certificate(
             error_msg = str(cert_error)
             # 인증서 확인 실패 시에도 등록 URL을 조회해볼 수 있음
             try:
-                regist_url_result = auth_service.get_certificate_regist_url(
+                regist_url_result = await auth_service.get_certificate_regist_url(
                     member_id=current_user.barobill_id,
                     member_pwd=request.password,
                 )
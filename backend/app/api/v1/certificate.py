@@ -3,14 +3,14 @@ from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.models.user import User
 from app.api.v1.auth import get_current_user
-from app.core.barobill.barobill_auth import BaroBillAuthService
+from app.core.barobill.barobill_auth import AsyncBaroBillAuthService
 from app.core.config import settings
 
 router = APIRouter()
 
 
 @router.get("/status")
-def get_certificate_status(
+async def get_certificate_status(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -37,14 +37,14 @@ def get_certificate_status(
     
     try:
         # 사용자별 인증키로 인증 서비스 생성
-        auth_service = BaroBillAuthService(
+        auth_service = AsyncBaroBillAuthService(
             cert_key=current_user.barobill_cert_key,
             corp_num=current_user.barobill_corp_num.replace("-", "").strip(),
             use_test_server=getattr(settings, "BAROBILL_USE_TEST_SERVER", False)
         )
         
-        # 인증서 상태 조회
-        cert_status = auth_service.get_certificate_status()
+        # 인증서 상태 조회 (캐시를 무시하고 다시 조회해 발행 전 확인용 캐시도 갱신)
+        cert_status = await auth_service.refresh_certificate_status()
         
         return {
             "certificate_registered": cert_status["certificate_registered"],
@@ -6,6 +6,7 @@ from app.models.user import User
 from app.models.client import Client
 from app.api.v1.auth import get_current_user
 from app.schemas.client import ClientCreate, ClientUpdate, ClientResponse
+from app.services.company_service import CompanyService
 
 router = APIRouter()
 
@@ -19,10 +20,9 @@ def create_client(
     """거래처 생성"""
     try:
         # 중복 확인 (사용자별로 사업자번호 중복 체크)
-        existing = db.query(Client).filter(
-            Client.user_id == current_user.id,
-            Client.business_number == client.business_number
-        ).first()
+        existing = CompanyService.find_client_by_business_number(
+            db, current_user.id, client.business_number
+        )
         
         if existing:
             raise HTTPException(
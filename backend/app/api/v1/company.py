@@ -56,7 +56,7 @@ def validate_company_info_match(
         (정합성 일치 여부, 불일치 사유)
     """
     # 사업자번호 완전 일치 확인
-    our_corp_num = our_company.business_number.replace("-", "").strip()
+    our_corp_num = our_company.business_number_normalized
     barobill_corp_num = barobill_info.get("corp_num", "").replace("-", "").strip()
     
     if our_corp_num != barobill_corp_num:
@@ -107,7 +107,7 @@ def link_company_to_barobill(
             return False, "바로빌 파트너 서비스를 생성할 수 없습니다."
         
         # 사업자번호 정리
-        corp_num_clean = company.business_number.replace("-", "").strip()
+        corp_num_clean = company.business_number_normalized
         if not corp_num_clean or len(corp_num_clean) != 10:
             return False, "유효하지 않은 사업자번호입니다."
         
@@ -249,13 +249,8 @@ def create_company(
     """
     try:
         # 중복 확인 (사용자별로 사업자번호 중복 체크)
-        existing = (
-            db.query(Company)
-            .filter(
-                Company.user_id == current_user.id,
-                Company.business_number == company.business_number,
-            )
-            .first()
+        existing = CompanyService.find_company_by_business_number(
+            db, current_user.id, company.business_number
         )
 
         if existing:
@@ -380,8 +375,8 @@ def update_company(
 
             if partner_service:
                 try:
-                    # 수정할 회원사의 사업자번호 (company.business_number 사용)
-                    target_corp_num = company.business_number.replace("-", "").strip()
+                    # 수정할 회원사의 사업자번호 (정규화 사업자번호 사용)
+                    target_corp_num = company.business_number_normalized
 
                     if not target_corp_num or len(target_corp_num) != 10:
                         raise Exception("유효하지 않은 사업자번호입니다.")
@@ -1,3 +1,4 @@
+from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
@@ -9,6 +10,7 @@ from app.models.invoice import Invoice
 from app.models.user import User
 from app.api.v1.auth import get_current_user
 from app.services.tax_invoice import TaxInvoiceService
+from app.services.tax_invoice_state_sync_service import TaxInvoiceStateSyncService
 from app.core.config import settings
 
 router = APIRouter()
@@ -81,115 +83,76 @@ def get_invoices(
     return invoices
 
 
-def get_tax_invoice_service() -> TaxInvoiceService:
-    """세금계산서 서비스 의존성"""
-    return TaxInvoiceService()
-
-
 @router.post("/invoices/check-status", response_model=dict)
 def check_invoice_status(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-    service: TaxInvoiceService = Depends(get_tax_invoice_service),
 ):
     """
     바로빌로 발행한 세금계산서의 상태를 체크하고 업데이트
 
-    - "대기" 상태인 세금계산서 중 mgt_key가 있는 것만 체크
-    - 바로빌 API로 상태 조회 후 홈택스 전송 완료 시 "완료"로 업데이트
+    - 상태는 백그라운드 동기화 작업자가 주기적으로 DB에 반영하므로,
+      마지막 동기화 후 TAX_INVOICE_STATE_SYNC_STALE_SECONDS가 지난 "대기" 건만 바로빌에 조회
+      (작업자를 실행하지 않는 경우 "대기" 건 전체 조회)
+    - 관리번호를 호출당 최대 건수로 나눠 조회하고, 홈택스 전송 완료 건은 일괄 UPDATE로 "완료" 처리
     """
     try:
         # 바로빌 API 인증키 확인 (안전하게 속성 접근)
-        cert_key = getattr(settings, "BAROBILL_CERT_KEY", None)
-        corp_num = getattr(settings, "BAROBILL_CORP_NUM", None)
-        if not cert_key or not corp_num:
+        if not settings.is_barobill_configured():
             return {
                 "success": False,
                 "message": "바로빌 API 인증키가 설정되지 않았습니다.",
                 "updated_count": 0,
             }
 
-        # "대기" 상태이고 mgt_key가 있는 세금계산서 조회
-        pending_invoices = (
-            db.query(Invoice)
-            .filter(
-                Invoice.user_id == current_user.id,
-                Invoice.status == "대기",
-                Invoice.mgt_key.isnot(None),
-                Invoice.mgt_key != "",
-            )
-            .all()
-        )
+        # 동기화가 필요한 "대기" 세금계산서의 관리번호 조회
+        now = datetime.utcnow()
+        if settings.TAX_INVOICE_STATE_SYNC_INTERVAL > 0:
+            cutoff = now - timedelta(seconds=settings.TAX_INVOICE_STATE_SYNC_STALE_SECONDS)
+        else:
+            cutoff = now
+        mgt_key_list = TaxInvoiceStateSyncService.find_stale(
+            db, cutoff, settings.TAX_INVOICE_STATE_SYNC_BATCH_SIZE, user_id=current_user.id
+        ).get(current_user.id, [])
 
-        if not pending_invoices:
+        if not mgt_key_list:
             return {
                 "success": True,
                 "message": "체크할 세금계산서가 없습니다.",
                 "updated_count": 0,
+                "checked_count": 0,
             }
 
-        # mgt_key 리스트 생성
-        mgt_key_list = [
-            invoice.mgt_key for invoice in pending_invoices if invoice.mgt_key
-        ]
+        # 바로빌 API로 상태 조회 (호출당 최대 건수로 나눠서)
+        service = TaxInvoiceStateSyncService.get_service(
+            TaxInvoiceService, current_user.barobill_cert_key, current_user.barobill_corp_num
+        )
+        results = []
+        error = None
+        for chunk in TaxInvoiceStateSyncService.chunk(
+            mgt_key_list, settings.TAX_INVOICE_STATE_SYNC_CHUNK_SIZE
+        ):
+            try:
+                states_result = service.get_tax_invoice_states(chunk)
+            except Exception as e:
+                error = e
+                break
+            results.append(
+                (current_user.id, chunk, TaxInvoiceStateSyncService.parse_states(states_result))
+            )
 
-        if not mgt_key_list:
-            return {
-                "success": True,
-                "message": "유효한 관리번호가 없습니다.",
-                "updated_count": 0,
-            }
+        # 조회한 만큼 상태 일괄 업데이트
+        updated_count = 0
+        if results:
+            updated_count = TaxInvoiceStateSyncService.apply_states(db, results, now)
 
-        # 바로빌 API로 상태 조회
-        try:
-            states_result = service.get_tax_invoice_states(mgt_key_list)
-        except Exception as e:
+        if error is not None:
             return {
                 "success": False,
-                "message": f"바로빌 상태 조회 실패: {str(e)}",
-                "updated_count": 0,
+                "message": f"바로빌 상태 조회 실패: {str(error)}",
+                "updated_count": updated_count,
             }
 
-        # 상태 업데이트
-        updated_count = 0
-        for state_info in states_result:
-            mgt_key = state_info.get("MgtKey") or state_info.get("mgt_key")
-            barobill_state = state_info.get("BarobillState") or state_info.get(
-                "barobill_state"
-            )
-
-            if not mgt_key:
-                continue
-
-            # 바로빌 상태 값 확인
-            # BarobillState 값:
-            # 0: 발행 대기
-            # 1: 발행 완료 (홈택스 전송 대기)
-            # 2: 홈택스 전송 완료
-            # 3: 홈택스 전송 실패
-            # 4: 취소됨
-            # 등등...
-
-            # 홈택스 전송 완료 상태 확인 (2 또는 특정 값)
-            # 바로빌 문서에 따르면 BarobillState가 2이면 홈택스 전송 완료
-            if barobill_state == 2:
-                # 해당 세금계산서 찾기
-                invoice = (
-                    db.query(Invoice)
-                    .filter(
-                        Invoice.user_id == current_user.id,
-                        Invoice.mgt_key == mgt_key,
-                        Invoice.status == "대기",
-                    )
-                    .first()
-                )
-
-                if invoice:
-                    invoice.status = "완료"
-                    updated_count += 1
-
-        db.commit()
-
         return {
             "success": True,
             "message": f"{updated_count}건의 세금계산서 상태가 업데이트되었습니다.",
@@ -1,12 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Optional
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
-from app.services.tax_invoice import TaxInvoiceService
+from app.services.tax_invoice import AsyncTaxInvoiceService
+from app.services.tax_invoice_service_cache import tax_invoice_service_cache
 from app.services.invoice_service import InvoiceService
 from app.services.corp_state_service import CorpStateService
-from app.core.barobill import BaroBillInvoiceService
+from app.services.tax_invoice_pricing import VatRateError, price_invoice
+from app.services.idempotency_service import IdempotencyService, run_idempotent
+from app.core.barobill import (
+    AsyncBaroBillInvoiceService,
+    AsyncBaroBillAuthService,
+    BaroBillUnavailableError,
+)
 from app.core.config import settings
 from app.db.session import get_db
 from app.models.user import User
@@ -37,12 +45,12 @@ def get_current_user_optional(
         return None
 
 
-def get_tax_invoice_service() -> TaxInvoiceService:
-    """세금계산서 서비스 의존성"""
-    return TaxInvoiceService()
+def get_tax_invoice_service() -> AsyncTaxInvoiceService:
+    """세금계산서 서비스 의존성 (비동기)"""
+    return tax_invoice_service_cache.get(AsyncTaxInvoiceService)
 
 
-def get_barobill_service() -> BaroBillInvoiceService:
+def get_barobill_service() -> AsyncBaroBillInvoiceService:
     """바로빌 서비스 의존성"""
     # 실제 바로빌 서버로 HTTP 요청을 보내므로 검증 필요
     settings.validate_barobill()
@@ -52,7 +60,7 @@ def get_barobill_service() -> BaroBillInvoiceService:
     corp_num = getattr(settings, "BAROBILL_CORP_NUM", None)
     use_test_server = getattr(settings, "BAROBILL_USE_TEST_SERVER", False)
 
-    return BaroBillInvoiceService(
+    return AsyncBaroBillInvoiceService(
         cert_key=cert_key, corp_num=corp_num, use_test_server=use_test_server
     )
 
@@ -64,119 +72,75 @@ class CorpStateCheckRequest(BaseModel):
 @router.post(
     "/tax-invoices/register", response_model=dict, status_code=status.HTTP_201_CREATED
 )
-def register_tax_invoice(
+async def register_tax_invoice(
     invoice: TaxInvoiceCreate,
-    service: TaxInvoiceService = Depends(get_tax_invoice_service),
+    service: AsyncTaxInvoiceService = Depends(get_tax_invoice_service),
 ):
     """세금계산서 등록"""
     try:
-        # 부가세율 검증 및 재계산
-        vat_rate_percent = invoice.vat_rate_percent if invoice.vat_rate_percent is not None else 10.0
-        
-        # 부가세율 유효성 검증 (0 이상 10 이하)
-        if vat_rate_percent < 0 or vat_rate_percent > 10:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"부가세율은 0 이상 10 이하여야 합니다. (입력값: {vat_rate_percent}%)"
-            )
-        
-        # 부가세율을 소수로 변환 (10% -> 0.1)
-        vat_rate = vat_rate_percent / 100.0
-        
         # 스키마를 딕셔너리로 변환
         invoice_data = invoice.model_dump(exclude={"IssueTiming", "vat_rate_percent"})
         issue_timing = invoice.IssueTiming
-        
-        # 각 품목의 부가세 재계산
-        if invoice_data.get('TaxInvoiceTradeLineItems'):
-            total_supply = 0
-            total_tax = 0
-            
-            for item in invoice_data['TaxInvoiceTradeLineItems']:
-                # 공급가액 추출
-                try:
-                    supply_value = float(item.get('Amount', 0))
-                except (ValueError, TypeError):
-                    supply_value = 0
-                
-                # 품목별 부가세율이 있으면 사용, 없으면 전체 부가세율 사용
-                item_vat_rate_percent = item.get('vat_rate_percent')
-                if item_vat_rate_percent is not None:
-                    # 품목별 부가세율 검증
-                    if item_vat_rate_percent < 0 or item_vat_rate_percent > 10:
-                        raise HTTPException(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            detail=f"품목 '{item.get('Name', '')}'의 부가세율은 0 이상 10 이하여야 합니다. (입력값: {item_vat_rate_percent}%)"
-                        )
-                    item_vat_rate = item_vat_rate_percent / 100.0
-                else:
-                    item_vat_rate = vat_rate
-                
-                # 부가세 재계산 (공급가액 * 부가세율)
-                tax_amount = round(supply_value * item_vat_rate)
-                item['Tax'] = str(int(tax_amount))
-                
-                total_supply += supply_value
-                total_tax += tax_amount
-                
-                # vat_rate_percent 필드는 barobill API에 전송하지 않도록 제거
-                if 'vat_rate_percent' in item:
-                    del item['vat_rate_percent']
-            
-            # 전체 합계 재계산
-            invoice_data['AmountTotal'] = str(int(total_supply))
-            invoice_data['TaxTotal'] = str(int(total_tax))
-            invoice_data['TotalAmount'] = str(int(total_supply + total_tax))
 
-        mgt_key = service.regist_tax_invoice(invoice_data, issue_timing)
+        # 품목별 부가세 및 합계 재계산
+        try:
+            price_invoice(invoice_data, invoice.vat_rate_percent)
+        except VatRateError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        mgt_key = await service.regist_tax_invoice(invoice_data, issue_timing)
 
         return {
             "success": True,
             "mgt_key": mgt_key,
             "message": "세금계산서가 등록되었습니다.",
         }
-    except HTTPException:
+    except (HTTPException, BaroBillUnavailableError):
         raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/tax-invoices/{mgt_key}", response_model=dict)
-def get_tax_invoice(
-    mgt_key: str, service: TaxInvoiceService = Depends(get_tax_invoice_service)
+async def get_tax_invoice(
+    mgt_key: str, service: AsyncTaxInvoiceService = Depends(get_tax_invoice_service)
 ):
     """세금계산서 조회"""
     try:
-        result = service.get_tax_invoice(mgt_key)
+        result = await service.get_tax_invoice(mgt_key)
         return {"success": True, "data": result}
+    except BaroBillUnavailableError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
 @router.post("/tax-invoices/states", response_model=dict)
-def get_tax_invoice_states(
+async def get_tax_invoice_states(
     mgt_key_list: List[str],
-    service: TaxInvoiceService = Depends(get_tax_invoice_service),
+    service: AsyncTaxInvoiceService = Depends(get_tax_invoice_service),
 ):
     """세금계산서 상태 조회 (복수)"""
     try:
-        result = service.get_tax_invoice_states(mgt_key_list)
+        result = await service.get_tax_invoice_states(mgt_key_list)
         return {"success": True, "data": result}
+    except BaroBillUnavailableError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.post("/tax-invoices/issue", response_model=dict)
-def issue_tax_invoice(
+async def issue_tax_invoice(
     issue_data: TaxInvoiceIssueSchema,
-    service: TaxInvoiceService = Depends(get_tax_invoice_service),
+    service: AsyncTaxInvoiceService = Depends(get_tax_invoice_service),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """세금계산서 발행 (바로빌 발행 + DB 상태 업데이트)"""
     try:
         # 바로빌 API 호출
-        result = service.issue_tax_invoice(
+        result = await service.issue_tax_invoice(
             mgt_key=issue_data.mgt_key,
             send_sms=issue_data.send_sms,
             sms_message=issue_data.sms_message or "",
@@ -188,17 +152,14 @@ def issue_tax_invoice(
 
         # 발행 성공 시 DB 상태 업데이트 (서비스 레이어 사용)
         if result > 0:
-            InvoiceService.update_invoice_after_issue(
+            await run_in_threadpool(
+                InvoiceService.update_invoice_after_issue,
                 db, current_user.id, issue_data.mgt_key, result
             )
         else:
             # 발행 실패 시
-            db.rollback()
-            error_msg = (
-                service.barobill.get_err_string(result)
-                if hasattr(service, "barobill")
-                else f"발행 실패 (코드: {result})"
-            )
+            await run_in_threadpool(db.rollback)
+            error_msg = await service.barobill.get_err_string(result)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail=error_msg
             )
@@ -210,22 +171,45 @@ def issue_tax_invoice(
         }
     except HTTPException:
         raise
+    except BaroBillUnavailableError:
+        await run_in_threadpool(db.rollback)
+        raise
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.delete("/tax-invoices/{mgt_key}", response_model=dict)
-def delete_tax_invoice(
+async def delete_tax_invoice(
     mgt_key: str,
-    service: TaxInvoiceService = Depends(get_tax_invoice_service),
+    service: AsyncTaxInvoiceService = Depends(get_tax_invoice_service),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
 ):
-    """세금계산서 취소 (바로빌 취소 + DB 상태 업데이트)"""
+    """
+    세금계산서 취소 (바로빌 취소 + DB 상태 업데이트)
+
+    Idempotency-Key 헤더를 보내면 같은 키의 재요청에는 바로빌 호출 없이 첫 성공 응답을 반환합니다.
+    """
+    return await run_idempotent(
+        db,
+        current_user.id,
+        idempotency_key,
+        IdempotencyService.fingerprint("DELETE /barobill/tax-invoices", {"mgt_key": mgt_key}),
+        lambda: _delete_tax_invoice(mgt_key, service, db, current_user),
+    )
+
+
+async def _delete_tax_invoice(
+    mgt_key: str, service: AsyncTaxInvoiceService, db: Session, current_user: User
+):
+    """세금계산서 취소 처리 (delete_tax_invoice 참고)"""
     try:
         # Invoice 찾기 (서비스 레이어 사용)
-        invoice = InvoiceService.find_invoice_by_mgt_key(db, current_user.id, mgt_key)
+        invoice = await run_in_threadpool(
+            InvoiceService.find_invoice_by_mgt_key, db, current_user.id, mgt_key
+        )
 
         if not invoice:
             raise HTTPException(
@@ -236,7 +220,7 @@ def delete_tax_invoice(
         # 바로빌에서 실제 상태 확인 (실시간 상태 체크)
         barobill_state = None
         try:
-            states_result = service.get_tax_invoice_states([mgt_key])
+            states_result = await service.get_tax_invoice_states([mgt_key])
             if states_result and len(states_result) > 0:
                 barobill_state = states_result[0].get(
                     "BarobobillState"
@@ -248,22 +232,20 @@ def delete_tax_invoice(
         InvoiceService.validate_invoice_cancellation(db, invoice, barobill_state)
 
         # 바로빌 취소 API 호출
-        result = service.delete_tax_invoice(mgt_key)
+        result = await service.delete_tax_invoice(mgt_key)
 
         # 취소 실패 시
         if result < 0:
-            error_msg = (
-                service.barobill.get_err_string(result)
-                if hasattr(service, "barobill")
-                else f"취소 실패 (코드: {result})"
-            )
+            error_msg = await service.barobill.get_err_string(result)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"세금계산서 취소 실패: {error_msg}",
             )
 
         # DB 상태 업데이트 (서비스 레이어 사용)
-        InvoiceService.update_invoice_after_cancel(db, current_user.id, mgt_key)
+        await run_in_threadpool(
+            InvoiceService.update_invoice_after_cancel, db, current_user.id, mgt_key
+        )
 
         return {
             "success": True,
@@ -272,25 +254,48 @@ def delete_tax_invoice(
         }
     except HTTPException:
         raise
+    except BaroBillUnavailableError:
+        await run_in_threadpool(db.rollback)
+        raise
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.delete("/tax-invoices/by-invoice/{invoice_id}", response_model=dict)
-def delete_tax_invoice_by_invoice_id(
+async def delete_tax_invoice_by_invoice_id(
     invoice_id: int,
-    service: TaxInvoiceService = Depends(get_tax_invoice_service),
+    service: AsyncTaxInvoiceService = Depends(get_tax_invoice_service),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
 ):
-    """세금계산서 취소 (invoice_id로 취소)"""
+    """
+    세금계산서 취소 (invoice_id로 취소)
+
+    Idempotency-Key 헤더를 보내면 같은 키의 재요청에는 바로빌 호출 없이 첫 성공 응답을 반환합니다.
+    """
+    return await run_idempotent(
+        db,
+        current_user.id,
+        idempotency_key,
+        IdempotencyService.fingerprint(
+            "DELETE /barobill/tax-invoices/by-invoice", {"invoice_id": invoice_id}
+        ),
+        lambda: _delete_tax_invoice_by_invoice_id(invoice_id, service, db, current_user),
+    )
+
+
+async def _delete_tax_invoice_by_invoice_id(
+    invoice_id: int, service: AsyncTaxInvoiceService, db: Session, current_user: User
+):
+    """세금계산서 취소 처리 (delete_tax_invoice_by_invoice_id 참고)"""
     try:
         # invoice_id로 Invoice 찾기
         from app.models.invoice import Invoice
 
-        invoice = (
-            db.query(Invoice)
+        invoice = await run_in_threadpool(
+            lambda: db.query(Invoice)
             .filter(Invoice.id == invoice_id, Invoice.user_id == current_user.id)
             .first()
         )
@@ -302,8 +307,8 @@ def delete_tax_invoice_by_invoice_id(
             )
 
         # mgt_key 찾기 (서비스 레이어 사용)
-        mgt_key = InvoiceService.find_mgt_key_by_invoice_id(
-            db, current_user.id, invoice_id
+        mgt_key = await run_in_threadpool(
+            InvoiceService.find_mgt_key_by_invoice_id, db, current_user.id, invoice_id
         )
 
         if not mgt_key:
@@ -315,7 +320,7 @@ def delete_tax_invoice_by_invoice_id(
         # 바로빌에서 실제 상태 확인
         barobill_state = None
         try:
-            states_result = service.get_tax_invoice_states([mgt_key])
+            states_result = await service.get_tax_invoice_states([mgt_key])
             if states_result and len(states_result) > 0:
                 barobill_state = states_result[0].get("BarobillState") or states_result[
                     0
@@ -327,22 +332,20 @@ def delete_tax_invoice_by_invoice_id(
         InvoiceService.validate_invoice_cancellation(db, invoice, barobill_state)
 
         # 바로빌 취소 API 호출
-        result = service.delete_tax_invoice(mgt_key)
+        result = await service.delete_tax_invoice(mgt_key)
 
         # 취소 실패 시
         if result < 0:
-            error_msg = (
-                service.barobill.get_err_string(result)
-                if hasattr(service, "barobill")
-                else f"취소 실패 (코드: {result})"
-            )
+            error_msg = await service.barobill.get_err_string(result)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"세금계산서 취소 실패: {error_msg}",
             )
 
         # DB 상태 업데이트 (서비스 레이어 사용)
-        InvoiceService.update_invoice_after_cancel(db, current_user.id, mgt_key)
+        await run_in_threadpool(
+            InvoiceService.update_invoice_after_cancel, db, current_user.id, mgt_key
+        )
 
         return {
             "success": True,
@@ -351,15 +354,18 @@ def delete_tax_invoice_by_invoice_id(
         }
     except HTTPException:
         raise
+    except BaroBillUnavailableError:
+        await run_in_threadpool(db.rollback)
+        raise
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.post("/corp-state/check", response_model=dict)
-def check_corp_state(
+async def check_corp_state(
     request: CorpStateCheckRequest,
-    service: BaroBillInvoiceService = Depends(get_barobill_service),
+    service: AsyncBaroBillInvoiceService = Depends(get_barobill_service),
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
@@ -376,7 +382,7 @@ def check_corp_state(
                 detail="바로빌 API 인증키가 설정되지 않았습니다.",
             )
 
-        result = service.get_corp_state_ex(corp_num_clean)
+        result = await service.get_corp_state_ex(corp_num_clean)
 
         # 상태 설명 매핑 (서비스 레이어 사용)
         state_mapping = CorpStateService.get_state_mapping()
@@ -391,7 +397,8 @@ def check_corp_state(
         cert_status_info = None
         if current_user:
             # 이력 저장 (과금 없음)
-            CorpStateService.save_corp_state_history(
+            await run_in_threadpool(
+                CorpStateService.save_corp_state_history,
                 db=db,
                 user=current_user,
                 corp_num=corp_num_clean,
@@ -402,18 +409,19 @@ def check_corp_state(
             )
 
             # 발행 사용량 정보 조회 (정보 제공용)
-            usage_info = CorpStateService.get_invoice_usage_info(db, current_user.id)
+            usage_info = await run_in_threadpool(
+                CorpStateService.get_invoice_usage_info, db, current_user.id
+            )
             
             # 인증서 상태 조회 (정보 제공용)
             if current_user.barobill_linked and current_user.barobill_cert_key and current_user.barobill_corp_num:
                 try:
-                    from app.core.barobill.barobill_auth import BaroBillAuthService
-                    auth_service = BaroBillAuthService(
+                    auth_service = AsyncBaroBillAuthService(
                         cert_key=current_user.barobill_cert_key,
                         corp_num=current_user.barobill_corp_num.replace("-", "").strip(),
                         use_test_server=getattr(settings, "BAROBILL_USE_TEST_SERVER", False)
                     )
-                    cert_status = auth_service.get_certificate_status()
+                    cert_status = await auth_service.get_cached_certificate_status()
                     cert_status_info = {
                         "certificate_registered": cert_status["certificate_registered"],
                         "certificate_status_message": cert_status["status_message"],
@@ -445,7 +453,7 @@ def check_corp_state(
             response.update(cert_status_info)
         
         return response
-    except HTTPException:
+    except (HTTPException, BaroBillUnavailableError):
         raise
     except Exception as e:
         error_msg = str(e)
@@ -1,313 +1,254 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from decimal import Decimal
-from datetime import date, datetime
-import json
+import asyncio
+import logging
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
 from app.db.session import get_db
 from app.models.user import User
-from app.models.company import Company
-from app.crud.usage import record_usage_log
-from app.models.usage_log import UsageType
-from app.models.tax_invoice_issue import TaxInvoiceIssue
+from app.models.tax_invoice_mirror import TaxInvoiceMirrorDirection
 from pydantic import BaseModel
 from app.api.v1.auth import get_current_user
-from app.schemas.tax_invoice_barobill import TaxInvoiceCreate
-from app.services.tax_invoice import TaxInvoiceService
+from app.schemas.tax_invoice_barobill import TaxInvoiceBatchCreate, TaxInvoiceCreate
+from app.services.tax_invoice import AsyncTaxInvoiceService
+from app.services.tax_invoice_service_cache import tax_invoice_service_cache
+from app.services.invoice_service import InvoiceService
+from app.services.company_service import CompanyService
 from app.services.corp_state_service import calculate_free_invoice_remaining
-from app.core.barobill.barobill_auth import BaroBillAuthService
+from app.services.tax_invoice_pricing import VatRateError, price_invoice, price_invoices
+from app.services.tax_invoice_job_service import TaxInvoiceJobService
+from app.services.idempotency_service import IdempotencyService, NonRetryableHTTPException, run_idempotent
+from app.services.tax_invoice_job_worker import tax_invoice_job_worker
+from app.services.tax_invoice_mirror_service import TaxInvoiceMirrorService
+from app.services.tax_invoice_mirror_worker import tax_invoice_mirror_worker
+from app.services.tax_invoice_export_service import (
+    EXPORT_FORMATS,
+    MEDIA_TYPES,
+    export_chunks,
+    export_filename,
+)
+from app.services.tax_invoice_report_service import TaxInvoiceReportService
+from app.services.tax_invoice_callback_service import (
+    CALLBACK_NOT_FOUND,
+    TaxInvoiceCallbackService,
+    tax_invoice_callback_buffer,
+)
+from app.core.barobill.barobill_auth import AsyncBaroBillAuthService
+from app.core.barobill.barobill_resilience import BaroBillUnavailableError
 from app.core.config import settings
+from app.utils.business_number import normalize_business_number
 
 router = APIRouter(prefix="/barobill/tax-invoices", tags=["barobill-tax-invoices"])
+logger = logging.getLogger(__name__)
 
-# 무료 발행 기본 제공 수량 상수
-FREE_INVOICE_QUOTA = 5
 
-
-@router.post("/issue", response_model=dict, status_code=status.HTTP_201_CREATED)
-def issue_tax_invoice(
-    invoice: TaxInvoiceCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
+def _prepare_invoice_data(invoice: TaxInvoiceCreate) -> Tuple[Dict[str, Any], int]:
     """
-    전자세금계산서 발행 (사용자별 인증키 사용)
-    
-    로그인한 사용자의 바로빌 인증키로 세금계산서를 발행합니다.
-    발행 시 사용 내역을 기록합니다.
+    부가세율 검증 후 품목별 부가세/합계를 다시 계산해 바로빌 전송 데이터 생성
+
+    Returns:
+        (바로빌 전송 데이터, 발행시점)
+
+    Raises:
+        HTTPException: 부가세율이 0 이상 10 이하가 아닌 경우 (400)
     """
-    # 발행자 사업자번호로 회사 정보 조회
-    invoicer_corp_num = invoice.InvoicerParty.CorpNum.replace("-", "").strip()
-    
-    # 회사 정보 조회 (사용자별로 사업자번호로 조회)
-    # 모든 회사를 조회한 후 Python에서 비교 (SQL 함수 사용 대신)
-    companies = (
-        db.query(Company)
-        .filter(Company.user_id == current_user.id)
-        .all()
-    )
-    
-    company = None
-    for c in companies:
-        if c.business_number.replace("-", "").strip() == invoicer_corp_num:
-            company = c
-            break
-    
-    if not company:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="회사 정보를 찾을 수 없습니다. 먼저 회사 정보를 저장해주세요."
-        )
-    
-    # 바로빌 연동 확인 (회사 정보 기준)
-    if not company.barobill_linked:
+    # 바로빌 전송 데이터
+    invoice_data = invoice.model_dump(exclude={'IssueTiming', 'vat_rate_percent'})
+
+    # 품목별 부가세 및 합계 재계산
+    try:
+        price_invoice(invoice_data, invoice.vat_rate_percent)
+    except VatRateError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="바로빌 연동이 완료되지 않았습니다. 회사 정보를 확인해주세요."
+            detail=str(e)
         )
-    
+
+    # 즉시 발행은 공급자 문서번호가 관리번호가 되므로 바로빌 호출 전에 채움 (작업은 재시도 시에도 같은 번호 사용)
+    InvoiceService.ensure_mgt_key(invoice_data)
+
+    return invoice_data, invoice.IssueTiming
+
+
+async def _ensure_can_issue(db: Session, current_user: User, corp_num: Optional[str] = None) -> Optional[int]:
+    """
+    발행 사전 검증 (회사/바로빌 연동, 인증키, 인증서, 무료 제공 건수/결제수단)
+
+    Args:
+        db: 데이터베이스 세션
+        current_user: 발행 사용자
+        corp_num: 발행자 사업자번호 (정규화, 없으면 회사 확인 생략 - 일괄 발행은 건별로 확인)
+
+    Returns:
+        즉시 발행 가능한 건수 (결제수단이 있으면 None, 제한 없음)
+
+    Raises:
+        HTTPException: 회사 정보 없음(404), 연동/인증키/인증서 문제(400), 무료 건수 소진 + 결제수단 없음(403)
+    """
+    if corp_num is not None:
+        # 회사 정보 조회 (사용자별로 사업자번호로 조회)
+        company = await run_in_threadpool(
+            CompanyService.find_company_by_business_number, db, current_user.id, corp_num
+        )
+        if not company:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="회사 정보를 찾을 수 없습니다. 먼저 회사 정보를 저장해주세요."
+            )
+        # 바로빌 연동 확인 (회사 정보 기준)
+        if not company.barobill_linked:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="바로빌 연동이 완료되지 않았습니다. 회사 정보를 확인해주세요."
+            )
+
     # 사용자 인증키 확인 (발행에 필요)
     if not current_user.barobill_cert_key:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="바로빌 인증키가 등록되지 않았습니다."
         )
-    
+
     if not current_user.barobill_corp_num:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="사업자번호가 등록되지 않았습니다."
         )
-    
+
     # 인증서 등록 상태 확인 (발행 전 필수)
     try:
-        auth_service = BaroBillAuthService(
+        auth_service = AsyncBaroBillAuthService(
             cert_key=current_user.barobill_cert_key,
             corp_num=current_user.barobill_corp_num.replace("-", "").strip(),
             use_test_server=getattr(settings, "BAROBILL_USE_TEST_SERVER", False)
         )
-        cert_status = auth_service.get_certificate_status()
-        
+        cert_status = await auth_service.get_cached_certificate_status()
+
         if not cert_status["certificate_registered"]:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"인증서가 등록되지 않았습니다. {cert_status['status_message']}"
             )
-        
+
         if not cert_status["can_issue_invoice"]:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"세금계산서 발행이 불가능합니다. {cert_status['status_message']}"
             )
-    except HTTPException:
+    except (HTTPException, BaroBillUnavailableError):
         raise
     except Exception as cert_error:
         # 인증서 확인 실패 시에도 발행 시도 (바로빌 API에서 추가 검증)
-        import logging
-        logger = logging.getLogger(__name__)
         logger.warning(f"인증서 상태 확인 실패: {str(cert_error)}")
+
+    # 무료 제공 건수 확인 및 결제수단 확인 (결제수단은 payment_methods 기준, 작업자와 동일)
+    free_invoice_remaining = await run_in_threadpool(
+        calculate_free_invoice_remaining, db, current_user.id
+    )
+    has_payment_method = await run_in_threadpool(
+        InvoiceService.has_payment_method, db, current_user.id
+    )
+    if free_invoice_remaining <= 0 and not has_payment_method:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="무료 5건이 모두 소진되었습니다. 결제수단을 등록해야 발행이 가능합니다."
+        )
+    return None if has_payment_method else free_invoice_remaining
+
+
+@router.post("/issue", response_model=dict, status_code=status.HTTP_201_CREATED)
+async def issue_tax_invoice(
+    invoice: TaxInvoiceCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")
+):
+    """
+    전자세금계산서 발행 (사용자별 인증키 사용)
     
-    # 무료 제공 건수 확인 및 결제수단 확인 (발행 API에서만 적용)
-    free_invoice_remaining = calculate_free_invoice_remaining(db, current_user.id)
-    if free_invoice_remaining > 0:
-        # 무료 제공 건수가 있으면 정상 발행 처리
-        pass
-    else:
-        # 무료 제공 건수가 없으면 결제수단 확인
-        if not current_user.has_payment_method:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="무료 5건이 모두 소진되었습니다. 결제수단을 등록해야 발행이 가능합니다."
-            )
-    
+    로그인한 사용자의 바로빌 인증키로 세금계산서를 발행합니다.
+    발행 시 사용 내역을 기록합니다.
+
+    바로빌 호출은 비동기로 기다리고, DB 작업만 스레드풀에서 실행합니다.
+
+    Idempotency-Key 헤더를 보내면 같은 키의 재요청에는 바로빌 호출/과금 없이 첫 성공 응답을 반환합니다.
+    """
+    return await run_idempotent(
+        db,
+        current_user.id,
+        idempotency_key,
+        IdempotencyService.fingerprint("POST /barobill/tax-invoices/issue", invoice.model_dump(mode="json")),
+        lambda: _issue_tax_invoice(invoice, db, current_user),
+        status.HTTP_201_CREATED
+    )
+
+
+async def _save_after_barobill(
+    save,
+    db: Session,
+    current_user: User,
+    invoice_data: Dict[str, Any],
+    mgt_key: str,
+    *args
+):
+    """
+    바로빌 등록/발행이 끝난 건 저장
+
+    저장에 실패하면 바로빌에는 이미 등록/발행되어 있으므로 400으로 숨기지 않고 관리번호와 함께 500을 반환합니다.
+    재시도하면 새 관리번호로 중복 발행되므로 Idempotency-Key는 해제하지 않습니다(NonRetryableHTTPException).
+
+    Args:
+        save: InvoiceService.save_issued_tax_invoice / save_reserved_tax_invoice
+        mgt_key: 관리번호
+        *args: save에 넘길 나머지 인자 (발행 결과 코드 등)
+    """
     try:
-        # 부가세율 검증 및 재계산
-        vat_rate_percent = invoice.vat_rate_percent if invoice.vat_rate_percent is not None else 10.0
-        
-        # 부가세율 유효성 검증 (0 이상 10 이하)
-        if vat_rate_percent < 0 or vat_rate_percent > 10:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"부가세율은 0 이상 10 이하여야 합니다. (입력값: {vat_rate_percent}%)"
-            )
-        
-        # 부가세율을 소수로 변환 (10% -> 0.1)
-        vat_rate = vat_rate_percent / 100.0
-        
-        # 세금계산서 등록 및 발행
-        invoice_data = invoice.model_dump(exclude={'IssueTiming', 'vat_rate_percent'})
-        issue_timing = invoice.IssueTiming
-        
-        # 각 품목의 부가세 재계산
-        if invoice_data.get('TaxInvoiceTradeLineItems'):
-            total_supply = 0
-            total_tax = 0
-            
-            for item in invoice_data['TaxInvoiceTradeLineItems']:
-                # 공급가액 추출
-                try:
-                    supply_value = float(item.get('Amount', 0))
-                except (ValueError, TypeError):
-                    supply_value = 0
-                
-                # 품목별 부가세율이 있으면 사용, 없으면 전체 부가세율 사용
-                item_vat_rate_percent = item.get('vat_rate_percent')
-                if item_vat_rate_percent is not None:
-                    # 품목별 부가세율 검증
-                    if item_vat_rate_percent < 0 or item_vat_rate_percent > 10:
-                        raise HTTPException(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            detail=f"품목 '{item.get('Name', '')}'의 부가세율은 0 이상 10 이하여야 합니다. (입력값: {item_vat_rate_percent}%)"
-                        )
-                    item_vat_rate = item_vat_rate_percent / 100.0
-                else:
-                    item_vat_rate = vat_rate
-                
-                # 부가세 재계산 (공급가액 * 부가세율)
-                tax_amount = round(supply_value * item_vat_rate)
-                item['Tax'] = str(int(tax_amount))
-                
-                total_supply += supply_value
-                total_tax += tax_amount
-                
-                # vat_rate_percent 필드는 barobill API에 전송하지 않도록 제거
-                if 'vat_rate_percent' in item:
-                    del item['vat_rate_percent']
-            
-            # 전체 합계 재계산
-            invoice_data['AmountTotal'] = str(int(total_supply))
-            invoice_data['TaxTotal'] = str(int(total_tax))
-            invoice_data['TotalAmount'] = str(int(total_supply + total_tax))
+        await run_in_threadpool(save, db, current_user, invoice_data, mgt_key, *args)
+    except Exception as e:
+        await run_in_threadpool(db.rollback)
+        logger.exception(f"세금계산서 발행 정보 저장 실패 (관리번호: {mgt_key}): {e}")
+        raise NonRetryableHTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "message": f"바로빌 등록/발행은 완료되었으나 발행 정보 저장에 실패했습니다: {str(e)}",
+                "mgt_key": mgt_key,
+            }
+        )
+
+
+async def _issue_tax_invoice(invoice: TaxInvoiceCreate, db: Session, current_user: User):
+    """전자세금계산서 발행 처리 (issue_tax_invoice 참고)"""
+    await _ensure_can_issue(db, current_user, normalize_business_number(invoice.InvoicerParty.CorpNum))
+
+    try:
+        # 부가세 재계산 및 바로빌 전송 데이터 생성
+        invoice_data, issue_timing = _prepare_invoice_data(invoice)
         
-        # 사용자별 인증키로 세금계산서 서비스 생성
-        service = TaxInvoiceService(
+        # 사용자별 인증키의 세금계산서 서비스 (자격증명별로 재사용)
+        service = tax_invoice_service_cache.get(
+            AsyncTaxInvoiceService,
             cert_key=current_user.barobill_cert_key,
             corp_num=current_user.barobill_corp_num
         )
         
-        # 등록
-        mgt_key = service.regist_tax_invoice(invoice_data, issue_timing)
-        
-        # 즉시 발행인 경우 발행
+        # 즉시 발행인 경우 등록과 발행을 한 번에 처리 (바로빌 왕복 1회, 등록만 된 건이 남지 않음)
         if issue_timing == 1:
-            result = service.issue_tax_invoice(
-                mgt_key=mgt_key,
+            result = await service.regist_and_issue_tax_invoice(
+                invoice_data,
                 send_sms=False,
                 force_issue=True
             )
+            # 관리번호는 공급자 문서번호(MgtNum, _prepare_invoice_data에서 채움)
+            mgt_key = invoice_data["InvoicerParty"]["MgtNum"]
             
-            # 발행 성공 시에만 과금 처리
             if result > 0:  # 발행 성공
-                # 발행 성공 후 현재 사용량 확인 (TaxInvoiceIssue 저장 전이므로 +1 해서 계산)
-                # TaxInvoiceIssue는 아래에서 저장되므로, 저장 전 현재 상태를 기준으로 판단
-                current_used_count = db.query(TaxInvoiceIssue).filter(
-                    TaxInvoiceIssue.user_id == current_user.id,
-                    TaxInvoiceIssue.barobill_result_code > 0
-                ).count()
-                
-                # 무료 제공 건수(5건)를 초과한 경우 과금 처리
-                if current_used_count >= FREE_INVOICE_QUOTA:
-                    # 결제수단이 등록된 경우 과금 처리
-                    if current_user.has_payment_method:
-                        # 사용 내역 기록 (후불 청구)
-                        record_usage_log(
-                            db=db,
-                            user_id=current_user.id,
-                            usage_type=UsageType.INVOICE_ISSUE,
-                            quantity=1
-                        )
-                        # BillingCharge 기록
-                        from app.models.billing_charge import BillingCharge, ChargeType
-                        charge = BillingCharge(
-                            user_id=current_user.id,
-                            charge_type=ChargeType.INVOICE,
-                            amount=200  # 계산서 발행 건당 200원
-                        )
-                        db.add(charge)
-            
-            # 발행 정보를 DB에 저장 (5년 보관)
-            write_date_str = invoice_data.get('WriteDate', '')
-            # YYYYMMDD 형식을 date 객체로 변환
-            issue_date_obj = date.today()
-            if write_date_str and len(write_date_str) == 8:
-                try:
-                    issue_date_obj = datetime.strptime(write_date_str, '%Y%m%d').date()
-                except ValueError:
-                    pass  # 변환 실패 시 오늘 날짜 사용
-            
-            # 품목 정보를 JSON 문자열로 변환
-            line_items_json = None
-            if invoice_data.get('TaxInvoiceTradeLineItems'):
-                line_items_json = json.dumps(invoice_data['TaxInvoiceTradeLineItems'], ensure_ascii=False)
-            
-            # 발행 정보 저장
-            tax_invoice_issue = TaxInvoiceIssue(
-                user_id=current_user.id,
-                mgt_key=mgt_key,
-                issue_date=issue_date_obj,
-                write_date=write_date_str,
-                invoicer_corp_num=invoice_data.get('InvoicerParty', {}).get('CorpNum', ''),
-                invoicer_corp_name=invoice_data.get('InvoicerParty', {}).get('CorpName', ''),
-                invoicer_ceo_name=invoice_data.get('InvoicerParty', {}).get('CEOName'),
-                invoicer_addr=invoice_data.get('InvoicerParty', {}).get('Addr'),
-                invoicer_biz_type=invoice_data.get('InvoicerParty', {}).get('BizType'),
-                invoicer_biz_class=invoice_data.get('InvoicerParty', {}).get('BizClass'),
-                invoicer_email=invoice_data.get('InvoicerParty', {}).get('Email'),
-                invoicee_corp_num=invoice_data.get('InvoiceeParty', {}).get('CorpNum', ''),
-                invoicee_corp_name=invoice_data.get('InvoiceeParty', {}).get('CorpName', ''),
-                invoicee_ceo_name=invoice_data.get('InvoiceeParty', {}).get('CEOName'),
-                invoicee_addr=invoice_data.get('InvoiceeParty', {}).get('Addr'),
-                invoicee_biz_type=invoice_data.get('InvoiceeParty', {}).get('BizType'),
-                invoicee_biz_class=invoice_data.get('InvoiceeParty', {}).get('BizClass'),
-                invoicee_email=invoice_data.get('InvoiceeParty', {}).get('Email'),
-                amount_total=invoice_data.get('AmountTotal'),
-                tax_total=invoice_data.get('TaxTotal'),
-                total_amount=invoice_data.get('TotalAmount'),
-                cash=invoice_data.get('Cash'),
-                chk_bill=invoice_data.get('ChkBill'),
-                note=invoice_data.get('Note'),
-                credit=invoice_data.get('Credit'),
-                purpose_type=invoice_data.get('PurposeType'),
-                tax_type=invoice_data.get('TaxType'),
-                remark1=invoice_data.get('Remark1'),
-                remark2=invoice_data.get('Remark2'),
-                remark3=invoice_data.get('Remark3'),
-                line_items=line_items_json,
-                barobill_result_code=result if isinstance(result, int) else None,
-                barobill_state="발행완료" if result > 0 else None
-            )
-            db.add(tax_invoice_issue)
-            
-            # Invoice 모델도 생성 (발행내역 표시 및 취소 기능을 위해)
-            if result > 0:  # 발행 성공 시에만
-                from app.models.invoice import Invoice
-                # 세금계산서 타입 결정 (1: 세금계산서, 2: 계산서)
-                tax_type_str = "세금계산서" if invoice_data.get('TaxInvoiceType', 1) == 1 else "계산서"
-                # 과세/면세 구분
-                if invoice_data.get('TaxType', 1) == 2:
-                    tax_type_str = "면세" + tax_type_str
-                else:
-                    tax_type_str = "과세" + tax_type_str
-                
-                # 총액을 Decimal로 변환
-                total_amount_str = invoice_data.get('TotalAmount', '0')
-                try:
-                    total_amount_decimal = Decimal(total_amount_str)
-                except:
-                    total_amount_decimal = Decimal('0')
-                
-                # Invoice 생성
-                invoice = Invoice(
-                    user_id=current_user.id,
-                    customer_name=invoice_data.get('InvoiceeParty', {}).get('CorpName', '거래처'),
-                    amount=total_amount_decimal,
-                    tax_type=tax_type_str,
-                    memo=invoice_data.get('Remark1') or invoice_data.get('Remark2') or invoice_data.get('Remark3'),
-                    status="대기",  # 바로빌로 발행하면 "대기" 상태
-                    mgt_key=mgt_key  # 바로빌 관리번호 저장
+                # 발행 성공 시에만 과금 처리 후 발행 정보를 DB에 저장 (5년 보관)
+                await _save_after_barobill(
+                    InvoiceService.save_issued_tax_invoice,
+                    db, current_user, invoice_data, mgt_key, result
                 )
-                db.add(invoice)
-            
-                db.commit()
                 
                 return {
                     "success": True,
@@ -317,92 +258,19 @@ def issue_tax_invoice(
                 }
             else:
                 # 발행 실패 시 에러 처리 (무료 건수 차감 안됨)
-                db.rollback()
-                error_msg = service.barobill.get_err_string(result) if hasattr(service, 'barobill') else f"발행 실패 (코드: {result})"
+                await run_in_threadpool(db.rollback)
+                error_msg = await service.barobill.get_err_string(result)
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=error_msg
                 )
         else:
-            # 발행 예약인 경우에도 저장
-            write_date_str = invoice_data.get('WriteDate', '')
-            issue_date_obj = date.today()
-            if write_date_str and len(write_date_str) == 8:
-                try:
-                    issue_date_obj = datetime.strptime(write_date_str, '%Y%m%d').date()
-                except ValueError:
-                    pass
-            
-            line_items_json = None
-            if invoice_data.get('TaxInvoiceTradeLineItems'):
-                line_items_json = json.dumps(invoice_data['TaxInvoiceTradeLineItems'], ensure_ascii=False)
-            
-            tax_invoice_issue = TaxInvoiceIssue(
-                user_id=current_user.id,
-                mgt_key=mgt_key,
-                issue_date=issue_date_obj,
-                write_date=write_date_str,
-                invoicer_corp_num=invoice_data.get('InvoicerParty', {}).get('CorpNum', ''),
-                invoicer_corp_name=invoice_data.get('InvoicerParty', {}).get('CorpName', ''),
-                invoicer_ceo_name=invoice_data.get('InvoicerParty', {}).get('CEOName'),
-                invoicer_addr=invoice_data.get('InvoicerParty', {}).get('Addr'),
-                invoicer_biz_type=invoice_data.get('InvoicerParty', {}).get('BizType'),
-                invoicer_biz_class=invoice_data.get('InvoicerParty', {}).get('BizClass'),
-                invoicer_email=invoice_data.get('InvoicerParty', {}).get('Email'),
-                invoicee_corp_num=invoice_data.get('InvoiceeParty', {}).get('CorpNum', ''),
-                invoicee_corp_name=invoice_data.get('InvoiceeParty', {}).get('CorpName', ''),
-                invoicee_ceo_name=invoice_data.get('InvoiceeParty', {}).get('CEOName'),
-                invoicee_addr=invoice_data.get('InvoiceeParty', {}).get('Addr'),
-                invoicee_biz_type=invoice_data.get('InvoiceeParty', {}).get('BizType'),
-                invoicee_biz_class=invoice_data.get('InvoiceeParty', {}).get('BizClass'),
-                invoicee_email=invoice_data.get('InvoiceeParty', {}).get('Email'),
-                amount_total=invoice_data.get('AmountTotal'),
-                tax_total=invoice_data.get('TaxTotal'),
-                total_amount=invoice_data.get('TotalAmount'),
-                cash=invoice_data.get('Cash'),
-                chk_bill=invoice_data.get('ChkBill'),
-                note=invoice_data.get('Note'),
-                credit=invoice_data.get('Credit'),
-                purpose_type=invoice_data.get('PurposeType'),
-                tax_type=invoice_data.get('TaxType'),
-                remark1=invoice_data.get('Remark1'),
-                remark2=invoice_data.get('Remark2'),
-                remark3=invoice_data.get('Remark3'),
-                line_items=line_items_json,
-                barobill_state="발행예약"
-            )
-            db.add(tax_invoice_issue)
-            
-            # 발행 예약인 경우에도 Invoice 모델 생성
-            from app.models.invoice import Invoice
-            # 세금계산서 타입 결정 (1: 세금계산서, 2: 계산서)
-            tax_type_str = "세금계산서" if invoice_data.get('TaxInvoiceType', 1) == 1 else "계산서"
-            # 과세/면세 구분
-            if invoice_data.get('TaxType', 1) == 2:
-                tax_type_str = "면세" + tax_type_str
-            else:
-                tax_type_str = "과세" + tax_type_str
-            
-            # 총액을 Decimal로 변환
-            total_amount_str = invoice_data.get('TotalAmount', '0')
-            try:
-                total_amount_decimal = Decimal(total_amount_str)
-            except:
-                total_amount_decimal = Decimal('0')
-            
-            # Invoice 생성
-            invoice = Invoice(
-                user_id=current_user.id,
-                customer_name=invoice_data.get('InvoiceeParty', {}).get('CorpName', '거래처'),
-                amount=total_amount_decimal,
-                tax_type=tax_type_str,
-                memo=invoice_data.get('Remark1') or invoice_data.get('Remark2') or invoice_data.get('Remark3'),
-                status="CREATED",  # 발행 예약은 "CREATED" 상태
-                mgt_key=mgt_key  # 바로빌 관리번호 저장
+            # 발행 예약인 경우 등록만 하고 저장
+            mgt_key = await service.regist_tax_invoice(invoice_data, issue_timing)
+            await _save_after_barobill(
+                InvoiceService.save_reserved_tax_invoice,
+                db, current_user, invoice_data, mgt_key
             )
-            db.add(invoice)
-            
-            db.commit()
             
             return {
                 "success": True,
@@ -412,58 +280,491 @@ def issue_tax_invoice(
             
     except HTTPException:
         raise
+    except BaroBillUnavailableError:
+        await run_in_threadpool(db.rollback)
+        raise
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
 
 
+def _batch_item_error(
+    index: int,
+    invoice: TaxInvoiceCreate,
+    message: str,
+    mgt_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """일괄 발행 건별 실패 결과"""
+    return {
+        "index": index,
+        "success": False,
+        "mgt_key": mgt_key or invoice.InvoicerParty.MgtNum,
+        "message": message,
+    }
+
+
+@router.post("/issue/batch", response_model=dict)
+async def issue_tax_invoices_batch(
+    batch: TaxInvoiceBatchCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")
+):
+    """
+    전자세금계산서 일괄 발행 (사용자별 인증키 사용)
+
+    회사/인증서/무료 제공 건수 확인은 요청당 한 번만 하고,
+    바로빌 호출은 BAROBILL_BATCH_CONCURRENCY개까지 동시에 보낸 뒤 발행 결과를 한 번에 저장합니다.
+    건별 실패는 전체 요청을 실패시키지 않고 results에 요청 순서대로 담아 반환합니다.
+
+    Idempotency-Key 헤더를 보내면 같은 키의 재요청에는 바로빌 호출/과금 없이 첫 성공 응답을 반환합니다.
+    """
+    return await run_idempotent(
+        db,
+        current_user.id,
+        idempotency_key,
+        IdempotencyService.fingerprint("POST /barobill/tax-invoices/issue/batch", batch.model_dump(mode="json")),
+        lambda: _issue_tax_invoices_batch(batch, db, current_user)
+    )
+
+
+async def _issue_tax_invoices_batch(batch: TaxInvoiceBatchCreate, db: Session, current_user: User):
+    """전자세금계산서 일괄 발행 처리 (issue_tax_invoices_batch 참고)"""
+    invoices = batch.invoices
+    if not invoices:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="발행할 세금계산서가 없습니다."
+        )
+    if len(invoices) > settings.BAROBILL_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {settings.BAROBILL_BATCH_MAX_ITEMS}건까지 발행할 수 있습니다."
+        )
+
+    # 인증키/인증서/무료 건수 확인 (결제수단이 없으면 무료 잔여 건수만큼만 즉시 발행, 회사는 건별로 확인)
+    issuable = await _ensure_can_issue(db, current_user)
+
+    # 발행자 회사 정보 (요청에 포함된 사업자번호를 한 번에 조회)
+    corp_nums = [normalize_business_number(invoice.InvoicerParty.CorpNum) for invoice in invoices]
+    companies = await run_in_threadpool(
+        CompanyService.find_companies_by_business_numbers, db, current_user.id, corp_nums
+    )
+
+    # 건별 사전 검증 (회사)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(invoices)
+    candidates = []
+    for index, (invoice, corp_num) in enumerate(zip(invoices, corp_nums)):
+        company = companies.get(corp_num)
+        if company is None:
+            results[index] = _batch_item_error(
+                index, invoice, "회사 정보를 찾을 수 없습니다. 먼저 회사 정보를 저장해주세요."
+            )
+            continue
+        if not company.barobill_linked:
+            results[index] = _batch_item_error(
+                index, invoice, "바로빌 연동이 완료되지 않았습니다. 회사 정보를 확인해주세요."
+            )
+            continue
+        candidates.append(index)
+
+    # 부가세/합계 일괄 계산
+    priced = price_invoices(
+        (
+            invoices[index].model_dump(exclude={'IssueTiming', 'vat_rate_percent'}),
+            invoices[index].vat_rate_percent,
+        )
+        for index in candidates
+    )
+
+    # 건별 사전 검증 (부가세율/무료 건수)
+    jobs = []
+    for index, (invoice_data, error) in zip(candidates, priced):
+        invoice = invoices[index]
+        if error is not None:
+            results[index] = _batch_item_error(index, invoice, str(error))
+            continue
+        InvoiceService.ensure_mgt_key(invoice_data)
+        issue_timing = invoice.IssueTiming
+        if issue_timing == 1 and issuable is not None:
+            if issuable <= 0:
+                results[index] = _batch_item_error(
+                    index, invoice, "무료 발행 건수를 초과했습니다. 결제수단을 등록해야 발행이 가능합니다."
+                )
+                continue
+            issuable -= 1
+        jobs.append((index, invoice, invoice_data, issue_timing))
+
+    # 바로빌 호출 (동시 호출 수 제한)
+    service = tax_invoice_service_cache.get(
+        AsyncTaxInvoiceService,
+        cert_key=current_user.barobill_cert_key,
+        corp_num=current_user.barobill_corp_num
+    )
+    semaphore = asyncio.Semaphore(max(settings.BAROBILL_BATCH_CONCURRENCY, 1))
+    outcomes: Dict[int, Tuple[Dict[str, Any], str, Optional[int]]] = {}
+
+    async def dispatch(index: int, invoice: TaxInvoiceCreate, invoice_data: Dict[str, Any], issue_timing: int):
+        async with semaphore:
+            try:
+                if issue_timing == 1:
+                    result = await service.regist_and_issue_tax_invoice(
+                        invoice_data,
+                        send_sms=False,
+                        force_issue=True
+                    )
+                    mgt_key = invoice_data["InvoicerParty"]["MgtNum"]
+                else:
+                    result = None
+                    mgt_key = await service.regist_tax_invoice(invoice_data, issue_timing)
+            except Exception as e:
+                # 서킷 열림/동시 호출 한도 초과도 건별 실패로 처리
+                results[index] = _batch_item_error(
+                    index, invoice, str(e), invoice_data["InvoicerParty"]["MgtNum"]
+                )
+                return
+        outcomes[index] = (invoice_data, mgt_key, result)
+        results[index] = {
+            "index": index,
+            "success": True,
+            "mgt_key": mgt_key,
+            "issue_result": result,
+            "message": (
+                "세금계산서가 발행되었습니다."
+                if issue_timing == 1
+                else "세금계산서가 등록되었습니다. 발행 예약 상태입니다."
+            ),
+        }
+
+    await asyncio.gather(*(dispatch(*job) for job in jobs))
+
+    # 발행 결과 일괄 저장 (요청 순서대로)
+    issued = []
+    reserved = []
+    for index in sorted(outcomes):
+        invoice_data, mgt_key, result = outcomes[index]
+        if result is None:
+            reserved.append((invoice_data, mgt_key))
+        else:
+            issued.append((invoice_data, mgt_key, result))
+
+    if issued or reserved:
+        try:
+            await run_in_threadpool(
+                InvoiceService.save_batch_tax_invoices,
+                db, current_user, issued, reserved
+            )
+        except Exception as e:
+            await run_in_threadpool(db.rollback)
+            logger.error(f"일괄 발행 결과 저장 실패: {str(e)}")
+            # 바로빌에는 발행되었으므로 건별 결과를 함께 반환해 대사할 수 있도록 하고, 재시도로 중복 발행되지 않도록 키 유지
+            raise NonRetryableHTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "message": f"발행 결과 저장 중 오류가 발생했습니다: {str(e)}",
+                    "results": results,
+                }
+            )
+
+    succeeded = sum(1 for item in results if item["success"])
+    return {
+        "success": succeeded == len(results),
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results,
+    }
+
+
+@router.post("/jobs", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
+async def enqueue_tax_invoice_job(
+    invoice: TaxInvoiceCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")
+):
+    """
+    전자세금계산서 발행 작업 등록 (202 Accepted)
+
+    /issue와 같은 사전 검증(회사/인증키/인증서/무료 제공 건수/부가세율)을 마친 뒤
+    발행 작업을 큐에 넣고 바로 반환합니다. 바로빌 발행은 백그라운드 작업자가 처리하며,
+    진행 상태는 GET /jobs/{job_id}로 조회합니다.
+
+    Idempotency-Key 헤더를 보내면 같은 키의 재요청에는 작업을 다시 등록하지 않고 첫 응답(같은 job_id)을 반환합니다.
+    """
+    return await run_idempotent(
+        db,
+        current_user.id,
+        idempotency_key,
+        IdempotencyService.fingerprint("POST /barobill/tax-invoices/jobs", invoice.model_dump(mode="json")),
+        lambda: _enqueue_tax_invoice_job(invoice, db, current_user),
+        status.HTTP_202_ACCEPTED
+    )
+
+
+async def _enqueue_tax_invoice_job(invoice: TaxInvoiceCreate, db: Session, current_user: User):
+    """전자세금계산서 발행 작업 등록 처리 (enqueue_tax_invoice_job 참고)"""
+    # 무료 제공 건수/결제수단은 작업자가 처리 시점에 다시 확인
+    await _ensure_can_issue(db, current_user, normalize_business_number(invoice.InvoicerParty.CorpNum))
+
+    # 부가세 재계산 및 바로빌 전송 데이터 생성
+    invoice_data, issue_timing = _prepare_invoice_data(invoice)
+
+    job = await run_in_threadpool(
+        TaxInvoiceJobService.enqueue, db, current_user.id, invoice_data, issue_timing
+    )
+    tax_invoice_job_worker.notify()
+
+    return {
+        "job_id": job.job_id,
+        "status": job.status.value,
+        "status_url": f"{settings.API_V1_PREFIX}{router.prefix}/jobs/{job.job_id}",
+    }
+
+
+@router.get("/jobs/{job_id}", response_model=dict)
+def get_tax_invoice_job(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    전자세금계산서 발행 작업 상태 조회
+
+    status: queued(대기/재시도 대기), running(처리 중), succeeded(완료),
+    failed(바로빌 오류 등 실패), dead(재시도 소진 또는 발행 여부 확인 필요)
+    """
+    job = TaxInvoiceJobService.get_job(db, current_user.id, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="발행 작업을 찾을 수 없습니다."
+        )
+    return TaxInvoiceJobService.to_response(job)
+
+
 class CallbackRequest(BaseModel):
     """바로빌 callback 요청"""
     mgt_key: str
     status: str  # "발행성공" 또는 기타 상태
 
 
+class CallbackBatchRequest(BaseModel):
+    """바로빌 일괄 callback 요청"""
+    callbacks: List[CallbackRequest]
+
+
 @router.post("/callback", response_model=dict)
-def handle_callback(
-    callback_data: CallbackRequest,
-    db: Session = Depends(get_db)
-):
+async def handle_callback(callback_data: CallbackRequest):
     """
     바로빌 홈택스 전송 완료 callback 처리
     
     홈택스 전송이 완료되면 바로빌에서 이 엔드포인트로 callback을 보냅니다.
-    TaxInvoiceIssue의 상태를 업데이트합니다.
+    동시에 들어온 callback을 TAX_INVOICE_CALLBACK_BUFFER_WINDOW_MS 동안 모아
+    TaxInvoiceIssue/Invoice 상태를 한 번에 업데이트합니다.
     """
     try:
-        # TaxInvoiceIssue 업데이트
-        tax_invoice_issue = db.query(TaxInvoiceIssue).filter(
-            TaxInvoiceIssue.mgt_key == callback_data.mgt_key
-        ).first()
-        
-        if tax_invoice_issue:
-            tax_invoice_issue.barobill_state = callback_data.status
-            db.commit()
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"해당 관리번호({callback_data.mgt_key})의 세금계산서를 찾을 수 없습니다."
-            )
-        
-        return {
-            "success": True,
-            "message": "상태가 업데이트되었습니다.",
-            "mgt_key": callback_data.mgt_key,
-            "status": callback_data.status
-        }
-    except HTTPException:
-        raise
+        outcome = await tax_invoice_callback_buffer.submit(
+            callback_data.mgt_key, callback_data.status
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Callback 처리 중 오류가 발생했습니다: {str(e)}"
+        )
+
+    if outcome == CALLBACK_NOT_FOUND:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"해당 관리번호({callback_data.mgt_key})의 세금계산서를 찾을 수 없습니다."
+        )
+
+    return {
+        "success": True,
+        "message": "상태가 업데이트되었습니다.",
+        "mgt_key": callback_data.mgt_key,
+        "status": callback_data.status
+    }
+
+
+@router.post("/callback/batch", response_model=dict)
+async def handle_callback_batch(
+    batch: CallbackBatchRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    바로빌 callback 일괄 처리
+
+    여러 관리번호의 상태를 상태별 UPDATE 한 번으로 반영하고, 관리번호별 결과를 요청 순서대로 반환합니다.
+    (outcome: updated 또는 not_found, 같은 관리번호가 여러 번 오면 마지막 상태를 반영)
+    """
+    callbacks = batch.callbacks
+    if not callbacks:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="처리할 callback이 없습니다."
+        )
+    if len(callbacks) > settings.TAX_INVOICE_CALLBACK_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {settings.TAX_INVOICE_CALLBACK_BATCH_MAX_ITEMS}건까지 처리할 수 있습니다."
+        )
+
+    try:
+        outcomes = await run_in_threadpool(
+            TaxInvoiceCallbackService.apply,
+            db, [(item.mgt_key, item.status) for item in callbacks]
+        )
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Callback 처리 중 오류가 발생했습니다: {str(e)}"
         )
 
+    results = [
+        {"mgt_key": item.mgt_key, "status": item.status, "outcome": outcomes[item.mgt_key]}
+        for item in callbacks
+    ]
+    not_found = sum(1 for item in results if item["outcome"] == CALLBACK_NOT_FOUND)
+    return {
+        "success": not_found == 0,
+        "total": len(results),
+        "updated": len(results) - not_found,
+        "not_found": not_found,
+        "results": results,
+    }
+
+
+@router.get("/mirror", response_model=dict)
+def get_tax_invoice_mirror(
+    direction: Optional[TaxInvoiceMirrorDirection] = Query(None, description="sales(매출) 또는 purchase(매입)"),
+    start_date: Optional[str] = Query(None, description="작성일자 시작 (YYYYMMDD)"),
+    end_date: Optional[str] = Query(None, description="작성일자 종료 (YYYYMMDD)"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    바로빌 매출/매입 세금계산서 목록 조회 (미러 테이블)
+
+    앱 밖에서 발행한 매출 건과 받은 매입 건을 포함합니다. 바로빌을 직접 조회하지 않고
+    백그라운드 작업자가 동기화한 미러 테이블을 읽으며, sync_states로 구분별 마지막 동기화 시점을 함께 반환합니다.
+    """
+    total, rows = TaxInvoiceMirrorService.list_mirrors(
+        db, current_user.id, direction, start_date, end_date, skip, limit
+    )
+    return {
+        "total": total,
+        "items": [TaxInvoiceMirrorService.to_response(row) for row in rows],
+        "sync_states": [
+            TaxInvoiceMirrorService.sync_state_response(state)
+            for state in TaxInvoiceMirrorService.get_sync_states(db, current_user.id)
+        ],
+    }
+
+
+@router.post("/mirror/sync", response_model=dict)
+async def sync_tax_invoice_mirror(current_user: User = Depends(get_current_user)):
+    """
+    바로빌 매출/매입 세금계산서 목록 즉시 동기화 (현재 사용자)
+
+    워터마크 이후 기간만 조회하며, 구분별 조회/추가/갱신 건수를 반환합니다.
+    """
+    if not current_user.barobill_cert_key or not current_user.barobill_corp_num:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="바로빌 인증키 또는 사업자번호가 등록되지 않았습니다."
+        )
+
+    summary = await tax_invoice_mirror_worker.sync_user(current_user.id)
+    return {
+        "success": all(result["success"] for result in summary.values()),
+        "results": summary,
+    }
+
+
+@router.get("/export")
+def export_tax_invoices(
+    format: str = Query("csv", description="csv, jsonl 또는 xlsx"),
+    start_date: Optional[date] = Query(None, description="발행일자 시작 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="발행일자 종료 (YYYY-MM-DD)"),
+    gzip: bool = Query(False, description="gzip 압축 여부"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    발행 세금계산서 보관분 내보내기 (스트리밍)
+
+    서버 측 커서로 읽으면서 바로 내보내므로 기간이 길어도 메모리 사용량이 일정합니다.
+    CSV/XLSX는 품목 한 줄당 한 행, JSONL은 세금계산서 한 건당 한 줄(line_items 배열 포함)입니다.
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 내보내기 형식입니다. ({', '.join(EXPORT_FORMATS)})"
+        )
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시작일자가 종료일자보다 늦습니다."
+        )
+
+    filename = export_filename(format, start_date, end_date, gzip)
+    return StreamingResponse(
+        export_chunks(
+            format, current_user.id, start_date, end_date, gzip,
+            yield_per=settings.TAX_INVOICE_EXPORT_YIELD_PER,
+        ),
+        media_type="application/gzip" if gzip else MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def _check_report_period(start_date: Optional[date], end_date: Optional[date]):
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시작일자가 종료일자보다 늦습니다."
+        )
+
+
+@router.get("/reports/monthly", response_model=dict)
+def get_monthly_report(
+    start_date: Optional[date] = Query(None, description="발행일자 시작 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="발행일자 종료 (YYYY-MM-DD)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """월별 발행 합계 (취소된 건 제외)"""
+    _check_report_period(start_date, end_date)
+    return {"items": TaxInvoiceReportService.monthly_totals(db, current_user.id, start_date, end_date)}
+
+
+@router.get("/reports/items", response_model=dict)
+def get_item_report(
+    start_date: Optional[date] = Query(None, description="발행일자 시작 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="발행일자 종료 (YYYY-MM-DD)"),
+    limit: int = Query(20, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """품목별 매출 상위 N개 (취소된 건 제외)"""
+    _check_report_period(start_date, end_date)
+    return {"items": TaxInvoiceReportService.top_items(db, current_user.id, start_date, end_date, limit)}
+
+
+@router.get("/reports/clients", response_model=dict)
+def get_client_report(
+    start_date: Optional[date] = Query(None, description="발행일자 시작 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="발행일자 종료 (YYYY-MM-DD)"),
+    limit: int = Query(20, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """거래처별 매출 상위 N개 (취소된 건 제외)"""
+    _check_report_period(start_date, end_date)
+    return {"items": TaxInvoiceReportService.client_revenue(db, current_user.id, start_date, end_date, limit)}
@@ -1,16 +1,59 @@
 """
 바로빌 API 모듈
 """
-from app.core.barobill.barobill_client import BaroBillClient, BaroBillService
-from app.core.barobill.barobill_auth import BaroBillAuthService
-from app.core.barobill.barobill_invoice import BaroBillInvoiceService
-from app.core.barobill.barobill_member import BaroBillMemberService
+from app.core.barobill.barobill_client import (
+    BaroBillClient,
+    BaroBillService,
+    AsyncBaroBillClient,
+    AsyncBaroBillService,
+)
+from app.core.barobill.barobill_registry import BaroBillClientRegistry, client_registry
+from app.core.barobill.barobill_errors import BaroBillErrorCatalog, error_catalog
+from app.core.barobill.barobill_serializer import zeep_to_dict
+from app.core.barobill.barobill_metrics import BaroBillSoapClient, BaroBillAsyncSoapClient
+from app.core.barobill.barobill_singleflight import SingleFlight, AsyncSingleFlight
+from app.core.barobill.barobill_cert_cache import CertificateStatusCache, certificate_status_cache
+from app.core.barobill.barobill_resilience import (
+    BaroBillResilience,
+    BaroBillUnavailableError,
+    CircuitOpenError,
+    BulkheadFullError,
+)
+from app.core.barobill.barobill_auth import BaroBillAuthService, AsyncBaroBillAuthService
+from app.core.barobill.barobill_invoice import (
+    BaroBillInvoiceService,
+    AsyncBaroBillInvoiceService,
+)
+from app.core.barobill.barobill_member import (
+    BaroBillMemberService,
+    AsyncBaroBillMemberService,
+)
 
 __all__ = [
     "BaroBillClient",
     "BaroBillService",
+    "BaroBillClientRegistry",
+    "client_registry",
+    "BaroBillErrorCatalog",
+    "error_catalog",
+    "BaroBillResilience",
+    "BaroBillUnavailableError",
+    "CircuitOpenError",
+    "BulkheadFullError",
+    "zeep_to_dict",
+    "BaroBillSoapClient",
+    "BaroBillAsyncSoapClient",
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "CertificateStatusCache",
+    "certificate_status_cache",
     "BaroBillAuthService",
     "BaroBillInvoiceService",
     "BaroBillMemberService",
+    "AsyncBaroBillClient",
+    "AsyncBaroBillService",
+    "AsyncBaroBillAuthService",
+    "AsyncBaroBillInvoiceService",
+    "AsyncBaroBillMemberService",
 ]
 
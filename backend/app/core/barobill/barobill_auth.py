@@ -2,7 +2,122 @@
 바로빌 인증 관련 API 서비스
 """
 import re
-from app.core.barobill.barobill_client import BaroBillService
+from typing import Optional
+from app.core.barobill.barobill_client import BaroBillService, AsyncBaroBillService
+from app.core.barobill.barobill_cert_cache import certificate_status_cache
+
+# 오류 코드 패턴 (예: -10002)
+ERROR_CODE_PATTERN = re.compile("^-[0-9]{5}$")
+
+
+def _build_cert_check_result(result: int, error_msg: Optional[str] = None) -> dict:
+    """
+    CheckCERTIsValid 결과를 응답 딕셔너리로 변환
+
+    Args:
+        result: 바로빌 응답 코드 (음수: 오류 코드, 양수: 유효한 인증서)
+        error_msg: 오류 메시지 (조회 실패 시 None)
+    """
+    # result가 음수면 오류 코드, 양수면 유효한 인증서
+    if result < 0:
+        if error_msg is not None:
+            return {
+                "is_valid": False,
+                "result_code": result,
+                "error_message": error_msg,
+                "message": f"인증서 확인 실패: {error_msg} (코드: {result})",
+            }
+        return {
+            "is_valid": False,
+            "result_code": result,
+            "error_message": None,
+            "message": f"인증서 확인 실패 (코드: {result})",
+        }
+
+    # result가 양수면 유효한 인증서
+    return {
+        "is_valid": True,
+        "result_code": result,
+        "error_message": None,
+        "message": "인증서가 유효합니다.",
+    }
+
+
+def _build_certificate_status(cert_check_result: dict) -> dict:
+    """인증서 유효성 확인 결과를 인증서 등록 상태 딕셔너리로 변환"""
+    # 인증서 유효성 확인 결과
+    is_valid = cert_check_result.get("is_valid", False)
+    result_code = cert_check_result.get("result_code")
+    error_message = cert_check_result.get("error_message")
+
+    # 인증서 등록 여부 판단
+    certificate_registered = is_valid
+
+    # 발행 가능 여부 판단 (인증서가 유효하면 발행 가능)
+    can_issue_invoice = is_valid
+
+    # 상태 메시지 생성
+    if certificate_registered:
+        status_message = "인증서가 등록되어 있습니다."
+    else:
+        if error_message:
+            status_message = f"인증서 미등록: {error_message}"
+        else:
+            status_message = "인증서가 등록되지 않았습니다."
+
+    return {
+        "certificate_registered": certificate_registered,
+        "can_issue_invoice": can_issue_invoice,
+        "status_message": status_message,
+        "raw_barobill_response": {
+            "result_code": result_code,
+            "error_message": error_message,
+            "is_valid": is_valid,
+        },
+    }
+
+
+def _build_certificate_status_error(error: Exception) -> dict:
+    """API 호출 실패 시 인증서 미등록으로 간주한 상태 딕셔너리"""
+    error_msg = str(error)
+    return {
+        "certificate_registered": False,
+        "can_issue_invoice": False,
+        "status_message": f"인증서 상태 확인 실패: {error_msg}",
+        "raw_barobill_response": {
+            "error": error_msg
+        },
+    }
+
+
+def _build_regist_url_error(result, error_code: Optional[int], error_msg: Optional[str]) -> dict:
+    """GetCertificateRegistURL 오류 응답 딕셔너리 (메시지 조회 실패 시 error_msg=None)"""
+    if error_msg is not None:
+        return {
+            "success": False,
+            "url": None,
+            "result_code": error_code,
+            "error_message": error_msg,
+            "message": f"인증서 등록 URL 조회 실패: {error_msg} (코드: {error_code})",
+        }
+    return {
+        "success": False,
+        "url": None,
+        "result_code": result,
+        "error_message": None,
+        "message": f"인증서 등록 URL 조회 실패 (코드: {result})",
+    }
+
+
+def _build_regist_url_success(result) -> dict:
+    """GetCertificateRegistURL 성공 응답 딕셔너리"""
+    return {
+        "success": True,
+        "url": str(result),
+        "result_code": None,
+        "error_message": None,
+        "message": "인증서 등록 URL을 조회했습니다.",
+    }
 
 
 class BaroBillAuthService(BaroBillService):
@@ -11,7 +126,7 @@ class BaroBillAuthService(BaroBillService):
     def check_cert_is_valid(self, member_id: str = None, member_pwd: str = None) -> dict:
         """
         인증서 유효성 확인 (비밀번호 불필요)
-        
+
         바로빌 API의 CheckCERTIsValid는 인증키와 사업자번호만으로 호출 가능합니다.
 
         Args:
@@ -27,41 +142,23 @@ class BaroBillAuthService(BaroBillService):
                 CorpNum=self.client.corp_num,
             )
 
-            # result가 음수면 오류 코드, 양수면 유효한 인증서
+            error_msg = None
             if result < 0:
                 # 오류 코드에 대한 메시지 조회
                 try:
                     error_msg = self.get_err_string(result)
-                    return {
-                        "is_valid": False,
-                        "result_code": result,
-                        "error_message": error_msg,
-                        "message": f"인증서 확인 실패: {error_msg} (코드: {result})",
-                    }
                 except:
-                    return {
-                        "is_valid": False,
-                        "result_code": result,
-                        "error_message": None,
-                        "message": f"인증서 확인 실패 (코드: {result})",
-                    }
-            else:
-                # result가 양수면 유효한 인증서
-                return {
-                    "is_valid": True,
-                    "result_code": result,
-                    "error_message": None,
-                    "message": "인증서가 유효합니다.",
-                }
+                    error_msg = None
+            return _build_cert_check_result(result, error_msg)
         except Exception as e:
             raise
-    
+
     def get_certificate_status(self) -> dict:
         """
         인증서 등록 상태 조회 (비밀번호 불필요)
-        
+
         바로빌 API를 통해 인증서 등록 여부 및 발행 가능 여부를 확인합니다.
-        
+
         Returns:
             {
                 "certificate_registered": bool,
@@ -72,49 +169,35 @@ class BaroBillAuthService(BaroBillService):
         """
         try:
             # CheckCERTIsValid API 호출
-            cert_check_result = self.check_cert_is_valid()
-            
-            # 인증서 유효성 확인 결과
-            is_valid = cert_check_result.get("is_valid", False)
-            result_code = cert_check_result.get("result_code")
-            error_message = cert_check_result.get("error_message")
-            
-            # 인증서 등록 여부 판단
-            certificate_registered = is_valid
-            
-            # 발행 가능 여부 판단 (인증서가 유효하면 발행 가능)
-            can_issue_invoice = is_valid
-            
-            # 상태 메시지 생성
-            if certificate_registered:
-                status_message = "인증서가 등록되어 있습니다."
-            else:
-                if error_message:
-                    status_message = f"인증서 미등록: {error_message}"
-                else:
-                    status_message = "인증서가 등록되지 않았습니다."
-            
-            return {
-                "certificate_registered": certificate_registered,
-                "can_issue_invoice": can_issue_invoice,
-                "status_message": status_message,
-                "raw_barobill_response": {
-                    "result_code": result_code,
-                    "error_message": error_message,
-                    "is_valid": is_valid,
-                }
-            }
+            return _build_certificate_status(self.check_cert_is_valid())
         except Exception as e:
             # API 호출 실패 시 인증서 미등록으로 간주
-            error_msg = str(e)
-            return {
-                "certificate_registered": False,
-                "can_issue_invoice": False,
-                "status_message": f"인증서 상태 확인 실패: {error_msg}",
-                "raw_barobill_response": {
-                    "error": error_msg
-                }
-            }
+            return _build_certificate_status_error(e)
+
+    def get_cached_certificate_status(self) -> dict:
+        """
+        인증서 등록 상태 조회 (캐시 우선)
+
+        (서버, 사업자번호)별 캐시에 있으면 CheckCERTIsValid 호출 없이 반환합니다.
+        API 호출 자체가 실패한 결과는 캐시하지 않습니다.
+
+        Returns:
+            get_certificate_status와 같은 형식의 딕셔너리
+        """
+        status = certificate_status_cache.get(self.client.corp_num, self.client.use_test_server)
+        if status is not None:
+            return status
+        try:
+            status = _build_certificate_status(self.check_cert_is_valid())
+        except Exception as e:
+            return _build_certificate_status_error(e)
+        certificate_status_cache.set(self.client.corp_num, status, self.client.use_test_server)
+        return status
+
+    def refresh_certificate_status(self) -> dict:
+        """캐시를 무시하고 인증서 등록 상태를 다시 조회해 캐시 갱신"""
+        certificate_status_cache.invalidate(self.client.corp_num, self.client.use_test_server)
+        return self.get_cached_certificate_status()
 
     def get_certificate_regist_url(self, member_id: str, member_pwd: str) -> dict:
         """
@@ -136,35 +219,96 @@ class BaroBillAuthService(BaroBillService):
             )
 
             # 오류 코드 패턴 확인 (예: -10002)
-            if re.compile("^-[0-9]{5}$").match(str(result)) is not None:
+            if ERROR_CODE_PATTERN.match(str(result)) is not None:
                 # 오류 코드에 대한 메시지 조회
                 try:
                     error_code = int(result)
                     error_msg = self.get_err_string(error_code)
-                    return {
-                        "success": False,
-                        "url": None,
-                        "result_code": error_code,
-                        "error_message": error_msg,
-                        "message": f"인증서 등록 URL 조회 실패: {error_msg} (코드: {error_code})",
-                    }
+                    return _build_regist_url_error(result, error_code, error_msg)
                 except:
-                    return {
-                        "success": False,
-                        "url": None,
-                        "result_code": result,
-                        "error_message": None,
-                        "message": f"인증서 등록 URL 조회 실패 (코드: {result})",
-                    }
+                    return _build_regist_url_error(result, None, None)
             else:
                 # 성공 시 URL 반환
-                return {
-                    "success": True,
-                    "url": str(result),
-                    "result_code": None,
-                    "error_message": None,
-                    "message": "인증서 등록 URL을 조회했습니다.",
-                }
+                return _build_regist_url_success(result)
         except Exception as e:
             raise
 
+
+class AsyncBaroBillAuthService(AsyncBaroBillService):
+    """바로빌 인증 관련 서비스 (비동기)"""
+
+    async def check_cert_is_valid(self, member_id: str = None, member_pwd: str = None) -> dict:
+        """
+        인증서 유효성 확인 (비밀번호 불필요)
+
+        Args:
+            member_id: 바로빌 회원사 아이디 (선택사항, 사용하지 않음)
+            member_pwd: 바로빌 회원사 비밀번호 (선택사항, 사용하지 않음)
+
+        Returns:
+            인증서 유효성 확인 결과 딕셔너리
+        """
+        result = await self.client.get_common_client().service.CheckCERTIsValid(
+            CERTKEY=self.client.cert_key,
+            CorpNum=self.client.corp_num,
+        )
+
+        error_msg = None
+        if result < 0:
+            try:
+                error_msg = await self.get_err_string(result)
+            except Exception:
+                error_msg = None
+        return _build_cert_check_result(result, error_msg)
+
+    async def get_certificate_status(self) -> dict:
+        """인증서 등록 상태 조회 (BaroBillAuthService.get_certificate_status와 동일한 형식)"""
+        try:
+            return _build_certificate_status(await self.check_cert_is_valid())
+        except Exception as e:
+            return _build_certificate_status_error(e)
+
+    async def get_cached_certificate_status(self) -> dict:
+        """인증서 등록 상태 조회 (캐시 우선, BaroBillAuthService.get_cached_certificate_status와 동일)"""
+        status = certificate_status_cache.get(self.client.corp_num, self.client.use_test_server)
+        if status is not None:
+            return status
+        try:
+            status = _build_certificate_status(await self.check_cert_is_valid())
+        except Exception as e:
+            return _build_certificate_status_error(e)
+        certificate_status_cache.set(self.client.corp_num, status, self.client.use_test_server)
+        return status
+
+    async def refresh_certificate_status(self) -> dict:
+        """캐시를 무시하고 인증서 등록 상태를 다시 조회해 캐시 갱신"""
+        certificate_status_cache.invalidate(self.client.corp_num, self.client.use_test_server)
+        return await self.get_cached_certificate_status()
+
+    async def get_certificate_regist_url(self, member_id: str, member_pwd: str) -> dict:
+        """
+        인증서 등록 URL 조회
+
+        Args:
+            member_id: 바로빌 회원사 아이디
+            member_pwd: 바로빌 회원사 비밀번호
+
+        Returns:
+            인증서 등록 URL 딕셔너리
+        """
+        result = await self.client.get_common_client().service.GetCertificateRegistURL(
+            CERTKEY=self.client.cert_key,
+            CorpNum=self.client.corp_num,
+            ID=member_id,
+            PWD=member_pwd,
+        )
+
+        if ERROR_CODE_PATTERN.match(str(result)) is None:
+            return _build_regist_url_success(result)
+
+        try:
+            error_code = int(result)
+            error_msg = await self.get_err_string(error_code)
+            return _build_regist_url_error(result, error_code, error_msg)
+        except Exception:
+            return _build_regist_url_error(result, None, None)
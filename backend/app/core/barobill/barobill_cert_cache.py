@@ -0,0 +1,112 @@
+"""
+바로빌 인증서 등록 상태 캐시
+
+세금계산서 발행 전 확인(CheckCERTIsValid)은 매 발행마다 바로빌을 한 번 더 호출하지만,
+인증서 등록 상태는 1년에 몇 번 바뀌지 않으므로 (서버, 사업자번호)별로 TTL 동안 보관합니다.
+
+- 유효한 인증서: BAROBILL_CERT_STATUS_TTL 동안 보관
+- 미등록/오류 코드 응답: BAROBILL_CERT_STATUS_NEGATIVE_TTL 동안 보관 (등록 직후 빨리 반영되도록 짧게)
+- 호출 자체가 실패한 경우(타임아웃 등)는 보관하지 않음
+- 인증서 상태 확인 API(/certificate/status, /barobill-members/certificate/check)가 명시적으로 무효화
+"""
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from prometheus_client import Counter
+from app.core.config import settings
+from app.core.barobill.barobill_registry import get_server_name
+
+CERT_STATUS_CACHE_LOOKUPS = Counter(
+    "barobill_cert_status_cache_total",
+    "인증서 등록 상태 캐시 조회 수",
+    ["result"],
+)
+
+
+def normalize_corp_num(corp_num: str) -> str:
+    """사업자번호에서 하이픈/공백 제거"""
+    return (corp_num or "").replace("-", "").strip()
+
+
+class CertificateStatusCache:
+    """(서버, 사업자번호)별 인증서 등록 상태를 TTL 동안 보관하는 스레드 안전 캐시"""
+
+    def __init__(self, ttl: float = 3600.0, negative_ttl: float = 60.0, max_entries: int = 10000):
+        """
+        Args:
+            ttl: 인증서가 유효한 상태의 보관 시간(초)
+            negative_ttl: 인증서 미등록/오류 상태의 보관 시간(초)
+            max_entries: 최대 보관 건수 (넘으면 만료된 항목부터 정리)
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[str, str], Tuple[float, dict]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(corp_num: str, use_test_server: bool = False) -> Tuple[str, str]:
+        return (get_server_name(use_test_server), normalize_corp_num(corp_num))
+
+    def get(self, corp_num: str, use_test_server: bool = False) -> Optional[dict]:
+        """
+        보관 중인 인증서 상태 조회
+
+        Returns:
+            인증서 상태 딕셔너리 사본 (없거나 만료되면 None)
+        """
+        key = self.make_key(corp_num, use_test_server)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            CERT_STATUS_CACHE_LOOKUPS.labels("miss").inc()
+            return None
+        CERT_STATUS_CACHE_LOOKUPS.labels("hit").inc()
+        return dict(entry[1])
+
+    def set(self, corp_num: str, status: dict, use_test_server: bool = False):
+        """인증서 상태 보관 (등록 여부에 따라 TTL 적용, TTL이 0 이하면 보관 안 함)"""
+        ttl = self.ttl if status.get("certificate_registered") else self.negative_ttl
+        if ttl <= 0:
+            return
+        key = self.make_key(corp_num, use_test_server)
+        now = time.monotonic()
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._prune(now)
+            self._entries[key] = (now + ttl, dict(status))
+
+    def invalidate(self, corp_num: str, use_test_server: Optional[bool] = None):
+        """
+        사업자번호의 인증서 상태 무효화
+
+        Args:
+            corp_num: 사업자번호
+            use_test_server: 무효화할 서버 (None이면 실전/테스트 서버 모두)
+        """
+        servers = (False, True) if use_test_server is None else (use_test_server,)
+        with self._lock:
+            for server in servers:
+                self._entries.pop(self.make_key(corp_num, server), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _prune(self, now: float):
+        """만료된 항목 제거 후에도 가득 차 있으면 만료가 가장 빠른 항목부터 제거"""
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        overflow = len(self._entries) - self.max_entries + 1
+        if overflow > 0:
+            oldest = sorted(self._entries, key=lambda key: self._entries[key][0])[:overflow]
+            for key in oldest:
+                del self._entries[key]
+
+
+# 프로세스 전역 인증서 상태 캐시
+certificate_status_cache = CertificateStatusCache(
+    ttl=settings.BAROBILL_CERT_STATUS_TTL,
+    negative_ttl=settings.BAROBILL_CERT_STATUS_NEGATIVE_TTL,
+    max_entries=settings.BAROBILL_CERT_STATUS_MAX_ENTRIES,
+)
@@ -1,12 +1,65 @@
 """
 바로빌 API 클라이언트 기본 클래스
 """
-from zeep import Client
+from zeep import AsyncClient, Client
 from typing import Optional
+from app.core.barobill.barobill_registry import (
+    client_registry,
+    SERVICE_TI,
+    SERVICE_CORPSTATE,
+    SERVICE_BANKACCOUNT,
+    SERVICE_CARD,
+    SERVICE_CASHBILL,
+    SERVICE_SMS,
+    SERVICE_KAKAOTALK,
+    SERVICE_FAX,
+    SERVICE_EDOC,
+)
+from app.core.barobill.barobill_errors import error_catalog
+
+
+class SoapService:
+    """
+    서비스별 SOAP 클라이언트 지연 생성 디스크립터
+
+    처음 접근할 때만 레지스트리에서 zeep 클라이언트를 가져와 인스턴스에 캐시합니다.
+    (인스턴스 __dict__에 저장되므로 이후 접근은 일반 속성 조회)
+    """
+
+    def __init__(self, service: str):
+        self.service = service
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        client = obj.get_client(self.service)
+        obj.__dict__[self.name] = client
+        return client
 
 
 class BaroBillClient:
-    """바로빌 API 클라이언트"""
+    """
+    바로빌 API 클라이언트
+
+    자격증명(인증키/사업자번호)만 보관하는 가벼운 뷰입니다.
+    실제 zeep 클라이언트는 프로세스 전역 레지스트리에서 공유하며,
+    각 서비스 클라이언트는 처음 사용할 때 생성됩니다.
+    """
+
+    # 서비스별 SOAP 클라이언트 (지연 생성)
+    client = SoapService(SERVICE_TI)  # 세금계산서 + 공통 API
+    corp_state_client = SoapService(SERVICE_CORPSTATE)
+    bank_account_client = SoapService(SERVICE_BANKACCOUNT)
+    card_client = SoapService(SERVICE_CARD)
+    cash_bill_client = SoapService(SERVICE_CASHBILL)
+    sms_client = SoapService(SERVICE_SMS)
+    kakaotalk_client = SoapService(SERVICE_KAKAOTALK)
+    fax_client = SoapService(SERVICE_FAX)
+    edoc_client = SoapService(SERVICE_EDOC)
 
     def __init__(self, cert_key: str, corp_num: str, use_test_server: bool = False):
         """
@@ -21,30 +74,55 @@ class BaroBillClient:
         self.corp_num = corp_num
         self.use_test_server = use_test_server
 
-        # WSDL URL 설정
-        if use_test_server:
-            wsdl_url = "https://testws.baroservice.com/TI.asmx?WSDL"
-            corp_state_wsdl_url = "https://testws.baroservice.com/CORPSTATE.asmx?WSDL"
-        else:
-            wsdl_url = "https://ws.baroservice.com/TI.asmx?WSDL"
-            corp_state_wsdl_url = "https://ws.baroservice.com/CORPSTATE.asmx?WSDL"
+    def get_client(self, service: str) -> Client:
+        """
+        서비스 이름으로 SOAP 클라이언트 반환 (레지스트리에서 공유)
 
-        # SOAP 클라이언트 생성
-        self.client = Client(wsdl_url)
-        self.corp_state_client = Client(corp_state_wsdl_url)
+        Args:
+            service: 서비스 이름 (예: TI, CORPSTATE)
+        """
+        return client_registry.get_client(service, self.use_test_server)
 
-    def get_common_client(self):
+    def get_common_client(self) -> Client:
         """공통 API 클라이언트 반환"""
         return self.client
 
-    def get_tax_invoice_client(self):
+    def get_tax_invoice_client(self) -> Client:
         """세금계산서 API 클라이언트 반환"""
         return self.client
 
-    def get_corp_state_client(self):
+    def get_corp_state_client(self) -> Client:
         """사업자 상태 조회 API 클라이언트 반환"""
         return self.corp_state_client
 
+    def get_bank_account_client(self) -> Client:
+        """계좌조회 API 클라이언트 반환"""
+        return self.bank_account_client
+
+    def get_card_client(self) -> Client:
+        """카드조회 API 클라이언트 반환"""
+        return self.card_client
+
+    def get_cash_bill_client(self) -> Client:
+        """현금영수증 API 클라이언트 반환"""
+        return self.cash_bill_client
+
+    def get_sms_client(self) -> Client:
+        """문자전송 API 클라이언트 반환"""
+        return self.sms_client
+
+    def get_kakaotalk_client(self) -> Client:
+        """카카오톡전송 API 클라이언트 반환"""
+        return self.kakaotalk_client
+
+    def get_fax_client(self) -> Client:
+        """팩스전송 API 클라이언트 반환"""
+        return self.fax_client
+
+    def get_edoc_client(self) -> Client:
+        """전자문서 API 클라이언트 반환"""
+        return self.edoc_client
+
 
 class BaroBillService:
     """바로빌 서비스 기본 클래스"""
@@ -56,12 +134,18 @@ class BaroBillService:
         """
         오류 코드에 대한 오류 메시지 조회
 
+        프로세스 전역 카탈로그에 있으면 SOAP 호출 없이 반환합니다.
+
         Args:
             err_code: 오류 코드
 
         Returns:
             오류 메시지
         """
+        return error_catalog.lookup(err_code, self.fetch_err_string)
+
+    def fetch_err_string(self, err_code: int) -> str:
+        """카탈로그를 거치지 않고 GetErrString으로 오류 메시지 조회"""
         try:
             result = self.client.get_common_client().service.GetErrString(
                 CERTKEY=self.client.cert_key,
@@ -71,3 +155,42 @@ class BaroBillService:
         except Exception as e:
             raise
 
+
+class AsyncBaroBillClient(BaroBillClient):
+    """
+    바로빌 비동기 API 클라이언트
+
+    동기 클라이언트와 같은 서비스 속성/조회 메서드를 제공하며,
+    각 속성은 레지스트리의 zeep AsyncClient를 반환합니다.
+    """
+
+    def get_client(self, service: str) -> AsyncClient:
+        """서비스 이름으로 비동기 SOAP 클라이언트 반환 (레지스트리에서 공유)"""
+        return client_registry.get_async_client(service, self.use_test_server)
+
+
+class AsyncBaroBillService:
+    """바로빌 비동기 서비스 기본 클래스"""
+
+    def __init__(self, cert_key: str, corp_num: str, use_test_server: bool = False):
+        self.client = AsyncBaroBillClient(cert_key, corp_num, use_test_server)
+
+    async def get_err_string(self, err_code: int) -> str:
+        """
+        오류 코드에 대한 오류 메시지 조회
+
+        Args:
+            err_code: 오류 코드
+
+        Returns:
+            오류 메시지
+        """
+        message = error_catalog.get(err_code)
+        if message is not None:
+            return message
+        message = await self.client.get_common_client().service.GetErrString(
+            CERTKEY=self.client.cert_key,
+            ErrCode=err_code,
+        )
+        error_catalog.set(err_code, message)
+        return message
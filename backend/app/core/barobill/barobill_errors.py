@@ -0,0 +1,178 @@
+"""
+바로빌 오류 메시지 카탈로그
+
+실패 응답마다 GetErrString SOAP 호출을 한 번 더 하면 바로빌이 느릴 때 지연이 두 배가 되므로,
+오류 코드 -> 메시지를 프로세스 전역 딕셔너리에 보관하고 조회는 딕셔너리 조회로 처리합니다.
+
+- 테이블에 없는 코드는 한 번만 GetErrString으로 조회한 뒤 메모이즈
+- 오류 코드 테이블(error_codes.json)에 코드가 있으면 처음 조회할 때 함께 적재
+- 백그라운드 스레드가 알려진 코드의 메시지를 주기적으로 다시 받아 갱신
+
+패키지에는 빈 테이블만 포함되어 있으므로, 첫 실패 응답부터 GetErrString을 생략하려면
+바로빌 인증키가 있는 환경에서 테이블을 생성해 배포합니다.
+
+테이블 생성/갱신: python utils/refresh_barobill_error_codes.py -10002 -32000 ... (코드 목록 지정)
+"""
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 패키지에 포함된 오류 코드 테이블 (기본은 빈 테이블)
+DEFAULT_ERROR_CODES_PATH = Path(__file__).resolve().parent / "error_codes.json"
+
+
+class BaroBillErrorCatalog:
+    """오류 코드별 메시지를 메모이즈하는 스레드 안전 카탈로그"""
+
+    def __init__(self, path: Optional[str] = None, preload: bool = True):
+        """
+        Args:
+            path: 오류 코드 테이블 경로 (없으면 패키지 기본 경로)
+            preload: 처음 조회할 때 테이블을 미리 적재할지 여부
+        """
+        self.path = Path(path) if path else DEFAULT_ERROR_CODES_PATH
+        self.preload = preload
+        self._messages: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._stop_event = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def _ensure_loaded(self):
+        """테이블을 아직 적재하지 않았다면 적재 (preload가 꺼져 있으면 생략)"""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if self.preload:
+                self._messages.update(self._read_table())
+
+    def _read_table(self) -> Dict[int, str]:
+        """오류 코드 테이블 파일 읽기 (파일이 없거나 깨졌으면 빈 딕셔너리)"""
+        if not self.path.is_file():
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return {int(code): message for code, message in data.get("codes", {}).items()}
+        except Exception as e:
+            logger.warning(f"바로빌 오류 코드 테이블 로딩 실패: {str(e)}")
+            return {}
+
+    def get(self, err_code: int) -> Optional[str]:
+        """메모이즈된 오류 메시지 조회 (없으면 None)"""
+        self._ensure_loaded()
+        return self._messages.get(int(err_code))
+
+    def set(self, err_code: int, message: Optional[str]):
+        """오류 메시지 저장 (빈 메시지는 저장하지 않음)"""
+        if not message:
+            return
+        self._ensure_loaded()
+        with self._lock:
+            self._messages[int(err_code)] = message
+
+    def codes(self) -> Iterable[int]:
+        """카탈로그에 있는 오류 코드 목록"""
+        self._ensure_loaded()
+        return sorted(self._messages)
+
+    def lookup(self, err_code: int, fetch: Callable[[int], str]) -> str:
+        """
+        오류 메시지 조회 (없으면 fetch로 한 번 조회해 메모이즈)
+
+        Args:
+            err_code: 오류 코드
+            fetch: 오류 코드 -> 메시지 조회 함수 (GetErrString 호출)
+
+        Returns:
+            오류 메시지
+        """
+        message = self.get(err_code)
+        if message is not None:
+            return message
+        message = fetch(err_code)
+        self.set(err_code, message)
+        return message
+
+    def refresh(self, fetch: Callable[[int], str]) -> int:
+        """
+        알려진 모든 코드의 메시지를 다시 조회해 갱신
+
+        개별 코드 조회가 실패하면 기존 메시지를 그대로 유지합니다.
+
+        Returns:
+            갱신된 코드 개수
+        """
+        refreshed = 0
+        for err_code in self.codes():
+            if self._stop_event.is_set():
+                break
+            try:
+                self.set(err_code, fetch(err_code))
+                refreshed += 1
+            except Exception as e:
+                logger.warning(f"바로빌 오류 메시지 갱신 실패 (코드: {err_code}): {str(e)}")
+        return refreshed
+
+    def save(self, path: Optional[str] = None):
+        """현재 카탈로그를 오류 코드 테이블 파일로 저장"""
+        target = Path(path) if path else self.path
+        with self._lock:
+            codes = {str(code): message for code, message in sorted(self._messages.items())}
+        data = {
+            "fetched_at": datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ"),
+            "codes": codes,
+        }
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+    def start_background_refresh(self, fetch: Callable[[int], str], interval: int):
+        """
+        주기적으로 카탈로그를 갱신하는 데몬 스레드 시작
+
+        Args:
+            fetch: 오류 코드 -> 메시지 조회 함수
+            interval: 갱신 주기(초)
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._stop_event.clear()
+
+        def run():
+            while not self._stop_event.wait(interval):
+                refreshed = self.refresh(fetch)
+                logger.info(f"바로빌 오류 메시지 카탈로그 갱신: {refreshed}개")
+
+        self._refresh_thread = threading.Thread(
+            target=run, name="barobill-error-catalog", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def stop_background_refresh(self):
+        """백그라운드 갱신 스레드 종료"""
+        self._stop_event.set()
+        self._refresh_thread = None
+
+    def clear(self):
+        """메모이즈된 메시지 제거 (다음 조회 시 테이블부터 다시 적재)"""
+        with self._lock:
+            self._messages.clear()
+            self._loaded = False
+
+
+# 프로세스 전역 카탈로그
+error_catalog = BaroBillErrorCatalog(
+    path=settings.BAROBILL_ERROR_CODES_PATH,
+    preload=settings.BAROBILL_ERROR_CODES_PRELOAD,
+)
@@ -0,0 +1,181 @@
+"""
+바로빌 SOAP 오퍼레이션 지표 (Prometheus)
+
+레지스트리가 만드는 zeep 클라이언트의 service 프록시를 감싸서
+BaroBillClient를 거치는 모든 SOAP 호출의 지연 시간, 음수 결과 코드, 예외, 동시 진행 수를 기록합니다.
+지표는 /metrics 엔드포인트에서 Prometheus 텍스트 형식으로 노출됩니다. (METRICS_ENABLED로 켜고 METRICS_TOKEN Bearer 토큰으로 보호)
+"""
+import time
+from typing import Any, Optional
+from prometheus_client import Counter, Gauge, Histogram
+from zeep import AsyncClient, Client
+
+# 바로빌 호출은 수십 ms ~ 수십 초까지 분포하므로 기본 버킷보다 넓게 설정
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+SOAP_LATENCY = Histogram(
+    "barobill_soap_request_duration_seconds",
+    "바로빌 SOAP 오퍼레이션 응답 시간",
+    ["service", "operation"],
+    buckets=LATENCY_BUCKETS,
+)
+SOAP_RESULT_CODES = Counter(
+    "barobill_soap_result_code_total",
+    "바로빌 SOAP 오퍼레이션 음수 결과 코드 수",
+    ["service", "operation", "code"],
+)
+SOAP_ERRORS = Counter(
+    "barobill_soap_errors_total",
+    "바로빌 SOAP 오퍼레이션 예외 수 (타임아웃, SOAP Fault, 서킷 열림 등)",
+    ["service", "operation", "error"],
+)
+SOAP_IN_FLIGHT = Gauge(
+    "barobill_soap_in_flight",
+    "진행 중인 바로빌 SOAP 오퍼레이션 수",
+    ["service", "operation"],
+)
+
+# 결과 객체에서 오류 코드를 담는 필드 (음수면 호출 실패)
+RESULT_CODE_FIELDS = ("State", "BarobillState", "TaxInvoiceType")
+
+
+def get_result_code(result: Any) -> Optional[int]:
+    """
+    SOAP 결과에서 음수 결과 코드 추출 (성공이면 None)
+
+    정수 결과(RegistTaxInvoiceEX 등), 오류 코드 문자열(GetCertificateRegistURL),
+    State/BarobillState/TaxInvoiceType 필드를 가진 객체(단건 또는 오류 1건짜리 목록)를 처리합니다.
+    """
+    if isinstance(result, list):
+        if len(result) != 1:
+            return None
+        result = result[0]
+    if isinstance(result, bool):
+        return None
+    if isinstance(result, int):
+        return result if result < 0 else None
+    if isinstance(result, str):
+        if result.startswith("-") and result[1:].isdigit():
+            return int(result)
+        return None
+    for field in RESULT_CODE_FIELDS:
+        try:
+            value = getattr(result, field)
+        except AttributeError:
+            continue
+        if isinstance(value, int) and value < 0:
+            return value
+    return None
+
+
+def _record_result(service: str, operation: str, result: Any):
+    code = get_result_code(result)
+    if code is not None:
+        SOAP_RESULT_CODES.labels(service, operation, str(code)).inc()
+
+
+class InstrumentedOperation:
+    """SOAP 오퍼레이션 호출을 감싸 지표를 기록 (동기)"""
+
+    def __init__(self, service: str, operation: str, proxy):
+        self.service = service
+        self.operation = operation
+        self.proxy = proxy
+        self.latency = SOAP_LATENCY.labels(service, operation)
+        self.in_flight = SOAP_IN_FLIGHT.labels(service, operation)
+
+    def __call__(self, *args, **kwargs):
+        self.in_flight.inc()
+        started = time.perf_counter()
+        try:
+            result = self.proxy(*args, **kwargs)
+        except Exception as e:
+            SOAP_ERRORS.labels(self.service, self.operation, type(e).__name__).inc()
+            raise
+        finally:
+            self.latency.observe(time.perf_counter() - started)
+            self.in_flight.dec()
+        _record_result(self.service, self.operation, result)
+        return result
+
+
+class AsyncInstrumentedOperation(InstrumentedOperation):
+    """SOAP 오퍼레이션 호출을 감싸 지표를 기록 (비동기)"""
+
+    async def __call__(self, *args, **kwargs):
+        self.in_flight.inc()
+        started = time.perf_counter()
+        try:
+            result = await self.proxy(*args, **kwargs)
+        except Exception as e:
+            SOAP_ERRORS.labels(self.service, self.operation, type(e).__name__).inc()
+            raise
+        finally:
+            self.latency.observe(time.perf_counter() - started)
+            self.in_flight.dec()
+        _record_result(self.service, self.operation, result)
+        return result
+
+
+class InstrumentedServiceProxy:
+    """
+    zeep ServiceProxy 래퍼 (오퍼레이션별 래퍼는 처음 접근 시 만들어 캐시)
+
+    single_flight가 있으면 병합 대상 오퍼레이션의 동일 동시 호출을 하나로 합칩니다.
+    병합은 지표 기록 바깥에서 일어나므로 지표에는 실제로 전송한 호출만 집계됩니다.
+    """
+
+    operation_class = InstrumentedOperation
+
+    def __init__(self, proxy, service: str, single_flight=None):
+        self._proxy = proxy
+        self._service = service
+        self._single_flight = single_flight
+
+    def __getattr__(self, name: str):
+        operation = self.operation_class(self._service, name, getattr(self._proxy, name))
+        if self._single_flight is not None:
+            operation = self._single_flight.wrap(self._service, name, operation)
+        self.__dict__[name] = operation
+        return operation
+
+    def __getitem__(self, name: str):
+        return getattr(self, name)
+
+
+class AsyncInstrumentedServiceProxy(InstrumentedServiceProxy):
+    operation_class = AsyncInstrumentedOperation
+
+
+class BaroBillSoapClient(Client):
+    """service 호출마다 지표를 기록하는 zeep Client"""
+
+    service_proxy_class = InstrumentedServiceProxy
+
+    def __init__(self, *args, service_name: str, single_flight=None, **kwargs):
+        self.service_name = service_name
+        self.single_flight = single_flight
+        super().__init__(*args, **kwargs)
+
+    def bind(self, service_name=None, port_name=None):
+        proxy = super().bind(service_name=service_name, port_name=port_name)
+        if proxy is None:
+            return proxy
+        return self.service_proxy_class(proxy, self.service_name, self.single_flight)
+
+
+class BaroBillAsyncSoapClient(AsyncClient):
+    """service 호출마다 지표를 기록하는 zeep AsyncClient"""
+
+    service_proxy_class = AsyncInstrumentedServiceProxy
+
+    def __init__(self, *args, service_name: str, single_flight=None, **kwargs):
+        self.service_name = service_name
+        self.single_flight = single_flight
+        super().__init__(*args, **kwargs)
+
+    def bind(self, service_name=None, port_name=None):
+        proxy = super().bind(service_name=service_name, port_name=port_name)
+        if proxy is None:
+            return proxy
+        return self.service_proxy_class(proxy, self.service_name, self.single_flight)
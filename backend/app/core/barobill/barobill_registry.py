@@ -0,0 +1,360 @@
+"""
+바로빌 SOAP 클라이언트 레지스트리
+
+WSDL 다운로드/파싱은 요청마다 수백 ms가 걸리므로, (서버, 서비스) 조합별
+zeep 클라이언트를 프로세스당 한 번만 생성하고 모든 요청에서 공유합니다.
+인증키/사업자번호는 호출 인자로만 전달되므로 클라이언트는 자격증명과 무관합니다.
+
+WSDL은 로컬 스냅샷(barobill_wsdl)을 우선 사용하고, 원격에서 받은 문서는
+SqliteCache로 디스크에 캐시하여 콜드 스타트 지연을 줄입니다.
+모든 클라이언트는 커넥션 풀과 타임아웃이 설정된 하나의 전송 계층을 공유하며,
+오퍼레이션별 서킷 브레이커 상태도 동기/비동기 전송 계층이 함께 사용합니다.
+클라이언트의 service 프록시는 오퍼레이션별 지표(barobill_metrics)를 기록하고,
+멱등 조회의 동일 동시 호출은 하나로 병합(barobill_singleflight)합니다.
+"""
+import asyncio
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from zeep import AsyncClient, Client
+from zeep.cache import SqliteCache
+from app.core.config import settings
+from app.core.barobill.barobill_resilience import (
+    AsyncBulkhead,
+    BaroBillResilience,
+    Bulkhead,
+)
+from app.core.barobill.barobill_transport import (
+    BaroBillAsyncTransport,
+    BaroBillTransport,
+)
+from app.core.barobill.barobill_metrics import BaroBillAsyncSoapClient, BaroBillSoapClient
+from app.core.barobill.barobill_serializer import clear_layout_cache
+from app.core.barobill.barobill_singleflight import AsyncSingleFlight, SingleFlight
+from app.core.barobill.barobill_wsdl import find_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+# 바로빌 서버 주소
+BAROBILL_PRODUCTION_HOST = "https://ws.baroservice.com"
+BAROBILL_TEST_HOST = "https://testws.baroservice.com"
+
+# 서비스 이름
+SERVICE_TI = "TI"  # 세금계산서 + 공통 API
+SERVICE_CORPSTATE = "CORPSTATE"  # 사업자등록상태조회
+SERVICE_BANKACCOUNT = "BANKACCOUNT"  # 계좌조회
+SERVICE_CARD = "CARD"  # 카드조회
+SERVICE_CASHBILL = "CASHBILL"  # 현금영수증
+SERVICE_SMS = "SMS"  # 문자전송
+SERVICE_KAKAOTALK = "KAKAOTALK"  # 카카오톡전송
+SERVICE_FAX = "FAX"  # 팩스전송
+SERVICE_EDOC = "EDOC"  # 전자문서
+
+# barobill/ 샘플에서 사용하는 전체 서비스 목록 (WSDL 스냅샷 갱신 대상)
+BAROBILL_SERVICES = (
+    SERVICE_TI,
+    SERVICE_CORPSTATE,
+    SERVICE_BANKACCOUNT,
+    SERVICE_CARD,
+    SERVICE_CASHBILL,
+    SERVICE_SMS,
+    SERVICE_KAKAOTALK,
+    SERVICE_FAX,
+    SERVICE_EDOC,
+)
+BAROBILL_SERVERS = ("production", "test")
+
+
+def get_server_name(use_test_server: bool) -> str:
+    """레지스트리 키로 사용할 서버 이름 반환 (test / production)"""
+    return "test" if use_test_server else "production"
+
+
+def get_wsdl_url(service: str, use_test_server: bool = False) -> str:
+    """
+    서비스별 WSDL URL 반환
+
+    BAROBILL_STUB_URL이 설정되어 있으면 서버 구분 없이 스텁 서버 주소를 사용합니다.
+
+    Args:
+        service: 서비스 이름 (예: TI, CORPSTATE)
+        use_test_server: 테스트 서버 사용 여부
+
+    Returns:
+        WSDL URL
+    """
+    if settings.BAROBILL_STUB_URL:
+        return f"{settings.BAROBILL_STUB_URL.rstrip('/')}/{service}.asmx?WSDL"
+    return get_barobill_wsdl_url(service, use_test_server)
+
+
+def get_barobill_wsdl_url(service: str, use_test_server: bool = False) -> str:
+    """실제 바로빌 서버의 WSDL URL 반환 (BAROBILL_STUB_URL 무시, 스냅샷 갱신용)"""
+    host = BAROBILL_TEST_HOST if use_test_server else BAROBILL_PRODUCTION_HOST
+    return f"{host}/{service}.asmx?WSDL"
+
+
+def get_wsdl_location(service: str, use_test_server: bool = False) -> str:
+    """
+    zeep에 전달할 WSDL 위치 반환
+
+    BAROBILL_WSDL_OFFLINE이 켜져 있고 로컬 스냅샷이 있으면 파일 경로를,
+    없으면 원격 WSDL URL을 반환합니다.
+    스텁 서버(BAROBILL_STUB_URL)를 사용할 때는 스텁이 제공하는 WSDL을 사용합니다.
+    """
+    if settings.BAROBILL_WSDL_OFFLINE and not settings.BAROBILL_STUB_URL:
+        snapshot = find_snapshot(
+            service, get_server_name(use_test_server), settings.BAROBILL_WSDL_DIR
+        )
+        if snapshot:
+            return snapshot
+    return get_wsdl_url(service, use_test_server)
+
+
+def get_cache_dir() -> Path:
+    """바로빌 디스크 캐시 디렉토리 반환 (BAROBILL_CACHE_DIR, 없으면 $XDG_CACHE_HOME 또는 ~/.cache 아래 barobill)"""
+    if settings.BAROBILL_CACHE_DIR:
+        return Path(settings.BAROBILL_CACHE_DIR)
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "barobill"
+
+
+def get_wsdl_cache() -> Optional[SqliteCache]:
+    """
+    원격 WSDL/XSD 문서용 디스크 캐시 반환
+
+    BAROBILL_WSDL_CACHE_PATH가 비어 있으면 BAROBILL_CACHE_DIR/wsdl-cache.db를 사용합니다.
+    임시 디렉토리와 달리 재시작 후에도 남아 있어야 하므로 컨테이너에서는 볼륨 경로를 지정합니다.
+    캐시 파일을 만들 수 없는 환경에서는 캐시 없이 동작합니다.
+    스텁 서버는 로컬에서 WSDL을 바로 만들어 주고 버전에 따라 오퍼레이션이 바뀌므로 캐시하지 않습니다.
+    """
+    if not settings.BAROBILL_WSDL_CACHE_ENABLED or settings.BAROBILL_STUB_URL:
+        return None
+    path = Path(settings.BAROBILL_WSDL_CACHE_PATH or get_cache_dir() / "wsdl-cache.db")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return SqliteCache(path=str(path), timeout=settings.BAROBILL_WSDL_CACHE_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"바로빌 WSDL 캐시 생성 실패 (캐시 없이 진행): {str(e)}")
+        return None
+
+
+def create_resilience() -> BaroBillResilience:
+    """설정값으로 서킷 브레이커/재시도/벌크헤드 생성"""
+    return BaroBillResilience(
+        failure_threshold=settings.BAROBILL_CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout=settings.BAROBILL_CIRCUIT_RECOVERY_TIMEOUT,
+        retry_operations=settings.BAROBILL_RETRY_OPERATIONS,
+        retry_max_attempts=settings.BAROBILL_RETRY_MAX_ATTEMPTS,
+        retry_base_delay=settings.BAROBILL_RETRY_BASE_DELAY,
+        retry_max_delay=settings.BAROBILL_RETRY_MAX_DELAY,
+        retry_budget_ratio=settings.BAROBILL_RETRY_BUDGET_RATIO,
+        bulkhead=Bulkhead(
+            max_concurrent=settings.BAROBILL_BULKHEAD_MAX_CONCURRENT,
+            wait_timeout=settings.BAROBILL_BULKHEAD_WAIT_TIMEOUT,
+        ),
+        async_bulkhead=AsyncBulkhead(
+            max_concurrent=settings.BAROBILL_ASYNC_MAX_CONNECTIONS,
+            wait_timeout=settings.BAROBILL_BULKHEAD_WAIT_TIMEOUT,
+        ),
+    )
+
+
+def create_transport(resilience: Optional[BaroBillResilience] = None) -> BaroBillTransport:
+    """설정값(커넥션 풀, 타임아웃)으로 바로빌 전송 계층 생성"""
+    return BaroBillTransport(
+        cache=get_wsdl_cache(),
+        wsdl_timeout=settings.BAROBILL_WSDL_TIMEOUT,
+        connect_timeout=settings.BAROBILL_CONNECT_TIMEOUT,
+        read_timeout=settings.BAROBILL_READ_TIMEOUT,
+        operation_timeouts=settings.BAROBILL_OPERATION_TIMEOUTS,
+        pool_connections=settings.BAROBILL_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=settings.BAROBILL_HTTP_POOL_MAXSIZE,
+        pool_block=settings.BAROBILL_HTTP_POOL_BLOCK,
+        resilience=resilience,
+    )
+
+
+def create_async_transport(
+    resilience: Optional[BaroBillResilience] = None,
+) -> BaroBillAsyncTransport:
+    """설정값(동시 연결 수, 타임아웃)으로 비동기 전송 계층 생성"""
+    return BaroBillAsyncTransport(
+        cache=get_wsdl_cache(),
+        wsdl_timeout=settings.BAROBILL_WSDL_TIMEOUT,
+        connect_timeout=settings.BAROBILL_CONNECT_TIMEOUT,
+        read_timeout=settings.BAROBILL_READ_TIMEOUT,
+        operation_timeouts=settings.BAROBILL_OPERATION_TIMEOUTS,
+        max_connections=settings.BAROBILL_ASYNC_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.BAROBILL_HTTP_POOL_MAXSIZE,
+        resilience=resilience,
+    )
+
+
+# clear()에서 예약한 비동기 전송 계층 종료 태스크 (완료 전에 GC되지 않도록 참조 유지)
+_closing_tasks = set()
+
+
+def _close_async_transport(async_transport: BaroBillAsyncTransport):
+    """
+    동기 코드에서 비동기 전송 계층 연결 종료
+
+    실행 중인 이벤트 루프가 있으면 aclose()를 태스크로 예약하고, 없으면 바로 실행합니다.
+    """
+    async_transport.wsdl_client.close()
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is not None:
+        task = loop.create_task(async_transport.aclose())
+        _closing_tasks.add(task)
+        task.add_done_callback(_closing_tasks.discard)
+        return
+    try:
+        asyncio.run(async_transport.aclose())
+    except Exception as e:
+        logger.warning(f"바로빌 비동기 전송 계층 종료 실패: {str(e)}")
+
+
+class BaroBillClientRegistry:
+    """(서버, 서비스)별 zeep 클라이언트를 한 번만 생성해 공유하는 스레드 안전 레지스트리"""
+
+    def __init__(self):
+        self._clients: Dict[Tuple[str, str], Client] = {}
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._transport: Optional[BaroBillTransport] = None
+        self._async_clients: Dict[Tuple[str, str], AsyncClient] = {}
+        self._async_transport: Optional[BaroBillAsyncTransport] = None
+        self._resilience: Optional[BaroBillResilience] = None
+        # 동일 조회 병합 그룹 (동기/비동기 호출은 각각 따로 병합)
+        self.single_flight = SingleFlight(settings.BAROBILL_COALESCE_OPERATIONS)
+        self.async_single_flight = AsyncSingleFlight(settings.BAROBILL_COALESCE_OPERATIONS)
+
+    def get_client(self, service: str, use_test_server: bool = False) -> Client:
+        """
+        공유 zeep 클라이언트 조회 (없으면 생성)
+
+        서로 다른 서비스의 WSDL 파싱이 서로를 막지 않도록 키별 잠금을 사용합니다.
+
+        Args:
+            service: 서비스 이름 (예: TI, CORPSTATE)
+            use_test_server: 테스트 서버 사용 여부
+
+        Returns:
+            zeep 클라이언트
+        """
+        key = (get_server_name(use_test_server), service)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._create_client(service, use_test_server)
+                self._clients[key] = client
+        return client
+
+    def get_async_client(
+        self, service: str, use_test_server: bool = False
+    ) -> AsyncClient:
+        """
+        공유 비동기 zeep 클라이언트 조회 (없으면 생성)
+
+        WSDL은 동기 클라이언트가 파싱한 문서를 그대로 재사용하므로 추가 파싱 비용이 없습니다.
+
+        Args:
+            service: 서비스 이름 (예: TI, CORPSTATE)
+            use_test_server: 테스트 서버 사용 여부
+
+        Returns:
+            zeep AsyncClient
+        """
+        key = (get_server_name(use_test_server), service)
+        client = self._async_clients.get(key)
+        if client is not None:
+            return client
+
+        wsdl = self.get_client(service, use_test_server).wsdl
+        transport = self.get_async_transport()
+        with self._lock:
+            client = self._async_clients.get(key)
+            if client is None:
+                client = BaroBillAsyncSoapClient(
+                    wsdl,
+                    transport=transport,
+                    service_name=service,
+                    single_flight=self.async_single_flight,
+                )
+                self._async_clients[key] = client
+        return client
+
+    def get_async_transport(self) -> BaroBillAsyncTransport:
+        """비동기 전송 계층(httpx 커넥션 풀)도 레지스트리당 하나만 생성해 공유"""
+        if self._async_transport is None:
+            with self._lock:
+                if self._async_transport is None:
+                    self._async_transport = create_async_transport(
+                        self.get_resilience()
+                    )
+        return self._async_transport
+
+    def get_transport(self) -> BaroBillTransport:
+        """전송 계층(커넥션 풀, 디스크 캐시)은 레지스트리당 하나만 생성해 모든 클라이언트가 공유"""
+        if self._transport is None:
+            with self._lock:
+                if self._transport is None:
+                    self._transport = create_transport(self.get_resilience())
+        return self._transport
+
+    def get_resilience(self) -> BaroBillResilience:
+        """서킷 브레이커/재시도 예산은 동기/비동기 전송 계층이 공유"""
+        if self._resilience is None:
+            self._resilience = create_resilience()
+        return self._resilience
+
+    def _create_client(self, service: str, use_test_server: bool) -> Client:
+        """WSDL(로컬 스냅샷 우선)을 파싱해 zeep 클라이언트 생성"""
+        wsdl = get_wsdl_location(service, use_test_server)
+        logger.info(f"바로빌 SOAP 클라이언트 생성: {service} ({wsdl})")
+        return BaroBillSoapClient(
+            wsdl,
+            transport=self.get_transport(),
+            service_name=service,
+            single_flight=self.single_flight,
+        )
+
+    def clear(self):
+        """캐시된 클라이언트와 전송 계층 모두 제거하고 연결 종료 (다음 호출 시 다시 생성)"""
+        with self._lock:
+            self._clients.clear()
+            self._locks.clear()
+            self._async_clients.clear()
+            transport, self._transport = self._transport, None
+            async_transport, self._async_transport = self._async_transport, None
+            self._resilience = None
+        clear_layout_cache()
+        if transport is not None:
+            transport.session.close()
+        if async_transport is not None:
+            _close_async_transport(async_transport)
+
+    async def aclose(self):
+        """비동기 전송 계층 연결 종료 (앱 종료 시 호출)"""
+        with self._lock:
+            async_transport, self._async_transport = self._async_transport, None
+            self._async_clients.clear()
+        if async_transport is not None:
+            async_transport.wsdl_client.close()
+            await async_transport.aclose()
+
+
+# 프로세스 전역 레지스트리
+client_registry = BaroBillClientRegistry()
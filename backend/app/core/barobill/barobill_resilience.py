@@ -0,0 +1,342 @@
+"""
+바로빌 호출 장애 격리 (서킷 브레이커 / 재시도 예산 / 벌크헤드)
+
+바로빌이 느리거나 장애일 때도 모든 요청이 타임아웃까지 기다리면 워커 스레드가 고갈되어
+/auth/me, /clients 같은 DB 전용 엔드포인트까지 함께 멈춥니다.
+
+- 서킷 브레이커: 오퍼레이션별로 연속 실패가 임계치를 넘으면 일정 시간 즉시 실패 처리
+- 재시도: 멱등 조회 오퍼레이션만 지터 백오프로 재시도하며, 전체 재시도 횟수는 예산으로 제한
+- 벌크헤드: 동시에 진행 중인 바로빌 호출 수를 제한하고 초과 요청은 빠르게 거절
+
+전송 계층(BaroBillTransport / BaroBillAsyncTransport)이 모든 SOAP 호출을 이 계층을 통해 보냅니다.
+"""
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Iterable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 바로빌 서버/게이트웨이 장애로 보는 HTTP 상태 코드
+# (500은 잘못된 입력에 대한 SOAP Fault도 포함하므로 실패로 세지 않음)
+UNAVAILABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+# 서킷 브레이커 상태
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class BaroBillUnavailableError(Exception):
+    """바로빌 호출을 보내지 않고 즉시 거절한 경우 (서킷 열림, 벌크헤드 포화)"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(BaroBillUnavailableError):
+    """서킷이 열려 있어 호출을 거절"""
+
+
+class BulkheadFullError(BaroBillUnavailableError):
+    """동시 호출 한도를 넘어 호출을 거절"""
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커"""
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Args:
+            name: 오퍼레이션 이름
+            failure_threshold: 서킷을 여는 연속 실패 횟수
+            recovery_timeout: 서킷이 열린 뒤 시험 호출을 허용하기까지 대기 시간(초)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """
+        호출 전 확인 (열려 있으면 CircuitOpenError, 복구 대기 시간이 지나면 시험 호출 1건 허용)
+
+        시험 호출이 결과를 남기지 못한 채 recovery_timeout이 지나면 새 시험 호출을 허용합니다.
+        """
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return
+            now = time.monotonic()
+            elapsed = now - self.opened_at
+            if elapsed >= self.recovery_timeout:
+                # OPEN: 복구 대기 완료, HALF_OPEN: 이전 시험 호출 시각 기준으로 다시 대기 완료
+                self.state = STATE_HALF_OPEN
+                self.opened_at = now
+                return
+            retry_after = self.recovery_timeout - elapsed
+        raise CircuitOpenError(
+            f"바로빌 {self.name} 호출이 일시 중단되었습니다. 잠시 후 다시 시도해주세요.",
+            retry_after=retry_after,
+        )
+
+    def record_success(self):
+        """호출 성공 기록 (서킷 닫음)"""
+        with self._lock:
+            self.state = STATE_CLOSED
+            self.failures = 0
+
+    def record_aborted(self):
+        """호출이 결과 없이 중단된 경우 (취소 등, 시험 호출이었으면 서킷을 다시 열어 다음 시험 호출 허용)"""
+        with self._lock:
+            if self.state == STATE_HALF_OPEN:
+                self.state = STATE_OPEN
+                self.opened_at = time.monotonic()
+
+    def record_failure(self):
+        """호출 실패 기록 (임계치를 넘거나 시험 호출이 실패하면 서킷 열림)"""
+        with self._lock:
+            self.failures += 1
+            if self.state == STATE_HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != STATE_OPEN:
+                    logger.warning(f"바로빌 서킷 열림: {self.name} (연속 실패 {self.failures}회)")
+                self.state = STATE_OPEN
+                self.opened_at = time.monotonic()
+
+
+class RetryBudget:
+    """
+    재시도 예산 (토큰 버킷)
+
+    요청마다 ratio만큼 토큰이 쌓이고 재시도 1회마다 토큰 1개를 사용하므로,
+    장애 중에도 재시도가 전체 요청량의 ratio 비율을 넘지 않습니다.
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        """요청 1건 기록"""
+        with self._lock:
+            self.tokens = min(self.tokens + self.ratio, self.max_tokens)
+
+    def withdraw(self) -> bool:
+        """재시도 1회 사용 (예산이 없으면 False)"""
+        with self._lock:
+            if self.tokens < 1.0:
+                return False
+            self.tokens -= 1.0
+            return True
+
+
+class Bulkhead:
+    """동시 바로빌 호출 수 제한 (동기 호출용)"""
+
+    def __init__(self, max_concurrent: int = 16, wait_timeout: float = 1.0):
+        """
+        Args:
+            max_concurrent: 동시에 진행할 수 있는 바로빌 호출 수
+            wait_timeout: 자리가 날 때까지 기다리는 최대 시간(초)
+        """
+        self.max_concurrent = max_concurrent
+        self.wait_timeout = wait_timeout
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+
+    def acquire(self):
+        if not self._semaphore.acquire(timeout=self.wait_timeout):
+            raise BulkheadFullError(
+                "바로빌 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                retry_after=self.wait_timeout,
+            )
+
+    def release(self):
+        self._semaphore.release()
+
+
+class AsyncBulkhead:
+    """동시 바로빌 호출 수 제한 (비동기 호출용)"""
+
+    def __init__(self, max_concurrent: int = 100, wait_timeout: float = 1.0):
+        self.max_concurrent = max_concurrent
+        self.wait_timeout = wait_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def acquire(self):
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.wait_timeout)
+        except asyncio.TimeoutError:
+            raise BulkheadFullError(
+                "바로빌 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                retry_after=self.wait_timeout,
+            )
+
+    def release(self):
+        self._semaphore.release()
+
+
+class BaroBillResilience:
+    """오퍼레이션별 서킷 브레이커 + 멱등 조회 재시도 + 벌크헤드 조합"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        retry_operations: Optional[Iterable[str]] = None,
+        retry_max_attempts: int = 3,
+        retry_base_delay: float = 0.2,
+        retry_max_delay: float = 2.0,
+        retry_budget_ratio: float = 0.2,
+        bulkhead: Optional[Bulkhead] = None,
+        async_bulkhead: Optional[AsyncBulkhead] = None,
+    ):
+        """
+        Args:
+            failure_threshold: 서킷을 여는 연속 실패 횟수
+            recovery_timeout: 서킷이 열린 뒤 시험 호출까지 대기 시간(초)
+            retry_operations: 재시도를 허용할 멱등 조회 오퍼레이션 이름 목록
+            retry_max_attempts: 최초 호출을 포함한 최대 시도 횟수
+            retry_base_delay: 재시도 기본 대기 시간(초)
+            retry_max_delay: 재시도 최대 대기 시간(초)
+            retry_budget_ratio: 요청 대비 허용할 재시도 비율
+            bulkhead: 동기 호출 벌크헤드
+            async_bulkhead: 비동기 호출 벌크헤드
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.retry_operations = frozenset(retry_operations or ())
+        self.retry_max_attempts = max(retry_max_attempts, 1)
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.retry_budget = RetryBudget(ratio=retry_budget_ratio)
+        self.bulkhead = bulkhead
+        self.async_bulkhead = async_bulkhead
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get_breaker(self, operation: Optional[str]) -> CircuitBreaker:
+        """오퍼레이션별 서킷 브레이커 조회 (없으면 생성)"""
+        name = operation or "unknown"
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    name,
+                    CircuitBreaker(name, self.failure_threshold, self.recovery_timeout),
+                )
+        return breaker
+
+    def get_delay(self, attempt: int) -> float:
+        """재시도 대기 시간 (지수 백오프 + full jitter)"""
+        cap = min(self.retry_max_delay, self.retry_base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, cap)
+
+    def _can_retry(self, operation: Optional[str], attempt: int) -> bool:
+        return (
+            operation in self.retry_operations
+            and attempt < self.retry_max_attempts
+            and self.retry_budget.withdraw()
+        )
+
+    def call(
+        self,
+        operation: Optional[str],
+        func: Callable[[], T],
+        is_failure: Callable[[T], bool] = lambda result: False,
+    ) -> T:
+        """
+        장애 격리 계층을 거쳐 동기 호출 실행
+
+        Args:
+            operation: 오퍼레이션 이름
+            func: 실제 호출 함수
+            is_failure: 예외 없이 반환된 결과를 실패로 볼지 판단하는 함수 (예: HTTP 5xx)
+
+        Returns:
+            func 결과 (재시도를 모두 실패한 경우 마지막 결과 또는 예외)
+        """
+        breaker = self.get_breaker(operation)
+        self.retry_budget.deposit()
+        attempt = 0
+        while True:
+            attempt += 1
+            # 벌크헤드에서 거절되어도 시험 호출 기회를 쓰지 않도록 자리를 먼저 확보
+            if self.bulkhead is not None:
+                self.bulkhead.acquire()
+            try:
+                breaker.before_call()
+                try:
+                    result = func()
+                except Exception:
+                    breaker.record_failure()
+                    if not self._can_retry(operation, attempt):
+                        raise
+                except BaseException:
+                    # 취소 등으로 결과 없이 중단 (시험 호출이 HALF_OPEN에 남지 않도록 기록)
+                    breaker.record_aborted()
+                    raise
+                else:
+                    if not is_failure(result):
+                        breaker.record_success()
+                        return result
+                    breaker.record_failure()
+                    if not self._can_retry(operation, attempt):
+                        return result
+            finally:
+                if self.bulkhead is not None:
+                    self.bulkhead.release()
+
+            delay = self.get_delay(attempt)
+            logger.info(f"바로빌 {operation} 재시도 {attempt}회 ({delay:.2f}초 후)")
+            time.sleep(delay)
+
+    async def acall(
+        self,
+        operation: Optional[str],
+        func: Callable[[], Awaitable[T]],
+        is_failure: Callable[[T], bool] = lambda result: False,
+    ) -> T:
+        """장애 격리 계층을 거쳐 비동기 호출 실행 (call과 동일한 규칙)"""
+        breaker = self.get_breaker(operation)
+        self.retry_budget.deposit()
+        attempt = 0
+        while True:
+            attempt += 1
+            # 벌크헤드에서 거절되어도 시험 호출 기회를 쓰지 않도록 자리를 먼저 확보
+            if self.async_bulkhead is not None:
+                await self.async_bulkhead.acquire()
+            try:
+                breaker.before_call()
+                try:
+                    result = await func()
+                except Exception:
+                    breaker.record_failure()
+                    if not self._can_retry(operation, attempt):
+                        raise
+                except BaseException:
+                    # 취소 등으로 결과 없이 중단 (시험 호출이 HALF_OPEN에 남지 않도록 기록)
+                    breaker.record_aborted()
+                    raise
+                else:
+                    if not is_failure(result):
+                        breaker.record_success()
+                        return result
+                    breaker.record_failure()
+                    if not self._can_retry(operation, attempt):
+                        return result
+            finally:
+                if self.async_bulkhead is not None:
+                    self.async_bulkhead.release()
+
+            delay = self.get_delay(attempt)
+            logger.info(f"바로빌 {operation} 재시도 {attempt}회 ({delay:.2f}초 후)")
+            await asyncio.sleep(delay)
@@ -0,0 +1,87 @@
+"""
+바로빌 SOAP 응답(zeep 객체) -> dict 변환
+
+zeep 응답 객체는 __getattribute__를 가로채는 CompoundValue라서 __dict__/hasattr로 순회하면
+느리고 내부 속성(_xsd_elm 등)까지 따라 들어갑니다.
+타입별 필드 구성(필드 이름 -> 스칼라/복합/목록 여부)을 처음 한 번만 계산해 캐시하고,
+이후에는 __values__를 한 번 순회하면서 필요한 필드만 재귀 변환합니다.
+
+모든 바로빌 서비스가 zeep_to_dict를 공용으로 사용합니다.
+"""
+from typing import Any, Dict
+from zeep.xsd import ComplexType
+from zeep.xsd.valueobjects import CompoundValue
+
+# 필드 종류
+FIELD_SCALAR = 0  # 그대로 사용
+FIELD_SCALAR_LIST = 1  # 스칼라 목록 (리스트 복사)
+FIELD_COMPLEX = 2  # 복합 타입 (재귀 변환)
+FIELD_ANY = 3  # 스키마로 판단할 수 없는 필드 (값을 보고 변환)
+
+# zeep 값 클래스 -> {필드 이름: 필드 종류}
+_layouts: Dict[type, Dict[str, int]] = {}
+
+
+def _build_layout(value: CompoundValue) -> Dict[str, int]:
+    """zeep 값 객체의 XSD 타입에서 필드 구성 계산"""
+    xsd_type = value._xsd_type
+    layout = {}
+    for name, element in xsd_type.elements:
+        element_type = getattr(element, "type", None)
+        is_list = getattr(element, "accepts_multiple", False)
+        if element_type is None:
+            layout[name] = FIELD_ANY
+        elif isinstance(element_type, ComplexType):
+            layout[name] = FIELD_ANY if is_list else FIELD_COMPLEX
+        else:
+            layout[name] = FIELD_SCALAR_LIST if is_list else FIELD_SCALAR
+    for name, _attribute in xsd_type.attributes:
+        layout[name] = FIELD_SCALAR
+    return layout
+
+
+def get_layout(value: CompoundValue) -> Dict[str, int]:
+    """zeep 값 클래스별 필드 구성 조회 (처음 한 번만 계산)"""
+    cls = type(value)
+    layout = _layouts.get(cls)
+    if layout is None:
+        layout = _layouts[cls] = _build_layout(value)
+    return layout
+
+
+def _convert_compound(value: CompoundValue) -> Dict[str, Any]:
+    layout = get_layout(value)
+    result = {}
+    for name, field in value.__values__.items():
+        kind = layout.get(name, FIELD_ANY)
+        if field is None or kind == FIELD_SCALAR:
+            result[name] = field
+        elif kind == FIELD_SCALAR_LIST:
+            result[name] = list(field) if isinstance(field, list) else field
+        elif kind == FIELD_COMPLEX and isinstance(field, CompoundValue):
+            result[name] = _convert_compound(field)
+        else:
+            result[name] = zeep_to_dict(field)
+    return result
+
+
+def zeep_to_dict(value: Any) -> Any:
+    """
+    zeep 응답 객체를 일반 dict/list로 변환
+
+    Args:
+        value: zeep 응답 (복합 타입 객체, 목록, 스칼라)
+
+    Returns:
+        복합 타입은 dict, 목록은 list, 스칼라는 그대로 반환
+    """
+    if isinstance(value, CompoundValue):
+        return _convert_compound(value)
+    if isinstance(value, list):
+        return [zeep_to_dict(item) for item in value]
+    return value
+
+
+def clear_layout_cache():
+    """필드 구성 캐시 비우기 (WSDL 갱신 후 클라이언트를 다시 만들 때)"""
+    _layouts.clear()
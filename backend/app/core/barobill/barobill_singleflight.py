@@ -0,0 +1,160 @@
+"""
+바로빌 동일 조회 요청 병합 (single-flight)
+
+더블 클릭이나 프런트엔드의 병렬 요청으로 같은 인자의 조회(CheckCERTIsValid, GetCorpStateEx,
+GetTaxInvoiceStatesEX 등)가 동시에 들어오면, 먼저 들어온 호출 하나만 바로빌로 보내고
+나머지는 그 결과(또는 예외)를 함께 받습니다. 결과를 캐시하지는 않으며
+진행 중인 호출이 끝나면 다음 호출은 다시 바로빌로 전송됩니다.
+
+키는 (서비스, 오퍼레이션, 인자)이며 인증키도 인자에 포함되므로 다른 자격증명끼리 결과를 공유하지 않습니다.
+병합된 호출은 같은 결과 객체를 받으므로 호출하는 쪽에서 결과를 수정하지 않아야 합니다
+(서비스 코드는 zeep_to_dict로 변환해서 사용).
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple
+from prometheus_client import Counter
+from zeep.xsd.valueobjects import CompoundValue
+from app.core.barobill.barobill_serializer import zeep_to_dict
+
+SOAP_COALESCED = Counter(
+    "barobill_soap_coalesced_total",
+    "진행 중인 동일 호출에 병합되어 바로빌로 보내지 않은 SOAP 호출 수",
+    ["service", "operation"],
+)
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    호출 인자를 병합 키로 쓸 수 있는 해시 가능한 값으로 변환
+
+    Raises:
+        TypeError: 키로 만들 수 없는 인자 (이 경우 병합하지 않고 그대로 호출)
+    """
+    if isinstance(value, CompoundValue):
+        value = zeep_to_dict(value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    hash(value)
+    return value
+
+
+def make_key(service: str, operation: str, args: tuple, kwargs: dict) -> Optional[Tuple]:
+    """병합 키 생성 (키로 만들 수 없는 인자가 있으면 None)"""
+    try:
+        return (service, operation, freeze(args), freeze(kwargs))
+    except TypeError:
+        return None
+
+
+class _Call:
+    """진행 중인 동기 호출 (먼저 들어온 호출의 결과를 대기 중인 호출과 공유)"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """동일 키 동기 호출 병합 (스레드풀에서 실행되는 동기 엔드포인트용)"""
+
+    def __init__(self, operations: Iterable[str] = ()):
+        """
+        Args:
+            operations: 병합할 오퍼레이션 이름 목록 (멱등 조회만)
+        """
+        self.operations = frozenset(operations)
+        self._calls: Dict[Tuple, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Tuple, func: Callable[[], Any]) -> Any:
+        """
+        같은 키의 호출이 진행 중이면 그 결과를 기다리고, 없으면 직접 실행
+
+        Args:
+            key: 병합 키
+            func: 실제 호출 함수
+
+        Returns:
+            func 결과 (예외도 대기 중인 호출에 그대로 전달)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            SOAP_COALESCED.labels(key[0], key[1]).inc()
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def wrap(self, service: str, operation: str, func: Callable) -> Callable:
+        """병합 대상 오퍼레이션이면 병합 호출로 감싸서 반환"""
+        if operation not in self.operations:
+            return func
+
+        def coalesced(*args, **kwargs):
+            key = make_key(service, operation, args, kwargs)
+            if key is None:
+                return func(*args, **kwargs)
+            return self.do(key, lambda: func(*args, **kwargs))
+
+        return coalesced
+
+
+class AsyncSingleFlight(SingleFlight):
+    """동일 키 비동기 호출 병합 (같은 이벤트 루프 안의 동시 호출)"""
+
+    def __init__(self, operations: Iterable[str] = ()):
+        super().__init__(operations)
+        self._tasks: Dict[Tuple, asyncio.Task] = {}
+
+    async def do(self, key: Tuple, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        같은 키의 호출이 진행 중이면 그 결과를 기다리고, 없으면 태스크로 실행
+
+        호출은 별도 태스크에서 진행되므로 먼저 들어온 요청이 취소되어도
+        함께 기다리는 요청은 결과를 받습니다.
+        """
+        task = self._tasks.get(key)
+        if task is not None:
+            SOAP_COALESCED.labels(key[0], key[1]).inc()
+        else:
+            task = self._tasks[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Tuple, task: asyncio.Task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+    def wrap(self, service: str, operation: str, func: Callable) -> Callable:
+        """병합 대상 오퍼레이션이면 병합 호출로 감싸서 반환"""
+        if operation not in self.operations:
+            return func
+
+        async def coalesced(*args, **kwargs):
+            key = make_key(service, operation, args, kwargs)
+            if key is None:
+                return await func(*args, **kwargs)
+            return await self.do(key, lambda: func(*args, **kwargs))
+
+        return coalesced
@@ -0,0 +1,180 @@
+"""
+바로빌 SOAP HTTP 전송 계층
+
+- requests 커넥션 풀(keep-alive)을 모든 서비스 클라이언트가 공유하여 TCP/TLS 연결 재사용
+- 오퍼레이션별 (연결, 읽기) 타임아웃 적용으로 느린 바로빌 노드가 워커 스레드를 무한정 점유하지 않도록 제한
+- 비동기 엔드포인트용 httpx 기반 전송 계층 (BaroBillAsyncTransport)
+- 모든 SOAP 요청은 장애 격리 계층(BaroBillResilience)을 거쳐 전송
+"""
+import logging
+from typing import Dict, Optional, Tuple, Union
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from zeep.transports import AsyncTransport, Transport
+from app.core.barobill.barobill_resilience import (
+    UNAVAILABLE_STATUS_CODES,
+    BaroBillResilience,
+)
+
+logger = logging.getLogger(__name__)
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+def get_operation_name(headers: Optional[Dict[str, str]]) -> Optional[str]:
+    """
+    SOAPAction 헤더에서 오퍼레이션 이름 추출
+
+    예: '"http://ws.baroservice.com/IssueTaxInvoiceEx"' -> 'IssueTaxInvoiceEx'
+    """
+    if not headers:
+        return None
+    action = headers.get("SOAPAction") or headers.get("soapaction")
+    if not action:
+        return None
+    action = action.strip().strip('"')
+    return action.rsplit("/", 1)[-1] or None
+
+
+def is_unavailable_response(response) -> bool:
+    """바로빌 서버/게이트웨이 장애 응답인지 확인 (서킷 브레이커 실패로 기록)"""
+    return response.status_code in UNAVAILABLE_STATUS_CODES
+
+
+class BaroBillTransport(Transport):
+    """커넥션 풀과 오퍼레이션별 타임아웃을 지원하는 zeep Transport"""
+
+    def __init__(
+        self,
+        cache=None,
+        wsdl_timeout: int = 30,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 15.0,
+        operation_timeouts: Optional[Dict[str, float]] = None,
+        pool_connections: int = 4,
+        pool_maxsize: int = 20,
+        pool_block: bool = False,
+        resilience: Optional[BaroBillResilience] = None,
+    ):
+        """
+        Args:
+            cache: WSDL/XSD 문서 캐시 (zeep SqliteCache 등)
+            wsdl_timeout: WSDL/XSD 문서 로딩 타임아웃(초)
+            connect_timeout: 연결 타임아웃(초)
+            read_timeout: 기본 읽기 타임아웃(초)
+            operation_timeouts: 오퍼레이션별 읽기 타임아웃(초) (예: {"IssueTaxInvoiceEx": 30})
+            pool_connections: 호스트별 커넥션 풀 개수
+            pool_maxsize: 풀당 최대 커넥션 수 (동시 요청 수에 맞춰 설정)
+            pool_block: 풀이 가득 찼을 때 새 연결을 만들지 않고 대기할지 여부
+            resilience: 서킷 브레이커/재시도/벌크헤드 (없으면 그대로 전송)
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        super().__init__(
+            cache=cache,
+            timeout=wsdl_timeout,
+            operation_timeout=(connect_timeout, read_timeout),
+            session=session,
+        )
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.operation_timeouts = dict(operation_timeouts or {})
+        self.resilience = resilience
+
+    def get_timeout(self, operation: Optional[str]) -> Timeout:
+        """오퍼레이션에 적용할 (연결, 읽기) 타임아웃 반환"""
+        read_timeout = self.operation_timeouts.get(operation, self.read_timeout)
+        return (self.connect_timeout, read_timeout)
+
+    def post(self, address, message, headers):
+        """오퍼레이션별 타임아웃을 적용해 SOAP 요청 전송"""
+        operation = get_operation_name(headers)
+        timeout = self.get_timeout(operation)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "HTTP Post to %s (operation: %s, timeout: %s)", address, operation, timeout
+            )
+
+        def send():
+            return self.session.post(
+                address, data=message, headers=headers, timeout=timeout
+            )
+
+        if self.resilience is None:
+            return send()
+        return self.resilience.call(operation, send, is_failure=is_unavailable_response)
+
+
+class BaroBillAsyncTransport(AsyncTransport):
+    """httpx 기반 비동기 전송 계층 (커넥션 풀 + 오퍼레이션별 타임아웃)"""
+
+    def __init__(
+        self,
+        cache=None,
+        wsdl_timeout: int = 30,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 15.0,
+        operation_timeouts: Optional[Dict[str, float]] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        resilience: Optional[BaroBillResilience] = None,
+    ):
+        """
+        Args:
+            cache: WSDL/XSD 문서 캐시
+            wsdl_timeout: WSDL/XSD 문서 로딩 타임아웃(초)
+            connect_timeout: 연결 타임아웃(초)
+            read_timeout: 기본 읽기 타임아웃(초)
+            operation_timeouts: 오퍼레이션별 읽기 타임아웃(초)
+            max_connections: 동시 연결 최대 개수 (동시 진행 가능한 바로빌 호출 수)
+            max_keepalive_connections: 유지할 keep-alive 연결 수
+            resilience: 서킷 브레이커/재시도/벌크헤드 (없으면 그대로 전송)
+        """
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+        wsdl_client = httpx.Client(timeout=wsdl_timeout)
+        super().__init__(client=client, wsdl_client=wsdl_client, cache=cache)
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.operation_timeouts = dict(operation_timeouts or {})
+        self.resilience = resilience
+
+    def get_timeout(self, operation: Optional[str]) -> "httpx.Timeout":
+        """오퍼레이션에 적용할 httpx 타임아웃 반환"""
+        read_timeout = self.operation_timeouts.get(operation, self.read_timeout)
+        return httpx.Timeout(read_timeout, connect=self.connect_timeout)
+
+    async def post(self, address, message, headers):
+        """오퍼레이션별 타임아웃을 적용해 SOAP 요청 전송"""
+        operation = get_operation_name(headers)
+        timeout = self.get_timeout(operation)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "HTTP Post to %s (operation: %s, timeout: %s)", address, operation, timeout
+            )
+
+        async def send():
+            return await self.client.post(
+                address, content=message, headers=headers, timeout=timeout
+            )
+
+        if self.resilience is None:
+            return await send()
+        return await self.resilience.acall(
+            operation, send, is_failure=is_unavailable_response
+        )
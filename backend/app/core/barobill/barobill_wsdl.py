@@ -0,0 +1,127 @@
+"""
+바로빌 WSDL 스냅샷 관리
+
+Cloud Run 콜드 스타트 직후 첫 요청이 원격 WSDL 다운로드에 묶이지 않도록,
+서비스별 WSDL을 로컬 파일(wsdl/<server>/<SERVICE>.wsdl)로 보관하고 우선 사용합니다.
+스냅샷이 없으면 원격 WSDL URL로 대체합니다.
+
+스냅샷 갱신: python utils/refresh_barobill_wsdl.py
+"""
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 기본 스냅샷 디렉토리 (패키지에 포함)
+DEFAULT_WSDL_DIR = Path(__file__).resolve().parent / "wsdl"
+MANIFEST_FILE = "manifest.json"
+
+
+def _resolve_dir(wsdl_dir: Optional[str]) -> Path:
+    """스냅샷 디렉토리 경로 반환 (지정하지 않으면 기본 디렉토리)"""
+    return Path(wsdl_dir) if wsdl_dir else DEFAULT_WSDL_DIR
+
+
+def get_snapshot_path(
+    service: str, server: str, wsdl_dir: Optional[str] = None
+) -> Path:
+    """
+    서비스별 WSDL 스냅샷 파일 경로 반환
+
+    Args:
+        service: 서비스 이름 (예: TI, CORPSTATE)
+        server: 서버 이름 (test / production)
+        wsdl_dir: 스냅샷 디렉토리 (없으면 기본 디렉토리)
+
+    Returns:
+        스냅샷 파일 경로 (존재 여부와 무관)
+    """
+    return _resolve_dir(wsdl_dir) / server / f"{service}.wsdl"
+
+
+def find_snapshot(
+    service: str, server: str, wsdl_dir: Optional[str] = None
+) -> Optional[str]:
+    """
+    사용할 수 있는 WSDL 스냅샷 경로 조회
+
+    Returns:
+        스냅샷 파일 경로 문자열, 없으면 None
+    """
+    path = get_snapshot_path(service, server, wsdl_dir)
+    if path.is_file():
+        return str(path)
+    return None
+
+
+def load_manifest(wsdl_dir: Optional[str] = None) -> Dict:
+    """스냅샷 매니페스트(버전, 원본 URL, 해시) 조회"""
+    path = _resolve_dir(wsdl_dir) / MANIFEST_FILE
+    if not path.is_file():
+        return {"version": None, "snapshots": {}}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def refresh_snapshots(
+    services: Iterable[str],
+    servers: Iterable[str],
+    url_for,
+    wsdl_dir: Optional[str] = None,
+    timeout: int = 30,
+) -> Dict:
+    """
+    원격 WSDL을 다시 받아 스냅샷 및 매니페스트 갱신
+
+    XML로 파싱되지 않는 응답은 저장하지 않으므로 기존 스냅샷이 깨지지 않습니다.
+
+    Args:
+        services: 갱신할 서비스 이름 목록
+        servers: 갱신할 서버 이름 목록 (test / production)
+        url_for: (service, server) -> WSDL URL 함수
+        wsdl_dir: 스냅샷 디렉토리 (없으면 기본 디렉토리)
+        timeout: 다운로드 타임아웃(초)
+
+    Returns:
+        갱신된 매니페스트 딕셔너리
+    """
+    import requests
+    from lxml import etree
+
+    base_dir = _resolve_dir(wsdl_dir)
+    manifest = load_manifest(wsdl_dir)
+    snapshots = manifest.setdefault("snapshots", {})
+    fetched_at = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    for server in servers:
+        for service in services:
+            url = url_for(service, server)
+            response = requests.get(url, timeout=timeout)
+            response.raise_for_status()
+            content = response.content
+
+            # 유효한 XML인지 확인 후 저장
+            etree.fromstring(content)
+
+            path = get_snapshot_path(service, server, wsdl_dir)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+
+            snapshots[f"{server}/{service}"] = {
+                "url": url,
+                "sha256": hashlib.sha256(content).hexdigest(),
+                "fetched_at": fetched_at,
+            }
+            logger.info(f"바로빌 WSDL 스냅샷 갱신: {server}/{service} ({len(content)} bytes)")
+
+    manifest["version"] = fetched_at
+    base_dir.mkdir(parents=True, exist_ok=True)
+    with open(base_dir / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+
+    return manifest
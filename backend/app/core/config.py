@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 import logging
 import os
 
@@ -45,6 +45,157 @@ class Settings(BaseSettings):
     BAROBILL_USE_TEST_SERVER: bool = (
         False  # 테스트 서버 사용 여부 (운영: false, 테스트: true)
     )
+    # 로컬 스텁 서버 주소 (예: http://localhost:8090, 설정 시 운영/테스트 서버 대신 사용)
+    # 스텁 실행: python utils/barobill_stub.py
+    BAROBILL_STUB_URL: Optional[str] = None
+
+    # =========================
+    # 바로빌 WSDL 로딩 설정 (콜드 스타트 최적화)
+    # 로컬 스냅샷: app/core/barobill/wsdl (갱신: python utils/refresh_barobill_wsdl.py)
+    # =========================
+    BAROBILL_WSDL_OFFLINE: bool = True  # 로컬 WSDL 스냅샷 우선 사용 여부
+    BAROBILL_WSDL_DIR: Optional[str] = None  # 스냅샷 디렉토리 (없으면 패키지 기본 경로)
+    BAROBILL_WSDL_CACHE_ENABLED: bool = True  # 원격 WSDL 디스크 캐시 사용 여부
+    BAROBILL_CACHE_DIR: Optional[str] = None  # 디스크 캐시 디렉토리 (없으면 ~/.cache/barobill, 컨테이너는 볼륨 경로 지정)
+    BAROBILL_WSDL_CACHE_PATH: Optional[str] = None  # SqliteCache 파일 경로 (없으면 BAROBILL_CACHE_DIR/wsdl-cache.db)
+    BAROBILL_WSDL_CACHE_TIMEOUT: int = 86400  # 디스크 캐시 유효 시간(초)
+    BAROBILL_WSDL_TIMEOUT: int = 30  # WSDL/XSD 다운로드 타임아웃(초)
+
+    # =========================
+    # 바로빌 SOAP 전송 설정 (커넥션 풀 / 타임아웃)
+    # =========================
+    BAROBILL_HTTP_POOL_CONNECTIONS: int = 4  # 호스트별 커넥션 풀 개수
+    BAROBILL_HTTP_POOL_MAXSIZE: int = 20  # 풀당 keep-alive 커넥션 수 (동시 호출 수 이상 권장)
+    BAROBILL_HTTP_POOL_BLOCK: bool = False  # 풀 소진 시 대기 여부 (false: 임시 연결 생성)
+    BAROBILL_ASYNC_MAX_CONNECTIONS: int = 200  # 비동기 엔드포인트의 바로빌 동시 연결 최대 개수
+    BAROBILL_CONNECT_TIMEOUT: float = 3.0  # 연결 타임아웃(초)
+    BAROBILL_READ_TIMEOUT: float = 15.0  # 기본 읽기 타임아웃(초)
+    # 오퍼레이션별 읽기 타임아웃(초), 환경변수는 JSON 형식 (예: '{"IssueTaxInvoiceEx": 40}')
+    BAROBILL_OPERATION_TIMEOUTS: Dict[str, float] = {
+        "RegistTaxInvoiceEX": 20.0,
+        "IssueTaxInvoiceEx": 30.0,
+        "DeleteTaxInvoice": 20.0,
+        "GetTaxInvoice": 10.0,
+        "GetTaxInvoiceStatesEX": 10.0,
+        "GetCorpStateEx": 5.0,
+        "CheckCERTIsValid": 5.0,
+        "GetErrString": 5.0,
+    }
+
+    # =========================
+    # 바로빌 장애 격리 설정 (서킷 브레이커 / 재시도 / 벌크헤드)
+    # =========================
+    BAROBILL_CIRCUIT_FAILURE_THRESHOLD: int = 5  # 서킷을 여는 오퍼레이션별 연속 실패 횟수
+    BAROBILL_CIRCUIT_RECOVERY_TIMEOUT: float = 30.0  # 서킷이 열린 뒤 시험 호출까지 대기 시간(초)
+    # 재시도를 허용할 멱등 조회 오퍼레이션 (등록/발행/삭제는 절대 재시도하지 않음)
+    BAROBILL_RETRY_OPERATIONS: List[str] = [
+        "GetTaxInvoiceStatesEX",
+        "GetCorpStateEx",
+        "CheckCERTIsValid",
+    ]
+    BAROBILL_RETRY_MAX_ATTEMPTS: int = 3  # 최초 호출 포함 최대 시도 횟수
+    BAROBILL_RETRY_BASE_DELAY: float = 0.2  # 재시도 기본 대기 시간(초, 지수 백오프 + 지터)
+    BAROBILL_RETRY_MAX_DELAY: float = 2.0  # 재시도 최대 대기 시간(초)
+    BAROBILL_RETRY_BUDGET_RATIO: float = 0.2  # 요청 대비 허용 재시도 비율
+    BAROBILL_BULKHEAD_MAX_CONCURRENT: int = 16  # 동기 엔드포인트의 바로빌 동시 호출 한도 (스레드풀 40개 중 일부만 점유)
+    BAROBILL_BULKHEAD_WAIT_TIMEOUT: float = 1.0  # 동시 호출 한도 초과 시 대기 시간(초), 초과하면 503
+    # 같은 인자로 동시에 들어온 호출을 하나로 병합할 멱등 조회 오퍼레이션
+    BAROBILL_COALESCE_OPERATIONS: List[str] = [
+        "GetTaxInvoiceStatesEX",
+        "GetCorpStateEx",
+        "CheckCERTIsValid",
+    ]
+
+    # =========================
+    # 세금계산서 일괄 발행
+    # =========================
+    BAROBILL_BATCH_MAX_ITEMS: int = 500  # 일괄 발행 요청당 최대 건수
+    BAROBILL_BATCH_CONCURRENCY: int = 8  # 일괄 발행 시 바로빌 동시 호출 수
+
+    # =========================
+    # 세금계산서 발행 작업 큐 (202 Accepted 후 백그라운드 발행)
+    # =========================
+    TAX_INVOICE_JOB_WORKERS: int = 2  # 프로세스당 작업자 코루틴 수, 0이면 작업자 미실행
+    TAX_INVOICE_JOB_POLL_INTERVAL: float = 1.0  # 대기 작업이 없을 때 폴링 주기(초)
+    TAX_INVOICE_JOB_LEASE_SECONDS: int = 120  # 작업 lease 시간(초), 바로빌 호출 타임아웃보다 길게
+    TAX_INVOICE_JOB_MAX_ATTEMPTS: int = 5  # 재시도 가능한 오류의 최대 시도 횟수
+    TAX_INVOICE_JOB_RETRY_BASE_DELAY: float = 5.0  # 재시도 대기 시간 기준(초), 시도마다 2배
+    TAX_INVOICE_JOB_RETRY_MAX_DELAY: float = 300.0  # 재시도 대기 시간 상한(초)
+
+    # =========================
+    # 세금계산서 바로빌 상태 동기화 (백그라운드 GetTaxInvoiceStatesEX, /invoices/check-status)
+    # =========================
+    TAX_INVOICE_STATE_SYNC_INTERVAL: float = 60.0  # 동기화 주기(초), 0이면 작업자 미실행 (check-status가 직접 조회)
+    TAX_INVOICE_STATE_SYNC_STALE_SECONDS: int = 300  # 마지막 동기화 후 다시 조회하기까지의 시간(초)
+    TAX_INVOICE_STATE_SYNC_BATCH_SIZE: int = 5000  # 한 번의 동기화에서 테이블별 최대 조회 행 수
+    TAX_INVOICE_STATE_SYNC_CHUNK_SIZE: int = 100  # GetTaxInvoiceStatesEX 호출당 관리번호 수 (바로빌 최대 100)
+    TAX_INVOICE_STATE_SYNC_CONCURRENCY: int = 4  # 동기화 시 바로빌 동시 호출 수
+
+    # =========================
+    # 바로빌 callback 반영 (POST /barobill/tax-invoices/callback, /callback/batch)
+    # =========================
+    TAX_INVOICE_CALLBACK_BUFFER_WINDOW_MS: float = 5.0  # 단건 callback을 모아 반영하는 시간(ms), 0이면 바로 반영
+    TAX_INVOICE_CALLBACK_BUFFER_MAX_ITEMS: int = 500  # 모은 건수가 이만큼이면 시간 전이라도 반영
+    TAX_INVOICE_CALLBACK_BATCH_MAX_ITEMS: int = 5000  # 일괄 callback 요청당 최대 건수
+
+    # =========================
+    # 바로빌 매출/매입 세금계산서 목록 미러 (GetPeriodTaxInvoiceSalesList / PurchaseList)
+    # =========================
+    TAX_INVOICE_MIRROR_SYNC_INTERVAL: float = 3600.0  # 전체 사용자 동기화 주기(초), 0이면 작업자 미실행
+    TAX_INVOICE_MIRROR_INITIAL_DAYS: int = 365  # 처음 동기화할 때 조회할 기간(일)
+    TAX_INVOICE_MIRROR_OVERLAP_DAYS: int = 31  # 증분 동기화 시 워터마크 이전으로 다시 조회할 기간(일)
+    TAX_INVOICE_MIRROR_WINDOW_DAYS: int = 31  # 조회 기간을 나누는 단위(일)
+    TAX_INVOICE_MIRROR_PAGE_SIZE: int = 100  # 페이지당 건수 (CountPerPage)
+    TAX_INVOICE_MIRROR_CONCURRENCY: int = 4  # 2페이지 이후 동시 조회 수
+    TAX_INVOICE_MIRROR_TAX_TYPES: List[int] = [1, 2]  # 조회할 과세형태 (TaxType, 1: 세금계산서, 2: 계산서)
+    TAX_INVOICE_MIRROR_DATE_TYPE: int = 1  # 조회 기준일자 (DateType, 1: 작성일자)
+
+    # =========================
+    # 발행 세금계산서 내보내기 (GET /barobill/tax-invoices/export, CSV/JSONL/XLSX 스트리밍)
+    # =========================
+    TAX_INVOICE_EXPORT_YIELD_PER: int = 1000  # 서버 측 커서에서 한 번에 가져올 행 수
+
+    # =========================
+    # 발행 세금계산서 보관 만료분 정리 (python utils/purge_tax_invoice_issues.py)
+    # =========================
+    TAX_INVOICE_RETENTION_CHUNK_SIZE: int = 500  # 한 트랜잭션에서 삭제할 행 수
+    TAX_INVOICE_RETENTION_SLEEP_SECONDS: float = 0.2  # chunk 사이 대기 시간(초)
+    TAX_INVOICE_RETENTION_ARCHIVE_DIR: Optional[str] = None  # 삭제 전 gzip JSONL로 보관할 디렉토리 (없으면 보관하지 않음)
+
+    # =========================
+    # 멱등성 키 (Idempotency-Key 헤더, 발행/취소 API)
+    # =========================
+    IDEMPOTENCY_KEY_TTL_HOURS: int = 24  # 저장된 응답 보관 시간(시간), 지나면 같은 키를 새 요청으로 처리
+    IDEMPOTENCY_KEY_MAX_LENGTH: int = 255  # 키 최대 길이
+
+    # =========================
+    # 바로빌 오류 메시지 카탈로그 (GetErrString 메모이즈)
+    # 오류 코드 테이블: app/core/barobill/error_codes.json (기본은 빈 테이블, 생성/갱신: python utils/refresh_barobill_error_codes.py <코드...>)
+    # =========================
+    BAROBILL_ERROR_CODES_PRELOAD: bool = True  # 오류 코드 테이블에 있는 코드를 처음 조회할 때 적재할지 여부
+    BAROBILL_ERROR_CODES_PATH: Optional[str] = None  # 오류 코드 테이블 경로 (없으면 패키지 기본 경로)
+    BAROBILL_ERROR_CODES_REFRESH_INTERVAL: int = 21600  # 백그라운드 갱신 주기(초), 0이면 갱신 안 함
+
+    # =========================
+    # 바로빌 인증서 등록 상태 캐시 (발행 전 CheckCERTIsValid 생략)
+    # =========================
+    BAROBILL_CERT_STATUS_TTL: int = 3600  # 인증서가 유효한 상태 보관 시간(초), 0이면 캐시 안 함
+    BAROBILL_CERT_STATUS_NEGATIVE_TTL: int = 60  # 미등록/오류 상태 보관 시간(초), 0이면 캐시 안 함
+    BAROBILL_CERT_STATUS_MAX_ENTRIES: int = 10000  # 최대 보관 사업자 수
+
+    # =========================
+    # 세금계산서 서비스 캐시 (자격증명별 TaxInvoiceService 재사용)
+    # =========================
+    TAX_INVOICE_SERVICE_CACHE_MAX_ENTRIES: int = 512  # 최대 보관 인스턴스 수, 0이면 캐시 안 함
+    TAX_INVOICE_SERVICE_CACHE_IDLE_TTL: int = 1800  # 마지막 사용 후 보관 시간(초)
+
+    # =========================
+    # 운영 지표 (Prometheus /metrics)
+    # 공개 앱에 노출되므로 기본은 꺼짐, 켜면 METRICS_TOKEN으로 보호 (Authorization: Bearer <토큰>)
+    # =========================
+    METRICS_ENABLED: bool = False  # /metrics 엔드포인트 등록 여부
+    METRICS_TOKEN: Optional[str] = None  # 스크레이프 Bearer 토큰 (없으면 /metrics는 401, 내부망 전용이면 METRICS_ALLOW_ANONYMOUS)
+    METRICS_ALLOW_ANONYMOUS: bool = False  # 토큰 없이 조회 허용 (외부에서 접근할 수 없는 내부 포트/경로에서만 사용)
 
     def __init__(self, **kwargs):
         """Settings 초기화 및 환경변수 존재 여부 로깅"""
@@ -1,10 +1,25 @@
-from fastapi import FastAPI
+import secrets
+import time
+from typing import Optional
+
+from fastapi import FastAPI, Header, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, Histogram, generate_latest
 from starlette.requests import Request
 
 from app.api.v1 import api_router
 from app.core.config import settings
+from app.core.barobill import (
+    BaroBillService,
+    BaroBillUnavailableError,
+    client_registry,
+    error_catalog,
+)
 from app.db.session import test_db_connection, engine, Base
+from app.services.tax_invoice_job_worker import tax_invoice_job_worker
+from app.services.tax_invoice_state_sync_worker import tax_invoice_state_sync_worker
+from app.services.tax_invoice_mirror_worker import tax_invoice_mirror_worker
 
 
 app = FastAPI(
@@ -47,6 +62,9 @@ def init_db_endpoint():
             corp_state_history,
             billing_charge,
             favorite_item,
+            tax_invoice_job,
+            idempotency_key,
+            tax_invoice_mirror,
         )
 
         Base.metadata.create_all(bind=engine)
@@ -67,6 +85,15 @@ def init_db_endpoint():
 # ======================================================
 # 🔍 요청 디버깅 미들웨어
 # ======================================================
+# 바로빌 SOAP 지연(barobill_soap_request_duration_seconds)과 비교할 전체 요청 지연
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route"],
+    buckets=(0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+
 @app.middleware("http")
 async def debug_middleware(request: Request, call_next):
     origin = request.headers.get("origin", "N/A")
@@ -75,7 +102,13 @@ async def debug_middleware(request: Request, call_next):
 
     print(f"[DEBUG] {method} {path} | Origin: {origin}")
 
+    started = time.perf_counter()
     response = await call_next(request)
+    # 경로 파라미터별로 라벨이 늘어나지 않도록 라우트 템플릿 기준으로 기록
+    route = request.scope.get("route")
+    HTTP_LATENCY.labels(method, getattr(route, "path", "unmatched")).observe(
+        time.perf_counter() - started
+    )
     return response
 
 
@@ -102,6 +135,17 @@ app.add_middleware(
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
 
+# ======================================================
+# 바로빌 장애 격리 (서킷 열림 / 동시 호출 한도 초과) -> 503
+# ======================================================
+@app.exception_handler(BaroBillUnavailableError)
+async def barobill_unavailable_handler(request: Request, exc: BaroBillUnavailableError):
+    headers = {}
+    if exc.retry_after is not None:
+        headers["Retry-After"] = str(max(int(exc.retry_after + 0.999), 1))
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers=headers)
+
+
 # ======================================================
 # Startup 이벤트
 # ======================================================
@@ -115,6 +159,46 @@ async def startup_event():
     else:
         print("❌ DB connection failed")
 
+    # 바로빌 오류 메시지 카탈로그 백그라운드 갱신 (파트너 인증키로 GetErrString 호출)
+    if (
+        settings.is_barobill_configured()
+        and settings.BAROBILL_ERROR_CODES_REFRESH_INTERVAL > 0
+    ):
+        barobill_service = BaroBillService(
+            cert_key=settings.BAROBILL_CERT_KEY,
+            corp_num=settings.BAROBILL_CORP_NUM,
+            use_test_server=settings.BAROBILL_USE_TEST_SERVER,
+        )
+        error_catalog.start_background_refresh(
+            barobill_service.fetch_err_string,
+            settings.BAROBILL_ERROR_CODES_REFRESH_INTERVAL,
+        )
+
+    # 세금계산서 발행 작업자 (POST /barobill/tax-invoices/jobs 로 등록된 작업 처리)
+    if settings.TAX_INVOICE_JOB_WORKERS > 0:
+        tax_invoice_job_worker.start()
+
+    # 세금계산서 바로빌 상태 동기화 (화면은 DB에 반영된 상태를 조회)
+    if settings.TAX_INVOICE_STATE_SYNC_INTERVAL > 0:
+        tax_invoice_state_sync_worker.start()
+
+    # 바로빌 매출/매입 세금계산서 목록 미러 (대시보드는 미러 테이블을 조회)
+    if settings.TAX_INVOICE_MIRROR_SYNC_INTERVAL > 0:
+        tax_invoice_mirror_worker.start()
+
+
+# ======================================================
+# Shutdown 이벤트
+# ======================================================
+@app.on_event("shutdown")
+async def shutdown_event():
+    error_catalog.stop_background_refresh()
+    await tax_invoice_job_worker.stop()
+    await tax_invoice_state_sync_worker.stop()
+    await tax_invoice_mirror_worker.stop()
+    # 비동기 바로빌 클라이언트의 httpx 커넥션 풀 정리
+    await client_registry.aclose()
+
 
 # ======================================================
 # 기본 엔드포인트
@@ -124,6 +208,24 @@ def health_check():
     return {"status": "ok"}
 
 
+def metrics(authorization: Optional[str] = Header(None)):
+    """
+    Prometheus 지표 (바로빌 오퍼레이션별 지연/결과 코드/동시 호출 수, HTTP 요청 지연)
+
+    METRICS_ENABLED일 때만 등록되며, METRICS_TOKEN을 Bearer 토큰으로 보내야 조회할 수 있습니다.
+    """
+    if not settings.METRICS_ALLOW_ANONYMOUS:
+        expected = f"Bearer {settings.METRICS_TOKEN}" if settings.METRICS_TOKEN else None
+        if expected is None or not secrets.compare_digest(authorization or "", expected):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="인증이 필요합니다.")
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+# 운영 지표는 기본적으로 노출하지 않음 (METRICS_ENABLED)
+if settings.METRICS_ENABLED:
+    app.add_api_route("/metrics", metrics, methods=["GET"], include_in_schema=False)
+
+
 @app.get("/")
 def root():
     return {
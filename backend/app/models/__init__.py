@@ -11,11 +11,18 @@ from app.models.payment import Payment
 from app.models.payment_method import PaymentMethod
 from app.models.free_quota import FreeQuota
 from app.models.free_quota_history import FreeQuotaHistory
-from app.models.tax_invoice_issue import TaxInvoiceIssue
+from app.models.tax_invoice_issue import TaxInvoiceIssue, TaxInvoiceIssueLineItem
 from app.models.session import UserSession
 from app.models.device_session import UserDeviceSession
 from app.models.corp_state_history import CorpStateHistory
 from app.models.favorite_item import FavoriteItem
+from app.models.tax_invoice_job import TaxInvoiceJob, TaxInvoiceJobStatus
+from app.models.idempotency_key import IdempotencyKey, IdempotencyKeyStatus
+from app.models.tax_invoice_mirror import (
+    TaxInvoiceMirror,
+    TaxInvoiceMirrorDirection,
+    TaxInvoiceMirrorSyncState,
+)
 
 __all__ = [
     "User",
@@ -32,8 +39,16 @@ __all__ = [
     "FreeQuota",
     "FreeQuotaHistory",
     "TaxInvoiceIssue",
+    "TaxInvoiceIssueLineItem",
     "UserSession",
     "UserDeviceSession",
     "CorpStateHistory",
     "FavoriteItem",
+    "TaxInvoiceJob",
+    "TaxInvoiceJobStatus",
+    "IdempotencyKey",
+    "IdempotencyKeyStatus",
+    "TaxInvoiceMirror",
+    "TaxInvoiceMirrorDirection",
+    "TaxInvoiceMirrorSyncState",
 ]
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from app.db.session import Base
+from app.utils.business_number import normalize_business_number
 
 
 class Client(Base):
@@ -11,6 +12,7 @@ class Client(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     business_number = Column(String(20), nullable=False)  # 사업자등록번호
+    business_number_normalized = Column(String(20), nullable=False)  # 하이픈 제거 사업자등록번호 (조회용, 저장 시 자동 갱신)
     company_name = Column(String(255), nullable=False)  # 회사명
     ceo_name = Column(String(100), nullable=False)  # 대표자명
     business_type = Column(String(100), nullable=False)  # 업태
@@ -25,3 +27,13 @@ class Client(Base):
     
     user = relationship("User", backref="clients")
 
+    __table_args__ = (
+        # 사용자별 사업자번호 조회 (거래처 중복 확인)
+        Index("idx_clients_user_business_number", "user_id", "business_number_normalized"),
+    )
+
+    @validates("business_number")
+    def _sync_business_number_normalized(self, key, value):
+        """사업자번호 저장 시 정규화 컬럼도 함께 갱신"""
+        self.business_number_normalized = normalize_business_number(value)
+        return value
@@ -0,0 +1,37 @@
+"""
+멱등성 키 모델 (Idempotency-Key 헤더)
+"""
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum, UniqueConstraint
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.db.session import Base
+import enum
+
+
+class IdempotencyKeyStatus(str, enum.Enum):
+    """멱등성 키 처리 상태"""
+    IN_PROGRESS = "in_progress"  # 첫 요청 처리 중
+    COMPLETED = "completed"  # 응답 저장 완료 (재요청 시 저장된 응답 반환)
+
+
+class IdempotencyKey(Base):
+    """발행/취소 요청의 멱등성 키와 저장된 응답"""
+
+    __tablename__ = "idempotency_keys"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    key = Column(String(255), nullable=False)  # Idempotency-Key 헤더 값
+    request_hash = Column(String(64), nullable=False)  # 요청 지문 (메서드 + 경로 + 본문 SHA-256)
+    status = Column(Enum(IdempotencyKeyStatus), nullable=False, default=IdempotencyKeyStatus.IN_PROGRESS)
+    response_status_code = Column(Integer)  # 저장된 응답 상태 코드
+    response_body = Column(Text)  # 저장된 응답 본문 (JSON)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    expires_at = Column(DateTime, nullable=False)  # 만료 시각 (UTC), 지나면 같은 키를 새 요청으로 처리
+
+    # 관계
+    user = relationship("User", backref="idempotency_keys")
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "key", name="uq_idempotency_keys_user_key"),
+    )
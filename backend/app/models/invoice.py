@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Numeric, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Numeric, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.session import Base
@@ -8,6 +8,9 @@ class Invoice(Base):
     """세금계산서 모델"""
 
     __tablename__ = "invoices"
+    __table_args__ = (
+        Index("idx_invoices_status_state_synced_at", "status", "state_synced_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -19,6 +22,7 @@ class Invoice(Base):
     mgt_key = Column(
         String(100), nullable=True, index=True
     )  # 바로빌 관리번호 (바로빌로 발행한 경우)
+    state_synced_at = Column(DateTime, nullable=True)  # 바로빌 상태 마지막 동기화 시각 (UTC)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
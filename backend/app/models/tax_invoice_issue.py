@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Date
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Date, Index, Numeric
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.session import Base
@@ -8,6 +8,12 @@ from datetime import datetime, timedelta
 class TaxInvoiceIssue(Base):
     """바로빌 전자세금계산서 발행 정보 모델 (5년 보관)"""
     __tablename__ = "tax_invoice_issues"
+    __table_args__ = (
+        Index("idx_tax_invoice_issues_state_synced_at", "barobill_state", "state_synced_at"),
+        # 리포트: 사용자 + 발행일자 (월별 합계), 사용자 + 거래처 (거래처별 매출)
+        Index("idx_tax_invoice_issues_user_issue_date", "user_id", "issue_date"),
+        Index("idx_tax_invoice_issues_user_invoicee", "user_id", "invoicee_corp_num"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -41,6 +47,10 @@ class TaxInvoiceIssue(Base):
     amount_total = Column(String(50))  # 공급가액
     tax_total = Column(String(50))  # 세액
     total_amount = Column(String(50))  # 합계금액
+    # 금액 정보 (숫자, SQL 집계용)
+    amount_total_value = Column(Numeric(18, 2))  # 공급가액
+    tax_total_value = Column(Numeric(18, 2))  # 세액
+    total_amount_value = Column(Numeric(18, 2))  # 합계금액
     
     # 결제 정보
     cash = Column(String(50))
@@ -55,12 +65,13 @@ class TaxInvoiceIssue(Base):
     remark2 = Column(Text)
     remark3 = Column(Text)
     
-    # 품목 정보 (JSON 형태로 저장)
+    # 품목 정보 (JSON 형태로 저장, 집계용으로 tax_invoice_issue_line_items에도 저장)
     line_items = Column(Text)  # JSON 문자열로 저장
     
     # 바로빌 응답 정보
     barobill_result_code = Column(Integer)  # 바로빌 응답 코드
     barobill_state = Column(String(50))  # 바로빌 상태
+    state_synced_at = Column(DateTime, nullable=True)  # 바로빌 상태 마지막 동기화 시각 (UTC)
     
     # 보관 기간 관리
     retention_until = Column(Date, nullable=False, index=True)  # 보관 만료일 (발행일 + 5년)
@@ -71,6 +82,13 @@ class TaxInvoiceIssue(Base):
     
     # 관계 설정
     user = relationship("User", backref="tax_invoice_issues")
+    trade_line_items = relationship(
+        "TaxInvoiceIssueLineItem",
+        back_populates="tax_invoice_issue",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="TaxInvoiceIssueLineItem.line_no",
+    )
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -78,3 +96,35 @@ class TaxInvoiceIssue(Base):
         if self.issue_date and not self.retention_until:
             self.retention_until = self.issue_date + timedelta(days=365 * 5)
 
+
+class TaxInvoiceIssueLineItem(Base):
+    """발행 세금계산서 품목 모델 (line_items JSON을 행 단위로 정규화, SQL 집계용)"""
+    __tablename__ = "tax_invoice_issue_line_items"
+
+    id = Column(Integer, primary_key=True, index=True)
+    tax_invoice_issue_id = Column(
+        Integer, ForeignKey("tax_invoice_issues.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    line_no = Column(Integer, nullable=False)  # 품목 순번 (1부터)
+
+    # 집계용 비정규화 컬럼 (세금계산서와 같은 값)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    issue_date = Column(Date, nullable=False)  # 발행일자
+
+    purchase_expiry = Column(String(20))  # 품목 일자
+    name = Column(String(255), nullable=False)  # 품목명
+    information = Column(String(255))  # 규격
+    quantity = Column(Numeric(18, 4))  # 수량 (ChargeableUnit)
+    unit_price = Column(Numeric(18, 2))  # 단가
+    amount = Column(Numeric(18, 2))  # 공급가액
+    tax = Column(Numeric(18, 2))  # 세액
+    description = Column(Text)  # 비고
+
+    # 관계 설정
+    tax_invoice_issue = relationship("TaxInvoiceIssue", back_populates="trade_line_items")
+
+    __table_args__ = (
+        # 리포트: 사용자 + 발행일자, 사용자 + 품목명 (품목별 매출)
+        Index("idx_tax_invoice_issue_line_items_user_issue_date", "user_id", "issue_date"),
+        Index("idx_tax_invoice_issue_line_items_user_name", "user_id", "name"),
+    )
@@ -0,0 +1,50 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum, Index
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.db.session import Base
+import enum
+
+
+class TaxInvoiceJobStatus(str, enum.Enum):
+    """세금계산서 발행 작업 상태"""
+    QUEUED = "queued"  # 대기 (재시도 대기 포함)
+    RUNNING = "running"  # 작업자가 처리 중 (lease 보유)
+    SUCCEEDED = "succeeded"  # 발행(또는 발행 예약) 완료
+    FAILED = "failed"  # 바로빌 오류 코드 등 재시도해도 결과가 같은 실패
+    DEAD = "dead"  # 재시도 소진 또는 결과 확인이 필요한 실패 (dead letter)
+
+
+class TaxInvoiceJob(Base):
+    """세금계산서 발행 작업 큐 모델 (202 Accepted 후 백그라운드 작업자가 처리)"""
+    __tablename__ = "tax_invoice_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(String(32), nullable=False, unique=True, index=True)  # 외부 노출용 작업 ID
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+    status = Column(Enum(TaxInvoiceJobStatus), nullable=False, default=TaxInvoiceJobStatus.QUEUED)
+    payload = Column(Text, nullable=False)  # 바로빌 전송 데이터 + 발행시점 (JSON)
+
+    # 재시도 / lease (시각은 UTC)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    next_run_at = Column(DateTime, nullable=False)  # 다음 실행 가능 시각
+    lease_owner = Column(String(100))  # 처리 중인 작업자
+    lease_expires_at = Column(DateTime)  # lease 만료 시각
+
+    # 결과
+    mgt_key = Column(String(100))  # 바로빌 관리번호
+    result_code = Column(Integer)  # 바로빌 결과 코드
+    last_error = Column(Text)  # 마지막 오류 메시지
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    finished_at = Column(DateTime)  # 종료 시각 (succeeded/failed/dead)
+
+    # 관계
+    user = relationship("User", backref="tax_invoice_jobs")
+
+    __table_args__ = (
+        # 작업자 폴링: 상태 + 실행 가능 시각
+        Index("idx_tax_invoice_jobs_status_next_run", "status", "next_run_at"),
+    )
@@ -0,0 +1,84 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.db.session import Base
+import enum
+
+
+class TaxInvoiceMirrorDirection(str, enum.Enum):
+    """바로빌 세금계산서 목록 구분"""
+    SALES = "sales"  # 매출 (GetPeriodTaxInvoiceSalesList)
+    PURCHASE = "purchase"  # 매입 (GetPeriodTaxInvoicePurchaseList)
+
+
+class TaxInvoiceMirror(Base):
+    """바로빌 매출/매입 세금계산서 목록 미러 모델 (앱 밖에서 발행/수신한 건 포함)"""
+    __tablename__ = "tax_invoice_mirrors"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    corp_num = Column(String(20), nullable=False)  # 조회한 사업자번호
+    direction = Column(Enum(TaxInvoiceMirrorDirection), nullable=False)
+
+    # 바로빌 식별 정보
+    invoice_key = Column(String(100), nullable=False)  # 바로빌 InvoiceKey (없으면 국세청 승인번호)
+    mgt_key = Column(String(100))  # 바로빌 관리번호 (바로빌로 발행한 매출 건)
+    nts_send_key = Column(String(50), index=True)  # 국세청 승인번호
+
+    # 세금계산서 정보
+    tax_invoice_type = Column(Integer)
+    tax_type = Column(Integer)  # 과세/면세/영세
+    purpose_type = Column(Integer)  # 청구/영수
+    modify_code = Column(String(10))
+    barobill_state = Column(Integer)  # 바로빌 상태 (BarobillState)
+    write_date = Column(String(8), nullable=False)  # 작성일자 (YYYYMMDD)
+    issue_dt = Column(String(14))  # 발행일시
+    nts_send_dt = Column(String(14))  # 국세청 전송일시
+
+    invoicer_corp_num = Column(String(20))
+    invoicer_corp_name = Column(String(255))
+    invoicee_corp_num = Column(String(20))
+    invoicee_corp_name = Column(String(255))
+    item_name = Column(String(255))
+
+    # 금액 정보 (바로빌 응답 그대로)
+    amount_total = Column(String(50))  # 공급가액
+    tax_total = Column(String(50))  # 세액
+    total_amount = Column(String(50))  # 합계금액
+
+    raw = Column(Text)  # 바로빌 SimpleTaxInvoiceEx 원본 (JSON)
+
+    synced_at = Column(DateTime, nullable=False)  # 마지막으로 바로빌 목록에서 확인한 시각 (UTC)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # 관계
+    user = relationship("User", backref="tax_invoice_mirrors")
+
+    __table_args__ = (
+        # 동기화 upsert 기준
+        UniqueConstraint("user_id", "direction", "invoice_key", name="uq_tax_invoice_mirrors_user_direction_key"),
+        # 대시보드 조회: 사용자 + 구분 + 작성일자
+        Index("idx_tax_invoice_mirrors_user_direction_write_date", "user_id", "direction", "write_date"),
+    )
+
+
+class TaxInvoiceMirrorSyncState(Base):
+    """바로빌 세금계산서 목록 미러 동기화 워터마크 (사용자 + 구분별)"""
+    __tablename__ = "tax_invoice_mirror_sync_states"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    direction = Column(Enum(TaxInvoiceMirrorDirection), nullable=False)
+    corp_num = Column(String(20), nullable=False)  # 동기화한 사업자번호 (바뀌면 처음부터 다시 동기화)
+
+    synced_through = Column(String(8))  # 이 작성일자까지 동기화 완료 (YYYYMMDD)
+    last_synced_at = Column(DateTime)  # 마지막 동기화 성공 시각 (UTC)
+    last_error = Column(Text)  # 마지막 동기화 오류
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "direction", name="uq_tax_invoice_mirror_sync_states_user_direction"),
+    )
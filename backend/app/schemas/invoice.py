@@ -32,6 +32,7 @@ class InvoiceResponse(InvoiceBase):
     user_id: int
     status: str
     mgt_key: Optional[str] = None
+    state_synced_at: Optional[datetime] = None  # 바로빌 상태 마지막 동기화 시각 (UTC)
     created_at: datetime
     updated_at: Optional[datetime] = None
     
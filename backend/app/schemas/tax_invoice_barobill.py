@@ -68,6 +68,12 @@ class TaxInvoiceCreate(BaseModel):
     IssueTiming: int = 1  # 1: 즉시발행, 2: 발행예약
 
 
+class TaxInvoiceBatchCreate(BaseModel):
+    """세금계산서 일괄 발행 스키마"""
+
+    invoices: List[TaxInvoiceCreate]
+
+
 class TaxInvoiceIssue(BaseModel):
     """세금계산서 발행 스키마"""
 
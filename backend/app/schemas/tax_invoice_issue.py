@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from typing import Optional
 from datetime import date, datetime
+from decimal import Decimal
 
 
 class TaxInvoiceIssueBase(BaseModel):
@@ -49,6 +50,10 @@ class TaxInvoiceIssueResponse(TaxInvoiceIssueBase):
     id: int
     user_id: int
     retention_until: date
+    amount_total_value: Optional[Decimal] = None  # 공급가액 (숫자)
+    tax_total_value: Optional[Decimal] = None  # 세액 (숫자)
+    total_amount_value: Optional[Decimal] = None  # 합계금액 (숫자)
+    state_synced_at: Optional[datetime] = None  # 바로빌 상태 마지막 동기화 시각 (UTC)
     created_at: datetime
     updated_at: Optional[datetime] = None
 
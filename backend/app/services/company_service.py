@@ -2,14 +2,86 @@
 회사 관련 비즈니스 로직 서비스
 """
 
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
+from sqlalchemy.orm import Session
 from app.core.barobill import BaroBillMemberService
 from app.core.config import settings
+from app.models.client import Client
+from app.models.company import Company
+from app.utils.business_number import normalize_business_number
 
 
 class CompanyService:
     """회사 관련 비즈니스 로직"""
 
+    @staticmethod
+    def find_company_by_business_number(
+        db: Session, user_id: int, business_number: str
+    ) -> Optional[Company]:
+        """
+        사용자의 회사 중 사업자번호가 일치하는 회사 조회 (하이픈 유무 무관, 인덱스 조회)
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+            business_number: 사업자번호 (하이픈 포함/미포함)
+
+        Returns:
+            먼저 등록된 회사 (없으면 None)
+        """
+        return (
+            db.query(Company)
+            .filter(
+                Company.user_id == user_id,
+                Company.business_number_normalized == normalize_business_number(business_number),
+            )
+            .order_by(Company.id)
+            .first()
+        )
+
+    @staticmethod
+    def find_companies_by_business_numbers(
+        db: Session, user_id: int, business_numbers: Iterable[str]
+    ) -> Dict[str, Company]:
+        """
+        사용자의 회사 중 사업자번호가 일치하는 회사들을 한 번에 조회 (인덱스 조회)
+
+        Returns:
+            {정규화 사업자번호: 먼저 등록된 회사}
+        """
+        wanted = {normalize_business_number(number) for number in business_numbers}
+        if not wanted:
+            return {}
+        companies = (
+            db.query(Company)
+            .filter(
+                Company.user_id == user_id,
+                Company.business_number_normalized.in_(wanted),
+            )
+            .order_by(Company.id)
+            .all()
+        )
+
+        found = {}
+        for company in companies:
+            found.setdefault(company.business_number_normalized, company)
+        return found
+
+    @staticmethod
+    def find_client_by_business_number(
+        db: Session, user_id: int, business_number: str
+    ) -> Optional[Client]:
+        """사용자의 거래처 중 사업자번호가 일치하는 거래처 조회 (하이픈 유무 무관, 인덱스 조회)"""
+        return (
+            db.query(Client)
+            .filter(
+                Client.user_id == user_id,
+                Client.business_number_normalized == normalize_business_number(business_number),
+            )
+            .order_by(Client.id)
+            .first()
+        )
+
     @staticmethod
     def get_barobill_partner_service() -> Optional[BaroBillMemberService]:
         """
@@ -0,0 +1,194 @@
+"""
+멱등성 키 서비스 (Idempotency-Key 헤더)
+
+모바일 재전송 등으로 같은 발행/취소 요청이 다시 들어와도 한 번만 처리되도록,
+(사용자, 키)별로 요청 지문과 성공 응답을 저장하고 재요청에는 저장된 응답을 그대로 반환합니다.
+재요청은 바로빌 호출, 무료 건수/과금 처리를 다시 실행하지 않습니다.
+
+- 성공 응답만 저장합니다. 처리 중 오류가 나거나 요청이 취소되면 키를 해제해 같은 키로 다시 시도할 수 있습니다.
+- 단, 다시 시도하면 중복 처리되는 실패(NonRetryableHTTPException, 바로빌 발행 후 저장 실패 등)는
+  키를 해제하지 않고 실패 응답을 저장해 재요청에도 그대로 반환합니다.
+- 같은 키로 다른 요청(지문 불일치)을 보내면 422, 첫 요청이 아직 처리 중이면 409를 반환합니다.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Optional
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.idempotency_key import IdempotencyKey, IdempotencyKeyStatus
+
+logger = logging.getLogger(__name__)
+
+# 재요청에 저장된 응답을 반환했음을 알리는 응답 헤더
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+class NonRetryableHTTPException(HTTPException):
+    """다시 시도하면 중복 처리되는 실패 (외부 처리는 끝났고 결과 저장만 실패한 경우 등)"""
+
+
+class IdempotencyService:
+    """멱등성 키 DB 로직"""
+
+    @staticmethod
+    def fingerprint(scope: str, payload: Any = None) -> str:
+        """
+        요청 지문 생성
+
+        Args:
+            scope: 엔드포인트 식별자 (예: "POST /barobill/tax-invoices/issue")
+            payload: 요청 본문/경로 파라미터 (JSON 직렬화 가능)
+        """
+        body = json.dumps(jsonable_encoder(payload), ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(f"{scope}\n{body}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def validate_key(key: str) -> str:
+        """Idempotency-Key 헤더 값 검증"""
+        key = key.strip()
+        if not key or len(key) > settings.IDEMPOTENCY_KEY_MAX_LENGTH:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Idempotency-Key는 1~{settings.IDEMPOTENCY_KEY_MAX_LENGTH}자여야 합니다."
+            )
+        return key
+
+    @staticmethod
+    def begin(db: Session, user_id: int, key: str, request_hash: str) -> IdempotencyKey:
+        """
+        멱등성 키 선점 (커밋 포함)
+
+        Returns:
+            새로 선점했으면 IN_PROGRESS 레코드, 이미 처리된 키면 COMPLETED 레코드
+
+        Raises:
+            HTTPException: 같은 키로 다른 요청을 보낸 경우 (422), 첫 요청이 처리 중인 경우 (409)
+        """
+        now = datetime.utcnow()
+        existing = db.query(IdempotencyKey).filter(
+            IdempotencyKey.user_id == user_id,
+            IdempotencyKey.key == key
+        ).first()
+
+        if existing is not None and existing.expires_at <= now:
+            # 만료된 키는 새 요청으로 처리
+            db.delete(existing)
+            db.commit()
+            existing = None
+
+        if existing is None:
+            record = IdempotencyKey(
+                user_id=user_id,
+                key=key,
+                request_hash=request_hash,
+                status=IdempotencyKeyStatus.IN_PROGRESS,
+                expires_at=now + timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS),
+            )
+            db.add(record)
+            try:
+                db.commit()
+                db.refresh(record)
+                return record
+            except IntegrityError:
+                # 동시에 같은 키로 들어온 요청이 먼저 선점
+                db.rollback()
+                existing = db.query(IdempotencyKey).filter(
+                    IdempotencyKey.user_id == user_id,
+                    IdempotencyKey.key == key
+                ).first()
+                if existing is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail="같은 Idempotency-Key로 요청이 처리 중입니다. 잠시 후 다시 시도해주세요."
+                    )
+
+        if existing.request_hash != request_hash:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="같은 Idempotency-Key로 다른 요청을 보낼 수 없습니다."
+            )
+        if existing.status != IdempotencyKeyStatus.COMPLETED:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="같은 Idempotency-Key로 요청이 처리 중입니다. 잠시 후 다시 시도해주세요."
+            )
+        return existing
+
+    @staticmethod
+    def complete(db: Session, record_id: int, status_code: int, body: Any):
+        """성공 응답 저장 (커밋 포함)"""
+        record = db.get(IdempotencyKey, record_id)
+        if record is None:
+            return
+        record.status = IdempotencyKeyStatus.COMPLETED
+        record.response_status_code = status_code
+        record.response_body = json.dumps(jsonable_encoder(body), ensure_ascii=False)
+        db.commit()
+
+    @staticmethod
+    def release(db: Session, record_id: int):
+        """처리 실패 시 키 해제 (커밋 포함, 같은 키로 다시 시도 가능)"""
+        db.rollback()
+        db.query(IdempotencyKey).filter(IdempotencyKey.id == record_id).delete(
+            synchronize_session=False
+        )
+        db.commit()
+
+
+async def run_idempotent(
+    db: Session,
+    user_id: int,
+    key: Optional[str],
+    request_hash: str,
+    handler: Callable[[], Awaitable[Any]],
+    status_code: int = status.HTTP_200_OK
+) -> Any:
+    """
+    Idempotency-Key가 있으면 한 번만 실행하고, 재요청에는 저장된 응답 반환
+
+    Args:
+        db: 데이터베이스 세션
+        user_id: 사용자 ID
+        key: Idempotency-Key 헤더 값 (없으면 handler를 그대로 실행)
+        request_hash: IdempotencyService.fingerprint로 만든 요청 지문
+        handler: 실제 처리 코루틴 함수 (응답 본문 반환)
+        status_code: 성공 응답 상태 코드 (재요청 응답에 그대로 사용)
+    """
+    if key is None:
+        return await handler()
+
+    key = IdempotencyService.validate_key(key)
+    record = await run_in_threadpool(IdempotencyService.begin, db, user_id, key, request_hash)
+    if record.status == IdempotencyKeyStatus.COMPLETED:
+        return JSONResponse(
+            content=json.loads(record.response_body),
+            status_code=record.response_status_code,
+            headers={REPLAYED_HEADER: "true"}
+        )
+
+    record_id = record.id
+    try:
+        result = await handler()
+    except NonRetryableHTTPException as e:
+        # 키를 해제하면 재요청이 다시 처리되므로 실패 응답을 저장 (저장도 실패하면 TTL 동안 처리 중(409)으로 남음)
+        try:
+            await run_in_threadpool(
+                IdempotencyService.complete, db, record_id, e.status_code, {"detail": e.detail}
+            )
+        except Exception as save_error:
+            logger.error(f"멱등성 키 실패 응답 저장 실패 (키: {key}): {str(save_error)}")
+        raise
+    except BaseException:
+        # 취소(CancelledError)도 해제해야 키가 TTL 동안 처리 중(409)으로 남지 않음, 해제는 다시 취소되지 않도록 보호
+        await asyncio.shield(run_in_threadpool(IdempotencyService.release, db, record_id))
+        raise
+    await run_in_threadpool(IdempotencyService.complete, db, record_id, status_code, result)
+    return result
@@ -1,22 +1,345 @@
 """
 세금계산서 발행/취소 관련 DB 및 비즈니스 로직 서비스
 """
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Tuple
 from decimal import Decimal
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
-from datetime import timedelta
+from datetime import date, datetime, timedelta
+import json
+import secrets
 from fastapi import HTTPException, status
 from app.models.invoice import Invoice
-from app.models.tax_invoice_issue import TaxInvoiceIssue
+from app.models.tax_invoice_issue import TaxInvoiceIssue, TaxInvoiceIssueLineItem
 from app.models.user import User
 from app.crud.usage import record_usage_log
 from app.models.usage_log import UsageType
+from app.models.billing_charge import BillingCharge, ChargeType
+from app.models.payment_method import PaymentMethod
+from app.services.corp_state_service import FREE_INVOICE_QUOTA
+from app.services.tax_invoice_pricing import parse_amount
+
+# 계산서 발행 건당 과금액 (원)
+INVOICE_ISSUE_CHARGE_AMOUNT = 200
 
 
 class InvoiceService:
     """세금계산서 발행/취소 관련 DB 및 비즈니스 로직"""
 
+    @staticmethod
+    def parse_write_date(write_date_str: Optional[str]) -> date:
+        """작성일자(YYYYMMDD)를 date로 변환 (변환 실패 시 오늘 날짜)"""
+        if write_date_str and len(write_date_str) == 8:
+            try:
+                return datetime.strptime(write_date_str, '%Y%m%d').date()
+            except ValueError:
+                pass  # 변환 실패 시 오늘 날짜 사용
+        return date.today()
+
+    @staticmethod
+    def generate_mgt_key() -> str:
+        """관리번호 생성 (작성시각 14자리 + 임의 8자리, 바로빌 관리번호 최대 24자)"""
+        return f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{secrets.token_hex(4)}"
+
+    @staticmethod
+    def ensure_mgt_key(invoice_data: Dict[str, Any]) -> str:
+        """
+        공급자 문서번호(InvoicerParty.MgtNum)가 없으면 관리번호를 생성해 채움
+
+        즉시 발행(RegistAndIssueTaxInvoice)은 MgtNum이 관리번호가 되므로 바로빌 호출 전에 반드시 채워야 합니다.
+
+        Returns:
+            관리번호
+        """
+        invoicer = invoice_data.setdefault('InvoicerParty', {})
+        if not invoicer.get('MgtNum'):
+            invoicer['MgtNum'] = InvoiceService.generate_mgt_key()
+        return invoicer['MgtNum']
+
+    @staticmethod
+    def amount_value(value: Any) -> Optional[Decimal]:
+        """금액 문자열을 숫자 컬럼(*_value) 값으로 변환 (tax_invoice_pricing.parse_amount 사용, 비어 있으면 None)"""
+        if value is None or value == '':
+            return None
+        return Decimal(parse_amount(value))
+
+    @staticmethod
+    def line_item_values(line_items: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        TaxInvoiceTradeLineItems를 tax_invoice_issue_line_items 컬럼 값 목록으로 변환
+
+        Args:
+            line_items: 바로빌로 전송한 품목 목록 (line_items JSON과 같은 형태)
+
+        Returns:
+            [{line_no, purchase_expiry, name, information, quantity, unit_price, amount, tax, description}]
+        """
+        values = []
+        for item in line_items or []:
+            if not isinstance(item, dict):
+                continue
+            values.append({
+                'line_no': len(values) + 1,
+                'purchase_expiry': item.get('PurchaseExpiry'),
+                'name': (item.get('Name') or '')[:255],
+                'information': (item.get('Information') or '')[:255] or None,
+                'quantity': InvoiceService.amount_value(item.get('ChargeableUnit')),
+                'unit_price': InvoiceService.amount_value(item.get('UnitPrice')),
+                'amount': InvoiceService.amount_value(item.get('Amount')),
+                'tax': InvoiceService.amount_value(item.get('Tax')),
+                'description': item.get('Description'),
+            })
+        return values
+
+    @staticmethod
+    def build_tax_invoice_issue(
+        user_id: int,
+        invoice_data: Dict[str, Any],
+        mgt_key: str,
+        **extra
+    ) -> TaxInvoiceIssue:
+        """
+        바로빌 전송 데이터로 TaxInvoiceIssue(5년 보관) 객체 생성
+
+        Args:
+            user_id: 사용자 ID
+            invoice_data: 바로빌로 전송한 세금계산서 데이터
+            mgt_key: 관리번호
+            **extra: barobill_result_code, barobill_state 등 추가 필드
+        """
+        write_date_str = invoice_data.get('WriteDate', '')
+        invoicer = invoice_data.get('InvoicerParty', {})
+        invoicee = invoice_data.get('InvoiceeParty', {})
+
+        issue_date = InvoiceService.parse_write_date(write_date_str)
+
+        # 품목 정보를 JSON 문자열로 변환 (집계용 품목 행도 함께 생성)
+        line_items_json = None
+        if invoice_data.get('TaxInvoiceTradeLineItems'):
+            line_items_json = json.dumps(invoice_data['TaxInvoiceTradeLineItems'], ensure_ascii=False)
+        trade_line_items = [
+            TaxInvoiceIssueLineItem(user_id=user_id, issue_date=issue_date, **values)
+            for values in InvoiceService.line_item_values(invoice_data.get('TaxInvoiceTradeLineItems'))
+        ]
+
+        return TaxInvoiceIssue(
+            user_id=user_id,
+            mgt_key=mgt_key,
+            issue_date=issue_date,
+            write_date=write_date_str,
+            invoicer_corp_num=invoicer.get('CorpNum', ''),
+            invoicer_corp_name=invoicer.get('CorpName', ''),
+            invoicer_ceo_name=invoicer.get('CEOName'),
+            invoicer_addr=invoicer.get('Addr'),
+            invoicer_biz_type=invoicer.get('BizType'),
+            invoicer_biz_class=invoicer.get('BizClass'),
+            invoicer_email=invoicer.get('Email'),
+            invoicee_corp_num=invoicee.get('CorpNum', ''),
+            invoicee_corp_name=invoicee.get('CorpName', ''),
+            invoicee_ceo_name=invoicee.get('CEOName'),
+            invoicee_addr=invoicee.get('Addr'),
+            invoicee_biz_type=invoicee.get('BizType'),
+            invoicee_biz_class=invoicee.get('BizClass'),
+            invoicee_email=invoicee.get('Email'),
+            amount_total=invoice_data.get('AmountTotal'),
+            tax_total=invoice_data.get('TaxTotal'),
+            total_amount=invoice_data.get('TotalAmount'),
+            amount_total_value=InvoiceService.amount_value(invoice_data.get('AmountTotal')),
+            tax_total_value=InvoiceService.amount_value(invoice_data.get('TaxTotal')),
+            total_amount_value=InvoiceService.amount_value(invoice_data.get('TotalAmount')),
+            cash=invoice_data.get('Cash'),
+            chk_bill=invoice_data.get('ChkBill'),
+            note=invoice_data.get('Note'),
+            credit=invoice_data.get('Credit'),
+            purpose_type=invoice_data.get('PurposeType'),
+            tax_type=invoice_data.get('TaxType'),
+            remark1=invoice_data.get('Remark1'),
+            remark2=invoice_data.get('Remark2'),
+            remark3=invoice_data.get('Remark3'),
+            line_items=line_items_json,
+            trade_line_items=trade_line_items,
+            **extra
+        )
+
+    @staticmethod
+    def build_invoice(
+        user_id: int,
+        invoice_data: Dict[str, Any],
+        mgt_key: str,
+        status: str
+    ) -> Invoice:
+        """
+        발행내역 표시 및 취소 기능을 위한 Invoice 객체 생성
+
+        Args:
+            user_id: 사용자 ID
+            invoice_data: 바로빌로 전송한 세금계산서 데이터
+            mgt_key: 관리번호
+            status: 상태 (즉시 발행: "대기", 발행 예약: "CREATED")
+        """
+        # 세금계산서 타입 결정 (1: 세금계산서, 2: 계산서)
+        tax_type_str = "세금계산서" if invoice_data.get('TaxInvoiceType', 1) == 1 else "계산서"
+        # 과세/면세 구분
+        if invoice_data.get('TaxType', 1) == 2:
+            tax_type_str = "면세" + tax_type_str
+        else:
+            tax_type_str = "과세" + tax_type_str
+
+        # 총액을 Decimal로 변환
+        total_amount_str = invoice_data.get('TotalAmount', '0')
+        try:
+            total_amount_decimal = Decimal(total_amount_str)
+        except:
+            total_amount_decimal = Decimal('0')
+
+        return Invoice(
+            user_id=user_id,
+            customer_name=invoice_data.get('InvoiceeParty', {}).get('CorpName', '거래처'),
+            amount=total_amount_decimal,
+            tax_type=tax_type_str,
+            memo=invoice_data.get('Remark1') or invoice_data.get('Remark2') or invoice_data.get('Remark3'),
+            status=status,
+            mgt_key=mgt_key  # 바로빌 관리번호 저장
+        )
+
+    @staticmethod
+    def save_issued_tax_invoice(
+        db: Session,
+        user: User,
+        invoice_data: Dict[str, Any],
+        mgt_key: str,
+        result_code: int
+    ):
+        """
+        즉시 발행 성공 건 저장 (과금 + TaxInvoiceIssue + Invoice, 커밋 포함)
+
+        Args:
+            db: 데이터베이스 세션
+            user: 발행 사용자
+            invoice_data: 바로빌로 전송한 세금계산서 데이터
+            mgt_key: 관리번호
+            result_code: 발행 결과 코드 (양수)
+        """
+        InvoiceService.charge_invoice_issues(db, user, 1)
+        db.add(InvoiceService.build_tax_invoice_issue(
+            user.id,
+            invoice_data,
+            mgt_key,
+            barobill_result_code=result_code,
+            barobill_state="발행완료"
+        ))
+        # 바로빌로 발행하면 "대기" 상태
+        db.add(InvoiceService.build_invoice(user.id, invoice_data, mgt_key, "대기"))
+        db.commit()
+
+    @staticmethod
+    def save_reserved_tax_invoice(
+        db: Session,
+        user: User,
+        invoice_data: Dict[str, Any],
+        mgt_key: str
+    ):
+        """
+        발행 예약(등록만 된) 건 저장 (TaxInvoiceIssue + Invoice, 커밋 포함)
+
+        Args:
+            db: 데이터베이스 세션
+            user: 발행 사용자
+            invoice_data: 바로빌로 전송한 세금계산서 데이터
+            mgt_key: 관리번호
+        """
+        db.add(InvoiceService.build_tax_invoice_issue(
+            user.id,
+            invoice_data,
+            mgt_key,
+            barobill_state="발행예약"
+        ))
+        # 발행 예약은 "CREATED" 상태
+        db.add(InvoiceService.build_invoice(user.id, invoice_data, mgt_key, "CREATED"))
+        db.commit()
+
+    @staticmethod
+    def has_payment_method(db: Session, user_id: int) -> bool:
+        """payment_methods에서 결제수단 등록 여부 확인"""
+        return (
+            db.query(PaymentMethod).filter(PaymentMethod.user_id == user_id).first()
+            is not None
+        )
+
+    @staticmethod
+    def charge_invoice_issues(db: Session, user: User, count: int):
+        """
+        발행 성공 N건 과금 처리 (결제수단은 payment_methods 기준)
+
+        TaxInvoiceIssue 저장 전에 호출하며, 발행 성공 건수는 한 번만 조회하고
+        건별로 무료 제공 건수 초과 여부를 판단합니다. (단건 발행은 count=1)
+        """
+        if count <= 0 or not InvoiceService.has_payment_method(db, user.id):
+            return
+
+        current_used_count = db.query(TaxInvoiceIssue).filter(
+            TaxInvoiceIssue.user_id == user.id,
+            TaxInvoiceIssue.barobill_result_code > 0
+        ).count()
+
+        # 무료 제공 건수를 넘는 건만 과금
+        charged_count = min(count, max(0, current_used_count + count - FREE_INVOICE_QUOTA))
+        for _ in range(charged_count):
+            record_usage_log(
+                db=db,
+                user_id=user.id,
+                usage_type=UsageType.INVOICE_ISSUE,
+                quantity=1
+            )
+        db.add_all([
+            BillingCharge(
+                user_id=user.id,
+                charge_type=ChargeType.INVOICE,
+                amount=INVOICE_ISSUE_CHARGE_AMOUNT
+            )
+            for _ in range(charged_count)
+        ])
+
+    @staticmethod
+    def save_batch_tax_invoices(
+        db: Session,
+        user: User,
+        issued: List[Tuple[Dict[str, Any], str, int]],
+        reserved: List[Tuple[Dict[str, Any], str]]
+    ):
+        """
+        일괄 발행 결과 저장 (과금 + TaxInvoiceIssue + Invoice, 한 번에 커밋)
+
+        Args:
+            db: 데이터베이스 세션
+            user: 발행 사용자
+            issued: 즉시 발행 성공 건 [(세금계산서 데이터, 관리번호, 결과 코드)]
+            reserved: 발행 예약 건 [(세금계산서 데이터, 관리번호)]
+        """
+        InvoiceService.charge_invoice_issues(db, user, len(issued))
+
+        rows = []
+        for invoice_data, mgt_key, result_code in issued:
+            rows.append(InvoiceService.build_tax_invoice_issue(
+                user.id,
+                invoice_data,
+                mgt_key,
+                barobill_result_code=result_code,
+                barobill_state="발행완료"
+            ))
+            rows.append(InvoiceService.build_invoice(user.id, invoice_data, mgt_key, "대기"))
+        for invoice_data, mgt_key in reserved:
+            rows.append(InvoiceService.build_tax_invoice_issue(
+                user.id,
+                invoice_data,
+                mgt_key,
+                barobill_state="발행예약"
+            ))
+            rows.append(InvoiceService.build_invoice(user.id, invoice_data, mgt_key, "CREATED"))
+
+        db.add_all(rows)
+        db.commit()
+
     @staticmethod
     def update_invoice_after_issue(
         db: Session,
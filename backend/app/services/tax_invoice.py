@@ -1,11 +1,16 @@
+from functools import cached_property
 from typing import Optional, List, Dict, Any
-from app.core.barobill import BaroBillService
+from app.core.barobill import BaroBillService, AsyncBaroBillService, zeep_to_dict
 from app.core.config import settings
+from app.services.tax_invoice_pricing import DEFAULT_VAT_RATE_PERCENT, compute_line_tax, parse_amount
 
 
 class TaxInvoiceService:
     """세금계산서 서비스"""
 
+    # 바로빌 서비스 클래스 (비동기 서비스는 AsyncBaroBillService 사용)
+    barobill_service_class = BaroBillService
+
     def __init__(self, cert_key: Optional[str] = None, corp_num: Optional[str] = None):
         """
         세금계산서 서비스 초기화
@@ -20,13 +25,27 @@ class TaxInvoiceService:
         use_test_server = getattr(settings, "BAROBILL_USE_TEST_SERVER", False)
 
         # 설정에서 테스트 서버 사용 여부 가져오기
-        self.barobill = BaroBillService(
+        self.barobill = self.barobill_service_class(
             cert_key=self.cert_key,
             corp_num=self.corp_num,
             use_test_server=use_test_server,
         )
         self.client = self.barobill.client.get_tax_invoice_client()
 
+    @cached_property
+    def types(self) -> Dict[str, Any]:
+        """세금계산서 요청에 쓰는 zeep 타입 팩토리 (처음 사용할 때 한 번 조회해 보관)"""
+        return {
+            name: self.client.get_type(f"ns0:{name}")
+            for name in (
+                "TaxInvoice",
+                "InvoiceParty",
+                "ArrayOfTaxInvoiceTradeLineItem",
+                "TaxInvoiceTradeLineItem",
+                "ArrayOfString",
+            )
+        }
+
     def get_tax_invoice(self, mgt_key: str) -> Dict[str, Any]:
         """
         세금계산서 조회 (조회용, 실제 HTTP 요청)
@@ -78,7 +97,7 @@ class TaxInvoiceService:
             )
         
         try:
-            array_type = self.client.get_type("ns0:ArrayOfString")
+            array_type = self.types["ArrayOfString"]
             result = self.client.service.GetTaxInvoiceStatesEX(
                 CERTKEY=self.cert_key,
                 CorpNum=self.corp_num,
@@ -183,6 +202,119 @@ class TaxInvoiceService:
         except Exception as e:
             raise
 
+    def regist_and_issue_tax_invoice(
+        self,
+        invoice_data: Dict[str, Any],
+        send_sms: bool = False,
+        force_issue: bool = False,
+        mail_title: str = "",
+    ) -> int:
+        """
+        세금계산서 등록과 즉시 발행을 한 번에 처리 (RegistAndIssueTaxInvoice, 실제 HTTP 요청)
+
+        등록(RegistTaxInvoiceEX) 후 발행(IssueTaxInvoiceEx)을 따로 호출하면 왕복이 두 번이고,
+        발행이 실패하면 등록만 된 세금계산서가 남으므로 즉시 발행은 이 메서드를 사용합니다.
+
+        Args:
+            invoice_data: 세금계산서 데이터
+            send_sms: SMS 발송 여부
+            force_issue: 강제발행 여부
+            mail_title: 메일 제목
+
+        Returns:
+            결과 코드 (양수: 성공)
+        """
+        return self._regist_and_issue(
+            "RegistAndIssueTaxInvoice",
+            invoice_data,
+            SendSMS=send_sms,
+            ForceIssue=force_issue,
+            MailTitle=mail_title,
+        )
+
+    def regist_and_issue_broker_tax_invoice(
+        self,
+        invoice_data: Dict[str, Any],
+        send_sms: bool = False,
+        force_issue: bool = False,
+        mail_title: str = "",
+    ) -> int:
+        """위수탁 세금계산서 등록 + 즉시 발행 (RegistAndIssueBrokerTaxInvoice, CorpNum은 수탁자)"""
+        return self._regist_and_issue(
+            "RegistAndIssueBrokerTaxInvoice",
+            invoice_data,
+            SendSMS=send_sms,
+            ForceIssue=force_issue,
+            MailTitle=mail_title,
+        )
+
+    def regist_and_pre_issue_tax_invoice(
+        self,
+        invoice_data: Dict[str, Any],
+        send_sms: bool = False,
+        issue_timing: int = 1,
+        mail_title: str = "",
+    ) -> int:
+        """세금계산서 등록 + 발행예정 (RegistAndPreIssueTaxInvoice, 공급받는자 승인 후 발행)"""
+        return self._regist_and_issue(
+            "RegistAndPreIssueTaxInvoice",
+            invoice_data,
+            SendSMS=send_sms,
+            IssueTiming=issue_timing,
+            MailTitle=mail_title,
+        )
+
+    def regist_and_pre_issue_broker_tax_invoice(
+        self,
+        invoice_data: Dict[str, Any],
+        send_sms: bool = False,
+        issue_timing: int = 1,
+        mail_title: str = "",
+    ) -> int:
+        """위수탁 세금계산서 등록 + 발행예정 (RegistAndPreIssueBrokerTaxInvoice, CorpNum은 수탁자)"""
+        return self._regist_and_issue(
+            "RegistAndPreIssueBrokerTaxInvoice",
+            invoice_data,
+            SendSMS=send_sms,
+            IssueTiming=issue_timing,
+            MailTitle=mail_title,
+        )
+
+    def regist_and_reverse_issue_tax_invoice(
+        self,
+        invoice_data: Dict[str, Any],
+        send_sms: bool = False,
+        force_issue: bool = False,
+        mail_title: str = "",
+    ) -> int:
+        """역발행 세금계산서 등록 + 역발행 요청 (RegistAndReverseIssueTaxInvoice, CorpNum은 공급받는자)"""
+        return self._regist_and_issue(
+            "RegistAndReverseIssueTaxInvoice",
+            invoice_data,
+            SendSMS=send_sms,
+            ForceIssue=force_issue,
+            MailTitle=mail_title,
+        )
+
+    def _regist_and_issue(self, operation: str, invoice_data: Dict[str, Any], **options) -> int:
+        """등록+발행 통합 오퍼레이션 호출 (음수 결과 코드면 예외)"""
+        # 실제 바로빌 서버로 HTTP 요청을 보내므로 검증 필요
+        settings.validate_barobill()
+
+        tax_invoice = self._create_tax_invoice_object(invoice_data)
+        result = getattr(self.client.service, operation)(
+            CERTKEY=self.cert_key,
+            CorpNum=self.corp_num,
+            Invoice=tax_invoice,
+            **options,
+        )
+
+        if result < 0:  # 호출 실패
+            error_msg = self.barobill.get_err_string(result)
+            raise Exception(f"세금계산서 등록/발행 실패: {error_msg} (코드: {result})")
+
+        return result
+
     def delete_tax_invoice(self, mgt_key: str) -> int:
         """
         세금계산서 삭제 (실제 HTTP 요청)
@@ -211,44 +343,98 @@ class TaxInvoiceService:
         except Exception as e:
             raise
 
+    def get_period_tax_invoice_list(
+        self,
+        operation: str,
+        user_id: str,
+        start_date: str,
+        end_date: str,
+        current_page: int = 1,
+        count_per_page: int = 100,
+        tax_type: int = 1,
+        date_type: int = 1
+    ) -> Dict[str, Any]:
+        """
+        기간별 매출/매입 세금계산서 목록 조회 (한 페이지, 실제 HTTP 요청)
+
+        Args:
+            operation: GetPeriodTaxInvoiceSalesList 또는 GetPeriodTaxInvoicePurchaseList
+            user_id: 바로빌 아이디
+            start_date: 시작일자 (YYYYMMDD)
+            end_date: 종료일자 (YYYYMMDD)
+            current_page: 조회할 페이지 (1부터)
+            count_per_page: 페이지당 건수
+            tax_type: 과세형태 (TaxType)
+            date_type: 조회 기준일자 (DateType)
+
+        Returns:
+            CurrentPage, CountPerPage, MaxPageNum, MaxIndex 와 목록(items, SimpleTaxInvoiceEx 딕셔너리)
+        """
+        if not settings.is_barobill_configured():
+            raise RuntimeError(
+                "바로빌 API 호출 실패: 바로빌 인증키가 설정되지 않았습니다."
+            )
+
+        result = getattr(self.client.service, operation)(
+            CERTKEY=self.cert_key,
+            CorpNum=self.corp_num,
+            UserID=user_id,
+            TaxType=tax_type,
+            DateType=date_type,
+            StartDate=start_date,
+            EndDate=end_date,
+            CountPerPage=count_per_page,
+            CurrentPage=current_page,
+        )
+
+        if result.CurrentPage < 0:  # 호출 실패
+            error_msg = self.barobill.get_err_string(result.CurrentPage)
+            raise Exception(
+                f"세금계산서 목록 조회 실패: {error_msg} (코드: {result.CurrentPage})"
+            )
+
+        return self._convert_period_list(result)
+
+    def _convert_period_list(self, result) -> Dict[str, Any]:
+        """기간별 목록 조회 결과를 딕셔너리로 변환 (목록이 비어 있으면 items=[])"""
+        invoice_list = result.SimpleTaxInvoiceExList
+        items = (invoice_list.SimpleTaxInvoiceEx if invoice_list is not None else None) or []
+        return {
+            "CurrentPage": result.CurrentPage,
+            "CountPerPage": result.CountPerPage,
+            "MaxPageNum": result.MaxPageNum or 0,
+            "MaxIndex": result.MaxIndex or 0,
+            "items": [self._convert_to_dict(item) for item in items],
+        }
+
     def _create_tax_invoice_object(self, invoice_data: Dict[str, Any]):
         """세금계산서 객체 생성"""
-        # TaxInvoice 타입 가져오기
-        tax_invoice_type = self.client.get_type("ns0:TaxInvoice")
-        invoice_party_type = self.client.get_type("ns0:InvoiceParty")
-        array_of_line_items_type = self.client.get_type(
-            "ns0:ArrayOfTaxInvoiceTradeLineItem"
-        )
-        line_item_type = self.client.get_type("ns0:TaxInvoiceTradeLineItem")
+        # TaxInvoice 타입 가져오기 (인스턴스에 보관된 팩토리)
+        types = self.types
+        tax_invoice_type = types["TaxInvoice"]
+        invoice_party_type = types["InvoiceParty"]
+        array_of_line_items_type = types["ArrayOfTaxInvoiceTradeLineItem"]
+        line_item_type = types["TaxInvoiceTradeLineItem"]
 
         # 전체 부가세율 확인 (API 엔드포인트에서 계산되었지만, 혹시 모를 경우를 대비)
-        vat_rate_percent = invoice_data.get("vat_rate_percent", 10.0)
-        vat_rate = vat_rate_percent / 100.0
+        vat_rate_percent = invoice_data.get("vat_rate_percent")
+        if vat_rate_percent is None:
+            vat_rate_percent = DEFAULT_VAT_RATE_PERCENT
 
         # 거래명세서 항목 생성
         line_items = []
         if "TaxInvoiceTradeLineItems" in invoice_data:
             for item_data in invoice_data["TaxInvoiceTradeLineItems"]:
-                # 공급가액 추출
-                try:
-                    supply_value = float(item_data.get("Amount", 0) or 0)
-                except (ValueError, TypeError):
-                    supply_value = 0
-
-                # VAT 금액 확인 및 계산
+                # VAT 금액 확인 (비어 있을 때만 부가세율로 계산, 엔드포인트에서 계산한 값은 그대로 사용)
                 tax_value = item_data.get("Tax", "")
-                if not tax_value or tax_value == "":
-                    # Tax 필드가 비어있으면 부가세율로 계산
+                if not tax_value:
                     # 품목별 부가세율이 있으면 사용, 없으면 전체 부가세율 사용
                     item_vat_rate_percent = item_data.get("vat_rate_percent")
-                    if item_vat_rate_percent is not None:
-                        item_vat_rate = item_vat_rate_percent / 100.0
-                    else:
-                        item_vat_rate = vat_rate
-
-                    # VAT 금액 계산 (공급가액 * 부가세율)
-                    tax_amount = round(supply_value * item_vat_rate)
-                    tax_value = str(int(tax_amount))
+                    if item_vat_rate_percent is None:
+                        item_vat_rate_percent = vat_rate_percent
+                    tax_value = str(compute_line_tax(
+                        parse_amount(item_data.get("Amount")), item_vat_rate_percent
+                    ))
 
                 # barobill API는 VAT 금액을 문자열로 받음
                 line_item = line_item_type(
@@ -324,22 +510,266 @@ class TaxInvoiceService:
         )
 
     def _convert_to_dict(self, obj) -> Dict[str, Any]:
-        """zeep 객체를 딕셔너리로 변환"""
-        if hasattr(obj, "__dict__"):
-            result = {}
-            for key, value in obj.__dict__.items():
-                if hasattr(value, "__dict__"):
-                    result[key] = self._convert_to_dict(value)
-                elif isinstance(value, list):
-                    result[key] = [
-                        (
-                            self._convert_to_dict(item)
-                            if hasattr(item, "__dict__")
-                            else item
-                        )
-                        for item in value
-                    ]
-                else:
-                    result[key] = value
-            return result
-        return obj
+        """zeep 객체를 딕셔너리로 변환 (타입별 필드 구성을 캐시하는 공용 변환기 사용)"""
+        return zeep_to_dict(obj)
+
+
+class AsyncTaxInvoiceService(TaxInvoiceService):
+    """
+    세금계산서 서비스 (비동기)
+
+    SOAP 호출을 이벤트 루프에서 기다리므로 스레드풀을 점유하지 않습니다.
+    세금계산서 객체 생성/변환 로직은 TaxInvoiceService와 공유합니다.
+    """
+
+    barobill_service_class = AsyncBaroBillService
+
+    async def get_tax_invoice(self, mgt_key: str) -> Dict[str, Any]:
+        """세금계산서 조회 (TaxInvoiceService.get_tax_invoice 참고)"""
+        if not settings.is_barobill_configured():
+            raise RuntimeError(
+                "바로빌 API 호출 실패: 바로빌 인증키가 설정되지 않았습니다."
+            )
+
+        result = await self.client.service.GetTaxInvoice(
+            CERTKEY=self.cert_key,
+            CorpNum=self.corp_num,
+            MgtKey=mgt_key,
+        )
+
+        if result.TaxInvoiceType < 0:  # 호출 실패
+            error_msg = await self.barobill.get_err_string(result.TaxInvoiceType)
+            raise Exception(
+                f"세금계산서 조회 실패: {error_msg} (코드: {result.TaxInvoiceType})"
+            )
+
+        return self._convert_to_dict(result)
+
+    async def get_tax_invoice_states(self, mgt_key_list: List[str]) -> List[Dict[str, Any]]:
+        """세금계산서 상태 조회 (TaxInvoiceService.get_tax_invoice_states 참고)"""
+        if not settings.is_barobill_configured():
+            raise RuntimeError(
+                "바로빌 API 호출 실패: 바로빌 인증키가 설정되지 않았습니다."
+            )
+
+        array_type = self.types["ArrayOfString"]
+        result = await self.client.service.GetTaxInvoiceStatesEX(
+            CERTKEY=self.cert_key,
+            CorpNum=self.corp_num,
+            MgtKeyList=array_type(mgt_key_list),
+        )
+
+        if (
+            len(result) == 1
+            and result[0].MgtKey is None
+            and result[0].BarobillState < 0
+        ):
+            error_msg = await self.barobill.get_err_string(result[0].BarobillState)
+            raise Exception(
+                f"세금계산서 상태 조회 실패: {error_msg} (코드: {result[0].BarobillState})"
+            )
+
+        return [self._convert_to_dict(state) for state in result]
+
+    async def regist_tax_invoice(
+        self, invoice_data: Dict[str, Any], issue_timing: int = 1
+    ) -> str:
+        """세금계산서 등록 (TaxInvoiceService.regist_tax_invoice 참고)"""
+        settings.validate_barobill()
+
+        tax_invoice = self._create_tax_invoice_object(invoice_data)
+
+        result = await self.client.service.RegistTaxInvoiceEX(
+            CERTKEY=self.cert_key,
+            CorpNum=self.corp_num,
+            Invoice=tax_invoice,
+            IssueTiming=issue_timing,
+        )
+
+        if result < 0:  # 호출 실패
+            error_msg = await self.barobill.get_err_string(result)
+            raise Exception(f"세금계산서 등록 실패: {error_msg} (코드: {result})")
+
+        return str(result)
+
+    async def issue_tax_invoice(
+        self,
+        mgt_key: str,
+        send_sms: bool = False,
+        sms_message: str = "",
+        force_issue: bool = False,
+        mail_title: str = "",
+        business_license_yn: bool = False,
+        bank_book_yn: bool = False,
+    ) -> int:
+        """세금계산서 발행 (TaxInvoiceService.issue_tax_invoice 참고)"""
+        settings.validate_barobill()
+
+        result = await self.client.service.IssueTaxInvoiceEx(
+            CERTKEY=self.cert_key,
+            CorpNum=self.corp_num,
+            MgtKey=mgt_key,
+            SendSMS=send_sms,
+            SMSMessage=sms_message,
+            ForceIssue=force_issue,
+            MailTitle=mail_title,
+            BusinessLicenseYN=business_license_yn,
+            BankBookYN=bank_book_yn,
+        )
+
+        if result < 0:  # 호출 실패
+            error_msg = await self.barobill.get_err_string(result)
+            raise Exception(f"세금계산서 발행 실패: {error_msg} (코드: {result})")
+
+        return result
+
+    async def regist_and_issue_tax_invoice(
+        self,
+        invoice_data: Dict[str, Any],
+        send_sms: bool = False,
+        force_issue: bool = False,
+        mail_title: str = "",
+    ) -> int:
+        """세금계산서 등록 + 즉시 발행 (TaxInvoiceService.regist_and_issue_tax_invoice 참고)"""
+        return await self._regist_and_issue(
+            "RegistAndIssueTaxInvoice",
+            invoice_data,
+            SendSMS=send_sms,
+            ForceIssue=force_issue,
+            MailTitle=mail_title,
+        )
+
+    async def regist_and_issue_broker_tax_invoice(
+        self,
+        invoice_data: Dict[str, Any],
+        send_sms: bool = False,
+        force_issue: bool = False,
+        mail_title: str = "",
+    ) -> int:
+        """위수탁 세금계산서 등록 + 즉시 발행 (TaxInvoiceService.regist_and_issue_broker_tax_invoice 참고)"""
+        return await self._regist_and_issue(
+            "RegistAndIssueBrokerTaxInvoice",
+            invoice_data,
+            SendSMS=send_sms,
+            ForceIssue=force_issue,
+            MailTitle=mail_title,
+        )
+
+    async def regist_and_pre_issue_tax_invoice(
+        self,
+        invoice_data: Dict[str, Any],
+        send_sms: bool = False,
+        issue_timing: int = 1,
+        mail_title: str = "",
+    ) -> int:
+        """세금계산서 등록 + 발행예정 (TaxInvoiceService.regist_and_pre_issue_tax_invoice 참고)"""
+        return await self._regist_and_issue(
+            "RegistAndPreIssueTaxInvoice",
+            invoice_data,
+            SendSMS=send_sms,
+            IssueTiming=issue_timing,
+            MailTitle=mail_title,
+        )
+
+    async def regist_and_pre_issue_broker_tax_invoice(
+        self,
+        invoice_data: Dict[str, Any],
+        send_sms: bool = False,
+        issue_timing: int = 1,
+        mail_title: str = "",
+    ) -> int:
+        """위수탁 세금계산서 등록 + 발행예정 (TaxInvoiceService.regist_and_pre_issue_broker_tax_invoice 참고)"""
+        return await self._regist_and_issue(
+            "RegistAndPreIssueBrokerTaxInvoice",
+            invoice_data,
+            SendSMS=send_sms,
+            IssueTiming=issue_timing,
+            MailTitle=mail_title,
+        )
+
+    async def regist_and_reverse_issue_tax_invoice(
+        self,
+        invoice_data: Dict[str, Any],
+        send_sms: bool = False,
+        force_issue: bool = False,
+        mail_title: str = "",
+    ) -> int:
+        """역발행 세금계산서 등록 + 역발행 요청 (TaxInvoiceService.regist_and_reverse_issue_tax_invoice 참고)"""
+        return await self._regist_and_issue(
+            "RegistAndReverseIssueTaxInvoice",
+            invoice_data,
+            SendSMS=send_sms,
+            ForceIssue=force_issue,
+            MailTitle=mail_title,
+        )
+
+    async def _regist_and_issue(self, operation: str, invoice_data: Dict[str, Any], **options) -> int:
+        """등록+발행 통합 오퍼레이션 호출 (TaxInvoiceService._regist_and_issue 참고)"""
+        settings.validate_barobill()
+
+        tax_invoice = self._create_tax_invoice_object(invoice_data)
+        result = await getattr(self.client.service, operation)(
+            CERTKEY=self.cert_key,
+            CorpNum=self.corp_num,
+            Invoice=tax_invoice,
+            **options,
+        )
+
+        if result < 0:  # 호출 실패
+            error_msg = await self.barobill.get_err_string(result)
+            raise Exception(f"세금계산서 등록/발행 실패: {error_msg} (코드: {result})")
+
+        return result
+
+    async def delete_tax_invoice(self, mgt_key: str) -> int:
+        """세금계산서 삭제 (TaxInvoiceService.delete_tax_invoice 참고)"""
+        settings.validate_barobill()
+
+        result = await self.client.service.DeleteTaxInvoice(
+            CERTKEY=self.cert_key,
+            CorpNum=self.corp_num,
+            MgtKey=mgt_key,
+        )
+
+        if result < 0:  # 호출 실패
+            error_msg = await self.barobill.get_err_string(result)
+            raise Exception(f"세금계산서 삭제 실패: {error_msg} (코드: {result})")
+
+        return result
+
+    async def get_period_tax_invoice_list(
+        self,
+        operation: str,
+        user_id: str,
+        start_date: str,
+        end_date: str,
+        current_page: int = 1,
+        count_per_page: int = 100,
+        tax_type: int = 1,
+        date_type: int = 1
+    ) -> Dict[str, Any]:
+        """기간별 매출/매입 세금계산서 목록 조회 (TaxInvoiceService.get_period_tax_invoice_list 참고)"""
+        if not settings.is_barobill_configured():
+            raise RuntimeError(
+                "바로빌 API 호출 실패: 바로빌 인증키가 설정되지 않았습니다."
+            )
+
+        result = await getattr(self.client.service, operation)(
+            CERTKEY=self.cert_key,
+            CorpNum=self.corp_num,
+            UserID=user_id,
+            TaxType=tax_type,
+            DateType=date_type,
+            StartDate=start_date,
+            EndDate=end_date,
+            CountPerPage=count_per_page,
+            CurrentPage=current_page,
+        )
+
+        if result.CurrentPage < 0:  # 호출 실패
+            error_msg = await self.barobill.get_err_string(result.CurrentPage)
+            raise Exception(
+                f"세금계산서 목록 조회 실패: {error_msg} (코드: {result.CurrentPage})"
+            )
+
+        return self._convert_period_list(result)
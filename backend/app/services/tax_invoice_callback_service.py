@@ -0,0 +1,183 @@
+"""
+바로빌 callback 상태 반영
+
+홈택스(국세청) 전송이 한꺼번에 완료되면 관리번호별 callback이 수천 건씩 들어오므로,
+건별 조회/커밋 대신 여러 건을 모아 상태별 UPDATE 한 번으로 tax_invoice_issues/invoices에 반영합니다.
+
+- TaxInvoiceCallbackService.apply: 모은 callback을 일괄 반영하고 관리번호별 결과 반환 (일괄 callback API)
+- TaxInvoiceCallbackBuffer: 단건 callback을 TAX_INVOICE_CALLBACK_BUFFER_WINDOW_MS 동안 모아 한 번에 반영
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.invoice import Invoice
+from app.models.tax_invoice_issue import TaxInvoiceIssue
+from app.services.tax_invoice_state_sync_service import PENDING_INVOICE_STATUS
+
+logger = logging.getLogger(__name__)
+
+# 관리번호별 반영 결과
+CALLBACK_UPDATED = "updated"
+CALLBACK_NOT_FOUND = "not_found"
+
+# callback 상태별 invoices.status 반영 값 (없는 상태는 tax_invoice_issues에만 반영)
+INVOICE_STATUS_BY_CALLBACK = {
+    "발행성공": "완료",
+    "전송완료": "완료",
+    "취소됨": "취소됨",
+}
+
+# IN 절 하나에 넣을 최대 관리번호 수
+IN_CLAUSE_SIZE = 1000
+
+
+def _chunks(items: List[str]) -> List[List[str]]:
+    return [items[i:i + IN_CLAUSE_SIZE] for i in range(0, len(items), IN_CLAUSE_SIZE)]
+
+
+class TaxInvoiceCallbackService:
+    """바로빌 callback 일괄 반영 DB 로직"""
+
+    @staticmethod
+    def apply(db: Session, callbacks: List[Tuple[str, str]]) -> Dict[str, str]:
+        """
+        callback 상태를 일괄 반영 (커밋 포함)
+
+        같은 관리번호가 여러 번 오면 마지막 상태를 반영합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            callbacks: [(관리번호, 상태)]
+
+        Returns:
+            관리번호별 반영 결과 (CALLBACK_UPDATED / CALLBACK_NOT_FOUND)
+        """
+        latest: Dict[str, str] = {}
+        for mgt_key, state in callbacks:
+            latest[mgt_key] = state
+        if not latest:
+            return {}
+
+        found = set()
+        for chunk in _chunks(list(latest)):
+            found.update(
+                mgt_key for (mgt_key,) in db.query(TaxInvoiceIssue.mgt_key).filter(
+                    TaxInvoiceIssue.mgt_key.in_(chunk)
+                )
+            )
+
+        keys_by_state: Dict[str, List[str]] = defaultdict(list)
+        for mgt_key, state in latest.items():
+            if mgt_key in found:
+                keys_by_state[state].append(mgt_key)
+
+        now = datetime.utcnow()
+        for state, mgt_keys in keys_by_state.items():
+            invoice_status = INVOICE_STATUS_BY_CALLBACK.get(state)
+            for chunk in _chunks(mgt_keys):
+                db.query(TaxInvoiceIssue).filter(
+                    TaxInvoiceIssue.mgt_key.in_(chunk)
+                ).update(
+                    {TaxInvoiceIssue.barobill_state: state, TaxInvoiceIssue.state_synced_at: now},
+                    synchronize_session=False
+                )
+                if invoice_status:
+                    db.query(Invoice).filter(
+                        Invoice.mgt_key.in_(chunk),
+                        Invoice.status == PENDING_INVOICE_STATUS,
+                    ).update(
+                        {Invoice.status: invoice_status, Invoice.state_synced_at: now},
+                        synchronize_session=False
+                    )
+        db.commit()
+
+        return {
+            mgt_key: CALLBACK_UPDATED if mgt_key in found else CALLBACK_NOT_FOUND
+            for mgt_key in latest
+        }
+
+
+class TaxInvoiceCallbackBuffer:
+    """단건 callback을 잠깐 모아 한 번에 반영하는 버퍼 (이벤트 루프 내에서 사용)"""
+
+    def __init__(self, window_ms: float = 5.0, max_items: int = 500):
+        """
+        Args:
+            window_ms: 첫 callback 이후 모으는 시간(ms), 0 이하면 바로 반영
+            max_items: 모은 건수가 이만큼이면 시간 전이라도 반영
+        """
+        self.window = window_ms / 1000
+        self.max_items = max_items
+        self._pending: List[Tuple[str, str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def submit(self, mgt_key: str, state: str) -> str:
+        """
+        callback 하나를 버퍼에 넣고 반영 결과를 기다림
+
+        Returns:
+            CALLBACK_UPDATED 또는 CALLBACK_NOT_FOUND
+
+        Raises:
+            반영 중 발생한 DB 오류
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((mgt_key, state, future))
+        if self.window <= 0 or len(self._pending) >= self.max_items:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._apply(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    @staticmethod
+    async def _apply(batch: List[Tuple[str, str, asyncio.Future]]):
+        try:
+            outcomes = await run_in_threadpool(
+                TaxInvoiceCallbackBuffer._apply_in_session,
+                [(mgt_key, state) for mgt_key, state, _ in batch]
+            )
+        except Exception as e:
+            logger.exception(f"바로빌 callback 일괄 반영 실패 ({len(batch)}건): {e}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for mgt_key, _, future in batch:
+            if not future.done():
+                future.set_result(outcomes[mgt_key])
+
+    @staticmethod
+    def _apply_in_session(callbacks: List[Tuple[str, str]]) -> Dict[str, str]:
+        db = SessionLocal()
+        try:
+            return TaxInvoiceCallbackService.apply(db, callbacks)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+# 프로세스 전역 callback 버퍼
+tax_invoice_callback_buffer = TaxInvoiceCallbackBuffer(
+    window_ms=settings.TAX_INVOICE_CALLBACK_BUFFER_WINDOW_MS,
+    max_items=settings.TAX_INVOICE_CALLBACK_BUFFER_MAX_ITEMS,
+)
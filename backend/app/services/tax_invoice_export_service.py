@@ -0,0 +1,380 @@
+"""
+발행 세금계산서(tax_invoice_issues) 보관분 스트리밍 내보내기
+
+연간 전체 내보내기도 메모리 사용량이 행 수와 무관하도록,
+서버 측 커서(stream_results)와 yield_per로 TAX_INVOICE_EXPORT_YIELD_PER행씩 읽으면서
+바로 CSV / JSONL / XLSX 바이트로 변환해 내보냅니다. line_items(JSON 문자열)는 행마다 파싱해 펼칩니다.
+
+- CSV / XLSX: 품목 한 줄당 한 행 (세금계산서 정보 반복, 품목이 없으면 한 행)
+- JSONL: 세금계산서 한 건당 한 줄 (line_items는 배열로 펼침)
+- gzip: 어떤 형식이든 스트리밍 압축 가능
+
+XLSX는 추가 의존성 없이 zipfile로 직접 작성하며(인라인 문자열 셀),
+시트당 XLSX_MAX_ROWS행을 넘으면 다음 시트로 넘어갑니다.
+"""
+import csv
+import io
+import json
+import re
+import zipfile
+import zlib
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape
+from sqlalchemy import select
+from app.db.session import SessionLocal
+from app.models.tax_invoice_issue import TaxInvoiceIssue
+
+EXPORT_FORMATS = ("csv", "jsonl", "xlsx")
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# 내보낼 세금계산서 컬럼 (컬럼명, 머리글)
+ISSUE_COLUMNS: List[Tuple[str, str]] = [
+    ("mgt_key", "관리번호"),
+    ("issue_date", "발행일자"),
+    ("write_date", "작성일자"),
+    ("invoicer_corp_num", "공급자 사업자번호"),
+    ("invoicer_corp_name", "공급자 상호"),
+    ("invoicer_ceo_name", "공급자 대표자"),
+    ("invoicer_addr", "공급자 주소"),
+    ("invoicer_biz_type", "공급자 업태"),
+    ("invoicer_biz_class", "공급자 종목"),
+    ("invoicer_email", "공급자 이메일"),
+    ("invoicee_corp_num", "공급받는자 사업자번호"),
+    ("invoicee_corp_name", "공급받는자 상호"),
+    ("invoicee_ceo_name", "공급받는자 대표자"),
+    ("invoicee_addr", "공급받는자 주소"),
+    ("invoicee_biz_type", "공급받는자 업태"),
+    ("invoicee_biz_class", "공급받는자 종목"),
+    ("invoicee_email", "공급받는자 이메일"),
+    ("amount_total", "공급가액"),
+    ("tax_total", "세액"),
+    ("total_amount", "합계금액"),
+    ("cash", "현금"),
+    ("chk_bill", "수표"),
+    ("note", "어음"),
+    ("credit", "외상미수금"),
+    ("purpose_type", "영수/청구"),
+    ("tax_type", "과세형태"),
+    ("remark1", "비고1"),
+    ("remark2", "비고2"),
+    ("remark3", "비고3"),
+    ("barobill_state", "바로빌 상태"),
+    ("retention_until", "보관 만료일"),
+]
+
+# 펼칠 품목 필드 (TaxInvoiceTradeLineItem 필드, 머리글)
+LINE_ITEM_COLUMNS: List[Tuple[str, str]] = [
+    ("PurchaseExpiry", "품목 일자"),
+    ("Name", "품목명"),
+    ("Information", "규격"),
+    ("ChargeableUnit", "수량"),
+    ("UnitPrice", "단가"),
+    ("Amount", "품목 공급가액"),
+    ("Tax", "품목 세액"),
+    ("Description", "품목 비고"),
+]
+
+HEADERS = [label for _, label in ISSUE_COLUMNS] + [label for _, label in LINE_ITEM_COLUMNS]
+
+# XLSX에서 숫자 셀로 쓸 열 (나머지는 문자열, 사업자번호/관리번호의 앞자리 0 보존)
+NUMERIC_HEADERS = {"공급가액", "세액", "합계금액", "수량", "단가", "품목 공급가액", "품목 세액"}
+
+# 시트당 최대 데이터 행 수 (Excel 한도 1,048,576행)
+XLSX_MAX_ROWS = 1_000_000
+
+# CSV/JSONL에서 이만큼 모이면 내보냄
+FLUSH_BYTES = 64 * 1024
+
+_NUMBER = re.compile(r"-?\d+(\.\d+)?")
+_XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _value(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def parse_line_items(raw: Optional[str]) -> List[Dict[str, Any]]:
+    """line_items JSON 문자열 파싱 (비어 있거나 잘못된 값이면 빈 목록)"""
+    if not raw:
+        return []
+    try:
+        items = json.loads(raw)
+    except ValueError:
+        return []
+    return [item for item in items if isinstance(item, dict)] if isinstance(items, list) else []
+
+
+def iter_issues(
+    user_id: int,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    yield_per: int = 1000
+) -> Iterator[Dict[str, Any]]:
+    """
+    발행 세금계산서를 서버 측 커서로 yield_per행씩 읽어 하나씩 반환
+
+    StreamingResponse 본문은 요청 의존성(get_db)이 닫힌 뒤 전송되므로 세션을 직접 열고 닫습니다.
+
+    Args:
+        user_id: 사용자 ID
+        start_date: 발행일자 시작
+        end_date: 발행일자 종료
+        yield_per: 한 번에 가져올 행 수
+
+    Yields:
+        {컬럼명: 값, "line_items": 원본 JSON 문자열}
+    """
+    columns = [getattr(TaxInvoiceIssue, name) for name, _ in ISSUE_COLUMNS] + [TaxInvoiceIssue.line_items]
+    query = select(*columns).where(TaxInvoiceIssue.user_id == user_id)
+    if start_date:
+        query = query.where(TaxInvoiceIssue.issue_date >= start_date)
+    if end_date:
+        query = query.where(TaxInvoiceIssue.issue_date <= end_date)
+    query = query.order_by(TaxInvoiceIssue.issue_date, TaxInvoiceIssue.id).execution_options(
+        stream_results=True, yield_per=max(yield_per, 1)
+    )
+
+    db = SessionLocal()
+    try:
+        for row in db.execute(query).mappings():
+            yield dict(row)
+    finally:
+        db.close()
+
+
+def iter_flat_rows(issues: Iterable[Dict[str, Any]]) -> Iterator[List[Any]]:
+    """세금계산서를 품목 한 줄당 한 행으로 펼침 (HEADERS 순서)"""
+    for issue in issues:
+        head = [_value(issue[name]) for name, _ in ISSUE_COLUMNS]
+        items = parse_line_items(issue["line_items"]) or [{}]
+        for item in items:
+            yield head + [item.get(field) for field, _ in LINE_ITEM_COLUMNS]
+
+
+def csv_chunks(issues: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """CSV 바이트 스트림 (Excel에서 한글이 깨지지 않도록 UTF-8 BOM 포함)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(HEADERS)
+    for row in iter_flat_rows(issues):
+        writer.writerow(row)
+        if buffer.tell() >= FLUSH_BYTES:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+
+def jsonl_chunks(issues: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """JSONL 바이트 스트림 (세금계산서 한 건당 한 줄)"""
+    buffer = io.StringIO()
+    for issue in issues:
+        record = {name: _value(issue[name]) for name, _ in ISSUE_COLUMNS}
+        record["line_items"] = parse_line_items(issue["line_items"])
+        buffer.write(json.dumps(record, ensure_ascii=False))
+        buffer.write("\n")
+        if buffer.tell() >= FLUSH_BYTES:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """zipfile 출력을 모았다가 꺼내 가는 비탐색(non-seekable) 스트림"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _xlsx_cell(header: str, value: Any) -> str:
+    if value is None or value == "":
+        return "<c/>"
+    if header in NUMERIC_HEADERS:
+        text = str(value).replace(",", "").strip()
+        if _NUMBER.fullmatch(text):
+            return f"<c><v>{text}</v></c>"
+    text = escape(_XML_INVALID.sub("", str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _xlsx_row(values: List[Any]) -> str:
+    return "<row>" + "".join(_xlsx_cell(h, v) for h, v in zip(HEADERS, values)) + "</row>"
+
+
+_XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_SHEET_HEAD = (
+    _XML_DECL
+    + '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_TAIL = "</sheetData></worksheet>"
+_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_DOC_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+def _xlsx_package_parts(sheet_count: int) -> List[Tuple[str, str]]:
+    sheet_names = ["세금계산서"] + [f"세금계산서 ({i})" for i in range(2, sheet_count + 1)]
+    content_types = (
+        _XML_DECL
+        + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        + "".join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for i in range(1, sheet_count + 1)
+        )
+        + "</Types>"
+    )
+    root_rels = (
+        _XML_DECL
+        + f'<Relationships xmlns="{_REL_NS}">'
+        f'<Relationship Id="rId1" Type="{_DOC_REL}/officeDocument" Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    )
+    workbook = (
+        _XML_DECL
+        + '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        f'xmlns:r="{_DOC_REL}"><sheets>'
+        + "".join(
+            f'<sheet name="{name}" sheetId="{i}" r:id="rId{i}"/>'
+            for i, name in enumerate(sheet_names, start=1)
+        )
+        + "</sheets></workbook>"
+    )
+    workbook_rels = (
+        _XML_DECL
+        + f'<Relationships xmlns="{_REL_NS}">'
+        + "".join(
+            f'<Relationship Id="rId{i}" Type="{_DOC_REL}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+            for i in range(1, sheet_count + 1)
+        )
+        + "</Relationships>"
+    )
+    return [
+        ("[Content_Types].xml", content_types),
+        ("_rels/.rels", root_rels),
+        ("xl/workbook.xml", workbook),
+        ("xl/_rels/workbook.xml.rels", workbook_rels),
+    ]
+
+
+def xlsx_chunks(issues: Iterable[Dict[str, Any]], max_rows: int = XLSX_MAX_ROWS) -> Iterator[bytes]:
+    """
+    XLSX 바이트 스트림
+
+    시트 XML을 행 단위로 압축해 내보내고, 시트 수가 정해진 뒤 마지막에 workbook.xml 등을 씁니다.
+    """
+    sink = _ChunkSink()
+    archive = zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED)
+    header = _xlsx_row(HEADERS).encode("utf-8")
+    sheet_count = 0
+    sheet = None
+    rows_in_sheet = 0
+
+    def open_sheet():
+        nonlocal sheet_count, rows_in_sheet
+        sheet_count += 1
+        rows_in_sheet = 0
+        handle = archive.open(f"xl/worksheets/sheet{sheet_count}.xml", mode="w", force_zip64=True)
+        handle.write(_SHEET_HEAD.encode("utf-8"))
+        handle.write(header)
+        return handle
+
+    try:
+        sheet = open_sheet()
+        for row in iter_flat_rows(issues):
+            if rows_in_sheet >= max_rows:
+                sheet.write(_SHEET_TAIL.encode("utf-8"))
+                sheet.close()
+                sheet = open_sheet()
+            sheet.write(_xlsx_row(row).encode("utf-8"))
+            rows_in_sheet += 1
+            data = sink.drain()
+            if data:
+                yield data
+        sheet.write(_SHEET_TAIL.encode("utf-8"))
+        sheet.close()
+        sheet = None
+
+        for name, content in _xlsx_package_parts(sheet_count):
+            archive.writestr(name, content)
+        archive.close()
+        yield sink.drain()
+    finally:
+        if sheet is not None:
+            sheet.close()
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """바이트 스트림을 gzip으로 스트리밍 압축"""
+    compressor = zlib.compressobj(wbits=31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_chunks(
+    export_format: str,
+    user_id: int,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    gzip: bool = False,
+    yield_per: int = 1000
+) -> Iterator[bytes]:
+    """
+    내보내기 바이트 스트림 (StreamingResponse 본문)
+
+    Args:
+        export_format: csv / jsonl / xlsx
+        user_id: 사용자 ID
+        start_date: 발행일자 시작
+        end_date: 발행일자 종료
+        gzip: gzip 압축 여부
+        yield_per: 한 번에 가져올 행 수
+
+    Raises:
+        ValueError: 지원하지 않는 형식
+    """
+    writers = {"csv": csv_chunks, "jsonl": jsonl_chunks, "xlsx": xlsx_chunks}
+    if export_format not in writers:
+        raise ValueError(f"지원하지 않는 내보내기 형식입니다: {export_format}")
+    chunks = writers[export_format](iter_issues(user_id, start_date, end_date, yield_per))
+    return gzip_chunks(chunks) if gzip else chunks
+
+
+def export_filename(
+    export_format: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    gzip: bool = False
+) -> str:
+    """내보내기 파일명 (tax_invoices_시작_종료.형식[.gz])"""
+    period = "_".join(d.strftime("%Y%m%d") for d in (start_date, end_date) if d) or "all"
+    return f"tax_invoices_{period}.{export_format}" + (".gz" if gzip else "")
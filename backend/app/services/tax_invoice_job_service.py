@@ -0,0 +1,261 @@
+"""
+세금계산서 발행 작업 큐 (DB 기반)
+
+발행 API는 검증된 요청을 tax_invoice_jobs에 넣고 바로 202를 반환하며,
+백그라운드 작업자(TaxInvoiceJobWorker)가 lease를 잡고 바로빌 호출/발행 정보 저장을 처리합니다.
+
+- lease: 조건부 UPDATE(상태가 그대로일 때만)로 작업을 가져오므로 인스턴스가 여러 개여도 한 작업자만 처리
+  (결과 기록도 RUNNING + lease_owner가 그대로일 때만 하므로, lease를 잃은 작업자는 dead letter를 덮어쓰지 않음)
+- 재시도: 바로빌로 요청이 나가지 않은 오류(서킷 열림, 연결 실패)만 지수 백오프로 재시도
+- dead letter: 재시도 소진, 결과를 알 수 없는 오류(응답 타임아웃), lease가 만료된 작업
+  (바로빌에 발행되었을 수 있으므로 자동으로 다시 발행하지 않고 확인이 필요한 상태로 둠)
+"""
+import json
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.tax_invoice_job import TaxInvoiceJob, TaxInvoiceJobStatus
+
+logger = logging.getLogger(__name__)
+
+# 종료 상태
+FINISHED_STATUSES = (
+    TaxInvoiceJobStatus.SUCCEEDED,
+    TaxInvoiceJobStatus.FAILED,
+    TaxInvoiceJobStatus.DEAD,
+)
+
+
+class TaxInvoiceJobService:
+    """세금계산서 발행 작업 큐 DB 로직"""
+
+    @staticmethod
+    def enqueue(
+        db: Session,
+        user_id: int,
+        invoice_data: Dict[str, Any],
+        issue_timing: int
+    ) -> TaxInvoiceJob:
+        """
+        발행 작업 등록 (커밋 포함)
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+            invoice_data: 부가세 재계산을 마친 바로빌 전송 데이터
+            issue_timing: 발행시점 (1: 즉시발행, 2: 발행예약)
+        """
+        job = TaxInvoiceJob(
+            job_id=uuid.uuid4().hex,
+            user_id=user_id,
+            status=TaxInvoiceJobStatus.QUEUED,
+            payload=json.dumps(
+                {"invoice_data": invoice_data, "issue_timing": issue_timing},
+                ensure_ascii=False
+            ),
+            attempts=0,
+            max_attempts=settings.TAX_INVOICE_JOB_MAX_ATTEMPTS,
+            next_run_at=datetime.utcnow(),
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return job
+
+    @staticmethod
+    def get_job(db: Session, user_id: int, job_id: str) -> Optional[TaxInvoiceJob]:
+        """사용자의 발행 작업 조회"""
+        return db.query(TaxInvoiceJob).filter(
+            TaxInvoiceJob.job_id == job_id,
+            TaxInvoiceJob.user_id == user_id
+        ).first()
+
+    @staticmethod
+    def get_payload(job: TaxInvoiceJob) -> Dict[str, Any]:
+        """작업 payload (바로빌 전송 데이터, 발행시점)"""
+        return json.loads(job.payload)
+
+    @staticmethod
+    def reap_expired(db: Session) -> int:
+        """
+        lease가 만료된 처리 중 작업을 dead letter로 이동 (커밋 포함)
+
+        작업자가 바로빌 호출 중에 중단되었을 수 있으므로 다시 발행하지 않습니다.
+
+        Returns:
+            이동한 작업 수
+        """
+        now = datetime.utcnow()
+        count = db.query(TaxInvoiceJob).filter(
+            TaxInvoiceJob.status == TaxInvoiceJobStatus.RUNNING,
+            TaxInvoiceJob.lease_expires_at < now
+        ).update(
+            {
+                TaxInvoiceJob.status: TaxInvoiceJobStatus.DEAD,
+                TaxInvoiceJob.last_error: "처리 중 작업자가 중단되었습니다. 바로빌 발행 여부 확인이 필요합니다.",
+                TaxInvoiceJob.lease_owner: None,
+                TaxInvoiceJob.lease_expires_at: None,
+                TaxInvoiceJob.finished_at: now,
+            },
+            synchronize_session=False
+        )
+        db.commit()
+        return count
+
+    @staticmethod
+    def lease_next(db: Session, owner: str, lease_seconds: int) -> Optional[TaxInvoiceJob]:
+        """
+        실행 가능한 작업 하나의 lease 획득 (커밋 포함)
+
+        후보를 조회한 뒤 상태가 그대로인 경우에만 UPDATE하므로,
+        다른 작업자가 먼저 가져간 작업은 건너뜁니다.
+
+        Args:
+            db: 데이터베이스 세션
+            owner: 작업자 식별자
+            lease_seconds: lease 유지 시간(초), 바로빌 호출 타임아웃보다 길어야 함
+
+        Returns:
+            lease를 잡은 작업 (없으면 None)
+        """
+        now = datetime.utcnow()
+        candidates = (
+            db.query(TaxInvoiceJob.id)
+            .filter(
+                TaxInvoiceJob.status == TaxInvoiceJobStatus.QUEUED,
+                TaxInvoiceJob.next_run_at <= now
+            )
+            .order_by(TaxInvoiceJob.next_run_at, TaxInvoiceJob.id)
+            .limit(10)
+            .all()
+        )
+
+        for (candidate_id,) in candidates:
+            leased = db.query(TaxInvoiceJob).filter(
+                TaxInvoiceJob.id == candidate_id,
+                TaxInvoiceJob.status == TaxInvoiceJobStatus.QUEUED
+            ).update(
+                {
+                    TaxInvoiceJob.status: TaxInvoiceJobStatus.RUNNING,
+                    TaxInvoiceJob.lease_owner: owner,
+                    TaxInvoiceJob.lease_expires_at: now + timedelta(seconds=lease_seconds),
+                    TaxInvoiceJob.attempts: TaxInvoiceJob.attempts + 1,
+                },
+                synchronize_session=False
+            )
+            db.commit()
+            if leased:
+                return db.get(TaxInvoiceJob, candidate_id)
+        return None
+
+    @staticmethod
+    def _update_owned(db: Session, job: TaxInvoiceJob, owner: str, values: Dict[Any, Any]) -> bool:
+        """lease를 가진 처리 중 작업만 조건부 UPDATE (lease를 잃었으면 로그만 남기고 False)"""
+        updated = db.query(TaxInvoiceJob).filter(
+            TaxInvoiceJob.id == job.id,
+            TaxInvoiceJob.status == TaxInvoiceJobStatus.RUNNING,
+            TaxInvoiceJob.lease_owner == owner
+        ).update(values, synchronize_session=False)
+        if not updated:
+            logger.warning(
+                f"세금계산서 발행 작업 lease 상실로 결과를 기록하지 않음 ({job.job_id}, 작업자 {owner}, "
+                f"기록하려던 상태 {values[TaxInvoiceJob.status].value})"
+            )
+        return bool(updated)
+
+    @staticmethod
+    def mark_succeeded(
+        db: Session,
+        job: TaxInvoiceJob,
+        owner: str,
+        mgt_key: str,
+        result_code: Optional[int]
+    ) -> bool:
+        """
+        작업 성공 기록 (커밋은 발행 정보 저장과 함께 호출하는 쪽에서)
+
+        Returns:
+            기록했으면 True, lease를 잃어 기록하지 않았으면 False
+        """
+        return TaxInvoiceJobService._update_owned(db, job, owner, {
+            TaxInvoiceJob.status: TaxInvoiceJobStatus.SUCCEEDED,
+            TaxInvoiceJob.mgt_key: mgt_key,
+            TaxInvoiceJob.result_code: result_code,
+            TaxInvoiceJob.last_error: None,
+            TaxInvoiceJob.lease_owner: None,
+            TaxInvoiceJob.lease_expires_at: None,
+            TaxInvoiceJob.finished_at: datetime.utcnow(),
+        })
+
+    @staticmethod
+    def mark_failed(
+        db: Session,
+        job: TaxInvoiceJob,
+        owner: str,
+        error: str,
+        retryable: bool = False,
+        dead: bool = False,
+        mgt_key: Optional[str] = None,
+        result_code: Optional[int] = None
+    ) -> bool:
+        """
+        작업 실패 기록 (커밋 포함)
+
+        Args:
+            db: 데이터베이스 세션
+            job: 작업
+            owner: lease를 잡은 작업자 식별자
+            error: 오류 메시지
+            retryable: 바로빌로 요청이 나가지 않아 다시 시도해도 되는 오류인지 여부
+            dead: 결과를 알 수 없어 확인이 필요한 오류인지 여부 (dead letter)
+            mgt_key: 함께 기록할 관리번호 (바로빌 발행 후 저장 실패 등)
+            result_code: 함께 기록할 바로빌 결과 코드
+
+        Returns:
+            기록했으면 True, lease를 잃어 기록하지 않았으면 False
+        """
+        now = datetime.utcnow()
+        values: Dict[Any, Any] = {
+            TaxInvoiceJob.last_error: error,
+            TaxInvoiceJob.lease_owner: None,
+            TaxInvoiceJob.lease_expires_at: None,
+        }
+        if mgt_key is not None:
+            values[TaxInvoiceJob.mgt_key] = mgt_key
+            values[TaxInvoiceJob.result_code] = result_code
+
+        if retryable and job.attempts < job.max_attempts:
+            # 지수 백오프 후 다시 대기열로
+            delay = min(
+                settings.TAX_INVOICE_JOB_RETRY_BASE_DELAY * (2 ** (job.attempts - 1)),
+                settings.TAX_INVOICE_JOB_RETRY_MAX_DELAY
+            )
+            values[TaxInvoiceJob.status] = TaxInvoiceJobStatus.QUEUED
+            values[TaxInvoiceJob.next_run_at] = now + timedelta(seconds=delay)
+        else:
+            values[TaxInvoiceJob.status] = (
+                TaxInvoiceJobStatus.DEAD if (retryable or dead) else TaxInvoiceJobStatus.FAILED
+            )
+            values[TaxInvoiceJob.finished_at] = now
+        updated = TaxInvoiceJobService._update_owned(db, job, owner, values)
+        db.commit()
+        return updated
+
+    @staticmethod
+    def to_response(job: TaxInvoiceJob) -> Dict[str, Any]:
+        """작업 상태 응답 딕셔너리"""
+        return {
+            "job_id": job.job_id,
+            "status": job.status.value,
+            "finished": job.status in FINISHED_STATUSES,
+            "attempts": job.attempts,
+            "max_attempts": job.max_attempts,
+            "mgt_key": job.mgt_key,
+            "result_code": job.result_code,
+            "error": job.last_error,
+            "created_at": job.created_at,
+            "finished_at": job.finished_at,
+        }
@@ -0,0 +1,226 @@
+"""
+세금계산서 발행 작업자
+
+애플리케이션 이벤트 루프에서 TAX_INVOICE_JOB_WORKERS개의 코루틴이 tax_invoice_jobs를 폴링해
+lease를 잡은 작업을 바로빌에 발행하고, 발행 정보 저장과 작업 완료를 한 트랜잭션으로 커밋합니다.
+DB 작업은 스레드풀에서, 바로빌 호출은 비동기로 처리합니다.
+"""
+import asyncio
+import json
+import logging
+import os
+import socket
+from typing import List, Optional
+import httpx
+from fastapi.concurrency import run_in_threadpool
+from zeep.exceptions import TransportError
+from app.core.config import settings
+from app.core.barobill.barobill_resilience import BaroBillUnavailableError
+from app.db.session import SessionLocal
+from app.models.tax_invoice_job import TaxInvoiceJob
+from app.models.user import User
+from app.services.corp_state_service import calculate_free_invoice_remaining
+from app.services.invoice_service import InvoiceService
+from app.services.tax_invoice import AsyncTaxInvoiceService
+from app.services.tax_invoice_job_service import TaxInvoiceJobService
+from app.services.tax_invoice_service_cache import tax_invoice_service_cache
+
+logger = logging.getLogger(__name__)
+
+# 바로빌로 요청이 나가지 않았음이 확실한 오류 (다시 시도해도 중복 발행되지 않음)
+RETRYABLE_ERRORS = (
+    BaroBillUnavailableError,
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+
+# 요청은 나갔지만 결과를 알 수 없는 오류 (dead letter로 두고 확인 필요)
+UNKNOWN_OUTCOME_ERRORS = (
+    httpx.HTTPError,
+    TransportError,
+)
+
+
+class TaxInvoiceJobWorker:
+    """tax_invoice_jobs를 처리하는 비동기 작업자 묶음"""
+
+    def __init__(
+        self,
+        workers: int = 2,
+        poll_interval: float = 1.0,
+        lease_seconds: int = 120
+    ):
+        """
+        Args:
+            workers: 동시에 처리할 작업자 코루틴 수
+            poll_interval: 대기 중인 작업이 없을 때 다시 조회하기까지의 시간(초)
+            lease_seconds: 작업 lease 유지 시간(초)
+        """
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    def start(self):
+        """작업자 코루틴 시작 (실행 중인 이벤트 루프에서 호출)"""
+        if self._tasks:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks = [
+            asyncio.create_task(self._run(f"{prefix}:{n}"), name=f"tax-invoice-job-{n}")
+            for n in range(self.workers)
+        ]
+
+    async def stop(self):
+        """작업자 종료 (처리 중인 작업은 lease 만료 후 dead letter로 정리됨)"""
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self):
+        """새 작업이 등록되었음을 알려 폴링 대기 없이 바로 처리"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self, owner: str):
+        while not self._stopping:
+            try:
+                processed = await self.run_once(owner)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"세금계산서 발행 작업자 오류 ({owner}): {e}")
+                processed = False
+
+            if not processed:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+    async def run_once(self, owner: str) -> bool:
+        """
+        작업 하나 처리
+
+        Returns:
+            처리한 작업이 있으면 True
+        """
+        db = SessionLocal()
+        try:
+            await run_in_threadpool(TaxInvoiceJobService.reap_expired, db)
+            job = await run_in_threadpool(
+                TaxInvoiceJobService.lease_next, db, owner, self.lease_seconds
+            )
+            if job is None:
+                return False
+            await self._process(db, job, owner)
+            return True
+        finally:
+            await run_in_threadpool(db.close)
+
+    async def _process(self, db, job: TaxInvoiceJob, owner: str):
+        payload = TaxInvoiceJobService.get_payload(job)
+        invoice_data = payload["invoice_data"]
+        issue_timing = payload["issue_timing"]
+
+        user = await run_in_threadpool(db.get, User, job.user_id)
+        if user is None or not user.barobill_cert_key or not user.barobill_corp_num:
+            await run_in_threadpool(
+                TaxInvoiceJobService.mark_failed, db, job, owner, "바로빌 인증키 또는 사업자번호가 등록되지 않았습니다."
+            )
+            return
+
+        # 즉시 발행은 처리 시점에 무료 제공 건수/결제수단 다시 확인 (대기 중 다른 발행으로 소진될 수 있음)
+        if issue_timing == 1:
+            free_invoice_remaining = await run_in_threadpool(
+                calculate_free_invoice_remaining, db, user.id
+            )
+            if free_invoice_remaining <= 0:
+                has_payment_method = await run_in_threadpool(
+                    InvoiceService.has_payment_method, db, user.id
+                )
+                if not has_payment_method:
+                    await run_in_threadpool(
+                        TaxInvoiceJobService.mark_failed, db, job, owner,
+                        "무료 5건이 모두 소진되었습니다. 결제수단을 등록해야 발행이 가능합니다."
+                    )
+                    return
+
+        # 관리번호 없이 등록된 작업은 여기서 채우고 payload에 저장 (재시도 시 같은 번호로 발행)
+        if issue_timing == 1 and not invoice_data.get("InvoicerParty", {}).get("MgtNum"):
+            InvoiceService.ensure_mgt_key(invoice_data)
+            job.payload = json.dumps(payload, ensure_ascii=False)
+
+        service = tax_invoice_service_cache.get(
+            AsyncTaxInvoiceService,
+            cert_key=user.barobill_cert_key,
+            corp_num=user.barobill_corp_num
+        )
+        try:
+            if issue_timing == 1:
+                result_code = await service.regist_and_issue_tax_invoice(
+                    invoice_data,
+                    send_sms=False,
+                    force_issue=True
+                )
+                mgt_key = invoice_data["InvoicerParty"]["MgtNum"]
+            else:
+                result_code = None
+                mgt_key = await service.regist_tax_invoice(invoice_data, issue_timing)
+        except RETRYABLE_ERRORS as e:
+            logger.warning(f"세금계산서 발행 작업 재시도 예정 ({job.job_id}): {e}")
+            await run_in_threadpool(
+                TaxInvoiceJobService.mark_failed, db, job, owner, str(e) or type(e).__name__, True
+            )
+            return
+        except UNKNOWN_OUTCOME_ERRORS as e:
+            logger.error(f"세금계산서 발행 결과 확인 필요 ({job.job_id}): {e}")
+            await run_in_threadpool(
+                TaxInvoiceJobService.mark_failed, db, job, owner,
+                f"바로빌 응답을 받지 못했습니다. 발행 여부 확인이 필요합니다. ({str(e) or type(e).__name__})",
+                False, True
+            )
+            return
+        except Exception as e:
+            # 바로빌 오류 코드 응답 등 (다시 시도해도 결과가 같음)
+            await run_in_threadpool(TaxInvoiceJobService.mark_failed, db, job, owner, str(e))
+            return
+
+        # 발행 정보 저장과 작업 완료를 한 번에 커밋
+        # (lease를 잃어 작업 상태를 기록하지 못해도 바로빌에는 발행되었으므로 발행 정보는 저장)
+        await run_in_threadpool(
+            TaxInvoiceJobService.mark_succeeded, db, job, owner, mgt_key, result_code
+        )
+        if issue_timing == 1:
+            issued, reserved = [(invoice_data, mgt_key, result_code)], []
+        else:
+            issued, reserved = [], [(invoice_data, mgt_key)]
+        try:
+            await run_in_threadpool(
+                InvoiceService.save_batch_tax_invoices, db, user, issued, reserved
+            )
+        except Exception as e:
+            # 바로빌에는 발행되었으므로 다시 발행하지 않고 확인 필요 상태로 기록
+            logger.exception(f"세금계산서 발행 정보 저장 실패 ({job.job_id}): {e}")
+            await run_in_threadpool(db.rollback)
+            await run_in_threadpool(
+                TaxInvoiceJobService.mark_failed, db, job, owner,
+                f"바로빌 발행은 완료되었으나 발행 정보 저장에 실패했습니다: {e}",
+                False, True, mgt_key, result_code
+            )
+
+
+# 프로세스 전역 작업자
+tax_invoice_job_worker = TaxInvoiceJobWorker(
+    workers=settings.TAX_INVOICE_JOB_WORKERS,
+    poll_interval=settings.TAX_INVOICE_JOB_POLL_INTERVAL,
+    lease_seconds=settings.TAX_INVOICE_JOB_LEASE_SECONDS,
+)
@@ -0,0 +1,276 @@
+"""
+바로빌 매출/매입 세금계산서 목록 미러 (DB 기반)
+
+앱 밖에서 발행한 매출 건과 거래처에게서 받은 매입 건도 볼 수 있도록,
+GetPeriodTaxInvoiceSalesList / GetPeriodTaxInvoicePurchaseList 결과를 tax_invoice_mirrors에 upsert 하고
+사용자/구분별로 동기화를 마친 작성일자(워터마크)를 tax_invoice_mirror_sync_states에 기록합니다.
+대시보드는 바로빌을 직접 페이지 조회하지 않고 미러 테이블을 읽습니다.
+
+- 처음 동기화: 오늘부터 TAX_INVOICE_MIRROR_INITIAL_DAYS 전까지
+- 증분 동기화: 워터마크에서 TAX_INVOICE_MIRROR_OVERLAP_DAYS 전부터 오늘까지 (늦게 발행/전송된 건 반영)
+- 조회 기간은 TAX_INVOICE_MIRROR_WINDOW_DAYS 단위로 나눠 조회
+"""
+import json
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.models.tax_invoice_mirror import (
+    TaxInvoiceMirror,
+    TaxInvoiceMirrorDirection,
+    TaxInvoiceMirrorSyncState,
+)
+from app.models.user import User
+
+# 구분별 바로빌 오퍼레이션
+OPERATION_BY_DIRECTION = {
+    TaxInvoiceMirrorDirection.SALES: "GetPeriodTaxInvoiceSalesList",
+    TaxInvoiceMirrorDirection.PURCHASE: "GetPeriodTaxInvoicePurchaseList",
+}
+
+DATE_FORMAT = "%Y%m%d"
+
+# IN 절 하나에 넣을 최대 키 수
+IN_CLAUSE_SIZE = 1000
+
+# SimpleTaxInvoiceEx 필드 -> 미러 컬럼
+MIRROR_FIELDS = {
+    "MgtKey": "mgt_key",
+    "NTSSendKey": "nts_send_key",
+    "TaxInvoiceType": "tax_invoice_type",
+    "TaxType": "tax_type",
+    "PurposeType": "purpose_type",
+    "ModifyCode": "modify_code",
+    "BarobillState": "barobill_state",
+    "WriteDate": "write_date",
+    "IssueDT": "issue_dt",
+    "NTSSendDT": "nts_send_dt",
+    "InvoicerCorpNum": "invoicer_corp_num",
+    "InvoicerCorpName": "invoicer_corp_name",
+    "InvoiceeCorpNum": "invoicee_corp_num",
+    "InvoiceeCorpName": "invoicee_corp_name",
+    "ItemName": "item_name",
+    "AmountTotal": "amount_total",
+    "TaxTotal": "tax_total",
+    "TotalAmount": "total_amount",
+}
+
+
+class TaxInvoiceMirrorService:
+    """세금계산서 목록 미러 DB 로직"""
+
+    @staticmethod
+    def find_sync_targets(db: Session) -> List[int]:
+        """바로빌 인증키와 사업자번호가 등록된 사용자 ID 목록"""
+        rows = db.query(User.id).filter(
+            User.is_active.is_(True),
+            User.barobill_cert_key.isnot(None),
+            User.barobill_cert_key != "",
+            User.barobill_corp_num.isnot(None),
+            User.barobill_corp_num != "",
+        ).order_by(User.id).all()
+        return [user_id for (user_id,) in rows]
+
+    @staticmethod
+    def get_sync_state(
+        db: Session,
+        user_id: int,
+        direction: TaxInvoiceMirrorDirection,
+        corp_num: str
+    ) -> TaxInvoiceMirrorSyncState:
+        """
+        동기화 워터마크 조회 (없으면 생성, 사업자번호가 바뀌었으면 처음부터 다시 동기화, 커밋 포함)
+        """
+        state = db.query(TaxInvoiceMirrorSyncState).filter(
+            TaxInvoiceMirrorSyncState.user_id == user_id,
+            TaxInvoiceMirrorSyncState.direction == direction,
+        ).first()
+        if state is None:
+            state = TaxInvoiceMirrorSyncState(user_id=user_id, direction=direction, corp_num=corp_num)
+            db.add(state)
+        elif state.corp_num != corp_num:
+            state.corp_num = corp_num
+            state.synced_through = None
+        db.commit()
+        db.refresh(state)
+        return state
+
+    @staticmethod
+    def plan_windows(
+        synced_through: Optional[str],
+        today: date,
+        initial_days: int,
+        overlap_days: int,
+        window_days: int
+    ) -> List[Tuple[str, str]]:
+        """
+        조회할 작성일자 기간 목록
+
+        Args:
+            synced_through: 워터마크 (YYYYMMDD, 없으면 처음 동기화)
+            today: 오늘
+            initial_days: 처음 동기화할 기간(일)
+            overlap_days: 증분 동기화 시 워터마크 이전으로 다시 조회할 기간(일)
+            window_days: 기간을 나누는 단위(일)
+
+        Returns:
+            [(시작일자, 종료일자)] (YYYYMMDD, 오래된 기간부터)
+        """
+        if synced_through:
+            start = datetime.strptime(synced_through, DATE_FORMAT).date() - timedelta(days=overlap_days)
+        else:
+            start = today - timedelta(days=initial_days)
+        start = min(start, today)
+
+        step = timedelta(days=max(window_days, 1))
+        windows = []
+        while start <= today:
+            end = min(start + step - timedelta(days=1), today)
+            windows.append((start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT)))
+            start = end + timedelta(days=1)
+        return windows
+
+    @staticmethod
+    def upsert(
+        db: Session,
+        user_id: int,
+        corp_num: str,
+        direction: TaxInvoiceMirrorDirection,
+        items: List[Dict[str, Any]],
+        synced_at: Optional[datetime] = None
+    ) -> Tuple[int, int]:
+        """
+        목록 조회 결과를 미러 테이블에 일괄 upsert (커밋 포함)
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+            corp_num: 조회한 사업자번호
+            direction: 매출/매입
+            items: SimpleTaxInvoiceEx 딕셔너리 목록
+            synced_at: 동기화 시각 (UTC, 기본 현재 시각)
+
+        Returns:
+            (추가한 건수, 갱신한 건수)
+        """
+        synced_at = synced_at or datetime.utcnow()
+        rows: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            invoice_key = item.get("InvoiceKey") or item.get("NTSSendKey")
+            if not invoice_key:
+                continue
+            row = {column: item.get(field) for field, column in MIRROR_FIELDS.items()}
+            row.update(
+                user_id=user_id,
+                corp_num=corp_num,
+                direction=direction,
+                invoice_key=invoice_key,
+                write_date=row["write_date"] or "",
+                raw=json.dumps(item, ensure_ascii=False, default=str),
+                synced_at=synced_at,
+            )
+            rows[invoice_key] = row
+        if not rows:
+            return 0, 0
+
+        existing: Dict[str, int] = {}
+        keys = list(rows)
+        for i in range(0, len(keys), IN_CLAUSE_SIZE):
+            existing.update(
+                db.query(TaxInvoiceMirror.invoice_key, TaxInvoiceMirror.id).filter(
+                    TaxInvoiceMirror.user_id == user_id,
+                    TaxInvoiceMirror.direction == direction,
+                    TaxInvoiceMirror.invoice_key.in_(keys[i:i + IN_CLAUSE_SIZE]),
+                ).all()
+            )
+
+        updates = [{"id": existing[key], **row} for key, row in rows.items() if key in existing]
+        inserts = [row for key, row in rows.items() if key not in existing]
+        if updates:
+            db.bulk_update_mappings(TaxInvoiceMirror, updates)
+        if inserts:
+            db.bulk_insert_mappings(TaxInvoiceMirror, inserts)
+        db.commit()
+        return len(inserts), len(updates)
+
+    @staticmethod
+    def mark_synced(db: Session, state: TaxInvoiceMirrorSyncState, synced_through: str):
+        """워터마크 갱신 (커밋 포함)"""
+        state.synced_through = synced_through
+        state.last_synced_at = datetime.utcnow()
+        state.last_error = None
+        db.commit()
+
+    @staticmethod
+    def mark_failed(db: Session, state: TaxInvoiceMirrorSyncState, error: str):
+        """동기화 실패 기록 (워터마크는 그대로 두어 다음 동기화에서 같은 기간부터 다시 조회, 커밋 포함)"""
+        state.last_error = error
+        db.commit()
+
+    @staticmethod
+    def list_mirrors(
+        db: Session,
+        user_id: int,
+        direction: Optional[TaxInvoiceMirrorDirection] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[int, List[TaxInvoiceMirror]]:
+        """
+        미러 목록 조회 (작성일자 최신순)
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+            direction: 매출/매입 (없으면 전체)
+            start_date: 작성일자 시작 (YYYYMMDD)
+            end_date: 작성일자 종료 (YYYYMMDD)
+            skip: 건너뛸 건수
+            limit: 최대 건수
+
+        Returns:
+            (전체 건수, 목록)
+        """
+        query = db.query(TaxInvoiceMirror).filter(TaxInvoiceMirror.user_id == user_id)
+        if direction is not None:
+            query = query.filter(TaxInvoiceMirror.direction == direction)
+        if start_date:
+            query = query.filter(TaxInvoiceMirror.write_date >= start_date)
+        if end_date:
+            query = query.filter(TaxInvoiceMirror.write_date <= end_date)
+        total = query.count()
+        rows = query.order_by(
+            TaxInvoiceMirror.write_date.desc(), TaxInvoiceMirror.id.desc()
+        ).offset(skip).limit(limit).all()
+        return total, rows
+
+    @staticmethod
+    def get_sync_states(db: Session, user_id: int) -> List[TaxInvoiceMirrorSyncState]:
+        """사용자의 구분별 동기화 워터마크"""
+        return db.query(TaxInvoiceMirrorSyncState).filter(
+            TaxInvoiceMirrorSyncState.user_id == user_id
+        ).all()
+
+    @staticmethod
+    def to_response(row: TaxInvoiceMirror) -> Dict[str, Any]:
+        """미러 행 API 응답"""
+        response = {column: getattr(row, column) for column in MIRROR_FIELDS.values()}
+        response.update(
+            id=row.id,
+            direction=row.direction.value,
+            corp_num=row.corp_num,
+            invoice_key=row.invoice_key,
+            synced_at=row.synced_at.isoformat() if row.synced_at else None,
+        )
+        return response
+
+    @staticmethod
+    def sync_state_response(state: TaxInvoiceMirrorSyncState) -> Dict[str, Any]:
+        """동기화 워터마크 API 응답"""
+        return {
+            "direction": state.direction.value,
+            "corp_num": state.corp_num,
+            "synced_through": state.synced_through,
+            "last_synced_at": state.last_synced_at.isoformat() if state.last_synced_at else None,
+            "last_error": state.last_error,
+        }
@@ -0,0 +1,237 @@
+"""
+바로빌 매출/매입 세금계산서 목록 미러 동기화 작업자
+
+TAX_INVOICE_MIRROR_SYNC_INTERVAL마다 바로빌 인증키가 등록된 사용자별로 매출/매입 목록을 동기화합니다.
+기간마다 1페이지를 먼저 조회해 MaxPageNum을 확인한 뒤 나머지 페이지를
+TAX_INVOICE_MIRROR_CONCURRENCY개까지 동시에 조회하고, 기간 단위로 미러 테이블에 upsert 합니다.
+모든 기간을 마치면 워터마크를 오늘로 옮깁니다. DB 작업은 스레드풀에서, 바로빌 호출은 비동기로 처리합니다.
+"""
+import asyncio
+import logging
+from datetime import date
+from typing import Any, Dict, List, Optional
+from fastapi.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.tax_invoice_mirror import TaxInvoiceMirrorDirection
+from app.models.user import User
+from app.services.tax_invoice import AsyncTaxInvoiceService
+from app.services.tax_invoice_mirror_service import (
+    DATE_FORMAT,
+    OPERATION_BY_DIRECTION,
+    TaxInvoiceMirrorService,
+)
+from app.services.tax_invoice_service_cache import tax_invoice_service_cache
+from app.utils.business_number import normalize_business_number
+
+logger = logging.getLogger(__name__)
+
+
+class TaxInvoiceMirrorWorker:
+    """바로빌 세금계산서 목록을 미러 테이블로 동기화하는 작업자"""
+
+    def __init__(
+        self,
+        interval: float = 3600.0,
+        initial_days: int = 365,
+        overlap_days: int = 31,
+        window_days: int = 31,
+        page_size: int = 100,
+        concurrency: int = 4,
+        tax_types: Optional[List[int]] = None,
+        date_type: int = 1
+    ):
+        """
+        Args:
+            interval: 전체 사용자 동기화 주기(초)
+            initial_days: 처음 동기화할 때 조회할 기간(일)
+            overlap_days: 증분 동기화 시 워터마크 이전으로 다시 조회할 기간(일)
+            window_days: 조회 기간을 나누는 단위(일)
+            page_size: 페이지당 건수
+            concurrency: 2페이지 이후 동시 조회 수
+            tax_types: 조회할 과세형태 목록
+            date_type: 조회 기준일자
+        """
+        self.interval = interval
+        self.initial_days = initial_days
+        self.overlap_days = overlap_days
+        self.window_days = window_days
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.tax_types = tax_types or [1]
+        self.date_type = date_type
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """동기화 코루틴 시작 (실행 중인 이벤트 루프에서 호출)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="tax-invoice-mirror")
+
+    async def stop(self):
+        """동기화 중단 (진행 중인 기간은 다음 동기화에서 다시 조회)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"세금계산서 목록 미러 동기화 오류: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def run_once(self) -> int:
+        """
+        전체 사용자 동기화 한 번 실행
+
+        Returns:
+            동기화한 사용자 수
+        """
+        db = SessionLocal()
+        try:
+            user_ids = await run_in_threadpool(TaxInvoiceMirrorService.find_sync_targets, db)
+        finally:
+            await run_in_threadpool(db.close)
+
+        for user_id in user_ids:
+            await self.sync_user(user_id)
+        return len(user_ids)
+
+    async def sync_user(self, user_id: int) -> Dict[str, Any]:
+        """
+        사용자 한 명의 매출/매입 목록 동기화
+
+        Returns:
+            구분별 결과 (success, fetched, inserted, updated, synced_through, error)
+        """
+        db = SessionLocal()
+        try:
+            user = await run_in_threadpool(db.get, User, user_id)
+            if user is None or not user.barobill_cert_key or not user.barobill_corp_num:
+                return {}
+            corp_num = normalize_business_number(user.barobill_corp_num)
+            service = tax_invoice_service_cache.get(
+                AsyncTaxInvoiceService, cert_key=user.barobill_cert_key, corp_num=corp_num
+            )
+
+            summary = {}
+            for direction in TaxInvoiceMirrorDirection:
+                summary[direction.value] = await self._sync_direction(
+                    db, service, user, corp_num, direction
+                )
+            return summary
+        finally:
+            await run_in_threadpool(db.close)
+
+    async def _sync_direction(
+        self,
+        db,
+        service: AsyncTaxInvoiceService,
+        user: User,
+        corp_num: str,
+        direction: TaxInvoiceMirrorDirection
+    ) -> Dict[str, Any]:
+        state = await run_in_threadpool(
+            TaxInvoiceMirrorService.get_sync_state, db, user.id, direction, corp_num
+        )
+        today = date.today()
+        windows = TaxInvoiceMirrorService.plan_windows(
+            state.synced_through, today, self.initial_days, self.overlap_days, self.window_days
+        )
+
+        fetched = inserted = updated = 0
+        try:
+            for start_date, end_date in windows:
+                for tax_type in self.tax_types:
+                    items = await self._fetch_window(
+                        service, OPERATION_BY_DIRECTION[direction], user.barobill_id,
+                        start_date, end_date, tax_type
+                    )
+                    fetched += len(items)
+                    added, changed = await run_in_threadpool(
+                        TaxInvoiceMirrorService.upsert, db, user.id, corp_num, direction, items
+                    )
+                    inserted += added
+                    updated += changed
+        except Exception as e:
+            logger.warning(
+                f"세금계산서 목록 미러 동기화 실패 (user_id={user.id}, {direction.value}): {e}"
+            )
+            await run_in_threadpool(db.rollback)
+            await run_in_threadpool(
+                TaxInvoiceMirrorService.mark_failed, db, state, str(e) or type(e).__name__
+            )
+            return {
+                "success": False,
+                "fetched": fetched,
+                "inserted": inserted,
+                "updated": updated,
+                "synced_through": state.synced_through,
+                "error": str(e),
+            }
+
+        synced_through = today.strftime(DATE_FORMAT)
+        await run_in_threadpool(TaxInvoiceMirrorService.mark_synced, db, state, synced_through)
+        return {
+            "success": True,
+            "fetched": fetched,
+            "inserted": inserted,
+            "updated": updated,
+            "synced_through": synced_through,
+        }
+
+    async def _fetch_window(
+        self,
+        service: AsyncTaxInvoiceService,
+        operation: str,
+        barobill_user_id: str,
+        start_date: str,
+        end_date: str,
+        tax_type: int
+    ) -> List[Dict[str, Any]]:
+        """기간 하나의 전체 목록 조회 (1페이지로 MaxPageNum 확인 후 나머지 페이지 동시 조회)"""
+
+        def fetch(page: int):
+            return service.get_period_tax_invoice_list(
+                operation, barobill_user_id, start_date, end_date,
+                current_page=page,
+                count_per_page=self.page_size,
+                tax_type=tax_type,
+                date_type=self.date_type,
+            )
+
+        first = await fetch(1)
+        items = list(first["items"])
+        if first["MaxPageNum"] <= 1:
+            return items
+
+        semaphore = asyncio.Semaphore(max(self.concurrency, 1))
+
+        async def fetch_limited(page: int):
+            async with semaphore:
+                return await fetch(page)
+
+        pages = await asyncio.gather(
+            *(fetch_limited(page) for page in range(2, first["MaxPageNum"] + 1))
+        )
+        for page in pages:
+            items.extend(page["items"])
+        return items
+
+
+# 프로세스 전역 목록 미러 작업자
+tax_invoice_mirror_worker = TaxInvoiceMirrorWorker(
+    interval=settings.TAX_INVOICE_MIRROR_SYNC_INTERVAL,
+    initial_days=settings.TAX_INVOICE_MIRROR_INITIAL_DAYS,
+    overlap_days=settings.TAX_INVOICE_MIRROR_OVERLAP_DAYS,
+    window_days=settings.TAX_INVOICE_MIRROR_WINDOW_DAYS,
+    page_size=settings.TAX_INVOICE_MIRROR_PAGE_SIZE,
+    concurrency=settings.TAX_INVOICE_MIRROR_CONCURRENCY,
+    tax_types=settings.TAX_INVOICE_MIRROR_TAX_TYPES,
+    date_type=settings.TAX_INVOICE_MIRROR_DATE_TYPE,
+)
@@ -0,0 +1,218 @@
+"""
+세금계산서 공급가액/부가세 계산
+
+발행/등록 경로(/issue, /issue/batch, /jobs, /tax-invoices 등록, 세금계산서 객체 생성)가 공유하는
+품목별 부가세와 합계 계산입니다. float 대신 정수/Decimal로 계산하므로
+1005원 x 10% 같은 경계값도 부동소수점 오차 없이 항상 반올림(0.5는 0에서 먼 쪽)됩니다.
+기존 float 계산의 round()(0.5는 짝수 쪽, 25원 x 10% -> 2원)와 결과가 다른 것은 의도된 변경입니다.
+
+- 공급가액: 정수 문자열은 int로, 소수는 Decimal로 파싱 (파싱 불가/비어 있으면 0)
+- 품목 부가세: 공급가액 x 부가세율을 원 단위로 반올림 (정수 분수 연산)
+- 합계: 품목을 한 번 순회하며 공급가액 합계(원 미만 절사)/부가세 합계/합계금액 계산
+- 부가세율: 0 이상 10 이하 (퍼센트), 범위를 벗어나면 VatRateError
+"""
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+Number = Union[int, Decimal]
+
+# 기본 부가세율 (퍼센트)
+DEFAULT_VAT_RATE_PERCENT = 10.0
+MAX_VAT_RATE_PERCENT = 10
+
+
+class VatRateError(ValueError):
+    """부가세율이 허용 범위(0 이상 10 이하)를 벗어난 경우"""
+
+
+class PricingResult(NamedTuple):
+    """일괄 계산 결과 (성공 시 invoice_data, 실패 시 error)"""
+    invoice_data: Optional[Dict[str, Any]]
+    error: Optional[VatRateError]
+
+
+def parse_amount(value: Any) -> Number:
+    """
+    금액 문자열 파싱 (천 단위 구분 쉼표 허용)
+
+    Returns:
+        정수면 int, 소수면 Decimal (비어 있거나 파싱할 수 없으면 0)
+    """
+    if value is None or value == "":
+        return 0
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return _parse_decimal(value)
+
+
+def _parse_decimal(value: Any) -> Number:
+    """int()로 파싱되지 않은 금액을 Decimal로 파싱 (비어 있거나 파싱할 수 없으면 0)"""
+    if value is None:
+        return 0
+    try:
+        amount = Decimal(str(value).replace(",", "").strip())
+    except (InvalidOperation, ValueError):
+        return 0
+    return amount if amount.is_finite() else 0
+
+
+@lru_cache(maxsize=128)
+def _rate_ratio(rate_percent: float) -> Tuple[int, int]:
+    """부가세율(퍼센트)을 비율 분수 (분자, 분모)로 변환 (10.0 -> (1, 10))"""
+    numerator, denominator = Decimal(str(rate_percent)).as_integer_ratio()
+    return numerator, denominator * 100
+
+
+@lru_cache(maxsize=128)
+def _rate_terms(rate_percent: float) -> Tuple[int, int, int, int]:
+    """반올림 계산용 세율 항 (분자, 분모, 2 x 분자, 2 x 분모)"""
+    numerator, denominator = _rate_ratio(rate_percent)
+    return numerator, denominator, 2 * numerator, 2 * denominator
+
+
+def validate_rate(rate_percent: Optional[float], item_name: Optional[str] = None) -> float:
+    """
+    부가세율 검증
+
+    Args:
+        rate_percent: 부가세율 (퍼센트, None이면 기본 10%)
+        item_name: 품목명 (품목별 부가세율인 경우 오류 메시지에 사용)
+
+    Raises:
+        VatRateError: 0 이상 10 이하가 아닌 경우
+    """
+    if rate_percent is None:
+        return DEFAULT_VAT_RATE_PERCENT
+    if rate_percent < 0 or rate_percent > MAX_VAT_RATE_PERCENT:
+        if item_name is not None:
+            raise VatRateError(
+                f"품목 '{item_name}'의 부가세율은 0 이상 10 이하여야 합니다. (입력값: {rate_percent}%)"
+            )
+        raise VatRateError(f"부가세율은 0 이상 10 이하여야 합니다. (입력값: {rate_percent}%)")
+    return rate_percent
+
+
+def _line_tax(supply: Number, rate_num: int, rate_den: int) -> int:
+    """공급가액 x (rate_num / rate_den)을 원 단위로 반올림 (0.5는 0에서 먼 쪽, 음수 금액도 대칭)"""
+    if supply.__class__ is int:
+        num, den = supply * rate_num, rate_den
+    else:
+        supply_num, supply_den = supply.as_integer_ratio()
+        num, den = supply_num * rate_num, supply_den * rate_den
+    if num >= 0:
+        return (2 * num + den) // (2 * den)
+    return -((den - 2 * num) // (2 * den))
+
+
+def compute_line_tax(supply: Number, rate_percent: float) -> int:
+    """
+    품목 부가세 계산 (공급가액 x 부가세율, 원 단위 반올림)
+
+    Args:
+        supply: 공급가액 (parse_amount 결과)
+        rate_percent: 부가세율 (퍼센트, 검증된 값)
+    """
+    return _line_tax(supply, *_rate_ratio(rate_percent))
+
+
+def price_invoice(
+    invoice_data: Dict[str, Any],
+    vat_rate_percent: Optional[float] = DEFAULT_VAT_RATE_PERCENT
+) -> Dict[str, Any]:
+    """
+    품목별 부가세와 합계를 한 번에 계산해 invoice_data에 기록 (제자리 수정)
+
+    품목별 vat_rate_percent가 있으면 그 세율을, 없으면 전체 세율을 사용하고,
+    바로빌로 보내지 않는 vat_rate_percent 필드는 제거합니다. 품목이 없으면 합계는 그대로 둡니다.
+
+    Args:
+        invoice_data: 바로빌 전송 데이터 (TaxInvoiceCreate.model_dump 결과)
+        vat_rate_percent: 전체 부가세율 (퍼센트, None이면 기본 10%)
+
+    Returns:
+        invoice_data
+
+    Raises:
+        VatRateError: 전체 또는 품목별 부가세율이 0 이상 10 이하가 아닌 경우
+    """
+    return _price_invoice(invoice_data, vat_rate_percent, {})
+
+
+def _price_invoice(
+    invoice_data: Dict[str, Any],
+    vat_rate_percent: Optional[float],
+    item_terms: Dict[float, Tuple[int, int, int, int]]
+) -> Dict[str, Any]:
+    """price_invoice 본체 (item_terms: 검증/변환을 마친 품목별 부가세율 -> 세율 항, 일괄 계산 시 공유)"""
+    rate_percent = validate_rate(vat_rate_percent)
+    items = invoice_data.get("TaxInvoiceTradeLineItems")
+    if not items:
+        return invoice_data
+
+    default_terms = _rate_terms(rate_percent)
+    total_supply: Number = 0
+    total_tax = 0
+    for item in items:
+        item_rate_percent = item.pop("vat_rate_percent", None)
+        if item_rate_percent is None:
+            rate_num, rate_den, rate_num2, rate_den2 = default_terms
+        else:
+            terms = item_terms.get(item_rate_percent)
+            if terms is None:
+                terms = item_terms[item_rate_percent] = _rate_terms(
+                    validate_rate(item_rate_percent, item.get("Name", ""))
+                )
+            rate_num, rate_den, rate_num2, rate_den2 = terms
+
+        amount = item.get("Amount")
+        try:
+            supply = int(amount)
+        except (ValueError, TypeError):
+            supply = _parse_decimal(amount)
+            tax = _line_tax(supply, rate_num, rate_den)
+        else:
+            # 정수 공급가액은 _line_tax의 정수 경로를 풀어 씀 (품목마다 함수 호출 생략)
+            num2 = supply * rate_num2
+            if num2 >= 0:
+                tax = (num2 + rate_den) // rate_den2
+            else:
+                tax = -((rate_den - num2) // rate_den2)
+
+        item["Tax"] = str(tax)
+        total_supply += supply
+        total_tax += tax
+
+    # 공급가액 합계는 원 미만 절사
+    total_supply = int(total_supply)
+    invoice_data["AmountTotal"] = str(total_supply)
+    invoice_data["TaxTotal"] = str(total_tax)
+    invoice_data["TotalAmount"] = str(total_supply + total_tax)
+    return invoice_data
+
+
+def price_invoices(
+    invoices: Iterable[Tuple[Dict[str, Any], Optional[float]]]
+) -> List[PricingResult]:
+    """
+    여러 세금계산서의 부가세/합계 일괄 계산 (일괄 발행용)
+
+    품목별 부가세율 검증/변환 결과는 모든 세금계산서가 공유하고, 세금계산서별 부가세율 오류는 해당 건의 error로 반환합니다.
+
+    Args:
+        invoices: [(바로빌 전송 데이터, 전체 부가세율)]
+
+    Returns:
+        입력 순서대로의 PricingResult 목록
+    """
+    item_terms: Dict[float, Tuple[int, int, int, int]] = {}
+    results = []
+    for invoice_data, vat_rate_percent in invoices:
+        try:
+            results.append(PricingResult(_price_invoice(invoice_data, vat_rate_percent, item_terms), None))
+        except VatRateError as e:
+            results.append(PricingResult(None, e))
+    return results
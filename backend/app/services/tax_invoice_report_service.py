@@ -0,0 +1,155 @@
+"""
+발행 세금계산서 리포트 (SQL 집계)
+
+숫자 금액 컬럼(*_value)과 품목 테이블(tax_invoice_issue_line_items)을 SUM / GROUP BY 로 집계합니다.
+(user_id, issue_date), (user_id, invoicee_corp_num), (user_id, name) 인덱스를 사용하며 취소된 건은 제외합니다.
+
+- 월별 합계: 발행일자 연/월별 건수와 공급가액/세액/합계금액
+- 품목별 매출: 품목명별 수량/공급가액/세액 상위 N개
+- 거래처별 매출: 공급받는자 사업자번호별 건수와 금액 상위 N개
+"""
+from datetime import date
+from typing import Any, Dict, List, Optional
+from sqlalchemy import extract, func, or_
+from sqlalchemy.orm import Session
+from app.models.tax_invoice_issue import TaxInvoiceIssue, TaxInvoiceIssueLineItem
+from app.services.tax_invoice_state_sync_service import ISSUE_STATE_BY_STATE, BAROBILL_STATE_CANCELLED
+
+# 집계에서 제외할 바로빌 상태
+CANCELLED_ISSUE_STATE = ISSUE_STATE_BY_STATE[BAROBILL_STATE_CANCELLED]
+
+
+def _number(value) -> float:
+    return float(value or 0)
+
+
+class TaxInvoiceReportService:
+    """발행 세금계산서 집계 DB 로직"""
+
+    @staticmethod
+    def _filter(query, model, user_id: int, start_date: Optional[date], end_date: Optional[date]):
+        query = query.filter(model.user_id == user_id)
+        if start_date:
+            query = query.filter(model.issue_date >= start_date)
+        if end_date:
+            query = query.filter(model.issue_date <= end_date)
+        return query
+
+    @staticmethod
+    def _not_cancelled():
+        return or_(
+            TaxInvoiceIssue.barobill_state.is_(None),
+            TaxInvoiceIssue.barobill_state != CANCELLED_ISSUE_STATE,
+        )
+
+    @staticmethod
+    def monthly_totals(
+        db: Session,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        월별 발행 합계
+
+        Returns:
+            [{month(YYYY-MM), count, amount_total, tax_total, total_amount}] (오래된 월부터)
+        """
+        year = extract("year", TaxInvoiceIssue.issue_date)
+        month = extract("month", TaxInvoiceIssue.issue_date)
+        query = db.query(
+            year.label("year"),
+            month.label("month"),
+            func.count(TaxInvoiceIssue.id),
+            func.sum(TaxInvoiceIssue.amount_total_value),
+            func.sum(TaxInvoiceIssue.tax_total_value),
+            func.sum(TaxInvoiceIssue.total_amount_value),
+        )
+        query = TaxInvoiceReportService._filter(query, TaxInvoiceIssue, user_id, start_date, end_date)
+        rows = query.filter(TaxInvoiceReportService._not_cancelled()).group_by(year, month).order_by(year, month)
+        return [
+            {
+                "month": f"{int(y):04d}-{int(m):02d}",
+                "count": count,
+                "amount_total": _number(amount_total),
+                "tax_total": _number(tax_total),
+                "total_amount": _number(total_amount),
+            }
+            for y, m, count, amount_total, tax_total, total_amount in rows
+        ]
+
+    @staticmethod
+    def top_items(
+        db: Session,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        품목별 매출 상위 N개 (품목 공급가액 합계 순)
+
+        Returns:
+            [{name, invoice_count, quantity, amount, tax}]
+        """
+        amount = func.sum(TaxInvoiceIssueLineItem.amount)
+        query = db.query(
+            TaxInvoiceIssueLineItem.name,
+            func.count(func.distinct(TaxInvoiceIssueLineItem.tax_invoice_issue_id)),
+            func.sum(TaxInvoiceIssueLineItem.quantity),
+            amount,
+            func.sum(TaxInvoiceIssueLineItem.tax),
+        ).join(TaxInvoiceIssue, TaxInvoiceIssue.id == TaxInvoiceIssueLineItem.tax_invoice_issue_id)
+        query = TaxInvoiceReportService._filter(query, TaxInvoiceIssueLineItem, user_id, start_date, end_date)
+        rows = query.filter(TaxInvoiceReportService._not_cancelled()).group_by(
+            TaxInvoiceIssueLineItem.name
+        ).order_by(amount.desc()).limit(limit)
+        return [
+            {
+                "name": name,
+                "invoice_count": invoice_count,
+                "quantity": _number(quantity),
+                "amount": _number(item_amount),
+                "tax": _number(tax),
+            }
+            for name, invoice_count, quantity, item_amount, tax in rows
+        ]
+
+    @staticmethod
+    def client_revenue(
+        db: Session,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        거래처(공급받는자)별 매출 상위 N개 (합계금액 순)
+
+        Returns:
+            [{corp_num, corp_name, count, amount_total, tax_total, total_amount}]
+        """
+        total_amount = func.sum(TaxInvoiceIssue.total_amount_value)
+        query = db.query(
+            TaxInvoiceIssue.invoicee_corp_num,
+            func.max(TaxInvoiceIssue.invoicee_corp_name),
+            func.count(TaxInvoiceIssue.id),
+            func.sum(TaxInvoiceIssue.amount_total_value),
+            func.sum(TaxInvoiceIssue.tax_total_value),
+            total_amount,
+        )
+        query = TaxInvoiceReportService._filter(query, TaxInvoiceIssue, user_id, start_date, end_date)
+        rows = query.filter(TaxInvoiceReportService._not_cancelled()).group_by(
+            TaxInvoiceIssue.invoicee_corp_num
+        ).order_by(total_amount.desc()).limit(limit)
+        return [
+            {
+                "corp_num": corp_num,
+                "corp_name": corp_name,
+                "count": count,
+                "amount_total": _number(amount_total),
+                "tax_total": _number(tax_total),
+                "total_amount": _number(client_total),
+            }
+            for corp_num, corp_name, count, amount_total, tax_total, client_total in rows
+        ]
@@ -0,0 +1,211 @@
+"""
+발행 세금계산서(tax_invoice_issues) 보관 기간 만료분 정리
+
+retention_until(발행일 + 5년)이 지난 행을 (retention_until, id) 키셋 순서로 chunk_size행씩 읽어,
+필요하면 gzip JSONL 파일에 먼저 보관한 뒤 chunk마다 짧은 트랜잭션으로 삭제합니다.
+chunk 사이에 sleep_seconds만큼 쉬어 운영 중인 DB에 주는 부하를 줄입니다.
+
+실행: python utils/purge_tax_invoice_issues.py (--dry-run, --archive-dir)
+"""
+import gzip
+import json
+import logging
+import os
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+from app.models.tax_invoice_issue import TaxInvoiceIssue, TaxInvoiceIssueLineItem
+
+logger = logging.getLogger(__name__)
+
+
+class TaxInvoiceArchive:
+    """만료분 보관 파일 (gzip JSONL, 한 줄에 한 행)"""
+
+    def __init__(self, archive_dir: str, cutoff: date):
+        """
+        Args:
+            archive_dir: 보관 디렉토리 (없으면 생성)
+            cutoff: 정리 기준일 (파일명에 포함)
+        """
+        directory = Path(archive_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / (
+            f"tax_invoice_issues_{cutoff.strftime('%Y%m%d')}_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}.jsonl.gz"
+        )
+        self._raw = open(self.path, "xb")
+        self._gzip = gzip.GzipFile(fileobj=self._raw, mode="wb")
+
+    def write(self, rows: List[Dict[str, Any]]):
+        """행을 기록하고 디스크까지 내려씀 (삭제 전에 보관이 끝났음을 보장)"""
+        for row in rows:
+            self._gzip.write(json.dumps(row, ensure_ascii=False, default=str).encode("utf-8"))
+            self._gzip.write(b"\n")
+        self._gzip.flush()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+
+    def close(self):
+        self._gzip.close()
+        self._raw.close()
+
+
+class TaxInvoiceRetentionService:
+    """보관 기간 만료 세금계산서 정리 DB 로직"""
+
+    @staticmethod
+    def count_expired(db: Session, cutoff: date) -> int:
+        """cutoff 이전에 보관 기간이 끝난 행 수"""
+        return db.query(func.count(TaxInvoiceIssue.id)).filter(
+            TaxInvoiceIssue.retention_until < cutoff
+        ).scalar()
+
+    @staticmethod
+    def fetch_expired_chunk(
+        db: Session,
+        cutoff: date,
+        after: Optional[Tuple[date, int]],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        보관 기간 만료 행 한 chunk 조회 (retention_until, id 키셋 순서)
+
+        Args:
+            db: 데이터베이스 세션
+            cutoff: 이 날짜 이전에 만료된 행만 조회
+            after: 직전 chunk 마지막 행의 (retention_until, id), 처음이면 None
+            limit: 최대 행 수
+
+        Returns:
+            전체 컬럼 딕셔너리 목록
+        """
+        table = TaxInvoiceIssue.__table__
+        query = select(table).where(table.c.retention_until < cutoff)
+        if after is not None:
+            last_until, last_id = after
+            query = query.where(or_(
+                table.c.retention_until > last_until,
+                and_(table.c.retention_until == last_until, table.c.id > last_id),
+            ))
+        query = query.order_by(table.c.retention_until, table.c.id).limit(limit)
+        return [dict(row) for row in db.execute(query).mappings()]
+
+    @staticmethod
+    def delete_chunk(db: Session, ids: List[int], cutoff: date) -> int:
+        """
+        chunk 삭제 (커밋 포함)
+
+        조회 후 보관 만료일이 바뀐 행은 지우지 않도록 만료 조건을 다시 겁니다.
+        품목 행(tax_invoice_issue_line_items)도 같은 트랜잭션에서 함께 삭제합니다.
+
+        Returns:
+            삭제한 행 수
+        """
+        expired_ids = select(TaxInvoiceIssue.id).where(
+            TaxInvoiceIssue.id.in_(ids),
+            TaxInvoiceIssue.retention_until < cutoff,
+        )
+        db.query(TaxInvoiceIssueLineItem).filter(
+            TaxInvoiceIssueLineItem.tax_invoice_issue_id.in_(expired_ids)
+        ).delete(synchronize_session=False)
+        deleted = db.query(TaxInvoiceIssue).filter(
+            TaxInvoiceIssue.id.in_(ids),
+            TaxInvoiceIssue.retention_until < cutoff,
+        ).delete(synchronize_session=False)
+        db.commit()
+        return deleted
+
+    @staticmethod
+    def purge(
+        db: Session,
+        cutoff: Optional[date] = None,
+        chunk_size: int = 500,
+        sleep_seconds: float = 0.0,
+        archive_dir: Optional[str] = None,
+        dry_run: bool = False,
+        max_rows: Optional[int] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        보관 기간 만료 행 정리
+
+        Args:
+            db: 데이터베이스 세션
+            cutoff: 이 날짜 이전에 만료된 행 정리 (기본 오늘, 오늘 이후는 불가)
+            chunk_size: chunk당 행 수 (트랜잭션 크기)
+            sleep_seconds: chunk 사이 대기 시간(초)
+            archive_dir: 삭제 전 보관할 디렉토리 (없으면 보관하지 않음)
+            dry_run: True면 조회만 하고 보관/삭제하지 않음
+            max_rows: 이번 실행에서 처리할 최대 행 수
+            on_progress: chunk마다 진행 상황 딕셔너리로 호출
+
+        Returns:
+            진행 상황 (cutoff, dry_run, total, scanned, archived, deleted, chunks, archive_path, elapsed)
+
+        Raises:
+            ValueError: cutoff가 오늘 이후
+        """
+        today = date.today()
+        cutoff = cutoff or today
+        if cutoff > today:
+            raise ValueError("보관 기간이 남은 세금계산서는 정리할 수 없습니다. (cutoff는 오늘 이전이어야 합니다)")
+
+        started = time.monotonic()
+        progress: Dict[str, Any] = {
+            "cutoff": cutoff.isoformat(),
+            "dry_run": dry_run,
+            "total": TaxInvoiceRetentionService.count_expired(db, cutoff),
+            "scanned": 0,
+            "archived": 0,
+            "deleted": 0,
+            "chunks": 0,
+            "archive_path": None,
+            "elapsed": 0.0,
+        }
+        archive = None
+        if archive_dir and not dry_run and progress["total"]:
+            archive = TaxInvoiceArchive(archive_dir, cutoff)
+            progress["archive_path"] = str(archive.path)
+
+        after = None
+        try:
+            while max_rows is None or progress["scanned"] < max_rows:
+                limit = chunk_size if max_rows is None else min(chunk_size, max_rows - progress["scanned"])
+                rows = TaxInvoiceRetentionService.fetch_expired_chunk(db, cutoff, after, max(limit, 1))
+                if not rows:
+                    break
+                after = (rows[-1]["retention_until"], rows[-1]["id"])
+                progress["scanned"] += len(rows)
+                progress["chunks"] += 1
+
+                if not dry_run:
+                    if archive is not None:
+                        archive.write(rows)
+                        progress["archived"] += len(rows)
+                    progress["deleted"] += TaxInvoiceRetentionService.delete_chunk(
+                        db, [row["id"] for row in rows], cutoff
+                    )
+
+                progress["elapsed"] = round(time.monotonic() - started, 3)
+                logger.info(
+                    f"세금계산서 보관 만료분 정리 진행: {progress['scanned']}/{progress['total']}행 "
+                    f"(삭제 {progress['deleted']}, 보관 {progress['archived']}, dry_run={dry_run})"
+                )
+                if on_progress:
+                    on_progress(dict(progress))
+                if len(rows) < limit:
+                    break
+                if sleep_seconds > 0:
+                    time.sleep(sleep_seconds)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            if archive is not None:
+                archive.close()
+
+        progress["elapsed"] = round(time.monotonic() - started, 3)
+        return progress
@@ -0,0 +1,148 @@
+"""
+자격증명별 세금계산서 서비스 캐시
+
+발행/조회 요청마다 TaxInvoiceService(cert_key, corp_num)를 새로 만들고
+TaxInvoice/InvoiceParty 등 zeep 타입을 다시 조회하는 대신,
+(서비스 클래스, 인증키, 사업자번호, 서버)별 인스턴스를 LRU로 보관해 재사용합니다.
+(zeep 클라이언트 자체는 client_registry가 프로세스 전역으로 공유)
+
+- 최대 TAX_INVOICE_SERVICE_CACHE_MAX_ENTRIES개까지 보관, 넘으면 가장 오래 쓰지 않은 항목부터 제거
+- TAX_INVOICE_SERVICE_CACHE_IDLE_TTL 동안 쓰이지 않은 항목은 다음 조회 시 제거
+- 사용자의 인증키/사업자번호가 바뀌면 이전 자격증명의 항목을 무효화
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple, Type, TypeVar
+from prometheus_client import Counter
+from sqlalchemy import event
+from app.core.config import settings
+from app.core.barobill.barobill_registry import get_server_name
+from app.models.user import User
+from app.services.tax_invoice import TaxInvoiceService
+
+ServiceT = TypeVar("ServiceT", bound=TaxInvoiceService)
+
+SERVICE_CACHE_LOOKUPS = Counter(
+    "tax_invoice_service_cache_total",
+    "세금계산서 서비스 캐시 조회/제거 수",
+    ["result"],
+)
+
+
+class TaxInvoiceServiceCache:
+    """자격증명별 세금계산서 서비스 인스턴스 LRU (스레드 안전)"""
+
+    def __init__(self, max_entries: int = 512, idle_ttl: float = 1800.0):
+        """
+        Args:
+            max_entries: 최대 보관 인스턴스 수 (0 이하면 캐시 안 함)
+            idle_ttl: 마지막 사용 후 보관 시간(초)
+        """
+        self.max_entries = max_entries
+        self.idle_ttl = idle_ttl
+        self._entries: "OrderedDict[Tuple, Tuple[float, TaxInvoiceService]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        service_class: Type[TaxInvoiceService],
+        cert_key: Optional[str],
+        corp_num: Optional[str]
+    ) -> Tuple:
+        use_test_server = getattr(settings, "BAROBILL_USE_TEST_SERVER", False)
+        return (service_class, cert_key, corp_num, get_server_name(use_test_server))
+
+    def get(
+        self,
+        service_class: Type[ServiceT],
+        cert_key: Optional[str] = None,
+        corp_num: Optional[str] = None
+    ) -> ServiceT:
+        """
+        자격증명의 세금계산서 서비스 반환 (없으면 생성해 보관)
+
+        Args:
+            service_class: TaxInvoiceService 또는 AsyncTaxInvoiceService
+            cert_key: 인증키 (없으면 파트너 인증키)
+            corp_num: 사업자번호 (없으면 파트너 사업자번호)
+        """
+        cert_key = cert_key or getattr(settings, "BAROBILL_CERT_KEY", None)
+        corp_num = corp_num or getattr(settings, "BAROBILL_CORP_NUM", None)
+        if self.max_entries <= 0:
+            return service_class(cert_key=cert_key, corp_num=corp_num)
+
+        key = self.make_key(service_class, cert_key, corp_num)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] <= self.idle_ttl:
+                self._entries[key] = (now, entry[1])
+                self._entries.move_to_end(key)
+                SERVICE_CACHE_LOOKUPS.labels("hit").inc()
+                return entry[1]
+
+        SERVICE_CACHE_LOOKUPS.labels("miss").inc()
+        service = service_class(cert_key=cert_key, corp_num=corp_num)
+        with self._lock:
+            self._entries[key] = (now, service)
+            self._entries.move_to_end(key)
+            self._evict(now)
+        return service
+
+    def invalidate(self, cert_key: Optional[str] = None, corp_num: Optional[str] = None):
+        """
+        인증키 또는 사업자번호가 일치하는 항목 제거
+
+        Args:
+            cert_key: 제거할 인증키 (None이면 조건 없음)
+            corp_num: 제거할 사업자번호 (None이면 조건 없음)
+        """
+        if cert_key is None and corp_num is None:
+            return
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if (cert_key is None or key[1] == cert_key)
+                and (corp_num is None or key[2] == corp_num)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self, now: float):
+        """유휴 시간이 지난 항목과 최대 개수를 넘는 오래된 항목 제거 (락 보유 상태에서 호출)"""
+        evicted = 0
+        while self._entries:
+            key, (last_used, _) = next(iter(self._entries.items()))
+            if len(self._entries) > self.max_entries or now - last_used > self.idle_ttl:
+                del self._entries[key]
+                evicted += 1
+            else:
+                break
+        if evicted:
+            SERVICE_CACHE_LOOKUPS.labels("evict").inc(evicted)
+
+
+# 프로세스 전역 세금계산서 서비스 캐시
+tax_invoice_service_cache = TaxInvoiceServiceCache(
+    max_entries=settings.TAX_INVOICE_SERVICE_CACHE_MAX_ENTRIES,
+    idle_ttl=settings.TAX_INVOICE_SERVICE_CACHE_IDLE_TTL,
+)
+
+
+@event.listens_for(User.barobill_cert_key, "set")
+def _invalidate_on_cert_key_change(target, value, oldvalue, initiator):
+    """사용자 인증키가 바뀌면 이전 인증키의 서비스 제거"""
+    if isinstance(oldvalue, str) and oldvalue != value:
+        tax_invoice_service_cache.invalidate(cert_key=oldvalue)
+
+
+@event.listens_for(User.barobill_corp_num, "set")
+def _invalidate_on_corp_num_change(target, value, oldvalue, initiator):
+    """사용자 사업자번호가 바뀌면 이전 인증키+사업자번호의 서비스 제거"""
+    if isinstance(oldvalue, str) and oldvalue != value and target.barobill_cert_key:
+        tax_invoice_service_cache.invalidate(cert_key=target.barobill_cert_key, corp_num=oldvalue)
@@ -0,0 +1,198 @@
+"""
+세금계산서 바로빌 상태 동기화 (DB 기반)
+
+요청마다 사용자의 대기 건을 GetTaxInvoiceStatesEX로 조회하던 방식 대신,
+동기화한 지 오래된 행(state_synced_at 이 NULL 이거나 오래된 순)을 모든 사용자에 걸쳐 모아
+사용자(자격증명)별로 관리번호를 바로빌 호출당 최대 건수로 나눠 조회하고, 결과를 집합 단위 UPDATE로 반영합니다.
+화면은 DB에 저장된 상태와 state_synced_at 을 그대로 읽습니다.
+
+- 대상: 상태가 "대기"인 invoices, 바로빌 상태가 발행완료/발행예약(또는 없음)인 tax_invoice_issues
+- 반영: 국세청 전송완료(2)는 "완료"/"전송완료", 취소(4)는 "취소됨"으로 변경하고 조회한 행의 state_synced_at 갱신
+- 호출 실패: 해당 묶음은 state_synced_at 을 갱신하지 않아 다음 동기화에서 다시 조회
+"""
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from app.models.invoice import Invoice
+from app.models.tax_invoice_issue import TaxInvoiceIssue
+from app.models.user import User
+from app.services.tax_invoice import TaxInvoiceService
+from app.services.tax_invoice_service_cache import tax_invoice_service_cache
+
+ServiceT = TypeVar("ServiceT", bound=TaxInvoiceService)
+
+# 바로빌 상태 (BarobillState)
+BAROBILL_STATE_NTS_SENT = 2  # 국세청 전송완료
+BAROBILL_STATE_CANCELLED = 4  # 취소됨
+
+# 동기화 대상 상태
+PENDING_INVOICE_STATUS = "대기"
+PENDING_ISSUE_STATES = ("발행완료", "발행예약")
+
+# 바로빌 상태별 반영 값 (invoices.status, tax_invoice_issues.barobill_state)
+INVOICE_STATUS_BY_STATE = {
+    BAROBILL_STATE_NTS_SENT: "완료",
+    BAROBILL_STATE_CANCELLED: "취소됨",
+}
+ISSUE_STATE_BY_STATE = {
+    BAROBILL_STATE_NTS_SENT: "전송완료",
+    BAROBILL_STATE_CANCELLED: "취소됨",
+}
+
+
+class TaxInvoiceStateSyncService:
+    """세금계산서 상태 동기화 DB 로직"""
+
+    @staticmethod
+    def find_stale(
+        db: Session,
+        cutoff: datetime,
+        limit: int,
+        user_id: Optional[int] = None
+    ) -> Dict[int, List[str]]:
+        """
+        동기화가 필요한 관리번호 조회 (오래 동기화하지 않은 순)
+
+        Args:
+            db: 데이터베이스 세션
+            cutoff: 이 시각 이전에 동기화한 행(또는 동기화한 적 없는 행)만 대상 (UTC)
+            limit: 테이블별 최대 조회 행 수
+            user_id: 지정하면 해당 사용자만 조회
+
+        Returns:
+            사용자 ID별 관리번호 목록 (중복 제거)
+        """
+        invoice_query = db.query(Invoice.user_id, Invoice.mgt_key).filter(
+            Invoice.status == PENDING_INVOICE_STATUS,
+            Invoice.mgt_key.isnot(None),
+            Invoice.mgt_key != "",
+            or_(Invoice.state_synced_at.is_(None), Invoice.state_synced_at < cutoff),
+        )
+        issue_query = db.query(TaxInvoiceIssue.user_id, TaxInvoiceIssue.mgt_key).filter(
+            or_(
+                TaxInvoiceIssue.barobill_state.in_(PENDING_ISSUE_STATES),
+                TaxInvoiceIssue.barobill_state.is_(None),
+            ),
+            or_(
+                TaxInvoiceIssue.state_synced_at.is_(None),
+                TaxInvoiceIssue.state_synced_at < cutoff,
+            ),
+        )
+        if user_id is not None:
+            invoice_query = invoice_query.filter(Invoice.user_id == user_id)
+            issue_query = issue_query.filter(TaxInvoiceIssue.user_id == user_id)
+
+        rows = (
+            invoice_query.order_by(Invoice.state_synced_at).limit(limit).all()
+            + issue_query.order_by(TaxInvoiceIssue.state_synced_at).limit(limit).all()
+        )
+
+        keys_by_user: Dict[int, List[str]] = defaultdict(list)
+        seen = set()
+        for row_user_id, mgt_key in rows:
+            if (row_user_id, mgt_key) not in seen:
+                seen.add((row_user_id, mgt_key))
+                keys_by_user[row_user_id].append(mgt_key)
+        return dict(keys_by_user)
+
+    @staticmethod
+    def get_credentials(
+        db: Session,
+        user_ids: Iterable[int]
+    ) -> Dict[int, Tuple[Optional[str], Optional[str]]]:
+        """사용자 ID별 바로빌 (인증키, 사업자번호) 조회 (한 번의 쿼리)"""
+        rows = db.query(User.id, User.barobill_cert_key, User.barobill_corp_num).filter(
+            User.id.in_(list(user_ids))
+        ).all()
+        return {user_id: (cert_key, corp_num) for user_id, cert_key, corp_num in rows}
+
+    @staticmethod
+    def get_service(
+        service_class: Type[ServiceT],
+        cert_key: Optional[str],
+        corp_num: Optional[str]
+    ) -> ServiceT:
+        """사용자 자격증명의 세금계산서 서비스 (인증키가 없으면 파트너 인증키)"""
+        if not cert_key or not corp_num:
+            cert_key = corp_num = None
+        return tax_invoice_service_cache.get(service_class, cert_key=cert_key, corp_num=corp_num)
+
+    @staticmethod
+    def chunk(mgt_keys: List[str], size: int) -> List[List[str]]:
+        """관리번호를 바로빌 호출당 최대 건수로 나누기"""
+        size = max(size, 1)
+        return [mgt_keys[i:i + size] for i in range(0, len(mgt_keys), size)]
+
+    @staticmethod
+    def parse_states(states_result: List[Dict]) -> Dict[str, int]:
+        """GetTaxInvoiceStatesEX 결과를 관리번호 -> BarobillState 로 변환"""
+        states = {}
+        for state_info in states_result:
+            mgt_key = state_info.get("MgtKey") or state_info.get("mgt_key")
+            barobill_state = state_info.get("BarobillState")
+            if barobill_state is None:
+                barobill_state = state_info.get("barobill_state")
+            if mgt_key and barobill_state is not None:
+                states[mgt_key] = barobill_state
+        return states
+
+    @staticmethod
+    def apply_states(
+        db: Session,
+        results: List[Tuple[int, List[str], Dict[str, int]]],
+        synced_at: Optional[datetime] = None
+    ) -> int:
+        """
+        조회 결과를 집합 단위 UPDATE로 반영 (커밋 포함)
+
+        Args:
+            db: 데이터베이스 세션
+            results: [(사용자 ID, 조회한 관리번호 묶음, 관리번호 -> BarobillState)]
+            synced_at: 동기화 시각 (UTC, 기본 현재 시각)
+
+        Returns:
+            상태가 바뀐 invoices 행 수
+        """
+        synced_at = synced_at or datetime.utcnow()
+        updated_count = 0
+        for user_id, mgt_keys, states in results:
+            for barobill_state, invoice_status in INVOICE_STATUS_BY_STATE.items():
+                changed = [key for key, state in states.items() if state == barobill_state]
+                if not changed:
+                    continue
+                updated_count += db.query(Invoice).filter(
+                    Invoice.user_id == user_id,
+                    Invoice.mgt_key.in_(changed),
+                    Invoice.status == PENDING_INVOICE_STATUS,
+                ).update(
+                    {Invoice.status: invoice_status, Invoice.state_synced_at: synced_at},
+                    synchronize_session=False
+                )
+                db.query(TaxInvoiceIssue).filter(
+                    TaxInvoiceIssue.user_id == user_id,
+                    TaxInvoiceIssue.mgt_key.in_(changed),
+                    or_(
+                        TaxInvoiceIssue.barobill_state.in_(PENDING_ISSUE_STATES),
+                        TaxInvoiceIssue.barobill_state.is_(None),
+                    ),
+                ).update(
+                    {
+                        TaxInvoiceIssue.barobill_state: ISSUE_STATE_BY_STATE[barobill_state],
+                        TaxInvoiceIssue.state_synced_at: synced_at,
+                    },
+                    synchronize_session=False
+                )
+
+            db.query(Invoice).filter(
+                Invoice.user_id == user_id,
+                Invoice.mgt_key.in_(mgt_keys),
+            ).update({Invoice.state_synced_at: synced_at}, synchronize_session=False)
+            db.query(TaxInvoiceIssue).filter(
+                TaxInvoiceIssue.user_id == user_id,
+                TaxInvoiceIssue.mgt_key.in_(mgt_keys),
+            ).update({TaxInvoiceIssue.state_synced_at: synced_at}, synchronize_session=False)
+
+        db.commit()
+        return updated_count
@@ -0,0 +1,143 @@
+"""
+세금계산서 바로빌 상태 동기화 작업자
+
+애플리케이션 이벤트 루프에서 TAX_INVOICE_STATE_SYNC_INTERVAL마다 동기화가 필요한 관리번호를 모아
+사용자별로 TAX_INVOICE_STATE_SYNC_CHUNK_SIZE개씩 GetTaxInvoiceStatesEX를 호출하고
+(동시 호출 TAX_INVOICE_STATE_SYNC_CONCURRENCY개), 결과를 한 트랜잭션으로 일괄 반영합니다.
+DB 작업은 스레드풀에서, 바로빌 호출은 비동기로 처리합니다.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.tax_invoice import AsyncTaxInvoiceService
+from app.services.tax_invoice_state_sync_service import TaxInvoiceStateSyncService
+
+logger = logging.getLogger(__name__)
+
+
+class TaxInvoiceStateSyncWorker:
+    """세금계산서 상태를 주기적으로 바로빌과 동기화하는 작업자"""
+
+    def __init__(
+        self,
+        interval: float = 60.0,
+        stale_seconds: int = 300,
+        batch_size: int = 5000,
+        chunk_size: int = 100,
+        concurrency: int = 4
+    ):
+        """
+        Args:
+            interval: 동기화 주기(초)
+            stale_seconds: 마지막 동기화 후 다시 조회하기까지의 시간(초)
+            batch_size: 한 번의 동기화에서 테이블별 최대 조회 행 수
+            chunk_size: 바로빌 호출당 관리번호 수
+            concurrency: 바로빌 동시 호출 수
+        """
+        self.interval = interval
+        self.stale_seconds = stale_seconds
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """동기화 코루틴 시작 (실행 중인 이벤트 루프에서 호출)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="tax-invoice-state-sync")
+
+    async def stop(self):
+        """동기화 중단"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                checked_count, _ = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"세금계산서 상태 동기화 오류: {e}")
+                checked_count = 0
+
+            # 대상이 한 번에 다 처리되지 않았으면 바로 이어서 동기화
+            if checked_count < self.batch_size:
+                await asyncio.sleep(self.interval)
+
+    async def run_once(self) -> Tuple[int, int]:
+        """
+        동기화 한 번 실행
+
+        Returns:
+            (조회에 성공한 관리번호 수, 상태가 바뀐 세금계산서 수)
+        """
+        db = SessionLocal()
+        try:
+            cutoff = datetime.utcnow() - timedelta(seconds=self.stale_seconds)
+            keys_by_user = await run_in_threadpool(
+                TaxInvoiceStateSyncService.find_stale, db, cutoff, self.batch_size
+            )
+            if not keys_by_user:
+                return 0, 0
+            credentials = await run_in_threadpool(
+                TaxInvoiceStateSyncService.get_credentials, db, list(keys_by_user)
+            )
+
+            semaphore = asyncio.Semaphore(max(self.concurrency, 1))
+            calls = []
+            for user_id, mgt_keys in keys_by_user.items():
+                cert_key, corp_num = credentials.get(user_id, (None, None))
+                service = TaxInvoiceStateSyncService.get_service(
+                    AsyncTaxInvoiceService, cert_key, corp_num
+                )
+                for chunk in TaxInvoiceStateSyncService.chunk(mgt_keys, self.chunk_size):
+                    calls.append(self._fetch(semaphore, service, user_id, chunk))
+
+            results = [result for result in await asyncio.gather(*calls) if result is not None]
+            updated_count = 0
+            if results:
+                updated_count = await run_in_threadpool(
+                    TaxInvoiceStateSyncService.apply_states, db, results
+                )
+            checked_count = sum(len(mgt_keys) for _, mgt_keys, _ in results)
+            if updated_count:
+                logger.info(f"세금계산서 상태 동기화: {checked_count}건 조회, {updated_count}건 변경")
+            return checked_count, updated_count
+        finally:
+            await run_in_threadpool(db.close)
+
+    @staticmethod
+    async def _fetch(
+        semaphore: asyncio.Semaphore,
+        service: AsyncTaxInvoiceService,
+        user_id: int,
+        mgt_keys: List[str]
+    ) -> Optional[Tuple[int, List[str], Dict[str, int]]]:
+        """관리번호 묶음 상태 조회 (실패하면 None, 다음 동기화에서 다시 조회)"""
+        async with semaphore:
+            try:
+                states_result = await service.get_tax_invoice_states(mgt_keys)
+            except Exception as e:
+                logger.warning(
+                    f"세금계산서 상태 조회 실패 (user_id={user_id}, {len(mgt_keys)}건): {e}"
+                )
+                return None
+        return user_id, mgt_keys, TaxInvoiceStateSyncService.parse_states(states_result)
+
+
+# 프로세스 전역 상태 동기화 작업자
+tax_invoice_state_sync_worker = TaxInvoiceStateSyncWorker(
+    interval=settings.TAX_INVOICE_STATE_SYNC_INTERVAL,
+    stale_seconds=settings.TAX_INVOICE_STATE_SYNC_STALE_SECONDS,
+    batch_size=settings.TAX_INVOICE_STATE_SYNC_BATCH_SIZE,
+    chunk_size=settings.TAX_INVOICE_STATE_SYNC_CHUNK_SIZE,
+    concurrency=settings.TAX_INVOICE_STATE_SYNC_CONCURRENCY,
+)
@@ -0,0 +1,3 @@
+def normalize_business_number(business_number: str) -> str:
+    """사업자번호 정규화 (하이픈/앞뒤 공백 제거, 예: "123-45-67890" -> "1234567890")"""
+    return (business_number or "").replace("-", "").strip()
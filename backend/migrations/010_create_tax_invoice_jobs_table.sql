@@ -0,0 +1,25 @@
+-- 세금계산서 발행 작업 큐 테이블 생성
+-- POST /barobill/tax-invoices/jobs 가 작업을 넣고, 백그라운드 작업자가 lease를 잡아 처리합니다.
+-- (next_run_at, lease_expires_at, finished_at 은 UTC)
+CREATE TABLE IF NOT EXISTS tax_invoice_jobs (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    job_id VARCHAR(32) NOT NULL,
+    user_id INT NOT NULL,
+    status ENUM('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', 'DEAD') NOT NULL DEFAULT 'QUEUED',
+    payload TEXT NOT NULL,
+    attempts INT NOT NULL DEFAULT 0,
+    max_attempts INT NOT NULL DEFAULT 5,
+    next_run_at DATETIME NOT NULL,
+    lease_owner VARCHAR(100) NULL,
+    lease_expires_at DATETIME NULL,
+    mgt_key VARCHAR(100) NULL,
+    result_code INT NULL,
+    last_error TEXT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NULL ON UPDATE CURRENT_TIMESTAMP,
+    finished_at DATETIME NULL,
+    UNIQUE KEY uq_tax_invoice_jobs_job_id (job_id),
+    INDEX idx_tax_invoice_jobs_user_id (user_id),
+    INDEX idx_tax_invoice_jobs_status_next_run (status, next_run_at),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
@@ -0,0 +1,18 @@
+-- 멱등성 키 테이블 생성
+-- 세금계산서 발행/취소 API의 Idempotency-Key 헤더별 요청 지문과 응답을 저장해
+-- 같은 키로 재요청하면 바로빌 호출/과금 없이 저장된 응답을 반환합니다. (expires_at 은 UTC)
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    user_id INT NOT NULL,
+    `key` VARCHAR(255) NOT NULL,
+    request_hash VARCHAR(64) NOT NULL,
+    status ENUM('IN_PROGRESS', 'COMPLETED') NOT NULL DEFAULT 'IN_PROGRESS',
+    response_status_code INT NULL,
+    response_body TEXT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    expires_at DATETIME NOT NULL,
+    UNIQUE KEY uq_idempotency_keys_user_key (user_id, `key`),
+    INDEX idx_idempotency_keys_user_id (user_id),
+    INDEX idx_idempotency_keys_expires_at (expires_at),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
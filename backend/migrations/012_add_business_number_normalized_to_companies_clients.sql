@@ -0,0 +1,22 @@
+-- companies / clients 테이블에 정규화 사업자번호 컬럼 및 (user_id, 정규화 사업자번호) 인덱스 추가
+-- 발행/연동 시 사용자의 회사를 전부 읽어 하이픈을 제거하며 비교하던 조회를 인덱스 조회 한 번으로 대체합니다.
+-- 이후 값은 애플리케이션이 business_number 저장 시 함께 갱신합니다.
+ALTER TABLE companies
+ADD COLUMN business_number_normalized VARCHAR(20) NULL COMMENT '하이픈 제거 사업자등록번호 (조회용)' AFTER business_number;
+
+UPDATE companies
+SET business_number_normalized = TRIM(REPLACE(business_number, '-', ''));
+
+ALTER TABLE companies
+MODIFY COLUMN business_number_normalized VARCHAR(20) NOT NULL COMMENT '하이픈 제거 사업자등록번호 (조회용)',
+ADD INDEX idx_companies_user_business_number (user_id, business_number_normalized);
+
+ALTER TABLE clients
+ADD COLUMN business_number_normalized VARCHAR(20) NULL COMMENT '하이픈 제거 사업자등록번호 (조회용)' AFTER business_number;
+
+UPDATE clients
+SET business_number_normalized = TRIM(REPLACE(business_number, '-', ''));
+
+ALTER TABLE clients
+MODIFY COLUMN business_number_normalized VARCHAR(20) NOT NULL COMMENT '하이픈 제거 사업자등록번호 (조회용)',
+ADD INDEX idx_clients_user_business_number (user_id, business_number_normalized);
@@ -0,0 +1,10 @@
+-- invoices / tax_invoice_issues 테이블에 바로빌 상태 동기화 시각 컬럼 및 인덱스 추가
+-- 백그라운드 상태 동기화 작업자가 동기화한 지 오래된 행(state_synced_at 이 NULL 이거나 오래된 순)부터
+-- GetTaxInvoiceStatesEX 로 조회해 일괄 갱신합니다. (state_synced_at 은 UTC)
+ALTER TABLE invoices
+ADD COLUMN state_synced_at DATETIME NULL COMMENT '바로빌 상태 마지막 동기화 시각 (UTC)' AFTER mgt_key,
+ADD INDEX idx_invoices_status_state_synced_at (status, state_synced_at);
+
+ALTER TABLE tax_invoice_issues
+ADD COLUMN state_synced_at DATETIME NULL COMMENT '바로빌 상태 마지막 동기화 시각 (UTC)' AFTER barobill_state,
+ADD INDEX idx_tax_invoice_issues_state_synced_at (barobill_state, state_synced_at);
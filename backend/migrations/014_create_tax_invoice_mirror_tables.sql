@@ -0,0 +1,52 @@
+-- 바로빌 매출/매입 세금계산서 목록 미러 테이블 및 동기화 워터마크 테이블 생성
+-- 백그라운드 작업자가 GetPeriodTaxInvoiceSalesList / GetPeriodTaxInvoicePurchaseList 를 페이지 병렬 조회해
+-- tax_invoice_mirrors 에 upsert 하고, 동기화를 마친 작성일자를 tax_invoice_mirror_sync_states 에 기록합니다.
+-- (synced_at, last_synced_at 은 UTC)
+CREATE TABLE IF NOT EXISTS tax_invoice_mirrors (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    user_id INT NOT NULL,
+    corp_num VARCHAR(20) NOT NULL COMMENT '조회한 사업자번호',
+    direction ENUM('SALES', 'PURCHASE') NOT NULL COMMENT '매출/매입',
+    invoice_key VARCHAR(100) NOT NULL COMMENT '바로빌 InvoiceKey (없으면 국세청 승인번호)',
+    mgt_key VARCHAR(100) NULL COMMENT '바로빌 관리번호',
+    nts_send_key VARCHAR(50) NULL COMMENT '국세청 승인번호',
+    tax_invoice_type INT NULL,
+    tax_type INT NULL,
+    purpose_type INT NULL,
+    modify_code VARCHAR(10) NULL,
+    barobill_state INT NULL,
+    write_date VARCHAR(8) NOT NULL COMMENT '작성일자 (YYYYMMDD)',
+    issue_dt VARCHAR(14) NULL,
+    nts_send_dt VARCHAR(14) NULL,
+    invoicer_corp_num VARCHAR(20) NULL,
+    invoicer_corp_name VARCHAR(255) NULL,
+    invoicee_corp_num VARCHAR(20) NULL,
+    invoicee_corp_name VARCHAR(255) NULL,
+    item_name VARCHAR(255) NULL,
+    amount_total VARCHAR(50) NULL,
+    tax_total VARCHAR(50) NULL,
+    total_amount VARCHAR(50) NULL,
+    raw TEXT NULL COMMENT '바로빌 SimpleTaxInvoiceEx 원본 (JSON)',
+    synced_at DATETIME NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NULL ON UPDATE CURRENT_TIMESTAMP,
+    INDEX idx_tax_invoice_mirrors_user_id (user_id),
+    UNIQUE KEY uq_tax_invoice_mirrors_user_direction_key (user_id, direction, invoice_key),
+    INDEX idx_tax_invoice_mirrors_user_direction_write_date (user_id, direction, write_date),
+    INDEX idx_tax_invoice_mirrors_nts_send_key (nts_send_key),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS tax_invoice_mirror_sync_states (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    user_id INT NOT NULL,
+    direction ENUM('SALES', 'PURCHASE') NOT NULL COMMENT '매출/매입',
+    corp_num VARCHAR(20) NOT NULL COMMENT '동기화한 사업자번호',
+    synced_through VARCHAR(8) NULL COMMENT '동기화 완료 작성일자 (YYYYMMDD)',
+    last_synced_at DATETIME NULL,
+    last_error TEXT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NULL ON UPDATE CURRENT_TIMESTAMP,
+    UNIQUE KEY uq_tax_invoice_mirror_sync_states_user_direction (user_id, direction),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
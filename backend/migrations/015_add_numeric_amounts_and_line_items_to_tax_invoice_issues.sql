@@ -0,0 +1,30 @@
+-- tax_invoice_issues 테이블에 숫자 금액 컬럼과 리포트용 인덱스 추가, 품목 테이블 생성
+-- 월별 합계 / 품목별 / 거래처별 매출을 행을 읽어 파이썬에서 파싱하지 않고 SQL SUM / GROUP BY 로 집계합니다.
+-- 발행 시 함께 저장되며, 기존 행은 python utils/backfill_tax_invoice_line_items.py 로 채웁니다.
+ALTER TABLE tax_invoice_issues
+ADD COLUMN amount_total_value DECIMAL(18, 2) NULL COMMENT '공급가액 (숫자)' AFTER total_amount,
+ADD COLUMN tax_total_value DECIMAL(18, 2) NULL COMMENT '세액 (숫자)' AFTER amount_total_value,
+ADD COLUMN total_amount_value DECIMAL(18, 2) NULL COMMENT '합계금액 (숫자)' AFTER tax_total_value,
+ADD INDEX idx_tax_invoice_issues_user_issue_date (user_id, issue_date),
+ADD INDEX idx_tax_invoice_issues_user_invoicee (user_id, invoicee_corp_num);
+
+CREATE TABLE IF NOT EXISTS tax_invoice_issue_line_items (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    tax_invoice_issue_id INT NOT NULL,
+    line_no INT NOT NULL COMMENT '품목 순번 (1부터)',
+    user_id INT NOT NULL,
+    issue_date DATE NOT NULL COMMENT '발행일자 (세금계산서와 같은 값)',
+    purchase_expiry VARCHAR(20) NULL COMMENT '품목 일자',
+    name VARCHAR(255) NOT NULL COMMENT '품목명',
+    information VARCHAR(255) NULL COMMENT '규격',
+    quantity DECIMAL(18, 4) NULL COMMENT '수량',
+    unit_price DECIMAL(18, 2) NULL COMMENT '단가',
+    amount DECIMAL(18, 2) NULL COMMENT '공급가액',
+    tax DECIMAL(18, 2) NULL COMMENT '세액',
+    description TEXT NULL COMMENT '비고',
+    INDEX idx_tax_invoice_issue_line_items_tax_invoice_issue_id (tax_invoice_issue_id),
+    INDEX idx_tax_invoice_issue_line_items_user_issue_date (user_id, issue_date),
+    INDEX idx_tax_invoice_issue_line_items_user_name (user_id, name),
+    FOREIGN KEY (tax_invoice_issue_id) REFERENCES tax_invoice_issues(id) ON DELETE CASCADE,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
@@ -0,0 +1,148 @@
+"""
+발행 세금계산서 숫자 금액 / 품목 테이블 백필 스크립트
+
+015 마이그레이션 이전에 저장된 tax_invoice_issues 행의 금액 문자열을 amount_total_value 등 숫자 컬럼에 채우고,
+line_items JSON을 tax_invoice_issue_line_items 행으로 펼칩니다.
+id 순서로 chunk 단위로 처리하고 chunk마다 커밋하므로 중간에 멈춰도 --start-id로 이어서 실행할 수 있습니다.
+품목 행이 이미 있는 세금계산서는 건너뜁니다(--rebuild를 주면 다시 만듦).
+
+사용법:
+    python utils/backfill_tax_invoice_line_items.py --dry-run
+    python utils/backfill_tax_invoice_line_items.py --chunk-size 500 --sleep 0.2
+    python utils/backfill_tax_invoice_line_items.py --start-id 120000 --rebuild
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+
+from app.db.session import SessionLocal
+from app.models.tax_invoice_issue import TaxInvoiceIssue, TaxInvoiceIssueLineItem
+from app.services.invoice_service import InvoiceService
+
+
+def load_line_items(raw):
+    """line_items JSON 문자열 파싱 (잘못된 값이면 빈 목록)"""
+    if not raw:
+        return []
+    try:
+        items = json.loads(raw)
+    except ValueError:
+        return []
+    return items if isinstance(items, list) else []
+
+
+def backfill_chunk(db, rows, rebuild: bool, dry_run: bool):
+    """
+    chunk 하나 백필 (커밋 포함)
+
+    Returns:
+        (금액을 채운 세금계산서 수, 추가한 품목 행 수)
+    """
+    ids = [row.id for row in rows]
+    existing = set()
+    if not rebuild:
+        existing = {
+            issue_id for (issue_id,) in db.query(TaxInvoiceIssueLineItem.tax_invoice_issue_id).filter(
+                TaxInvoiceIssueLineItem.tax_invoice_issue_id.in_(ids)
+            ).distinct()
+        }
+
+    amounts = []
+    line_items = []
+    for row in rows:
+        amounts.append({
+            "id": row.id,
+            "amount_total_value": InvoiceService.amount_value(row.amount_total),
+            "tax_total_value": InvoiceService.amount_value(row.tax_total),
+            "total_amount_value": InvoiceService.amount_value(row.total_amount),
+        })
+        if row.id in existing:
+            continue
+        for values in InvoiceService.line_item_values(load_line_items(row.line_items)):
+            line_items.append({
+                "tax_invoice_issue_id": row.id,
+                "user_id": row.user_id,
+                "issue_date": row.issue_date,
+                **values,
+            })
+
+    if dry_run:
+        return len(amounts), len(line_items)
+
+    if rebuild:
+        db.query(TaxInvoiceIssueLineItem).filter(
+            TaxInvoiceIssueLineItem.tax_invoice_issue_id.in_(ids)
+        ).delete(synchronize_session=False)
+    db.bulk_update_mappings(TaxInvoiceIssue, amounts)
+    if line_items:
+        db.bulk_insert_mappings(TaxInvoiceIssueLineItem, line_items)
+    db.commit()
+    return len(amounts), len(line_items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="발행 세금계산서 숫자 금액 / 품목 테이블 백필")
+    parser.add_argument("--dry-run", action="store_true", help="변경 없이 처리할 건수만 확인")
+    parser.add_argument("--chunk-size", type=int, default=500, help="한 트랜잭션에서 처리할 세금계산서 수")
+    parser.add_argument("--sleep", type=float, default=0.0, help="chunk 사이 대기 시간(초)")
+    parser.add_argument("--start-id", type=int, default=0, help="이 id 초과부터 처리 (중단 후 이어서 실행)")
+    parser.add_argument("--rebuild", action="store_true", help="품목 행이 이미 있어도 지우고 다시 만듦")
+    args = parser.parse_args()
+
+    if args.chunk_size < 1:
+        print("✗ --chunk-size는 1 이상이어야 합니다.")
+        sys.exit(1)
+
+    db = SessionLocal()
+    started = time.monotonic()
+    last_id = args.start_id
+    issues = items = 0
+    try:
+        total = db.query(TaxInvoiceIssue).filter(TaxInvoiceIssue.id > last_id).count()
+        print(f"{'[dry-run] ' if args.dry_run else ''}백필 시작: {total}건 (id > {last_id})")
+        while True:
+            rows = db.query(
+                TaxInvoiceIssue.id,
+                TaxInvoiceIssue.user_id,
+                TaxInvoiceIssue.issue_date,
+                TaxInvoiceIssue.amount_total,
+                TaxInvoiceIssue.tax_total,
+                TaxInvoiceIssue.total_amount,
+                TaxInvoiceIssue.line_items,
+            ).filter(TaxInvoiceIssue.id > last_id).order_by(TaxInvoiceIssue.id).limit(args.chunk_size).all()
+            if not rows:
+                break
+
+            filled, added = backfill_chunk(db, rows, args.rebuild, args.dry_run)
+            issues += filled
+            items += added
+            last_id = rows[-1].id
+            print(
+                f"  - {issues}/{total}건 처리, 품목 {items}행 (마지막 id: {last_id}, "
+                f"{round(time.monotonic() - started, 1)}초)"
+            )
+            if len(rows) < args.chunk_size:
+                break
+            if args.sleep > 0:
+                time.sleep(args.sleep)
+    except Exception as e:
+        db.rollback()
+        print(f"✗ 백필 실패 (마지막으로 완료한 id: {last_id}, --start-id {last_id}로 이어서 실행): {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    if args.dry_run:
+        print(f"✓ 처리 대상 {issues}건, 추가할 품목 {items}행 (변경하지 않음)")
+    else:
+        print(f"✓ 백필 완료: {issues}건 금액 반영, 품목 {items}행 추가")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,879 @@
+"""
+바로빌 SOAP 스텁 서버 (부하 테스트 / 오프라인 개발용)
+
+백엔드가 사용하는 TI, CORPSTATE 오퍼레이션을 메모리 상태로 흉내 내는 가짜 바로빌 서버입니다.
+WSDL도 직접 제공하므로 zeep 클라이언트가 그대로 붙을 수 있습니다.
+
+- 지연 주입: 평균 지연 + 지터, 오퍼레이션별 지연
+- 오류 주입: 음수 결과 코드 / SOAP Fault(HTTP 500) / HTTP 503 비율
+- 상태: 등록(0: 발행대기) -> 발행(1: 발행완료) -> 국세청 전송(2, --nts-delay 후) / 취소(4)
+- 제어: GET /__stub/stats, POST /__stub/config, POST /__stub/reset
+
+사용법:
+    python utils/barobill_stub.py --port 8090 --latency-ms 80 --jitter-ms 40 --error-rate 0.01
+
+백엔드 연결 (.env):
+    BAROBILL_STUB_URL=http://localhost:8090
+    BAROBILL_CERT_KEY=stub
+    BAROBILL_CORP_NUM=1234567890
+
+스텁의 오류 코드(-99xxx)는 실제 바로빌 코드가 아닙니다. -10002(인증 오류)와 -32000(이미 가입된 연계사업자)만
+백엔드가 분기 처리하는 실제 코드를 그대로 사용합니다.
+"""
+import argparse
+import asyncio
+import random
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+from lxml import etree
+
+NAMESPACE = "http://ws.baroservice.com/"
+SOAP_ENV = "http://schemas.xmlsoap.org/soap/envelope/"
+
+# ======================================================
+# 스키마 (스텁이 사용하는 필드만 정의)
+# ======================================================
+INVOICE_PARTY_FIELDS = [
+    "MgtNum", "CorpNum", "TaxRegID", "CorpName", "CEOName", "Addr", "BizClass",
+    "BizType", "ContactID", "ContactName", "TEL", "HP", "Email",
+]
+LINE_ITEM_FIELDS = [
+    "PurchaseExpiry", "Name", "Information", "ChargeableUnit", "UnitPrice",
+    "Amount", "Tax", "Description",
+]
+
+# 타입 이름 -> [(필드 이름, 타입, 반복 여부)]
+TYPES: Dict[str, List[Tuple[str, str, bool]]] = {
+    "InvoiceParty": [(name, "s:string", False) for name in INVOICE_PARTY_FIELDS],
+    "TaxInvoiceTradeLineItem": [(name, "s:string", False) for name in LINE_ITEM_FIELDS],
+    "ArrayOfTaxInvoiceTradeLineItem": [
+        ("TaxInvoiceTradeLineItem", "tns:TaxInvoiceTradeLineItem", True)
+    ],
+    "TaxInvoice": [
+        ("IssueDirection", "s:int", False),
+        ("TaxInvoiceType", "s:int", False),
+        ("ModifyCode", "s:string", False),
+        ("TaxType", "s:int", False),
+        ("TaxCalcType", "s:int", False),
+        ("PurposeType", "s:int", False),
+    ]
+    + [
+        (name, "s:string", False)
+        for name in [
+            "WriteDate", "AmountTotal", "TaxTotal", "TotalAmount", "Cash", "ChkBill",
+            "Note", "Credit", "Remark1", "Remark2", "Remark3", "Kwon", "Ho", "SerialNum",
+        ]
+    ]
+    + [
+        ("InvoicerParty", "tns:InvoiceParty", False),
+        ("InvoiceeParty", "tns:InvoiceParty", False),
+        ("BrokerParty", "tns:InvoiceParty", False),
+        ("TaxInvoiceTradeLineItems", "tns:ArrayOfTaxInvoiceTradeLineItem", False),
+    ],
+    "ArrayOfString": [("string", "s:string", True)],
+    "TaxInvoiceStateEX": [
+        ("MgtKey", "s:string", False),
+        ("InvoiceKey", "s:string", False),
+        ("BarobillState", "s:int", False),
+        ("OpenYN", "s:int", False),
+        ("NTSSendState", "s:int", False),
+        ("NTSSendKey", "s:string", False),
+        ("NTSSendResult", "s:string", False),
+        ("NTSSendDT", "s:string", False),
+        ("RegistDT", "s:string", False),
+        ("IssueDT", "s:string", False),
+    ],
+    "ArrayOfTaxInvoiceStateEX": [("TaxInvoiceStateEX", "tns:TaxInvoiceStateEX", True)],
+    "CorpState": [
+        ("CorpNum", "s:string", False),
+        ("CorpName", "s:string", False),
+        ("CeoName", "s:string", False),
+        ("CorpType", "s:string", False),
+        ("State", "s:int", False),
+        ("StateName", "s:string", False),
+        ("BaseDate", "s:string", False),
+    ],
+    "ArrayOfCorpState": [("CorpState", "tns:CorpState", True)],
+    "SimpleTaxInvoiceEx": [
+        ("MgtKey", "s:string", False),
+        ("InvoiceKey", "s:string", False),
+        ("NTSSendKey", "s:string", False),
+        ("TaxInvoiceType", "s:int", False),
+        ("TaxType", "s:int", False),
+        ("PurposeType", "s:int", False),
+        ("ModifyCode", "s:string", False),
+        ("BarobillState", "s:int", False),
+    ]
+    + [
+        (name, "s:string", False)
+        for name in [
+            "WriteDate", "IssueDT", "NTSSendDT", "InvoicerCorpNum", "InvoicerCorpName",
+            "InvoicerCEOName", "InvoiceeCorpNum", "InvoiceeCorpName", "InvoiceeCEOName",
+            "AmountTotal", "TaxTotal", "TotalAmount", "ItemName",
+        ]
+    ],
+    "ArrayOfSimpleTaxInvoiceEx": [("SimpleTaxInvoiceEx", "tns:SimpleTaxInvoiceEx", True)],
+    "PagedSimpleTaxInvoiceEx": [
+        ("CurrentPage", "s:int", False),
+        ("CountPerPage", "s:int", False),
+        ("MaxPageNum", "s:int", False),
+        ("MaxIndex", "s:int", False),
+        ("SimpleTaxInvoiceExList", "tns:ArrayOfSimpleTaxInvoiceEx", False),
+    ],
+}
+
+_CREDENTIALS = [("CERTKEY", "s:string"), ("CorpNum", "s:string")]
+
+# 서비스 -> 오퍼레이션 -> (파라미터 [(이름, 타입)], 결과 타입)
+OPERATIONS: Dict[str, Dict[str, Tuple[List[Tuple[str, str]], str]]] = {
+    "TI": {
+        "RegistTaxInvoiceEX": (
+            _CREDENTIALS + [("Invoice", "tns:TaxInvoice"), ("IssueTiming", "s:int")],
+            "s:int",
+        ),
+        "IssueTaxInvoiceEx": (
+            _CREDENTIALS
+            + [
+                ("MgtKey", "s:string"),
+                ("SendSMS", "s:boolean"),
+                ("SMSMessage", "s:string"),
+                ("ForceIssue", "s:boolean"),
+                ("MailTitle", "s:string"),
+                ("BusinessLicenseYN", "s:boolean"),
+                ("BankBookYN", "s:boolean"),
+            ],
+            "s:int",
+        ),
+        **{
+            operation: (
+                _CREDENTIALS
+                + [
+                    ("Invoice", "tns:TaxInvoice"),
+                    ("SendSMS", "s:boolean"),
+                    ("ForceIssue", "s:boolean"),
+                    ("MailTitle", "s:string"),
+                ],
+                "s:int",
+            )
+            for operation in [
+                "RegistAndIssueTaxInvoice",
+                "RegistAndIssueBrokerTaxInvoice",
+                "RegistAndReverseIssueTaxInvoice",
+            ]
+        },
+        **{
+            operation: (
+                _CREDENTIALS
+                + [
+                    ("Invoice", "tns:TaxInvoice"),
+                    ("SendSMS", "s:boolean"),
+                    ("IssueTiming", "s:int"),
+                    ("MailTitle", "s:string"),
+                ],
+                "s:int",
+            )
+            for operation in ["RegistAndPreIssueTaxInvoice", "RegistAndPreIssueBrokerTaxInvoice"]
+        },
+        "GetTaxInvoice": (_CREDENTIALS + [("MgtKey", "s:string")], "tns:TaxInvoice"),
+        "GetTaxInvoiceStateEX": (
+            _CREDENTIALS + [("MgtKey", "s:string")], "tns:TaxInvoiceStateEX"
+        ),
+        "GetTaxInvoiceStatesEX": (
+            _CREDENTIALS + [("MgtKeyList", "tns:ArrayOfString")],
+            "tns:ArrayOfTaxInvoiceStateEX",
+        ),
+        "DeleteTaxInvoice": (_CREDENTIALS + [("MgtKey", "s:string")], "s:int"),
+        **{
+            operation: (
+                _CREDENTIALS
+                + [
+                    ("UserID", "s:string"),
+                    ("TaxType", "s:int"),
+                    ("DateType", "s:int"),
+                    ("StartDate", "s:string"),
+                    ("EndDate", "s:string"),
+                    ("CountPerPage", "s:int"),
+                    ("CurrentPage", "s:int"),
+                ],
+                "tns:PagedSimpleTaxInvoiceEx",
+            )
+            for operation in ["GetPeriodTaxInvoiceSalesList", "GetPeriodTaxInvoicePurchaseList"]
+        },
+        "CheckCERTIsValid": (_CREDENTIALS, "s:int"),
+        "GetCertificateRegistURL": (
+            _CREDENTIALS + [("ID", "s:string"), ("PWD", "s:string")], "s:string"
+        ),
+        "CheckCorpIsMember": (_CREDENTIALS + [("CheckCorpNum", "s:string")], "s:int"),
+        "RegistCorp": (
+            _CREDENTIALS
+            + [
+                (name, "s:string")
+                for name in [
+                    "CorpName", "CEOName", "BizType", "BizClass", "PostNum", "Addr1",
+                    "Addr2", "MemberName", "ID", "PWD", "Grade", "TEL", "HP", "Email",
+                ]
+            ],
+            "s:int",
+        ),
+        "UpdateCorpInfo": (
+            _CREDENTIALS
+            + [
+                (name, "s:string")
+                for name in [
+                    "CorpName", "CEOName", "BizType", "BizClass", "PostNum", "Addr1", "Addr2",
+                ]
+            ],
+            "s:int",
+        ),
+        "UpdateUserInfo": (
+            _CREDENTIALS
+            + [
+                (name, "s:string")
+                for name in ["ID", "MemberName", "TEL", "HP", "Email", "Grade"]
+            ],
+            "s:int",
+        ),
+        "UpdateUserPWD": (
+            _CREDENTIALS + [("ID", "s:string"), ("newPWD", "s:string")], "s:int"
+        ),
+        "GetErrString": ([("CERTKEY", "s:string"), ("ErrCode", "s:int")], "s:string"),
+    },
+    "CORPSTATE": {
+        "GetCorpStateEx": (_CREDENTIALS + [("CheckCorpNum", "s:string")], "tns:CorpState"),
+        "GetCorpStatesEx": (
+            _CREDENTIALS + [("CheckCorpNumList", "tns:ArrayOfString")],
+            "tns:ArrayOfCorpState",
+        ),
+    },
+}
+
+# 스텁 오류 코드 (-10002, -32000 외에는 스텁 전용 코드)
+ERR_AUTH = -10002
+ERR_ALREADY_MEMBER = -32000
+ERR_NOT_FOUND = -99001
+ERR_DUPLICATE = -99002
+ERR_INVALID_STATE = -99003
+ERR_INJECTED = -99999
+ERROR_MESSAGES = {
+    ERR_AUTH: "인증키가 올바르지 않습니다. (스텁)",
+    ERR_ALREADY_MEMBER: "이미 가입된 연계사업자입니다. (스텁)",
+    ERR_NOT_FOUND: "관리번호에 해당하는 세금계산서가 없습니다. (스텁)",
+    ERR_DUPLICATE: "이미 등록된 관리번호입니다. (스텁)",
+    ERR_INVALID_STATE: "현재 상태에서 처리할 수 없는 세금계산서입니다. (스텁)",
+    ERR_INJECTED: "스텁 오류 주입으로 실패한 요청입니다.",
+}
+
+# 세금계산서 상태 (백엔드 invoice 상태 동기화 로직과 같은 값)
+STATE_REGISTERED = 0  # 발행대기
+STATE_ISSUED = 1  # 발행완료 (국세청 전송 대기)
+STATE_NTS_SENT = 2  # 국세청 전송완료
+STATE_CANCELLED = 4  # 취소됨
+
+
+# ======================================================
+# WSDL 생성
+# ======================================================
+def _element_xml(name: str, xsd_type: str, repeated: bool = False) -> str:
+    max_occurs = "unbounded" if repeated else "1"
+    return (
+        f'<s:element minOccurs="0" maxOccurs="{max_occurs}" name="{name}" '
+        f'type="{xsd_type}"/>'
+    )
+
+
+def build_wsdl(service: str, address: str) -> str:
+    """서비스별 WSDL 문서 생성 (document/literal, SOAP 1.1)"""
+    operations = OPERATIONS[service]
+    schema = []
+    for type_name, fields in TYPES.items():
+        elements = "".join(_element_xml(*field) for field in fields)
+        schema.append(
+            f'<s:complexType name="{type_name}"><s:sequence>{elements}</s:sequence></s:complexType>'
+        )
+    messages, port_ops, binding_ops = [], [], []
+    for op, (params, result_type) in operations.items():
+        request = "".join(_element_xml(name, xsd_type) for name, xsd_type in params)
+        response = _element_xml(f"{op}Result", result_type)
+        schema.append(
+            f'<s:element name="{op}"><s:complexType><s:sequence>{request}'
+            f"</s:sequence></s:complexType></s:element>"
+            f'<s:element name="{op}Response"><s:complexType><s:sequence>{response}'
+            f"</s:sequence></s:complexType></s:element>"
+        )
+        messages.append(
+            f'<wsdl:message name="{op}SoapIn"><wsdl:part name="parameters" element="tns:{op}"/></wsdl:message>'
+            f'<wsdl:message name="{op}SoapOut"><wsdl:part name="parameters" element="tns:{op}Response"/></wsdl:message>'
+        )
+        port_ops.append(
+            f'<wsdl:operation name="{op}"><wsdl:input message="tns:{op}SoapIn"/>'
+            f'<wsdl:output message="tns:{op}SoapOut"/></wsdl:operation>'
+        )
+        binding_ops.append(
+            f'<wsdl:operation name="{op}"><soap:operation soapAction="{NAMESPACE}{op}" style="document"/>'
+            f'<wsdl:input><soap:body use="literal"/></wsdl:input>'
+            f'<wsdl:output><soap:body use="literal"/></wsdl:output></wsdl:operation>'
+        )
+
+    port_type = f"BaroService_{service}Soap"
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<wsdl:definitions xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/" '
+        f'xmlns:tns="{NAMESPACE}" xmlns:s="http://www.w3.org/2001/XMLSchema" '
+        f'targetNamespace="{NAMESPACE}" xmlns:wsdl="http://schemas.xmlsoap.org/wsdl/">'
+        f'<wsdl:types><s:schema elementFormDefault="qualified" targetNamespace="{NAMESPACE}">'
+        + "".join(schema)
+        + "</s:schema></wsdl:types>"
+        + "".join(messages)
+        + f'<wsdl:portType name="{port_type}">'
+        + "".join(port_ops)
+        + "</wsdl:portType>"
+        + f'<wsdl:binding name="{port_type}" type="tns:{port_type}">'
+        '<soap:binding transport="http://schemas.xmlsoap.org/soap/http"/>'
+        + "".join(binding_ops)
+        + "</wsdl:binding>"
+        + f'<wsdl:service name="BaroService_{service}"><wsdl:port name="{port_type}" '
+        f'binding="tns:{port_type}"><soap:address location="{escape(address)}"/>'
+        "</wsdl:port></wsdl:service></wsdl:definitions>"
+    )
+
+
+# ======================================================
+# SOAP 요청 파싱 / 응답 직렬화
+# ======================================================
+def _local_name(element) -> str:
+    return etree.QName(element).localname
+
+
+def parse_value(element) -> Any:
+    """요청 XML 요소를 dict/list/문자열로 변환 (반복되는 자식은 list)"""
+    children = list(element)
+    if not children:
+        return element.text or ""
+    result: Dict[str, Any] = {}
+    for child in children:
+        name = _local_name(child)
+        value = parse_value(child)
+        if name in result:
+            if not isinstance(result[name], list):
+                result[name] = [result[name]]
+            result[name].append(value)
+        else:
+            result[name] = value
+    return result
+
+
+def as_list(value: Any, item_name: str) -> List[Any]:
+    """ArrayOfX 파라미터를 list로 변환"""
+    if not isinstance(value, dict):
+        return []
+    items = value.get(item_name, [])
+    return items if isinstance(items, list) else [items]
+
+
+def serialize_value(name: str, xsd_type: str, value: Any) -> str:
+    """결과 값을 타입 정의에 맞춰 XML로 직렬화"""
+    if value is None:
+        return ""
+    if xsd_type.startswith("tns:"):
+        fields = TYPES[xsd_type[4:]]
+        inner = []
+        for field_name, field_type, repeated in fields:
+            field_value = value.get(field_name) if isinstance(value, dict) else None
+            if repeated:
+                if field_value is not None and not isinstance(field_value, list):
+                    field_value = [field_value]
+                for item in field_value or []:
+                    inner.append(serialize_value(field_name, field_type, item))
+            else:
+                inner.append(serialize_value(field_name, field_type, field_value))
+        return f"<{name}>{''.join(inner)}</{name}>"
+    if xsd_type == "s:boolean":
+        value = "true" if value else "false"
+    return f"<{name}>{escape(str(value))}</{name}>"
+
+
+def soap_response(op: str, result_type: str, result: Any) -> str:
+    body = serialize_value(f"{op}Result", result_type, result)
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<soap:Envelope xmlns:soap="{SOAP_ENV}"><soap:Body>'
+        f'<{op}Response xmlns="{NAMESPACE}">{body}</{op}Response>'
+        "</soap:Body></soap:Envelope>"
+    )
+
+
+def soap_fault(message: str) -> str:
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<soap:Envelope xmlns:soap="{SOAP_ENV}"><soap:Body><soap:Fault>'
+        f"<faultcode>soap:Server</faultcode><faultstring>{escape(message)}</faultstring>"
+        "</soap:Fault></soap:Body></soap:Envelope>"
+    )
+
+
+# ======================================================
+# 메모리 상태 + 오퍼레이션 구현
+# ======================================================
+def _now() -> str:
+    return time.strftime("%Y%m%d%H%M%S")
+
+
+class StubState:
+    """스텁 서버의 세금계산서/회원사/설정 상태"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.lock = threading.Lock()
+        self.invoices: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.members = set()
+        self.corp_states: Dict[str, int] = {}
+        self.calls = Counter()
+        self.injected = Counter()
+
+    def reset(self):
+        with self.lock:
+            self.invoices.clear()
+            self.members.clear()
+            self.corp_states.clear()
+            self.calls.clear()
+            self.injected.clear()
+
+    def _check_auth(self, params: Dict[str, Any]) -> Optional[int]:
+        if not params.get("CERTKEY"):
+            return ERR_AUTH
+        return None
+
+    def _advance(self, record: Dict[str, Any]):
+        """발행 후 --nts-delay초가 지나면 국세청 전송완료로 변경"""
+        delay = self.config["nts_delay"]
+        if (
+            record["BarobillState"] == STATE_ISSUED
+            and delay >= 0
+            and time.monotonic() - record["_issued_at"] >= delay
+        ):
+            record["BarobillState"] = STATE_NTS_SENT
+            record["NTSSendState"] = 3
+            record["NTSSendDT"] = _now()
+
+    def _state_of(self, corp_num: str, mgt_key: str) -> Dict[str, Any]:
+        record = self.invoices.get((corp_num, mgt_key))
+        if record is None:
+            return {"MgtKey": mgt_key, "BarobillState": ERR_NOT_FOUND}
+        self._advance(record)
+        return {key: value for key, value in record.items() if not key.startswith("_")}
+
+    def handle(self, op: str, params: Dict[str, Any]) -> Any:
+        handler = getattr(self, f"op_{op}")
+        with self.lock:
+            return handler(params)
+
+    # ---------------- TI ----------------
+    def _regist(self, params, party: str = "InvoicerParty") -> Tuple[int, Optional[Dict[str, Any]]]:
+        """세금계산서 등록 (관리번호는 CorpNum 쪽 거래처의 MgtNum)"""
+        error = self._check_auth(params)
+        if error:
+            return error, None
+        invoice = params.get("Invoice") or {}
+        mgt_key = (invoice.get(party) or {}).get("MgtNum") or ""
+        key = (params.get("CorpNum", ""), mgt_key)
+        if not mgt_key:
+            return ERR_NOT_FOUND, None
+        if key in self.invoices:
+            return ERR_DUPLICATE, None
+        record = self.invoices[key] = {
+            "MgtKey": mgt_key,
+            "InvoiceKey": f"STUB{len(self.invoices) + 1:012d}",
+            "BarobillState": STATE_REGISTERED,
+            "OpenYN": 0,
+            "NTSSendState": 0,
+            "NTSSendKey": "",
+            "NTSSendResult": "",
+            "NTSSendDT": "",
+            "RegistDT": _now(),
+            "IssueDT": "",
+            "_invoice": invoice,
+            "_issued_at": 0.0,
+        }
+        return 1, record
+
+    @staticmethod
+    def _issue(record: Dict[str, Any]) -> int:
+        if record["BarobillState"] != STATE_REGISTERED:
+            return ERR_INVALID_STATE
+        record["BarobillState"] = STATE_ISSUED
+        record["IssueDT"] = _now()
+        record["NTSSendKey"] = f"NTS{record['InvoiceKey'][4:]}"
+        record["_issued_at"] = time.monotonic()
+        return 1
+
+    def _regist_and_issue(self, params, party: str = "InvoicerParty") -> int:
+        result, record = self._regist(params, party)
+        if record is None:
+            return result
+        return self._issue(record)
+
+    def op_RegistTaxInvoiceEX(self, params):
+        return self._regist(params)[0]
+
+    def op_IssueTaxInvoiceEx(self, params):
+        error = self._check_auth(params)
+        if error:
+            return error
+        record = self.invoices.get((params.get("CorpNum", ""), params.get("MgtKey", "")))
+        if record is None:
+            return ERR_NOT_FOUND
+        return self._issue(record)
+
+    def op_RegistAndIssueTaxInvoice(self, params):
+        return self._regist_and_issue(params)
+
+    def op_RegistAndIssueBrokerTaxInvoice(self, params):
+        return self._regist_and_issue(params, "BrokerParty")
+
+    def op_RegistAndReverseIssueTaxInvoice(self, params):
+        return self._regist_and_issue(params, "InvoiceeParty")
+
+    # 발행예정은 공급받는자 승인 전이므로 발행대기(0) 상태로 둠
+    def op_RegistAndPreIssueTaxInvoice(self, params):
+        return self._regist(params)[0]
+
+    def op_RegistAndPreIssueBrokerTaxInvoice(self, params):
+        return self._regist(params, "BrokerParty")[0]
+
+    def op_GetTaxInvoice(self, params):
+        error = self._check_auth(params)
+        if error:
+            return {"TaxInvoiceType": error}
+        record = self.invoices.get((params.get("CorpNum", ""), params.get("MgtKey", "")))
+        if record is None:
+            return {"TaxInvoiceType": ERR_NOT_FOUND}
+        return record["_invoice"]
+
+    def op_GetTaxInvoiceStateEX(self, params):
+        error = self._check_auth(params)
+        if error:
+            return {"BarobillState": error}
+        return self._state_of(params.get("CorpNum", ""), params.get("MgtKey", ""))
+
+    def op_GetTaxInvoiceStatesEX(self, params):
+        error = self._check_auth(params)
+        if error:
+            return {"TaxInvoiceStateEX": [{"BarobillState": error}]}
+        corp_num = params.get("CorpNum", "")
+        return {
+            "TaxInvoiceStateEX": [
+                self._state_of(corp_num, mgt_key)
+                for mgt_key in as_list(params.get("MgtKeyList"), "string")
+            ]
+        }
+
+    def _period_list(self, params, party: str) -> Dict[str, Any]:
+        """발행된 세금계산서 중 CorpNum이 party(공급자/공급받는자)인 건을 작성일자 기간으로 페이지 조회"""
+        error = self._check_auth(params)
+        if error:
+            return {"CurrentPage": error}
+        corp_num = params.get("CorpNum", "").replace("-", "")
+        start_date, end_date = params.get("StartDate", ""), params.get("EndDate", "")
+        is_exempt = str(params.get("TaxType") or "1") == "2"  # 2: 계산서(면세)
+        count_per_page = max(int(params.get("CountPerPage") or 10), 1)
+        current_page = max(int(params.get("CurrentPage") or 1), 1)
+
+        matched = []
+        for record in self.invoices.values():
+            if record["BarobillState"] in (STATE_REGISTERED, STATE_CANCELLED):
+                continue
+            invoice = record["_invoice"]
+            if (invoice.get(party) or {}).get("CorpNum", "").replace("-", "") != corp_num:
+                continue
+            if not start_date <= invoice.get("WriteDate", "") <= end_date:
+                continue
+            if (str(invoice.get("TaxType") or "1") == "2") != is_exempt:
+                continue
+            self._advance(record)
+            matched.append(self._simple_of(record))
+        matched.sort(key=lambda item: (item["WriteDate"], item["InvoiceKey"]))
+
+        offset = (current_page - 1) * count_per_page
+        return {
+            "CurrentPage": current_page,
+            "CountPerPage": count_per_page,
+            "MaxPageNum": max((len(matched) + count_per_page - 1) // count_per_page, 1),
+            "MaxIndex": len(matched),
+            "SimpleTaxInvoiceExList": {
+                "SimpleTaxInvoiceEx": matched[offset:offset + count_per_page]
+            },
+        }
+
+    @staticmethod
+    def _simple_of(record: Dict[str, Any]) -> Dict[str, Any]:
+        invoice = record["_invoice"]
+        invoicer = invoice.get("InvoicerParty") or {}
+        invoicee = invoice.get("InvoiceeParty") or {}
+        items = as_list(invoice.get("TaxInvoiceTradeLineItems"), "TaxInvoiceTradeLineItem")
+        return {
+            "MgtKey": record["MgtKey"],
+            "InvoiceKey": record["InvoiceKey"],
+            "NTSSendKey": record["NTSSendKey"],
+            "TaxInvoiceType": invoice.get("TaxInvoiceType") or 1,
+            "TaxType": invoice.get("TaxType") or 1,
+            "PurposeType": invoice.get("PurposeType") or 1,
+            "ModifyCode": invoice.get("ModifyCode", ""),
+            "BarobillState": record["BarobillState"],
+            "WriteDate": invoice.get("WriteDate", ""),
+            "IssueDT": record["IssueDT"],
+            "NTSSendDT": record["NTSSendDT"],
+            "InvoicerCorpNum": invoicer.get("CorpNum", ""),
+            "InvoicerCorpName": invoicer.get("CorpName", ""),
+            "InvoicerCEOName": invoicer.get("CEOName", ""),
+            "InvoiceeCorpNum": invoicee.get("CorpNum", ""),
+            "InvoiceeCorpName": invoicee.get("CorpName", ""),
+            "InvoiceeCEOName": invoicee.get("CEOName", ""),
+            "AmountTotal": invoice.get("AmountTotal", ""),
+            "TaxTotal": invoice.get("TaxTotal", ""),
+            "TotalAmount": invoice.get("TotalAmount", ""),
+            "ItemName": (items[0].get("Name", "") if items and isinstance(items[0], dict) else ""),
+        }
+
+    def op_GetPeriodTaxInvoiceSalesList(self, params):
+        return self._period_list(params, "InvoicerParty")
+
+    def op_GetPeriodTaxInvoicePurchaseList(self, params):
+        return self._period_list(params, "InvoiceeParty")
+
+    def op_DeleteTaxInvoice(self, params):
+        error = self._check_auth(params)
+        if error:
+            return error
+        record = self.invoices.get((params.get("CorpNum", ""), params.get("MgtKey", "")))
+        if record is None:
+            return ERR_NOT_FOUND
+        self._advance(record)
+        if record["BarobillState"] in (STATE_NTS_SENT, STATE_CANCELLED):
+            return ERR_INVALID_STATE
+        record["BarobillState"] = STATE_CANCELLED
+        return 1
+
+    def op_CheckCERTIsValid(self, params):
+        return self._check_auth(params) or 1
+
+    def op_GetCertificateRegistURL(self, params):
+        error = self._check_auth(params)
+        if error:
+            return str(error)
+        return f"{self.config['public_url']}/__stub/certificate?CorpNum={params.get('CorpNum', '')}"
+
+    def op_CheckCorpIsMember(self, params):
+        error = self._check_auth(params)
+        if error:
+            return error
+        return 1 if params.get("CheckCorpNum", "") in self.members else 0
+
+    def op_RegistCorp(self, params):
+        error = self._check_auth(params)
+        if error:
+            return error
+        corp_num = params.get("CorpNum", "")
+        if corp_num in self.members:
+            return ERR_ALREADY_MEMBER
+        self.members.add(corp_num)
+        return 1
+
+    def op_UpdateCorpInfo(self, params):
+        return self._check_auth(params) or 1
+
+    def op_UpdateUserInfo(self, params):
+        return self._check_auth(params) or 1
+
+    def op_UpdateUserPWD(self, params):
+        return self._check_auth(params) or 1
+
+    def op_GetErrString(self, params):
+        code = int(params.get("ErrCode") or 0)
+        return ERROR_MESSAGES.get(code, f"스텁 오류 ({code})")
+
+    # ---------------- CORPSTATE ----------------
+    def _corp_state(self, corp_num: str) -> Dict[str, Any]:
+        state = self.corp_states.get(corp_num, 1)
+        names = {0: "미등록", 1: "정상", 2: "휴업", 3: "폐업", 4: "간이과세", 5: "면세사업자"}
+        return {
+            "CorpNum": corp_num,
+            "CorpName": f"스텁상사{corp_num[-4:]}",
+            "CeoName": "홍길동",
+            "CorpType": "법인",
+            "State": state,
+            "StateName": names.get(state, ""),
+            "BaseDate": time.strftime("%Y%m%d"),
+        }
+
+    def op_GetCorpStateEx(self, params):
+        error = self._check_auth(params)
+        if error:
+            return {"State": error}
+        return self._corp_state(params.get("CheckCorpNum", ""))
+
+    def op_GetCorpStatesEx(self, params):
+        error = self._check_auth(params)
+        if error:
+            return {"CorpState": [{"State": error}]}
+        return {
+            "CorpState": [
+                self._corp_state(corp_num)
+                for corp_num in as_list(params.get("CheckCorpNumList"), "string")
+            ]
+        }
+
+
+# ======================================================
+# HTTP 앱
+# ======================================================
+DEFAULT_CONFIG = {
+    "latency_ms": 0.0,
+    "jitter_ms": 0.0,
+    "op_latency_ms": {},
+    "error_rate": 0.0,
+    "fault_rate": 0.0,
+    "unavailable_rate": 0.0,
+    "nts_delay": 5.0,
+    "public_url": "http://localhost:8090",
+}
+
+
+def create_app(config: Optional[Dict[str, Any]] = None) -> FastAPI:
+    """스텁 FastAPI 앱 생성 (config는 DEFAULT_CONFIG를 덮어씀)"""
+    state = StubState({**DEFAULT_CONFIG, **(config or {})})
+    app = FastAPI(title="Barobill SOAP Stub")
+    app.state.stub = state
+
+    @app.get("/{service}.asmx")
+    async def get_wsdl(service: str, request: Request):
+        if service not in OPERATIONS:
+            return Response(status_code=404)
+        address = str(request.url.replace(query=""))
+        return Response(build_wsdl(service, address), media_type="text/xml; charset=utf-8")
+
+    @app.post("/{service}.asmx")
+    async def call(service: str, request: Request):
+        if service not in OPERATIONS:
+            return Response(status_code=404)
+        try:
+            envelope = etree.fromstring(await request.body())
+            body = envelope.find(f"{{{SOAP_ENV}}}Body")
+            operation = body[0]
+        except Exception:
+            return Response(soap_fault("잘못된 SOAP 요청"), status_code=500, media_type="text/xml")
+
+        op = _local_name(operation)
+        if op not in OPERATIONS[service]:
+            return Response(soap_fault(f"알 수 없는 오퍼레이션: {op}"), status_code=500, media_type="text/xml")
+        params = parse_value(operation)
+        if not isinstance(params, dict):
+            params = {}
+
+        config = state.config
+        state.calls[op] += 1
+
+        latency = config["op_latency_ms"].get(op, config["latency_ms"])
+        latency += random.uniform(0, config["jitter_ms"])
+        if latency > 0:
+            await asyncio.sleep(latency / 1000)
+
+        roll = random.random()
+        if roll < config["unavailable_rate"]:
+            state.injected["unavailable"] += 1
+            return Response(status_code=503)
+        roll -= config["unavailable_rate"]
+        if roll < config["fault_rate"]:
+            state.injected["fault"] += 1
+            return Response(soap_fault("스텁 SOAP Fault 주입"), status_code=500, media_type="text/xml")
+        roll -= config["fault_rate"]
+
+        _params, result_type = OPERATIONS[service][op]
+        if roll < config["error_rate"] and result_type == "s:int":
+            state.injected["error_code"] += 1
+            result = ERR_INJECTED
+        else:
+            result = state.handle(op, params)
+        return Response(soap_response(op, result_type, result), media_type="text/xml; charset=utf-8")
+
+    @app.get("/__stub/stats")
+    async def stats():
+        return {
+            "calls": dict(state.calls),
+            "injected": dict(state.injected),
+            "invoices": len(state.invoices),
+            "members": len(state.members),
+            "config": state.config,
+        }
+
+    @app.post("/__stub/config")
+    async def update_config(request: Request):
+        """지연/오류 비율 등 설정 변경 (corp_states: {사업자번호: 상태} 도 지정 가능)"""
+        data = await request.json()
+        corp_states = data.pop("corp_states", None)
+        if corp_states:
+            state.corp_states.update({str(k): int(v) for k, v in corp_states.items()})
+        state.config.update({k: v for k, v in data.items() if k in DEFAULT_CONFIG})
+        return JSONResponse(state.config)
+
+    @app.post("/__stub/reset")
+    async def reset():
+        state.reset()
+        return {"success": True}
+
+    @app.get("/__stub/certificate")
+    async def certificate_page(CorpNum: str = ""):
+        return Response(f"스텁 인증서 등록 페이지 ({CorpNum})", media_type="text/plain; charset=utf-8")
+
+    return app
+
+
+def _parse_op_latency(values: List[str]) -> Dict[str, float]:
+    result = {}
+    for value in values or []:
+        op, _, ms = value.partition("=")
+        result[op] = float(ms)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="바로빌 SOAP 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="평균 응답 지연(ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="추가 무작위 지연 최대값(ms)")
+    parser.add_argument(
+        "--op-latency",
+        action="append",
+        metavar="OPERATION=MS",
+        help="오퍼레이션별 지연 (예: IssueTaxInvoiceEx=800, 여러 번 지정 가능)",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="음수 결과 코드 반환 비율 (정수 결과 오퍼레이션)")
+    parser.add_argument("--fault-rate", type=float, default=0.0, help="SOAP Fault(HTTP 500) 반환 비율")
+    parser.add_argument("--unavailable-rate", type=float, default=0.0, help="HTTP 503 반환 비율")
+    parser.add_argument("--nts-delay", type=float, default=5.0, help="발행 후 국세청 전송완료까지 시간(초), 음수면 전송 안 함")
+    args = parser.parse_args()
+
+    app = create_app(
+        {
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "op_latency_ms": _parse_op_latency(args.op_latency),
+            "error_rate": args.error_rate,
+            "fault_rate": args.fault_rate,
+            "unavailable_rate": args.unavailable_rate,
+            "nts_delay": args.nts_delay,
+            "public_url": f"http://{args.host}:{args.port}",
+        }
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+바로빌 응답 변환기 마이크로 벤치마크
+
+GetTaxInvoice(품목 N개) / GetTaxInvoiceStatesEX(관리번호 N개) 형태의 zeep 객체를
+zeep_to_dict, zeep.helpers.serialize_object, 기존 _convert_to_dict(__dict__ 순회)로 변환해 비교합니다.
+기존 방식은 zeep 내부 속성(_xsd_elm)까지 따라 들어가 RecursionError가 나므로 실패로 표시합니다.
+
+사용법:
+    python utils/bench_barobill_serializer.py
+    python utils/bench_barobill_serializer.py --items 200 --states 1000 --repeat 200
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+
+from zeep import xsd
+from zeep.helpers import serialize_object
+from app.core.barobill.barobill_serializer import zeep_to_dict
+
+
+def legacy_convert_to_dict(obj):
+    """기존 TaxInvoiceService._convert_to_dict 구현"""
+    if hasattr(obj, "__dict__"):
+        result = {}
+        for key, value in obj.__dict__.items():
+            if hasattr(value, "__dict__"):
+                result[key] = legacy_convert_to_dict(value)
+            elif isinstance(value, list):
+                result[key] = [
+                    legacy_convert_to_dict(item) if hasattr(item, "__dict__") else item
+                    for item in value
+                ]
+            else:
+                result[key] = value
+        return result
+    return obj
+
+
+def _string_elements(*names):
+    return [xsd.Element(name, xsd.String()) for name in names]
+
+
+PARTY = xsd.ComplexType(
+    xsd.Sequence(
+        _string_elements(
+            "MgtNum", "CorpNum", "TaxRegID", "CorpName", "CEOName", "Addr",
+            "BizClass", "BizType", "ContactID", "ContactName", "TEL", "HP", "Email",
+        )
+    )
+)
+ITEM = xsd.ComplexType(
+    xsd.Sequence(
+        _string_elements(
+            "PurchaseExpiry", "Name", "Information", "ChargeableUnit", "UnitPrice",
+            "Amount", "Tax", "Description",
+        )
+    )
+)
+TAX_INVOICE = xsd.Element(
+    "TaxInvoice",
+    xsd.ComplexType(
+        xsd.Sequence(
+            [xsd.Element("TaxInvoiceType", xsd.Integer()), xsd.Element("TaxType", xsd.Integer())]
+            + _string_elements(
+                "InvoiceKey", "WriteDate", "AmountTotal", "TaxTotal", "TotalAmount",
+                "Cash", "ChkBill", "Note", "Credit", "Remark1", "Remark2", "Remark3",
+            )
+            + [
+                xsd.Element("InvoicerParty", PARTY),
+                xsd.Element("InvoiceeParty", PARTY),
+                xsd.Element(
+                    "TaxInvoiceTradeLineItems",
+                    xsd.ComplexType(
+                        xsd.Sequence(
+                            [xsd.Element("TaxInvoiceTradeLineItem", ITEM, max_occurs="unbounded")]
+                        )
+                    ),
+                ),
+            ]
+        )
+    ),
+)
+STATE = xsd.Element(
+    "TaxInvoiceStateEX",
+    xsd.ComplexType(
+        xsd.Sequence(
+            _string_elements("MgtKey", "InvoiceKey", "NTSSendKey", "NTSSendResult", "RegistDT")
+            + [
+                xsd.Element("BarobillState", xsd.Integer()),
+                xsd.Element("NTSSendState", xsd.Integer()),
+                xsd.Element("OpenState", xsd.Integer()),
+            ]
+        )
+    ),
+)
+
+
+def build_party(prefix):
+    return {name: f"{prefix}-{name}" for name, _ in PARTY.elements}
+
+
+def build_tax_invoice(items):
+    line_items = [
+        {name: f"{i}-{name}" for name, _ in ITEM.elements} for i in range(items)
+    ]
+    return TAX_INVOICE(
+        TaxInvoiceType=1,
+        TaxType=1,
+        InvoiceKey="KEY",
+        WriteDate="20260101",
+        AmountTotal="100000",
+        TaxTotal="10000",
+        TotalAmount="110000",
+        InvoicerParty=build_party("invoicer"),
+        InvoiceeParty=build_party("invoicee"),
+        TaxInvoiceTradeLineItems={"TaxInvoiceTradeLineItem": line_items},
+    )
+
+
+def build_states(count):
+    return [
+        STATE(MgtKey=f"MGT{i:06d}", BarobillState=3000, NTSSendState=3, OpenState=1)
+        for i in range(count)
+    ]
+
+
+def bench(label, func, payload, repeat):
+    if isinstance(payload, list):
+        # 서비스 코드와 같이 상태 목록은 항목별로 변환
+        item_func = func
+        func = lambda states: [item_func(state) for state in states]
+    try:
+        func(payload)
+    except RecursionError:
+        print(f"  {label:<22} 실패 (RecursionError)")
+        return
+    seconds = min(timeit.repeat(lambda: func(payload), number=repeat, repeat=3))
+    print(f"  {label:<22} {seconds / repeat * 1e6:10.1f} us/회")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="바로빌 응답 변환기 벤치마크")
+    parser.add_argument("--items", type=int, default=50, help="세금계산서 품목 수")
+    parser.add_argument("--states", type=int, default=500, help="상태 조회 관리번호 수")
+    parser.add_argument("--repeat", type=int, default=100, help="반복 횟수")
+    args = parser.parse_args()
+
+    cases = [
+        (f"GetTaxInvoice (품목 {args.items}개)", build_tax_invoice(args.items)),
+        (f"GetTaxInvoiceStatesEX ({args.states}개)", build_states(args.states)),
+    ]
+    converters = [
+        ("zeep_to_dict", zeep_to_dict),
+        ("serialize_object", serialize_object),
+        ("legacy _convert_to_dict", legacy_convert_to_dict),
+    ]
+
+    for title, payload in cases:
+        print(title)
+        for label, func in converters:
+            bench(label, func, payload, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+세금계산서 부가세/합계 계산 벤치마크
+
+기존 엔드포인트의 float 재계산 루프(float(Amount), round(공급가액 x 세율))와
+app.services.tax_invoice_pricing(price_invoice / price_invoices)의 속도를 비교하고,
+공급가액 1원~N원 구간에서 두 방식의 품목 부가세가 달라지는 건수를 셉니다.
+(float 방식은 2.5 -> 2 처럼 0.5를 짝수 쪽으로, 1005 x 0.1 = 100.50000000000001 -> 101 처럼 오차대로 반올림)
+
+사용법:
+    python utils/bench_tax_invoice_pricing.py
+    python utils/bench_tax_invoice_pricing.py --invoices 500 --items 20 --repeat 20 --exact-range 100000
+"""
+import argparse
+import copy
+import sys
+import timeit
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+
+from app.services.tax_invoice_pricing import compute_line_tax, price_invoice, price_invoices
+
+
+def legacy_price_invoice(invoice_data, vat_rate_percent):
+    """기존 tax_invoice_issue.issue_tax_invoice의 부가세 재계산 루프"""
+    vat_rate = vat_rate_percent / 100.0
+    if invoice_data.get("TaxInvoiceTradeLineItems"):
+        total_supply = 0
+        total_tax = 0
+        for item in invoice_data["TaxInvoiceTradeLineItems"]:
+            try:
+                supply_value = float(item.get("Amount", 0))
+            except (ValueError, TypeError):
+                supply_value = 0
+            item_vat_rate_percent = item.get("vat_rate_percent")
+            if item_vat_rate_percent is not None:
+                item_vat_rate = item_vat_rate_percent / 100.0
+            else:
+                item_vat_rate = vat_rate
+            tax_amount = round(supply_value * item_vat_rate)
+            item["Tax"] = str(int(tax_amount))
+            total_supply += supply_value
+            total_tax += tax_amount
+            if "vat_rate_percent" in item:
+                del item["vat_rate_percent"]
+        invoice_data["AmountTotal"] = str(int(total_supply))
+        invoice_data["TaxTotal"] = str(int(total_tax))
+        invoice_data["TotalAmount"] = str(int(total_supply + total_tax))
+    return invoice_data
+
+
+def build_invoice(index, items):
+    line_items = []
+    for i in range(items):
+        item = {"Name": f"품목{i}", "Amount": str(1000 + index * 37 + i * 113), "Tax": ""}
+        if i % 5 == 0:
+            item["vat_rate_percent"] = 0.0
+        line_items.append(item)
+    return {"WriteDate": "20260101", "TaxInvoiceTradeLineItems": line_items}
+
+
+def bench(label, func, invoices, repeat):
+    # 입력을 제자리 수정하므로 매 반복마다 사본 사용 (사본 비용은 제외)
+    copies = [copy.deepcopy(invoices) for _ in range(repeat * 3)]
+    it = iter(copies)
+    seconds = min(timeit.repeat(lambda: func(next(it)), number=repeat, repeat=3))
+    count = len(invoices)
+    print(f"  {label:<26} {seconds / repeat * 1e3:8.2f} ms/회  ({seconds / repeat / count * 1e6:6.2f} us/건)")
+
+
+def count_mismatches(upper, rates):
+    mismatches = 0
+    for rate in rates:
+        float_rate = rate / 100.0
+        for supply in range(1, upper + 1):
+            if int(round(supply * float_rate)) != compute_line_tax(supply, rate):
+                mismatches += 1
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세금계산서 부가세/합계 계산 벤치마크")
+    parser.add_argument("--invoices", type=int, default=200, help="세금계산서 수")
+    parser.add_argument("--items", type=int, default=10, help="세금계산서당 품목 수")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수")
+    parser.add_argument("--exact-range", type=int, default=100000, help="정확도 비교 공급가액 상한(원)")
+    args = parser.parse_args()
+
+    invoices = [build_invoice(i, args.items) for i in range(args.invoices)]
+
+    print(f"세금계산서 {args.invoices}건 x 품목 {args.items}개")
+    bench(
+        "legacy float 루프",
+        lambda batch: [legacy_price_invoice(data, 10.0) for data in batch],
+        invoices, args.repeat,
+    )
+    bench(
+        "price_invoice",
+        lambda batch: [price_invoice(data, 10.0) for data in batch],
+        invoices, args.repeat,
+    )
+    bench(
+        "price_invoices (일괄)",
+        lambda batch: price_invoices((data, 10.0) for data in batch),
+        invoices, args.repeat,
+    )
+
+    rates = [10.0, 5.0, 3.3, 1.5]
+    mismatches = count_mismatches(args.exact_range, rates)
+    print(
+        f"공급가액 1~{args.exact_range}원 x 세율 {rates}: "
+        f"float 방식과 품목 부가세가 다른 건수 {mismatches}"
+    )
+
+
+if __name__ == "__main__":
+    main()
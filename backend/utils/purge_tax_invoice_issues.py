@@ -0,0 +1,87 @@
+"""
+발행 세금계산서 보관 기간 만료분 정리 스크립트
+
+retention_until(발행일 + 5년)이 지난 tax_invoice_issues 행을 chunk 단위로 삭제합니다.
+--archive-dir(또는 TAX_INVOICE_RETENTION_ARCHIVE_DIR)을 주면 삭제 전에 gzip JSONL 파일로 보관합니다.
+cron 등으로 주기적으로 실행하세요.
+
+사용법:
+    python utils/purge_tax_invoice_issues.py --dry-run                     # 정리 대상만 확인
+    python utils/purge_tax_invoice_issues.py --archive-dir /data/archive   # 보관 후 삭제
+    python utils/purge_tax_invoice_issues.py --chunk-size 200 --sleep 1 --max-rows 100000
+"""
+import argparse
+import logging
+import sys
+from datetime import date
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.tax_invoice_retention_service import TaxInvoiceRetentionService
+
+
+def print_progress(progress):
+    print(
+        f"  - {progress['scanned']}/{progress['total']}행 처리 "
+        f"(삭제 {progress['deleted']}, 보관 {progress['archived']}, {progress['elapsed']}초)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="발행 세금계산서 보관 기간 만료분 정리")
+    parser.add_argument("--dry-run", action="store_true", help="보관/삭제 없이 정리 대상만 확인")
+    parser.add_argument("--before", type=date.fromisoformat, default=None,
+                        help="이 날짜 이전에 만료된 행만 정리 (YYYY-MM-DD, 기본 오늘)")
+    parser.add_argument("--archive-dir", default=settings.TAX_INVOICE_RETENTION_ARCHIVE_DIR,
+                        help="삭제 전 gzip JSONL로 보관할 디렉토리")
+    parser.add_argument("--no-archive", action="store_true", help="설정된 보관 디렉토리가 있어도 보관하지 않음")
+    parser.add_argument("--chunk-size", type=int, default=settings.TAX_INVOICE_RETENTION_CHUNK_SIZE,
+                        help="한 트랜잭션에서 삭제할 행 수")
+    parser.add_argument("--sleep", type=float, default=settings.TAX_INVOICE_RETENTION_SLEEP_SECONDS,
+                        help="chunk 사이 대기 시간(초)")
+    parser.add_argument("--max-rows", type=int, default=None, help="이번 실행에서 처리할 최대 행 수")
+    args = parser.parse_args()
+
+    if args.chunk_size < 1:
+        print("✗ --chunk-size는 1 이상이어야 합니다.")
+        sys.exit(1)
+
+    archive_dir = None if args.no_archive else args.archive_dir
+    db = SessionLocal()
+    try:
+        print(
+            f"{'[dry-run] ' if args.dry_run else ''}세금계산서 보관 만료분 정리 시작 "
+            f"(기준일: {args.before or date.today()}, 보관: {archive_dir or '안 함'})"
+        )
+        progress = TaxInvoiceRetentionService.purge(
+            db,
+            cutoff=args.before,
+            chunk_size=args.chunk_size,
+            sleep_seconds=args.sleep,
+            archive_dir=archive_dir,
+            dry_run=args.dry_run,
+            max_rows=args.max_rows,
+            on_progress=print_progress,
+        )
+    except ValueError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    if args.dry_run:
+        print(f"✓ 정리 대상 {progress['total']}행 (삭제하지 않음)")
+    else:
+        print(f"✓ 정리 완료: {progress['deleted']}행 삭제, {progress['archived']}행 보관 ({progress['elapsed']}초)")
+        if progress["archive_path"]:
+            print(f"  보관 파일: {progress['archive_path']}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
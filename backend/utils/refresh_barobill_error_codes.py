@@ -0,0 +1,63 @@
+"""
+바로빌 오류 코드 테이블 갱신 스크립트
+
+파트너 인증키(BAROBILL_CERT_KEY)로 GetErrString을 호출해
+app/core/barobill/error_codes.json을 다시 생성합니다.
+테이블에 이미 있는 코드는 항상 다시 조회하고, 인자로 준 코드를 추가합니다.
+패키지에는 빈 테이블만 포함되어 있으므로 처음 생성할 때는 조회할 코드를 인자로 지정합니다.
+
+사용법:
+    python utils/refresh_barobill_error_codes.py                  # 테이블에 있는 코드만 갱신
+    python utils/refresh_barobill_error_codes.py -10002 -32000    # 코드 추가
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+
+from app.core.barobill import BaroBillService, error_catalog
+from app.core.config import settings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="바로빌 오류 코드 테이블 갱신")
+    parser.add_argument("codes", nargs="*", type=int, help="추가로 조회할 오류 코드 (예: -10002)")
+    args = parser.parse_args()
+
+    if not settings.is_barobill_configured():
+        print("✗ BAROBILL_CERT_KEY / BAROBILL_CORP_NUM 환경변수를 설정해주세요.")
+        sys.exit(1)
+
+    if not args.codes and not error_catalog.codes():
+        print("✗ 오류 코드 테이블이 비어 있습니다. 조회할 오류 코드를 인자로 지정해주세요. (예: -10002 -32000)")
+        sys.exit(1)
+
+    service = BaroBillService(
+        cert_key=settings.BAROBILL_CERT_KEY,
+        corp_num=settings.BAROBILL_CORP_NUM,
+        use_test_server=settings.BAROBILL_USE_TEST_SERVER,
+    )
+
+    failed = []
+    for code in args.codes:
+        try:
+            error_catalog.set(code, service.fetch_err_string(code))
+        except Exception as e:
+            failed.append(code)
+            print(f"✗ 오류 메시지 조회 실패 (코드: {code}): {e}")
+
+    refreshed = error_catalog.refresh(service.fetch_err_string)
+    error_catalog.save()
+
+    print(f"✓ 오류 코드 테이블 갱신 완료 ({refreshed}개 갱신, 저장 위치: {error_catalog.path})")
+    for code in error_catalog.codes():
+        print(f"  - {code}: {error_catalog.get(code)}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
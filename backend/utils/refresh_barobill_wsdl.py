@@ -0,0 +1,71 @@
+"""
+바로빌 WSDL 스냅샷 갱신 스크립트
+
+사용법:
+    python utils/refresh_barobill_wsdl.py                        # 전체 서비스, 운영/테스트 서버
+    python utils/refresh_barobill_wsdl.py --server test TI CORPSTATE
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+
+from app.core.barobill.barobill_registry import (
+    BAROBILL_SERVICES,
+    BAROBILL_SERVERS,
+    client_registry,
+    get_barobill_wsdl_url,
+)
+from app.core.barobill.barobill_wsdl import refresh_snapshots
+from app.core.config import settings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="바로빌 WSDL 스냅샷 갱신")
+    parser.add_argument(
+        "services",
+        nargs="*",
+        default=list(BAROBILL_SERVICES),
+        help=f"갱신할 서비스 (기본: {', '.join(BAROBILL_SERVICES)})",
+    )
+    parser.add_argument(
+        "--server",
+        choices=BAROBILL_SERVERS,
+        action="append",
+        help="갱신할 서버 (여러 번 지정 가능, 기본: 전체)",
+    )
+    parser.add_argument("--timeout", type=int, default=30, help="다운로드 타임아웃(초)")
+    args = parser.parse_args()
+
+    if settings.BAROBILL_STUB_URL:
+        print(f"ℹ BAROBILL_STUB_URL({settings.BAROBILL_STUB_URL})이 설정되어 있지만 스냅샷은 바로빌 서버에서 받습니다.")
+
+    servers = args.server or list(BAROBILL_SERVERS)
+    print(f"바로빌 WSDL 스냅샷 갱신 중... (서비스: {args.services}, 서버: {servers})")
+
+    try:
+        manifest = refresh_snapshots(
+            services=args.services,
+            servers=servers,
+            # 스텁 서버(BAROBILL_STUB_URL)가 설정되어 있어도 스냅샷은 항상 바로빌 원본에서 받음
+            url_for=lambda service, server: get_barobill_wsdl_url(service, server == "test"),
+            wsdl_dir=settings.BAROBILL_WSDL_DIR,
+            timeout=args.timeout,
+        )
+    except Exception as e:
+        print(f"✗ WSDL 스냅샷 갱신 실패: {e}")
+        sys.exit(1)
+
+    # 현재 프로세스에서 생성된 클라이언트가 있다면 새 스냅샷으로 다시 생성되도록 비움
+    client_registry.clear()
+
+    print(f"✓ WSDL 스냅샷 갱신 완료 (버전: {manifest['version']})")
+    for key, info in sorted(manifest["snapshots"].items()):
+        print(f"  - {key}: {info['sha256'][:12]} ({info['fetched_at']})")
+
+
+if __name__ == "__main__":
+    main()